@@ -0,0 +1,353 @@
+"""
+Бенчмарк накладных расходов оркестратора
+
+Меряет стоимость самого оркестратора, а не системы под нагрузкой:
+- parse:  разбор ответа /stats/requests (json, агрегат, сигнатуры ошибок
+          и интервальные метрики эндпоинтов - как в LocustAdapter.get_stats)
+          в зависимости от количества эндпоинтов
+- decide: стоимость decide() каждой стратегии по мере роста истории
+- memory: память на один сэмпл RawMetrics в истории
+- report: построение HTML/JSON-отчёта по длинной истории (--report-samples)
+- e2e:    полный прогон Orchestrator с каждой стратегией против
+          локальной заглушки Locust (stub_locust.py): длительность тика,
+          задержки вызовов адаптера и стратегии, опоздание цикла
+          (собственные замеры оркестратора, TestResult.timings)
+
+Результат - JSON (--output, иначе stdout; сообщения оркестратора во время
+прогонов уходят в stderr, чтобы не портить JSON). С --baseline сравнивает с прошлым прогоном
+и завершается с кодом 1, если горячий путь стал медленнее больше чем на
+--max-regression (для CI).
+
+Запуск (пакет должен быть установлен, например pip install -e .):
+    python benchmarks/run.py --endpoints 1,10,100,1000 --samples 200 --output bench.json
+    python benchmarks/run.py --baseline bench.json --max-regression 0.25
+"""
+
+import argparse
+import contextlib
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable
+
+from load_orchestrator.adapters.LocustAdapter import LocustAdapter
+from load_orchestrator.config import AdapterConfig, Config, OrchestratorConfig, StrategyConfig
+from load_orchestrator.factory import OrchestratorFactory
+from load_orchestrator.models import RawMetrics, StopReason, TestResult
+from load_orchestrator.orchestrator import Orchestrator
+from load_orchestrator.report import render
+
+from stub_locust import StubLocust, build_stats_payload
+
+# Параметры стратегий, рассчитанные на короткий прогон
+STRATEGY_PARAMS: dict[str, dict[str, Any]] = {
+    'degradation_search': {'initial_users': 10},
+    'break_point': {'initial_users': 10, 'step_multiplier': 1.5, 'error_threshold': 10},
+    'sla_validation': {'max_p99': 2000, 'max_error_rate': 5, 'initial_users': 10, 'step_multiplier': 1.5},
+    'target_rps': {'target_rps': 200, 'test_duration': 2},
+    'spike': {
+        'baseline_users': 10, 'baseline_duration': 0.5,
+        'spike_users': 800, 'spike_duration': 1,
+        'recovery_users': 10, 'recovery_duration': 0.5,
+    },
+    'canary': {'canary_users': 20, 'canary_duration': 1, 'error_threshold': 5},
+    'profile': {
+        'resolution': 0.05,
+        'segments': [
+            {'type': 'ramp', 'from': 0, 'to': 400, 'duration': 1},
+            {'type': 'sine', 'amplitude': 100, 'period': 0.5, 'duration': 1},
+        ],
+    },
+    'pipeline': {
+        'stages': [
+            {'type': 'canary', 'canary_users': 20, 'canary_duration': 0.5, 'error_threshold': 5},
+            {'type': 'sla_validation', 'max_p99': 2000, 'max_error_rate': 5, 'step_multiplier': 1.5},
+        ],
+    },
+}
+
+
+class _StubAdapter(LocustAdapter):
+    """LocustAdapter без запуска процесса: заглушка уже слушает порт"""
+
+    def launch(self):
+        pass
+
+
+def _summary(values: list[float]) -> dict[str, float]:
+    """Сводка по длительностям в микросекундах"""
+    if not values:
+        return {'count': 0}
+    ordered = sorted(values)
+    us = 1e6
+    return {
+        'count': len(ordered),
+        'mean_us': statistics.fmean(ordered) * us,
+        'p50_us': ordered[len(ordered) // 2] * us,
+        'p95_us': ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * us,
+        'max_us': ordered[-1] * us,
+    }
+
+
+def _timed(fn: Callable, sink: list[float]) -> Callable:
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            sink.append(time.perf_counter() - started)
+    return wrapper
+
+
+def _synthetic_metrics(count: int) -> list[RawMetrics]:
+    """Плавно растущая нагрузка с деградацией в конце"""
+    metrics = []
+    for i in range(count):
+        users = 10 + i
+        overload = max(0.0, (i - count * 0.8) / count)
+        rt = 20 * (1 + 10 * overload)
+        metrics.append(RawMetrics(
+            timestamp=1_000_000 + i,
+            users=users,
+            rps=users / (rt / 1000 + 1),
+            rt_avg=rt,
+            p50=rt,
+            p95=rt * 1.5,
+            p99=rt * 3,
+            failed_requests=0,
+            error_rate=0.0,
+            total_requests=users * 60,
+        ))
+    return metrics
+
+
+def bench_parse(endpoints: list[int], repeats: int) -> dict[str, Any]:
+    """Разбор /stats/requests: json.loads, parse_stats, ошибки и все эндпоинты"""
+    results = {}
+    for count in endpoints:
+        body = json.dumps(build_stats_payload(count, users=300)).encode()
+        adapter = LocustAdapter(test_file='stub')
+        durations = []
+        for _ in range(repeats):
+            started = time.perf_counter()
+            data = json.loads(body)
+            metrics = LocustAdapter.parse_stats(data)
+            adapter._add_failures(metrics, data.get("errors") or [])
+            adapter._add_endpoints(metrics, data.get("stats") or [])
+            durations.append(time.perf_counter() - started)
+        results[str(count)] = {'payload_bytes': len(body), **_summary(durations)}
+    return results
+
+
+def bench_decide(strategies: list[str], samples: int) -> dict[str, Any]:
+    """decide() по мере роста истории: среднее в первой и последней десятой части"""
+    results = {}
+    history = _synthetic_metrics(samples)
+    for name in strategies:
+        strategy = OrchestratorFactory._build_strategy(name, STRATEGY_PARAMS[name])
+        durations = []
+        for metrics in history:
+            started = time.perf_counter()
+            strategy.decide(metrics)
+            durations.append(time.perf_counter() - started)
+
+        tenth = max(1, len(durations) // 10)
+        first = statistics.fmean(durations[:tenth])
+        last = statistics.fmean(durations[-tenth:])
+        results[name] = {
+            **_summary(durations),
+            'first_tenth_mean_us': first * 1e6,
+            'last_tenth_mean_us': last * 1e6,
+            'growth': last / first if first > 0 else None,
+        }
+    return results
+
+
+def bench_memory(samples: int) -> dict[str, Any]:
+    """Память на один сэмпл истории"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    history = _synthetic_metrics(samples)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    del history
+    return {'samples': samples, 'bytes_total': allocated, 'bytes_per_sample': allocated / samples}
+
+
+def bench_report(samples: int) -> dict[str, Any]:
+    """HTML и JSON-отчёт по истории из samples сэмплов"""
+    history = _synthetic_metrics(samples)
+    result = TestResult(
+        started_at=history[0].timestamp,
+        finished_at=history[-1].timestamp,
+        max_stable_users=history[-1].users,
+        max_stable_rps=history[-1].rps,
+        stop_reason=StopReason.DEGRADATION,
+        history=history,
+    )
+    results = {'samples': samples}
+    for fmt in ('html', 'json'):
+        started = time.perf_counter()
+        output = render(result, fmt)
+        results[fmt] = {'seconds': time.perf_counter() - started, 'bytes': len(output)}
+    return results
+
+
+def bench_e2e(strategies: list[str], endpoints: list[int], samples: int,
+              tick: float, monitoring: float, max_seconds: float) -> dict[str, Any]:
+    """Полный прогон Orchestrator против заглушки Locust"""
+    results = {}
+    for count in endpoints:
+        for name in strategies:
+            with StubLocust(endpoints=count) as stub:
+                config = Config(
+                    adapter=AdapterConfig(type='locust', test_file='stub', host='127.0.0.1', port=stub.port),
+                    strategy=StrategyConfig(type=name, params=STRATEGY_PARAMS[name]),
+                    orchestrator=OrchestratorConfig(
+                        spawn_rate=1000,
+                        monitoring_interval=monitoring,
+                        tick_interval=tick,
+                        stabilization_time=0,
+                    ),
+                )
+                adapter = _StubAdapter(test_file='stub', host='127.0.0.1', port=stub.port)
+                strategy = OrchestratorFactory.create_strategy(config)
+                orchestrator = Orchestrator(config=config, adapter=adapter, strategy=strategy)
+
+                tick_costs: list[float] = []
+                get_stats = _timed(adapter.get_stats, tick_costs)
+                decide = strategy.decide
+                deadline = time.perf_counter() + max_seconds
+
+                def capped_get_stats():
+                    metrics = get_stats()
+                    if len(tick_costs) >= samples or time.perf_counter() > deadline:
+                        orchestrator.stop()
+                    return metrics
+
+                def timed_decide(metrics):
+                    started = time.perf_counter()
+                    try:
+                        return decide(metrics)
+                    finally:
+                        tick_costs[-1] += time.perf_counter() - started
+
+                adapter.get_stats = capped_get_stats
+                strategy.decide = timed_decide
+
+                started = time.perf_counter()
+                result = orchestrator.run()
+                wall = time.perf_counter() - started
+
+                results[f"{name}/{count}"] = {
+                    'strategy': name,
+                    'endpoints': count,
+                    'wall_s': wall,
+                    'samples': len(result.history),
+                    'stop_reason': result.stop_reason.name,
+                    'tick': _summary(tick_costs),
+                    'timings': result.timings,
+                }
+    return results
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any], max_regression: float) -> list[str]:
+    """
+    Сравнить горячие пути с прошлым прогоном
+
+    Returns:
+        Список описаний регрессий (пустой - регрессий нет)
+    """
+    regressions = []
+
+    def check(label: str, new: float | None, old: float | None):
+        if not new or not old:
+            return
+        change = (new - old) / old
+        if change > max_regression:
+            regressions.append(f"{label}: {old:.1f} -> {new:.1f} (+{change * 100:.0f}%)")
+
+    for key, item in current.get('parse', {}).items():
+        check(f"parse[{key}].p50_us", item.get('p50_us'), baseline.get('parse', {}).get(key, {}).get('p50_us'))
+    for key, item in current.get('decide', {}).items():
+        check(f"decide[{key}].mean_us", item.get('mean_us'), baseline.get('decide', {}).get(key, {}).get('mean_us'))
+    for fmt in ('html', 'json'):
+        check(
+            f"report.{fmt}.ms",
+            current.get('report', {}).get(fmt, {}).get('seconds', 0) * 1000,
+            baseline.get('report', {}).get(fmt, {}).get('seconds', 0) * 1000,
+        )
+    check(
+        "memory.bytes_per_sample",
+        current.get('memory', {}).get('bytes_per_sample'),
+        baseline.get('memory', {}).get('bytes_per_sample'),
+    )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Orchestrator overhead benchmarks")
+    parser.add_argument('--endpoints', default='1,10,100,1000', help='Comma-separated endpoint counts')
+    parser.add_argument('--samples', type=int, default=200, help='History length / samples per e2e run')
+    parser.add_argument('--strategies', default='all', help="Comma-separated strategy types or 'all'")
+    parser.add_argument('--repeats', type=int, default=200, help='Repeats for parse benchmark')
+    parser.add_argument('--report-samples', type=int, default=100_000, help='History length for report benchmark')
+    parser.add_argument('--tick', type=float, default=0.005, help='Orchestrator tick interval for e2e runs')
+    parser.add_argument('--monitoring', type=float, default=0.01, help='Monitoring interval for e2e runs')
+    parser.add_argument('--max-seconds', type=float, default=10.0, help='Wall-time cap per e2e run')
+    parser.add_argument('--skip-e2e', action='store_true', help='Only run in-process micro-benchmarks')
+    parser.add_argument('--output', help='Write JSON results to file (stdout if omitted)')
+    parser.add_argument('--baseline', help='Previous JSON results to compare against')
+    parser.add_argument('--max-regression', type=float, default=0.25, help='Allowed slowdown fraction')
+    args = parser.parse_args(argv)
+
+    endpoints = [int(v) for v in args.endpoints.split(',')]
+    strategies = list(STRATEGY_PARAMS) if args.strategies == 'all' else args.strategies.split(',')
+
+    results: dict[str, Any] = {
+        'meta': {
+            'created_at': datetime.now().isoformat(),
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'args': vars(args),
+        },
+    }
+    # Оркестратор и стратегии пишут прогресс в stdout - он нужен только для JSON
+    with contextlib.redirect_stdout(sys.stderr):
+        results['parse'] = bench_parse(endpoints, args.repeats)
+        results['decide'] = bench_decide(strategies, args.samples)
+        results['memory'] = bench_memory(args.samples)
+        results['report'] = bench_report(args.report_samples)
+        if not args.skip_e2e:
+            results['e2e'] = bench_e2e(
+                strategies, endpoints, args.samples, args.tick, args.monitoring, args.max_seconds
+            )
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output)
+    else:
+        print(output)
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.max_regression)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,188 @@
+"""
+Локальная заглушка REST API Locust для бенчмарков оркестратора
+
+Реализует эндпоинты, которые использует LocustAdapter:
+    GET  /                              - готовность
+    POST /swarm                         - user_count, spawn_rate
+    GET  /stop
+    GET  /stats/requests                - статистика по endpoints эндпоинтам + Aggregated
+    GET|POST /orchestrator/arrival_rate - pacing-плагин (открытая модель)
+
+Метрики генерируются простой моделью системы с ёмкостью capacity
+пользователей: после неё растут время ответа и ошибки, поэтому стратегии
+ведут себя как на реальном стенде и рано или поздно останавливаются.
+
+Ответ /stats/requests кэшируется для текущего числа пользователей, чтобы
+в замерах доминировала сторона оркестратора, а не заглушка.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+def build_stats_payload(endpoints: int, users: int, capacity: int = 500) -> dict:
+    """
+    Построить ответ /stats/requests в формате Locust
+
+    Args:
+        endpoints: Количество эндпоинтов в статистике (без Aggregated)
+        users: Текущее количество пользователей
+        capacity: Количество пользователей, после которого система деградирует
+
+    Returns:
+        Словарь, совместимый с ответом Locust
+    """
+    overload = max(0.0, (users - capacity) / capacity)
+    rt = 20.0 * (1 + 4 * overload)
+    fail_ratio = min(0.9, 0.2 * overload)
+    total_rps = users / (rt / 1000 + 1.0) if users else 0.0
+
+    stats = []
+    per_endpoint_rps = total_rps / endpoints
+    for i in range(endpoints):
+        stats.append(_stat_entry(f"/api/endpoint/{i}", rt * (1 + i % 7 / 10), per_endpoint_rps, fail_ratio))
+    stats.append(_stat_entry("Aggregated", rt, total_rps, fail_ratio, method=""))
+
+    return {
+        "state": "running" if users else "ready",
+        "user_count": users,
+        "total_rps": total_rps,
+        "total_fail_per_sec": total_rps * fail_ratio,
+        "fail_ratio": fail_ratio,
+        "current_response_time_percentile_1": rt * 1.5,
+        "current_response_time_percentile_2": rt * 3,
+        "stats": stats,
+        "errors": [],
+        "workers": [],
+    }
+
+
+def _stat_entry(name: str, rt: float, rps: float, fail_ratio: float, method: str = "GET") -> dict:
+    num_requests = int(rps * 60)
+    return {
+        "method": method,
+        "name": name,
+        "safe_name": name,
+        "num_requests": num_requests,
+        "num_failures": int(num_requests * fail_ratio),
+        "avg_response_time": rt,
+        "min_response_time": rt / 4,
+        "max_response_time": rt * 10,
+        "current_rps": rps,
+        "current_fail_per_sec": rps * fail_ratio,
+        "median_response_time": rt,
+        "ninetieth_response_time": rt * 1.3,
+        "ninety_ninth_response_time": rt * 3,
+        "response_time_percentile_0.95": rt * 1.5,
+        "response_time_percentile_0.99": rt * 3,
+        "avg_content_length": 512,
+    }
+
+
+class StubLocust:
+    """
+    HTTP-сервер заглушки в фоновом потоке
+
+    Пример:
+        with StubLocust(endpoints=100) as stub:
+            adapter = LocustAdapter(test_file="x", host="127.0.0.1", port=stub.port)
+    """
+
+    def __init__(self, endpoints: int = 1, capacity: int = 500, host: str = "127.0.0.1", port: int = 0):
+        self.endpoints = endpoints
+        self.capacity = capacity
+        self.users = 0
+        self.arrival_rate = 0.0
+        self.swarm_calls = 0
+
+        self._cache_users: int | None = None
+        self._cache_body = b""
+        self._lock = threading.Lock()
+
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    def start(self) -> "StubLocust":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StubLocust":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def stats_body(self) -> bytes:
+        with self._lock:
+            if self._cache_users != self.users:
+                payload = build_stats_payload(self.endpoints, self.users, self.capacity)
+                self._cache_body = json.dumps(payload).encode()
+                self._cache_users = self.users
+            return self._cache_body
+
+    def _make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True  # Заголовки и тело уходят разными send()
+
+            def log_message(self, format, *args):
+                pass
+
+            def _send(self, body: bytes, content_type: str = "application/json", status: int = 200):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _form(self) -> dict[str, str]:
+                length = int(self.headers.get("Content-Length", 0))
+                data = parse_qs(self.rfile.read(length).decode())
+                return {k: v[0] for k, v in data.items()}
+
+            def do_GET(self):
+                path = urlparse(self.path).path
+                if path == "/":
+                    self._send(b"<html>stub locust</html>", "text/html")
+                elif path == "/stats/requests":
+                    self._send(stub.stats_body())
+                elif path == "/stop":
+                    stub.users = 0
+                    self._send(b'{"success": true}')
+                elif path == "/orchestrator/arrival_rate":
+                    self._send(json.dumps({
+                        "target_rate": stub.arrival_rate,
+                        "offered_rate": stub.arrival_rate,
+                        "missed_rate": 0.0,
+                    }).encode())
+                else:
+                    self._send(b'{}', status=404)
+
+            def do_POST(self):
+                path = urlparse(self.path).path
+                form = self._form()
+                if path == "/swarm":
+                    stub.users = int(float(form.get("user_count", 0)))
+                    stub.swarm_calls += 1
+                    self._send(b'{"success": true, "message": "Swarming started"}')
+                elif path == "/orchestrator/arrival_rate":
+                    stub.arrival_rate = float(form.get("rate", 0))
+                    self._send(json.dumps({"target_rate": stub.arrival_rate}).encode())
+                else:
+                    self._send(b'{}', status=404)
+
+        return Handler
@@ -5,9 +5,15 @@ Load Orchestrator - умная система нагрузочного тест
 from .factory import OrchestratorFactory
 from .config import Config
 from .orchestrator import Orchestrator
+from .instrumentation import OrchestratorHook
+from .clock import Clock, SystemClock, VirtualClock
 
 __all__ = [
     'OrchestratorFactory',
     'Config',
     'Orchestrator',
+    'OrchestratorHook',
+    'Clock',
+    'SystemClock',
+    'VirtualClock',
 ]
\ No newline at end of file
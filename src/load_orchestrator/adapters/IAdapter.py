@@ -1,10 +1,16 @@
 import subprocess
 from abc import ABC, abstractmethod
 
+from ..clock import SYSTEM_CLOCK, Clock
+from ..schedule import LoadSchedule
+
 
 class IAdapter(ABC):
     """Abstract interface for adapters."""
 
+    # Часы для окон метрик и таймстемпов сэмплов (см. use_clock)
+    clock: Clock = SYSTEM_CLOCK
+
     def __init__(self, test_file: str):
         self.test_file = test_file
         self._process: subprocess.Popen | None = None
@@ -33,8 +39,99 @@ class IAdapter(ABC):
 
     @abstractmethod
     def configure(self, **kwargs):
-        """Начало или редактирование нагрузки"""
+        """
+        Начало или редактирование нагрузки
+
+        Закрытая модель: user_count, spawn_rate.
+        Открытая модель: arrival_rate (запросов/сек), если адаптер её поддерживает.
+        """
 
     @abstractmethod
     def is_ready(self):
         pass
+
+    def use_clock(self, clock: Clock) -> None:
+        """
+        Брать время из clock (вызывается оркестратором до launch())
+
+        Обёртки над другими адаптерами передают часы вложенным.
+        """
+        self.clock = clock
+
+    def generator_pids(self) -> list[int]:
+        """Процессы генератора (для контроля его собственной загрузки)"""
+        return [self._process.pid] if self._process else []
+
+    def scale_out(self) -> bool:
+        """
+        Добавить мощности генератору (например, worker в распределённом режиме)
+
+        Returns:
+            True если мощность добавлена, False если адаптер не умеет или упёрся в лимит
+        """
+        return False
+
+    def recycle(self) -> bool:
+        """
+        Подготовить запущенный генератор к следующему тесту без перезапуска
+        (вызывается после stop(), см. daemon.GeneratorPool)
+
+        Returns:
+            True если генератор можно переиспользовать, False - его нужно
+            остановить shutdown() (по умолчанию)
+        """
+        return False
+
+    def min_step_duration(self) -> float:
+        """
+        Минимальное время на одной ступени нагрузки (в секундах)
+
+        Оркестратор не меняет нагрузку чаще, даже если стратегия просит
+        (например, адаптеру нужно успеть обойти несколько целей на ступени).
+
+        Returns:
+            Время в секундах (по умолчанию 0 - без ограничения)
+        """
+        return 0.0
+
+    def min_sampling_interval(self) -> float:
+        """
+        Минимальный осмысленный интервал между get_stats() (в секундах)
+
+        Адаптеры, которым генератор присылает статистику с собственным
+        темпом (поток датаграмм), не получают новых данных чаще: burst-сбор
+        оркестратора (см. sampling) не опускается ниже этого интервала.
+
+        Returns:
+            Интервал в секундах (по умолчанию 0 - данные свежие на каждый вызов)
+        """
+        return 0.0
+
+    def interval_percentiles(self) -> bool:
+        """
+        Отдаёт ли адаптер перцентили за интервал (а не накопленные с начала теста)
+
+        Цели SLO по латентности (см. slo) считают долю медленных запросов
+        интервала - по накопленным перцентилям скорость сжигания бюджета
+        превращается в среднее за весь тест.
+
+        Returns:
+            True если p50/p95/p99 и перцентили RawMetrics.endpoints - за интервал (по умолчанию)
+        """
+        return True
+
+    def push_schedule(self, schedule: LoadSchedule) -> bool:
+        """
+        Передать генератору расписание нагрузки целиком (вызывается до launch)
+
+        Генератор сам меняет нагрузку по своим часам, configure() после
+        start_schedule() не вызывается.
+
+        Returns:
+            True если адаптер умеет исполнять расписание, False иначе
+        """
+        return False
+
+    def start_schedule(self) -> None:
+        """Запустить переданное расписание (отсчёт времени - с этого вызова)"""
+        raise NotImplementedError(f"{type(self).__name__} does not support pushed schedules")
@@ -0,0 +1,213 @@
+import os
+import socket
+import subprocess
+import tempfile
+import time
+
+from ..adapters.IAdapter import IAdapter
+from ..adapters.jtl import JtlTailer, JtlWindow
+from ..adapters.saturation import GeneratorSaturationDetector, ProcessCpuSampler
+from ..analytics.failures import failure_rates
+from ..models import RawMetrics
+
+
+class JMeterAdapter(IAdapter):
+    """
+    Адаптер для Apache JMeter (non-GUI режим)
+
+    Управление нагрузкой на лету - через свойства JMeter, которые
+    меняются командами BeanShell-сервера (setprop). План теста должен
+    читать их функцией __P, например Concurrency Thread Group
+    (jmeter-plugins), который перечитывает значения каждую секунду:
+
+        Target Concurrency: ${__P(threads,0)}
+        Ramp Up Time (sec): ${__P(rampup,0)}
+
+    Открытая модель (configure(arrival_rate=...)) задаёт свойство
+    arrival_rate в запросах/сек - например, для Arrivals Thread Group:
+    Target Rate (arrivals/min) = ${__jexl3(${__P(arrival_rate,0)} * 60)}.
+
+    Метрики строятся по JTL-файлу: на каждом get_stats() дочитываются
+    только новые байты (см. adapters.jtl), перцентили считаются по окну
+    с прошлого вызова.
+    """
+
+    DEFAULT_PORT = 9000  # Порт BeanShell-сервера (сессии на порту + 1)
+    DEFAULT_HOST = "127.0.0.1"
+
+    def __init__(
+        self,
+        test_file: str,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        jmeter: str = "jmeter",
+        results_file: str | None = None,
+        shutdown_port: int = 4445,
+        properties: dict[str, str] | None = None,
+        saturation_cpu: float = 90.0,
+    ):
+        """
+        Args:
+            test_file: Путь к .jmx плану
+            host: Адрес машины с JMeter (0.0.0.0 - локальная)
+            port: Порт BeanShell-сервера
+            jmeter: Команда запуска JMeter
+            results_file: Путь к JTL (по умолчанию - временный файл)
+            shutdown_port: UDP-порт команд non-GUI режима (jmeterengine.nongui.port)
+            properties: Дополнительные свойства JMeter (-J)
+            saturation_cpu: CPU процесса JMeter (% ядра), при котором генератор насыщен
+        """
+        super().__init__(test_file=test_file)
+        self._host = "127.0.0.1" if host == "0.0.0.0" else host
+        self._port = port
+        self._jmeter = jmeter
+        self._shutdown_port = shutdown_port
+        self._properties = properties or {}
+
+        if results_file is None:
+            results_file = os.path.join(tempfile.mkdtemp(prefix="jmeter-"), "results.jtl")
+        self.results_file = results_file
+
+        self._tailer = JtlTailer(results_file)
+        self._window = JtlWindow()
+        self._window_started = self.clock.time()
+        self._threads = 0
+        self._arrival_rate: float | None = None
+
+        self._saturation = GeneratorSaturationDetector(cpu_threshold=saturation_cpu)
+
+    def launch(self):
+        properties = {
+            "threads": "0",
+            "rampup": "0",
+            "arrival_rate": "0",
+            "beanshell.server.port": str(self._port),
+            "jmeterengine.nongui.port": str(self._shutdown_port),
+            # JTL в CSV с заголовком и без буферизации - иначе хвост отстаёт
+            "jmeter.save.saveservice.output_format": "csv",
+            "jmeter.save.saveservice.print_field_names": "true",
+            "jmeter.save.saveservice.autoflush": "true",
+            **self._properties,
+        }
+        # JMeter дописывает в существующий -l файл: строки прошлых запусков
+        # попали бы в первое окно и в total_requests
+        if os.path.exists(self.results_file):
+            os.remove(self.results_file)
+        self._tailer = JtlTailer(self.results_file)
+        self._window = JtlWindow()
+
+        command = [self._jmeter, "-n", "-t", self.test_file, "-l", self.results_file]
+        command += [f"-J{key}={value}" for key, value in properties.items()]
+
+        self._process = subprocess.Popen(command)
+        self._window_started = self.clock.time()
+
+    def is_ready(self):
+        try:
+            with socket.create_connection((self._host, self._port + 1), timeout=1):
+                return True
+        except OSError:
+            return False
+
+    def _setprop(self, **values) -> None:
+        """Выполнить setprop(...) через сессию BeanShell-сервера"""
+        script = "".join(f'setprop("{key}", "{value}");\n' for key, value in values.items())
+        with socket.create_connection((self._host, self._port + 1), timeout=5) as sock:
+            sock.sendall(script.encode())
+            sock.shutdown(socket.SHUT_WR)
+            # Дождаться, пока сервер выполнит скрипт и закроет сессию
+            while sock.recv(4096):
+                pass
+        print(f"JMeter properties: {values}")
+
+    def configure(self, user_count=None, spawn_rate=None, arrival_rate=None):
+        if arrival_rate is not None:
+            self._setprop(arrival_rate=float(arrival_rate))
+            self._arrival_rate = float(arrival_rate)
+            return
+
+        # Ramp-up Concurrency Thread Group задаётся временем, а не темпом
+        delta = abs(user_count - self._threads)
+        rampup = int(round(delta / spawn_rate)) if spawn_rate else 0
+        self._setprop(rampup=rampup, threads=user_count)
+        self._threads = user_count
+
+    def stop(self):
+        # Штатная остановка non-GUI теста (как shutdown.sh)
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.sendto(b"Shutdown", (self._host, self._shutdown_port))
+        self._threads = 0
+        self._arrival_rate = None
+
+    def get_stats(self):
+        self._tailer.read(self._window)
+
+        now = self.clock.time()
+        metrics = self.build_metrics(
+            self._window,
+            duration=now - self._window_started,
+            total_requests=self._tailer.total_requests,
+            total_failures=self._tailer.total_failures,
+            users=self._running_threads(),
+            offered_rps=self._arrival_rate,
+            timestamp=now,
+        )
+        self._window = JtlWindow()
+        self._window_started = now
+
+        return self._saturation.observe(metrics, self.generator_pids())
+
+    def _running_threads(self) -> int:
+        """Фактически запущенные потоки по JTL (заданные - если JTL их не пишет)"""
+        if self._tailer.last_threads is not None:
+            return self._tailer.last_threads
+        return self._threads
+
+    @staticmethod
+    def build_metrics(
+        window: JtlWindow,
+        duration: float,
+        total_requests: int,
+        total_failures: int,
+        users: int,
+        offered_rps: float | None = None,
+        timestamp: float | None = None,
+    ) -> RawMetrics:
+        """
+        Построить RawMetrics по окну JTL
+
+        Args:
+            window: Сэмплы с прошлого вызова
+            duration: Длительность окна (сек)
+            total_requests: Запросов за весь тест
+            total_failures: Ошибок за весь тест
+            users: Запущенные потоки
+            offered_rps: Предложенная нагрузка в открытой модели
+            timestamp: Момент снятия (по умолчанию - текущее время)
+
+        Returns:
+            RawMetrics за окно
+        """
+        histogram = window.histogram
+        return RawMetrics(
+            timestamp=time.time() if timestamp is None else timestamp,
+            users=users,
+            rps=window.count / duration if duration > 0 else 0.0,
+            rt_avg=window.rt_avg,
+            p50=histogram.percentile(0.50),
+            p95=histogram.percentile(0.95),
+            p99=histogram.percentile(0.99),
+            error_rate=window.failures / window.count * 100 if window.count else 0.0,
+            total_requests=total_requests,
+            failed_requests=total_failures,
+            offered_rps=offered_rps,
+            failures=failure_rates(window.signatures, window.count),
+            endpoints=window.endpoints(),
+        )
+
+    def generator_pids(self) -> list[int]:
+        # jmeter - shell-скрипт, сама JVM - его потомок
+        pids = super().generator_pids()
+        for pid in list(pids):
+            pids.extend(ProcessCpuSampler.children(pid))
+        return pids
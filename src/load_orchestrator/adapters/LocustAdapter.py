@@ -1,26 +1,242 @@
+import os
 import subprocess
+import tempfile
+from dataclasses import replace
 from datetime import datetime
 
 from ..adapters.IAdapter import IAdapter
+from ..adapters.saturation import GeneratorSaturationDetector, ProcessCpuSampler
+from ..adapters.stream import IntervalStreamReader, SOCKET_ENV, INTERVAL_ENV
+from ..analytics.failures import CumulativeFailures, SpaceSaving, failure_rates
+from ..analytics.latency import LatencyHistogram
 import requests as rq
 from ..models import RawMetrics
+from ..schedule import LoadSchedule
 
 class LocustAdapter(IAdapter):
+    """
+    Адаптер для Locust (управление через REST API веб-интерфейса)
+
+    Поддерживает две модели нагрузки:
+    - закрытая: configure(user_count, spawn_rate) - количество пользователей
+    - открытая: configure(arrival_rate) - запросов в секунду. Запускается пул
+      из pool_users пользователей, темп задаёт pacing-плагин
+      (load_orchestrator.locust_plugin.PacedHttpUser) через свой эндпоинт.
+      get_stats() отдаёт и фактический rps, и предложенный offered_rps.
+
+    Распределённый режим (workers > 0): запускается master и workers
+    процессов-worker'ов; scale_out() добавляет worker'ов до max_workers.
+
+    Если в locustfile подключён плагин load_orchestrator.locust_plugin.latency,
+    get_stats() дополняет метрики перцентилями с коррекцией coordinated
+    omission (p50_corrected/p95_corrected/p99_corrected).
+
+    Потоковый режим (stream: true): вместо опроса /stats/requests адаптер
+    принимает интервальные гистограммы от плагина
+    load_orchestrator.locust_plugin.stream по Unix-сокету (плагин
+    добавляется в -f автоматически). Веб-интерфейс остаётся для управления.
+
+    Расписание (push_schedule): предвычисленная нагрузка записывается в
+    сгенерированный locustfile с LoadTestShape и добавляется в -f; переходы
+    выполняет сам Locust. В основном locustfile не должно быть своего
+    LoadTestShape.
+
+    Ошибки интервала сводятся в сигнатуры (RawMetrics.failures): в REST-режиме
+    из накопительного списка errors того же ответа /stats/requests, в
+    потоковом - из top-k сигнатур в датаграммах плагина.
+
+    get_stats() проверяет насыщение самого генератора (CPU процессов из /proc
+    и закон Литтла) и помечает метрики generator_saturated.
+    """
 
     DEFAULT_PORT = 8089
     DEFAULT_HOST = "0.0.0.0"
-    def __init__(self, test_file: str, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+    ARRIVAL_RATE_PATH = "/orchestrator/arrival_rate"
+    LATENCY_PATH = "/orchestrator/latency"
+
+    def __init__(
+        self,
+        test_file: str,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        pool_users: int = 100,
+        workers: int = 0,
+        max_workers: int | None = None,
+        master_port: int = 5557,
+        saturation_cpu: float = 90.0,
+        stream: bool = False,
+        stream_interval: float = 1.0,
+        target_host: str | None = None,
+    ):
+        """
+        Args:
+            test_file: Путь к locustfile
+            host: Хост веб-интерфейса Locust
+            port: Порт веб-интерфейса Locust
+            pool_users: Размер пула пользователей в открытой модели
+                (должен покрывать arrival_rate * время ответа)
+            workers: Количество worker'ов (0 - одиночный процесс)
+            max_workers: Лимит worker'ов для scale_out (по умолчанию количество CPU)
+            master_port: Порт связи master-worker
+            saturation_cpu: CPU процесса генератора (% ядра), при котором он насыщен
+            stream: Получать метрики потоком по Unix-сокету вместо REST-опроса
+            stream_interval: Интервал отправки статистики плагином (сек)
+            target_host: Адрес тестируемой системы (--host Locust; по умолчанию из locustfile)
+        """
         super().__init__(test_file=test_file)
         self._port = port
         self._session = rq.Session()
         self._host = f"http://{host}:{self._port}"
 
+        self._pool_users = pool_users
+        self._pool_started = False
+        self._arrival_rate: float | None = None
+        self._latency_plugin = True  # Сбрасывается, если эндпоинт плагина не найден
+
+        self._workers_count = workers
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._master_port = master_port
+        self._workers: list[subprocess.Popen] = []
+
+        self._saturation = GeneratorSaturationDetector(cpu_threshold=saturation_cpu)
+
+        self._stream_enabled = stream
+        self._stream_interval = stream_interval
+        self._stream: IntervalStreamReader | None = None
+        self._stream_window_started = self.clock.time()
+        self._stream_last: RawMetrics | None = None  # Последнее окно с датаграммами
+
+        self._shape_file: str | None = None
+        self._schedule: LoadSchedule | None = None
+
+        self._target_host = target_host
+
+        self._failures = CumulativeFailures()
+        self._last_total_requests = 0
+        self._endpoint_totals: dict[str, tuple[int, int]] = {}  # эндпоинт -> накопленные (запросы, ошибки)
+
+    def _locustfiles(self) -> str:
+        files = [self.test_file]
+        if self._stream_enabled:
+            # Путь без импорта: пакет locust_plugin импортирует locust (и gevent monkey-patching)
+            files.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), "locust_plugin", "stream.py"))
+        if self._shape_file is not None:
+            files.append(self._shape_file)
+        return ",".join(files)
+
+    def interval_percentiles(self) -> bool:
+        """Перцентили за интервал - только в потоковом режиме (REST отдаёт накопленные)"""
+        return self._stream_enabled
+
+    def min_sampling_interval(self) -> float:
+        """В потоковом режиме плагин присылает статистику раз в stream_interval"""
+        return self._stream_interval if self._stream_enabled else 0.0
+
+    def push_schedule(self, schedule: LoadSchedule) -> bool:
+        """Сгенерировать LoadTestShape по расписанию (подключается при launch)"""
+        self._shape_file = os.path.join(tempfile.mkdtemp(prefix="locust-shape-"), "orchestrator_shape.py")
+        with open(self._shape_file, "w", encoding="utf-8") as f:
+            f.write(schedule.to_locust_shape())
+        self._schedule = schedule
+        print(f"📅 Load schedule: {len(schedule.steps)} steps, {schedule.duration:.0f}s -> {self._shape_file}")
+        return True
+
+    def start_schedule(self) -> None:
+        """Запустить LoadTestShape: с shape-классом /swarm стартует расписание"""
+        first = self._schedule.steps[0]
+        r = self._session.post(
+            f"{self._host}/swarm", data=dict(user_count=first.users, spawn_rate=first.spawn_rate)
+        )
+        print(r.text)
+
+    def _env(self) -> dict[str, str] | None:
+        if self._stream is None:
+            return None
+        return {
+            **os.environ,
+            SOCKET_ENV: self._stream.path,
+            INTERVAL_ENV: str(self._stream_interval),
+        }
+
     def launch(self):
-        self._process = subprocess.Popen([
+        if self._stream_enabled:
+            path = os.path.join(tempfile.mkdtemp(prefix="locust-stream-"), "stats.sock")
+            self._stream = IntervalStreamReader(path)
+            self._stream_window_started = self.clock.time()
+
+        command = [
             "locust",
-            "-f", self.test_file,
+            "-f", self._locustfiles(),
             "--web-port", str(self._port),
-        ])
+        ]
+        if self._target_host:
+            command += ["--host", self._target_host]
+        if self._workers_count > 0:
+            command += ["--master", "--master-bind-port", str(self._master_port)]
+
+        self._process = subprocess.Popen(command, env=self._env())
+        for _ in range(self._workers_count):
+            self._launch_worker()
+
+    def _launch_worker(self):
+        command = [
+            "locust",
+            "-f", self._locustfiles(),
+            "--worker",
+            "--master-host", "127.0.0.1",
+            "--master-port", str(self._master_port),
+        ]
+        if self._target_host:
+            command += ["--host", self._target_host]
+        self._workers.append(subprocess.Popen(command, env=self._env()))
+
+    def scale_out(self) -> bool:
+        """Добавить worker (только в распределённом режиме и до max_workers)"""
+        if self._workers_count == 0 or len(self._workers) >= self._max_workers:
+            return False
+        self._launch_worker()
+        print(f"➕ Added Locust worker: {len(self._workers)}/{self._max_workers}")
+        return True
+
+    def generator_pids(self) -> list[int]:
+        pids = super().generator_pids()
+        for pid in list(pids):
+            pids.extend(ProcessCpuSampler.children(pid))
+        pids.extend(worker.pid for worker in self._workers)
+        return pids
+
+    def shutdown(self):
+        for worker in self._workers:
+            worker.terminate()
+            worker.wait()
+        self._workers = []
+        super().shutdown()
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+    def recycle(self) -> bool:
+        """Сбросить статистику Locust и состояние адаптера; процесс остаётся запущенным"""
+        if self._process is None or self._process.poll() is not None:
+            return False
+        if self._shape_file is not None:
+            return False  # LoadTestShape вшит в процесс через -f
+        try:
+            self._session.get(f"{self._host}/stats/reset")
+        except rq.RequestException:
+            return False
+
+        self._pool_started = False
+        self._arrival_rate = None
+        self._failures.reset()
+        self._last_total_requests = 0
+        self._endpoint_totals = {}
+        self._saturation = GeneratorSaturationDetector(cpu_threshold=self._saturation.cpu_threshold)
+        if self._stream is not None:
+            self._stream.drain()
+        self._stream_window_started = self.clock.time()
+        self._stream_last = None
+        return True
 
     def is_ready(self):
         try:
@@ -30,23 +246,202 @@ class LocustAdapter(IAdapter):
         return r.status_code == 200
 
 
-    def configure(self, user_count, spawn_rate):
+    def configure(self, user_count=None, spawn_rate=None, arrival_rate=None):
+        if arrival_rate is not None:
+            self._configure_arrival_rate(arrival_rate, spawn_rate)
+            return
+
         r = self._session.post(f"{self._host}/swarm", data=dict(user_count=user_count, spawn_rate=spawn_rate))
         print(r.text)
 
+    def _configure_arrival_rate(self, arrival_rate, spawn_rate=None):
+        """
+        Открытая модель: запустить пул пользователей (один раз) и задать темп
+
+        Raises:
+            RuntimeError: Если в locustfile не подключён pacing-плагин
+        """
+        if not self._pool_started:
+            r = self._session.post(
+                f"{self._host}/swarm",
+                data=dict(user_count=self._pool_users, spawn_rate=spawn_rate or self._pool_users)
+            )
+            print(r.text)
+            self._pool_started = True
+
+        r = self._session.post(f"{self._host}{self.ARRIVAL_RATE_PATH}", data=dict(rate=arrival_rate))
+        if r.status_code == 404:
+            raise RuntimeError(
+                "Arrival-rate mode requires PacedHttpUser from load_orchestrator.locust_plugin "
+                "in the locustfile"
+            )
+        self._arrival_rate = float(arrival_rate)
+        print(r.text)
+
     def stop(self):
         self._session.get(f"{self._host}/stop")
+        self._pool_started = False
+        self._arrival_rate = None
 
     def get_stats(self):
-        r = self._session.get(f"{self._host}/stats/requests")
-        data = r.json()
+        # Открытая модель: сколько запросов генератор пытался отправить
+        offered_rps = None
+        if self._arrival_rate is not None:
+            pacing = self._session.get(f"{self._host}{self.ARRIVAL_RATE_PATH}").json()
+            offered_rps = pacing.get("offered_rate", self._arrival_rate)
+
+        if self._stream is not None:
+            metrics = self._stream_stats(offered_rps)
+        else:
+            r = self._session.get(f"{self._host}/stats/requests")
+            data = r.json()
+            metrics = self.parse_stats(data, offered_rps=offered_rps, timestamp=self.clock.time())
+            self._add_failures(metrics, data.get("errors") or [])
+            self._add_endpoints(metrics, data.get("stats") or [])
+        if self._latency_plugin:
+            self._add_corrected_latency(metrics)
+        return self._saturation.observe(metrics, self.generator_pids())
+
+    def _add_failures(self, metrics: RawMetrics, errors: list[dict]) -> None:
+        """Сигнатуры ошибок интервала из накопительного списка errors (уже пришёл в /stats/requests)"""
+        interval = self._failures.update((e.get("error", ""), e.get("occurrences", 0)) for e in errors)
+        requests = metrics.total_requests - self._last_total_requests
+        if requests < 0:
+            requests = metrics.total_requests
+        self._last_total_requests = metrics.total_requests
+        metrics.failures = failure_rates(interval, requests)
 
+    def _add_endpoints(self, metrics: RawMetrics, stats: list[dict]) -> None:
+        """
+        Эндпоинты за интервал для SLO (см. slo)
+
+        Запросы и ошибки - разность накопленных счётчиков Locust; перцентили
+        Locust отдаёт накопленными с начала теста (как и для Aggregated).
+        """
+        totals = {}
+        for entry in stats:
+            if entry.get("name") == "Aggregated":
+                continue
+            name = f"{entry.get('method') or ''} {entry.get('name')}".strip()
+            requests, failures = entry.get("num_requests", 0), entry.get("num_failures", 0)
+            totals[name] = (requests, failures)
+
+            previous_requests, previous_failures = self._endpoint_totals.get(name, (0, 0))
+            if requests < previous_requests:
+                previous_requests = previous_failures = 0  # Статистику генератора сбросили
+            metrics.endpoints[name] = {
+                'requests': requests - previous_requests,
+                'failures': max(0, failures - previous_failures),
+                'p50': entry.get("median_response_time") or 0,
+                'p95': entry.get("response_time_percentile_0.95") or 0,
+                'p99': entry.get("response_time_percentile_0.99") or 0,
+                'max': entry.get("max_response_time") or 0,
+            }
+        self._endpoint_totals = totals
+
+    def _stream_stats(self, offered_rps: float | None = None) -> RawMetrics:
+        """
+        Метрики за окно с прошлого вызова по датаграммам плагина stream
+
+        Если датаграмм ещё нет (опрос чаще stream_interval или сдвиг фаз
+        отправки и опроса), окно не закрывается, а повторяется прошлое:
+        пустое окно дало бы rps=0 при ненулевых пользователях (оркестратор
+        принял бы это за отказ системы), а следующее - завышенный rps.
+        Без датаграмм дольше двух stream_interval окно отдаётся как есть.
+        """
+        lost = self._stream.lost
+        samples = self._stream.drain()
+        if self._stream.lost > lost:
+            print(f"⚠️  Stream: {self._stream.lost - lost} interval(s) lost by the generator "
+                  f"({self._stream.lost} total), rps and counters are understated")
+        now = self.clock.time()
+        if not samples and self._stream_last is not None and \
+                now - self._stream_window_started < 2 * self._stream_interval:
+            return replace(self._stream_last, timestamp=now, offered_rps=offered_rps)
+
+        histogram = LatencyHistogram()
+        signatures = SpaceSaving()
+        endpoints: dict[str, list] = {}  # "<метод> <имя>" -> [гистограмма, ошибки]
+        requests = failures = 0
+        elapsed_sum = 0.0
+        for sample in samples:
+            histogram.merge(sample.histogram)
+            requests += sample.requests
+            failures += sample.failures
+            elapsed_sum += sample.elapsed_sum
+            for signature, count in sample.signatures.items():
+                signatures.add(signature, count)
+            for name, (endpoint, endpoint_failures) in sample.endpoints.items():
+                merged = endpoints.setdefault(name, [LatencyHistogram(precision=endpoint.precision), 0])
+                merged[0].merge(endpoint)
+                merged[1] += endpoint_failures
+
+        duration = now - self._stream_window_started
+        self._stream_window_started = now
+
+        metrics = RawMetrics(
+            timestamp=now,
+            users=self._stream.users,
+            rps=requests / duration if duration > 0 else 0.0,
+            rt_avg=elapsed_sum / requests if requests else 0.0,
+            p50=histogram.percentile(0.50),
+            p95=histogram.percentile(0.95),
+            p99=histogram.percentile(0.99),
+            error_rate=failures / requests * 100 if requests else 0.0,
+            total_requests=self._stream.total_requests,
+            failed_requests=self._stream.total_failures,
+            offered_rps=offered_rps,
+            failures=failure_rates(signatures, requests),
+            endpoints={
+                name: {
+                    'requests': endpoint.count,
+                    'failures': endpoint_failures,
+                    'p50': endpoint.percentile(0.50),
+                    'p95': endpoint.percentile(0.95),
+                    'p99': endpoint.percentile(0.99),
+                    'max': endpoint.max,
+                }
+                for name, (endpoint, endpoint_failures) in endpoints.items()
+            },
+        )
+        self._stream_last = metrics if samples else None
+        return metrics
+
+    def _add_corrected_latency(self, metrics: RawMetrics) -> None:
+        """Перцентили без coordinated omission из плагина latency (за окно с прошлого вызова)"""
+        r = self._session.get(f"{self._host}{self.LATENCY_PATH}")
+        if r.status_code == 404:
+            self._latency_plugin = False
+            return
+
+        window = r.json()
+        corrected = window.get("corrected")
+        if not window.get("count") or corrected is None:
+            return  # Нет запросов или коррекция выключена (интервал неизвестен)
+        metrics.p50_corrected = corrected["p50"]
+        metrics.p95_corrected = corrected["p95"]
+        metrics.p99_corrected = corrected["p99"]
+
+    @staticmethod
+    def parse_stats(data: dict, offered_rps: float | None = None, timestamp: float | None = None) -> RawMetrics:
+        """
+        Построить RawMetrics из ответа /stats/requests
+
+        Args:
+            data: Распарсенный JSON ответа Locust
+            offered_rps: Предложенная нагрузка в открытой модели
+            timestamp: Момент снятия (по умолчанию - текущее время)
+
+        Returns:
+            RawMetrics по строке Aggregated
+        """
         aggregated = next(
         (s for s in data.get("stats", []) if s.get("name") == "Aggregated"),
         {}
         )
+
         return RawMetrics(
-            timestamp=datetime.now().timestamp(),
+            timestamp=datetime.now().timestamp() if timestamp is None else timestamp,
             users=data.get("user_count", 0),
             rps=data.get("total_rps", 0),
             rt_avg=aggregated.get("avg_response_time", 0),  # Среднее время ответа
@@ -55,6 +450,8 @@ class LocustAdapter(IAdapter):
             p99=aggregated.get("response_time_percentile_0.99", 0),
             error_rate=data.get("fail_ratio", 0) * 100,  # fail_ratio это 0.0-1.0, переводим в %
             total_requests=aggregated.get("num_requests", 0),
-            failed_requests=aggregated.get("num_failures", 0)
+            failed_requests=aggregated.get("num_failures", 0),
+            offered_rps=offered_rps,
+            cumulative_percentiles=True,  # Перцентили Locust накоплены с начала теста
         )
 
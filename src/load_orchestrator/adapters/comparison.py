@@ -0,0 +1,254 @@
+"""
+A/B-сравнение: один оркестратор, две цели
+
+Прогоны baseline и candidate друг за другом смешивают разницу сборок с
+шумом общей инфраструктуры в разное время суток. ComparisonAdapter
+оборачивает два адаптера (A - baseline, B - candidate) и ведёт их на
+одних и тех же ступенях нагрузки:
+
+- simultaneous: обе цели под нагрузкой одновременно, пара сэмплов на
+  каждый get_stats();
+- interleaved: нагрузка только на одной цели, цели меняются каждые slice
+  секунд в порядке ABBA (линейный дрейф фона поровну делится между A и B);
+  пара - средние двух соседних срезов на одной нагрузке, поэтому ступень
+  держится не меньше двух срезов (min_step_duration). Первые
+  settle_samples сэмплов среза (рампа после переключения) в пары не идут.
+  Стратегии, меняющие нагрузку по своим часам (get_setpoint), ступени
+  не удлиняют - для них подходит simultaneous.
+
+Стратегия видит одну «худшую» картину (simultaneous: минимум rps, максимум
+задержек и ошибок по двум целям, сигнатуры ошибок и эндпоинты обеих целей;
+interleaved: активная цель), а парные
+сэмплы копятся в pairs для статистического вывода
+(analytics.comparison).
+"""
+
+from .IAdapter import IAdapter
+from ..clock import Clock
+from ..models import RawMetrics
+
+COMPARISON_MODES = ('simultaneous', 'interleaved')
+
+# Метрики, которые сравниваются в парах
+PAIRED_METRICS = ('rps', 'rt_avg', 'p50', 'p95', 'p99', 'error_rate')
+
+
+class PairedSample:
+    """Пара наблюдений A и B на одной нагрузке"""
+
+    __slots__ = ('load', 'timestamp', 'a', 'b')
+
+    def __init__(self, load: int, timestamp: float, a: dict[str, float], b: dict[str, float]):
+        self.load = load
+        self.timestamp = timestamp
+        self.a = a
+        self.b = b
+
+
+def _values(metrics: RawMetrics) -> dict[str, float]:
+    return {name: getattr(metrics, name) for name in PAIRED_METRICS}
+
+
+def _mean(samples: list[RawMetrics]) -> dict[str, float]:
+    return {name: sum(getattr(m, name) for m in samples) / len(samples) for name in PAIRED_METRICS}
+
+
+def _worst_failures(a: dict[str, float], b: dict[str, float]) -> dict[str, float]:
+    """Сигнатуры ошибок обеих целей: доля запросов - по худшей цели"""
+    return {signature: max(a.get(signature, 0.0), b.get(signature, 0.0)) for signature in a.keys() | b.keys()}
+
+
+def _worst_endpoints(a: dict[str, dict[str, float]], b: dict[str, dict[str, float]]) -> dict[str, dict[str, float]]:
+    """Эндпоинты обеих целей как агрегат: счётчики - сумма, перцентили - худшая цель"""
+    merged = {}
+    for name in a.keys() | b.keys():
+        sides = [side[name] for side in (a, b) if name in side]
+        merged[name] = {
+            key: sum(s.get(key, 0) for s in sides) if key in ('requests', 'failures') else max(s.get(key, 0) for s in sides)
+            for key in {key for s in sides for key in s}
+        }
+    return merged
+
+
+class ComparisonAdapter(IAdapter):
+    """Два адаптера на одних ступенях нагрузки (A - baseline, B - candidate)"""
+
+    def __init__(
+        self,
+        a: IAdapter,
+        b: IAdapter,
+        mode: str = 'simultaneous',
+        slice_duration: float = 10.0,
+        settle_samples: int = 1,
+        labels: tuple[str, str] = ('A', 'B'),
+    ):
+        """
+        Args:
+            a: Адаптер baseline
+            b: Адаптер candidate
+            mode: simultaneous или interleaved
+            slice_duration: Длительность среза в режиме interleaved (сек)
+            settle_samples: Сколько первых сэмплов среза не учитывать (interleaved)
+            labels: Имена целей в отчёте
+        """
+        if mode not in COMPARISON_MODES:
+            raise ValueError(f"Invalid comparison mode: '{mode}'. Supported: {', '.join(COMPARISON_MODES)}")
+        super().__init__(test_file=a.test_file)
+        self.a = a
+        self.b = b
+        self.mode = mode
+        self.slice_duration = slice_duration
+        self.settle_samples = settle_samples
+        self.labels = labels
+
+        self.pairs: list[PairedSample] = []
+        self._load: dict | None = None  # Последние параметры configure()
+
+        # interleaved: текущий срез и незакрытая половина пары
+        self._slice_index = 0
+        self._slice_started = 0.0
+        self._slice_samples: list[RawMetrics] = []
+        self._slice_seen = 0
+        self._half: tuple[str, int, dict[str, float]] | None = None
+
+    @property
+    def active(self) -> str:
+        """Цель под нагрузкой в режиме interleaved: порядок ABBA"""
+        return 'a' if self._slice_index % 4 in (0, 3) else 'b'
+
+    def _adapter(self, side: str) -> IAdapter:
+        return self.a if side == 'a' else self.b
+
+    @staticmethod
+    def _idle(load: dict) -> dict:
+        """Те же параметры configure(), но без нагрузки"""
+        if load.get('arrival_rate') is not None:
+            return {**load, 'arrival_rate': 0}
+        return {**load, 'user_count': 0}
+
+    def use_clock(self, clock: Clock) -> None:
+        super().use_clock(clock)
+        self.a.use_clock(clock)
+        self.b.use_clock(clock)
+
+    def launch(self):
+        self.a.launch()
+        self.b.launch()
+
+    def is_ready(self):
+        return self.a.is_ready() and self.b.is_ready()
+
+    def configure(self, **kwargs):
+        if self.mode == 'simultaneous':
+            self._load = kwargs
+            self.a.configure(**kwargs)
+            self.b.configure(**kwargs)
+            return
+
+        # Новая ступень - новый срез той же (активной) цели
+        self._close_slice()
+        self._load = kwargs
+        self._adapter(self.active).configure(**kwargs)
+        self._slice_started = self.clock.time()
+
+    def stop(self):
+        if self.mode == 'interleaved':
+            self._close_slice()  # Последний срез может закрыть пару
+        self.a.stop()
+        self.b.stop()
+
+    def shutdown(self):
+        self.a.shutdown()
+        self.b.shutdown()
+
+    def generator_pids(self) -> list[int]:
+        return self.a.generator_pids() + self.b.generator_pids()
+
+    def scale_out(self) -> bool:
+        scaled_a = self.a.scale_out()
+        scaled_b = self.b.scale_out()
+        return scaled_a or scaled_b
+
+    def interval_percentiles(self) -> bool:
+        return self.a.interval_percentiles() and self.b.interval_percentiles()
+
+    def min_sampling_interval(self) -> float:
+        return max(self.a.min_sampling_interval(), self.b.min_sampling_interval())
+
+    def min_step_duration(self) -> float:
+        """interleaved: ступень держится хотя бы срез A и срез B"""
+        return 2 * self.slice_duration if self.mode == 'interleaved' else 0.0
+
+    def _load_value(self) -> int:
+        load = self._load or {}
+        value = load.get('arrival_rate')
+        return int(value if value is not None else load.get('user_count') or 0)
+
+    def get_stats(self):
+        if self.mode == 'simultaneous':
+            return self._simultaneous_stats()
+        return self._interleaved_stats()
+
+    def _simultaneous_stats(self) -> RawMetrics:
+        a = self.a.get_stats()
+        b = self.b.get_stats()
+        self.pairs.append(PairedSample(self._load_value(), b.timestamp, _values(a), _values(b)))
+
+        # Стратегия решает по худшей из двух целей
+        worst = RawMetrics(
+            timestamp=b.timestamp,
+            users=min(a.users, b.users),
+            rps=min(a.rps, b.rps),
+            rt_avg=max(a.rt_avg, b.rt_avg),
+            p50=max(a.p50, b.p50),
+            p95=max(a.p95, b.p95),
+            p99=max(a.p99, b.p99),
+            failed_requests=a.failed_requests + b.failed_requests,
+            error_rate=max(a.error_rate, b.error_rate),
+            total_requests=a.total_requests + b.total_requests,
+            generator_saturated=a.generator_saturated or b.generator_saturated,
+            cumulative_percentiles=a.cumulative_percentiles or b.cumulative_percentiles,
+            failures=_worst_failures(a.failures, b.failures),
+            endpoints=_worst_endpoints(a.endpoints, b.endpoints),
+        )
+        for name in ('generator_cpu', 'offered_rps', 'p50_corrected', 'p95_corrected', 'p99_corrected'):
+            values = [getattr(m, name) for m in (a, b) if getattr(m, name) is not None]
+            setattr(worst, name, max(values) if values else None)
+        return worst
+
+    def _interleaved_stats(self) -> RawMetrics:
+        metrics = self._adapter(self.active).get_stats()
+
+        self._slice_seen += 1
+        if self._slice_seen > self.settle_samples:
+            self._slice_samples.append(metrics)
+
+        if self._load is not None and self.clock.time() - self._slice_started >= self.slice_duration:
+            self._switch()
+        return metrics
+
+    def _close_slice(self) -> None:
+        """Закрыть срез: его среднее - половина пары (или пара целиком)"""
+        if self._slice_samples:
+            side = self.active
+            mean = _mean(self._slice_samples)
+            load = self._load_value()
+            if self._half is not None and self._half[0] != side and self._half[1] == load:
+                a, b = (self._half[2], mean) if side == 'b' else (mean, self._half[2])
+                self.pairs.append(PairedSample(load, self.clock.time(), a, b))
+                self._half = None
+            else:
+                self._half = (side, load, mean)
+
+        self._slice_samples = []
+        self._slice_seen = 0
+
+    def _switch(self) -> None:
+        """Переключить нагрузку на другую цель"""
+        self._close_slice()
+        previous = self.active
+        self._slice_index += 1
+        if self.active != previous:
+            self._adapter(previous).configure(**self._idle(self._load))
+            self._adapter(self.active).configure(**self._load)
+        self._slice_started = self.clock.time()
@@ -0,0 +1,208 @@
+"""
+Инкрементальное чтение JTL (CSV-результатов JMeter)
+
+JtlTailer помнит смещение в файле и на каждом тике читает только новые
+байты: файл в несколько гигабайт не перечитывается и не перепарсивается.
+Неполная последняя строка (JMeter дописывает её прямо сейчас) остаётся в
+буфере до следующего чтения. Строки разбираются потоково и сразу
+складываются в окно (JtlWindow) - сами сэмплы не хранятся.
+"""
+
+import csv
+import os
+
+from ..analytics.failures import SpaceSaving, normalize
+from ..analytics.latency import LatencyHistogram
+
+# Порядок колонок JTL по умолчанию (jmeter.save.saveservice.* = true)
+DEFAULT_COLUMNS = [
+    'timeStamp', 'elapsed', 'label', 'responseCode', 'responseMessage',
+    'threadName', 'dataType', 'success', 'failureMessage', 'bytes',
+    'sentBytes', 'grpThreads', 'allThreads', 'URL', 'Latency', 'IdleTime', 'Connect',
+]
+
+READ_CHUNK = 1 << 20  # Сколько байт читать за раз
+MAX_LABELS = 200  # Сколько разных label держать по отдельности (остальные - только в агрегате)
+
+
+class JtlWindow:
+    """Агрегаты сэмплов JTL за окно между двумя get_stats()"""
+
+    def __init__(self):
+        self.histogram = LatencyHistogram()
+        self.count = 0
+        self.failures = 0
+        self.signatures = SpaceSaving()  # Top-k сигнатур ошибок окна
+        self.elapsed_total = 0.0
+        self.threads = 0
+        self.first_timestamp: float | None = None
+        self.last_timestamp: float | None = None
+        # label -> [гистограмма, ошибки] для SLO по эндпоинтам
+        self.labels: dict[str, list] = {}
+
+    def add(
+        self,
+        elapsed: float,
+        success: bool,
+        threads: int | None,
+        timestamp: float,
+        message: str = "",
+        label: str | None = None,
+    ) -> None:
+        self.histogram.record(elapsed)
+        if label is not None:
+            entry = self.labels.get(label)
+            if entry is None and len(self.labels) < MAX_LABELS:
+                entry = self.labels[label] = [LatencyHistogram(), 0]
+            if entry is not None:
+                entry[0].record(elapsed)
+                entry[1] += not success
+        self.count += 1
+        self.elapsed_total += elapsed
+        if not success:
+            self.failures += 1
+            self.signatures.add(normalize(message))
+        if threads is not None:
+            self.threads = threads
+        if self.first_timestamp is None:
+            self.first_timestamp = timestamp
+        self.last_timestamp = timestamp
+
+    @property
+    def rt_avg(self) -> float:
+        return self.elapsed_total / self.count if self.count else 0.0
+
+    def endpoints(self) -> dict[str, dict[str, float]]:
+        """Окно по label: {label: {requests, failures, p50, p95, p99, max}}"""
+        return {
+            label: {
+                'requests': histogram.count,
+                'failures': failures,
+                'p50': histogram.percentile(0.50),
+                'p95': histogram.percentile(0.95),
+                'p99': histogram.percentile(0.99),
+                'max': histogram.max,
+            }
+            for label, (histogram, failures) in self.labels.items()
+        }
+
+
+class JtlTailer:
+    """Хвост JTL-файла: новые байты -> строки CSV -> JtlWindow"""
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Путь к JTL-файлу (может ещё не существовать)
+        """
+        self.path = path
+        self.offset = 0
+        self.columns: list[str] | None = None
+        self._index: dict[str, int] = {}
+        self._buffer = b""
+
+        # Накопительные счётчики за весь тест
+        self.total_requests = 0
+        self.total_failures = 0
+        self.last_threads: int | None = None  # allThreads последнего сэмпла
+
+    def _set_columns(self, columns: list[str]) -> None:
+        self.columns = columns
+        self._index = {name: i for i, name in enumerate(columns)}
+
+    def read(self, window: JtlWindow) -> int:
+        """
+        Дочитать новые строки в окно
+
+        Args:
+            window: Окно, в которое складываются сэмплы
+
+        Returns:
+            Сколько сэмплов добавлено
+        """
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            return 0
+
+        if size < self.offset:
+            # Файл пересоздан (новый запуск JMeter) - читаем с начала
+            self.offset = 0
+            self._buffer = b""
+            self.columns = None
+
+        if size == self.offset:
+            return 0
+
+        added = 0
+        with open(self.path, 'rb') as f:
+            f.seek(self.offset)
+            while True:
+                chunk = f.read(READ_CHUNK)
+                if not chunk:
+                    break
+                self.offset += len(chunk)
+                added += self._feed(chunk, window)
+        return added
+
+    def _feed(self, chunk: bytes, window: JtlWindow) -> int:
+        data = self._buffer + chunk
+        end = data.rfind(b"\n")
+        if end == -1:
+            self._buffer = data
+            return 0
+        self._buffer = data[end + 1:]
+
+        lines = data[:end].decode('utf-8', errors='replace').splitlines()
+        added = 0
+        for row in csv.reader(lines):
+            if not row:
+                continue
+            if self.columns is None:
+                if row[0] == 'timeStamp':
+                    self._set_columns(row)
+                    continue
+                self._set_columns(DEFAULT_COLUMNS)
+            if self._add_row(row, window):
+                added += 1
+        return added
+
+    def _failure_message(self, row: list[str]) -> str:
+        """failureMessage сэмпла, а если его нет - код и текст ответа"""
+        def column(name: str) -> str:
+            i = self._index.get(name)
+            return row[i] if i is not None and i < len(row) else ""
+
+        return column('failureMessage') or f"{column('responseCode')} {column('responseMessage')}".strip()
+
+    def _add_row(self, row: list[str], window: JtlWindow) -> bool:
+        index = self._index
+        try:
+            timestamp = float(row[index['timeStamp']]) / 1000
+            elapsed = float(row[index['elapsed']])
+        except (KeyError, IndexError, ValueError):
+            return False  # Битая или обрезанная строка
+
+        success = True
+        if 'success' in index and index['success'] < len(row):
+            success = row[index['success']].lower() == 'true'
+
+        threads = None
+        if 'allThreads' in index and index['allThreads'] < len(row):
+            try:
+                threads = int(row[index['allThreads']])
+                self.last_threads = threads
+            except ValueError:
+                pass
+
+        message = ""
+        if not success:
+            message = self._failure_message(row)
+        label = None
+        if 'label' in index and index['label'] < len(row):
+            label = row[index['label']]
+        window.add(elapsed, success, threads, timestamp, message, label)
+        self.total_requests += 1
+        if not success:
+            self.total_failures += 1
+        return True
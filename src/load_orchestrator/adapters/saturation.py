@@ -0,0 +1,188 @@
+"""
+Обнаружение насыщения самого генератора нагрузки
+
+Если процесс генератора упёрся в CPU, плато rps создаёт генератор, а не
+система под нагрузкой, и DegradationSearch/BreakPoint находят ложную ёмкость.
+
+Детектор сочетает два сигнала:
+- CPU процессов генератора из /proc/<pid>/stat (utime + stime). Locust
+  однопоточен (gevent), поэтому смотрим на самый загруженный процесс:
+  ~100% одного ядра - предел.
+- Закон Литтла: users = rps * (rt + think). Время "think" оцениваем на
+  спокойном участке. Если при высокой загрузке CPU у пользователей
+  появляется необъяснимое время (users/rps заметно больше rt + think),
+  значит пользователи ждут не систему, а планировщик генератора.
+  rt - средняя задержка за интервал: у Locust REST rt_avg накоплен с
+  начала теста (RawMetrics.cumulative_percentiles), и интервальное
+  среднее считается по разности накопленных сумм. В открытой модели
+  (offered_rps задан) пользователи не задают темп запросов, и закон
+  Литтла не проверяется - остаётся только CPU.
+"""
+
+import os
+import statistics
+import time
+from collections import deque
+
+from ..models import RawMetrics
+
+CLOCK_TICKS = os.sysconf('SC_CLK_TCK') if hasattr(os, 'sysconf') else 100
+
+
+class ProcessCpuSampler:
+    """CPU процессов (в % одного ядра) по приросту utime+stime между вызовами"""
+
+    def __init__(self):
+        self._previous: dict[int, tuple[float, float]] = {}
+
+    @staticmethod
+    def available() -> bool:
+        return os.path.exists('/proc/self/stat')
+
+    @staticmethod
+    def _cpu_seconds(pid: int) -> float | None:
+        try:
+            with open(f'/proc/{pid}/stat', 'r') as f:
+                stat = f.read()
+        except OSError:
+            return None
+        # comm может содержать пробелы и скобки - поля считаем после последней ')'
+        fields = stat[stat.rfind(')') + 2:].split()
+        utime, stime = int(fields[11]), int(fields[12])
+        return (utime + stime) / CLOCK_TICKS
+
+    @staticmethod
+    def children(pid: int) -> list[int]:
+        """Прямые потомки процесса (если ядро отдаёт /proc/<pid>/task/<pid>/children)"""
+        try:
+            with open(f'/proc/{pid}/task/{pid}/children', 'r') as f:
+                return [int(p) for p in f.read().split()]
+        except OSError:
+            return []
+
+    def sample(self, pids: list[int]) -> dict[int, float]:
+        """
+        Загрузка CPU каждого процесса с прошлого вызова
+
+        Args:
+            pids: Процессы генератора
+
+        Returns:
+            pid -> CPU в % одного ядра (процессы без прошлого замера пропускаются)
+        """
+        now = time.monotonic()
+        usage = {}
+        current = {}
+        for pid in pids:
+            cpu = self._cpu_seconds(pid)
+            if cpu is None:
+                continue
+            current[pid] = (now, cpu)
+            previous = self._previous.get(pid)
+            if previous is not None and now > previous[0]:
+                usage[pid] = (cpu - previous[1]) / (now - previous[0]) * 100
+        self._previous = current
+        return usage
+
+
+class GeneratorSaturationDetector:
+    """Решает, насыщен ли генератор, по CPU и закону Литтла"""
+
+    def __init__(
+        self,
+        cpu_threshold: float = 90.0,
+        cpu_warning: float = 70.0,
+        littles_tolerance: float = 0.25,
+        baseline_samples: int = 5,
+    ):
+        """
+        Args:
+            cpu_threshold: CPU процесса (% ядра), при котором генератор насыщен
+            cpu_warning: CPU, начиная с которого учитывается закон Литтла
+            littles_tolerance: Допустимая доля необъяснимого времени в users/rps
+            baseline_samples: Сколько спокойных сэмплов нужно для оценки think time
+        """
+        self.cpu_threshold = cpu_threshold
+        self.cpu_warning = cpu_warning
+        self.littles_tolerance = littles_tolerance
+
+        self._sampler = ProcessCpuSampler()
+        self._think_samples: deque[float] = deque(maxlen=baseline_samples)
+        self._previous_totals: tuple[int, float] | None = None  # (запросы, сумма задержек, мс) прошлого сэмпла
+
+    def think_time(self) -> float | None:
+        """Оценка think time пользователей (сек) на спокойном участке"""
+        if len(self._think_samples) < self._think_samples.maxlen:
+            return None
+        return statistics.median(self._think_samples)
+
+    def interval_rt(self, metrics: RawMetrics) -> float | None:
+        """
+        Средняя задержка за интервал (мс)
+
+        Вызывается на каждом сэмпле: накопленный rt_avg (Locust REST)
+        пересчитывается в интервальный по разности накопленных сумм.
+
+        Returns:
+            Задержка или None, если запросов за интервал не было
+        """
+        if not metrics.cumulative_percentiles:
+            return metrics.rt_avg
+        totals = (metrics.total_requests, metrics.rt_avg * metrics.total_requests)
+        previous, self._previous_totals = self._previous_totals, totals
+        if previous is None or totals[0] <= previous[0]:
+            return None
+        return (totals[1] - previous[1]) / (totals[0] - previous[0])
+
+    def littles_residual(self, metrics: RawMetrics, rt_avg: float | None) -> float | None:
+        """
+        Доля времени цикла пользователя, не объяснённая rt + think
+
+        Args:
+            metrics: Метрики сэмпла
+            rt_avg: Средняя задержка за интервал (мс, см. interval_rt)
+
+        Returns:
+            (users/rps - rt - think) / (users/rps) или None, если оценить нельзя
+            (в том числе в открытой модели)
+        """
+        think = self.think_time()
+        if think is None or rt_avg is None or metrics.offered_rps is not None:
+            return None
+        if metrics.rps <= 0 or metrics.users <= 0:
+            return None
+        cycle = metrics.users / metrics.rps
+        return (cycle - rt_avg / 1000 - think) / cycle
+
+    def observe(self, metrics: RawMetrics, pids: list[int]) -> RawMetrics:
+        """
+        Дополнить метрики загрузкой генератора и флагом насыщения
+
+        Args:
+            metrics: Метрики от генератора
+            pids: Процессы генератора
+
+        Returns:
+            Те же метрики с generator_cpu и generator_saturated
+        """
+        rt_avg = self.interval_rt(metrics)
+        usage = self._sampler.sample(pids)
+        if not usage:
+            return metrics
+
+        cpu = max(usage.values())
+        metrics.generator_cpu = cpu
+
+        if cpu < self.cpu_warning:
+            # Спокойный участок: оцениваем think time (в закрытой модели)
+            if rt_avg is not None and metrics.offered_rps is None and metrics.rps > 0 and metrics.users > 0:
+                self._think_samples.append(max(0.0, metrics.users / metrics.rps - rt_avg / 1000))
+            return metrics
+
+        residual = self.littles_residual(metrics, rt_avg)
+        if cpu >= self.cpu_threshold or (residual is not None and residual > self.littles_tolerance):
+            metrics.generator_saturated = True
+            residual_text = f", Little's law residual {residual * 100:.0f}%" if residual is not None else ""
+            print(f"⚠️  Load generator saturated: CPU {cpu:.0f}%{residual_text}")
+
+        return metrics
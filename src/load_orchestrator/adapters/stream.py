@@ -0,0 +1,245 @@
+"""
+Поток интервальных гистограмм от генератора по Unix-сокету
+
+Опрос /stats/requests каждый тик заставляет Locust заново сериализовать
+накопленную статистику всех эндпоинтов в JSON - это CPU того самого
+генератора, который мы стараемся не насытить. Вместо этого плагин
+load_orchestrator.locust_plugin.stream раз в интервал отправляет
+компактную двоичную датаграмму: счётчики и лог-гистограмму задержек
+только за этот интервал. Адаптер вычитывает датаграммы без блокировки
+и складывает их в окно до следующего get_stats().
+
+Формат датаграммы (little-endian):
+    заголовок  HEADER: magic, version, pid, seq, timestamp, precision,
+               users, requests, failures, elapsed_sum, max, buckets
+    бакеты     buckets * BUCKET: (номер бакета i32, количество u32)
+    ошибки     FAILURES: количество сигнатур u16, затем на каждую
+               SIGNATURE (количество u32, длина u16) и UTF-8 текст
+               (с версии 2; сигнатуры - top-k интервала, см. analytics.failures;
+               не больше MAX_SIGNATURES самых частых, текст обрезается до
+               MAX_SIGNATURE_BYTES)
+    эндпоинты  ENDPOINTS: количество эндпоинтов u16, затем на каждый
+               ENDPOINT (запросы u32, ошибки u32, precision, max, бакеты u32,
+               длина имени u16), UTF-8 имя "<метод> <имя>" и бакеты * BUCKET
+               (с версии 3; для SLO по эндпоинтам, см. slo). Гистограммы
+               эндпоинтов грубее (ENDPOINT_PRECISION), эндпоинтов - не больше
+               MAX_ENDPOINTS с наибольшим числом запросов интервала, чтобы
+               датаграмма оставалась в пределах буфера сокета.
+
+Каждый процесс генератора (одиночный или worker) шлёт свои датаграммы;
+пользователи суммируются по последним значениям процессов. seq растёт на
+каждый интервал, в том числе неотправленный: по пропускам seq приёмник
+считает потерянные интервалы (IntervalStreamReader.lost).
+"""
+
+import os
+import socket
+import struct
+
+from ..analytics.latency import LatencyHistogram
+
+MAGIC = 0x4C4F  # "LO"
+VERSION = 3
+VERSIONS = (1, 2, 3)  # Версия 1 - без сигнатур ошибок, 2 - без эндпоинтов
+
+HEADER = struct.Struct("<HBIIddIIIddI")
+BUCKET = struct.Struct("<iI")
+FAILURES = struct.Struct("<H")
+SIGNATURE = struct.Struct("<IH")
+ENDPOINTS = struct.Struct("<H")
+ENDPOINT = struct.Struct("<IIddIH")
+
+ENDPOINT_PRECISION = 0.05
+MAX_ENDPOINTS = 50
+MAX_SIGNATURES = 20
+MAX_SIGNATURE_BYTES = 512
+
+SOCKET_ENV = "ORCHESTRATOR_STREAM_SOCKET"
+INTERVAL_ENV = "ORCHESTRATOR_STREAM_INTERVAL"
+
+RECEIVE_BUFFER = 1 << 18
+
+
+class IntervalSample:
+    """Одна датаграмма: статистика процесса генератора за интервал"""
+
+    __slots__ = ('pid', 'seq', 'timestamp', 'users', 'requests', 'failures', 'elapsed_sum', 'histogram',
+                 'signatures', 'endpoints')
+
+    def __init__(self, pid: int, seq: int, timestamp: float, users: int, requests: int,
+                 failures: int, elapsed_sum: float, histogram: LatencyHistogram,
+                 signatures: dict[str, int] | None = None,
+                 endpoints: dict[str, tuple[LatencyHistogram, int]] | None = None):
+        self.pid = pid
+        self.seq = seq
+        self.timestamp = timestamp
+        self.users = users
+        self.requests = requests
+        self.failures = failures
+        self.elapsed_sum = elapsed_sum
+        self.histogram = histogram
+        self.signatures = signatures or {}
+        self.endpoints = endpoints or {}  # "<метод> <имя>" -> (гистограмма, ошибки)
+
+
+def _pack_buckets(histogram: LatencyHistogram) -> bytes:
+    return b"".join(BUCKET.pack(bucket, count) for bucket, count in histogram.counts.items())
+
+
+def _unpack_histogram(data: bytes, offset: int, buckets: int, precision: float) -> tuple[LatencyHistogram, int]:
+    end = offset + buckets * BUCKET.size
+    if len(data) < end:
+        raise ValueError("Truncated interval datagram")
+    histogram = LatencyHistogram(precision=precision)
+    for bucket, count in BUCKET.iter_unpack(data[offset:end]):
+        histogram.counts[bucket] = count
+    return histogram, end
+
+
+def encode_interval(
+    pid: int,
+    seq: int,
+    timestamp: float,
+    users: int,
+    failures: int,
+    elapsed_sum: float,
+    histogram: LatencyHistogram,
+    signatures: dict[str, int] | None = None,
+    endpoints: dict[str, tuple[LatencyHistogram, int]] | None = None,
+) -> bytes:
+    """
+    Упаковать интервал в датаграмму (количество запросов берётся из гистограмм)
+
+    Из endpoints уходят MAX_ENDPOINTS эндпоинтов с наибольшим числом запросов,
+    из signatures - MAX_SIGNATURES самых частых сигнатур.
+    """
+    header = HEADER.pack(
+        MAGIC, VERSION, pid, seq, timestamp, histogram.precision,
+        users, histogram.count, failures, elapsed_sum, histogram.max, len(histogram.counts),
+    )
+    signatures = sorted((signatures or {}).items(), key=lambda item: item[1], reverse=True)[:MAX_SIGNATURES]
+    parts = [header, _pack_buckets(histogram), FAILURES.pack(len(signatures))]
+    for signature, count in signatures:
+        text = signature.encode("utf-8")[:MAX_SIGNATURE_BYTES]
+        parts.append(SIGNATURE.pack(count, len(text)) + text)
+
+    top = sorted((endpoints or {}).items(), key=lambda item: item[1][0].count, reverse=True)[:MAX_ENDPOINTS]
+    parts.append(ENDPOINTS.pack(len(top)))
+    for name, (endpoint, endpoint_failures) in top:
+        text = name.encode("utf-8")[:0xFFFF]
+        parts.append(ENDPOINT.pack(
+            endpoint.count, endpoint_failures, endpoint.precision, endpoint.max, len(endpoint.counts), len(text),
+        ))
+        parts.append(text)
+        parts.append(_pack_buckets(endpoint))
+    return b"".join(parts)
+
+
+def decode_interval(data: bytes) -> IntervalSample:
+    """
+    Распаковать датаграмму
+
+    Raises:
+        ValueError: Если датаграмма не из этого протокола или обрезана
+    """
+    if len(data) < HEADER.size:
+        raise ValueError("Truncated interval datagram")
+
+    (magic, version, pid, seq, timestamp, precision, users, requests,
+     failures, elapsed_sum, max_value, buckets) = HEADER.unpack_from(data)
+    if magic != MAGIC or version not in VERSIONS:
+        raise ValueError(f"Unknown interval datagram: magic={magic:#x} version={version}")
+    histogram, offset = _unpack_histogram(data, HEADER.size, buckets, precision)
+    histogram.count = requests
+    histogram.max = max_value
+
+    signatures = {}
+    endpoints = {}
+    try:
+        if version >= 2:
+            (entries,) = FAILURES.unpack_from(data, offset)
+            offset += FAILURES.size
+            for _ in range(entries):
+                count, length = SIGNATURE.unpack_from(data, offset)
+                offset += SIGNATURE.size
+                signatures[data[offset:offset + length].decode("utf-8", "replace")] = count
+                offset += length
+        if version >= 3:
+            (entries,) = ENDPOINTS.unpack_from(data, offset)
+            offset += ENDPOINTS.size
+            for _ in range(entries):
+                count, endpoint_failures, endpoint_precision, endpoint_max, endpoint_buckets, length = \
+                    ENDPOINT.unpack_from(data, offset)
+                offset += ENDPOINT.size
+                name = data[offset:offset + length].decode("utf-8", "replace")
+                endpoint, offset = _unpack_histogram(data, offset + length, endpoint_buckets, endpoint_precision)
+                endpoint.count = count
+                endpoint.max = endpoint_max
+                endpoints[name] = (endpoint, endpoint_failures)
+    except struct.error as e:
+        raise ValueError("Truncated interval datagram") from e
+    if offset != len(data):
+        raise ValueError("Truncated interval datagram")
+
+    return IntervalSample(
+        pid, seq, timestamp, users, requests, failures, elapsed_sum, histogram, signatures, endpoints,
+    )
+
+
+class IntervalStreamReader:
+    """Приёмник датаграмм на стороне оркестратора (неблокирующий)"""
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Путь Unix-сокета (создаётся заново)
+        """
+        self.path = path
+        if os.path.exists(path):
+            os.unlink(path)
+
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._socket.bind(path)
+        self._socket.setblocking(False)
+
+        self.users_by_pid: dict[int, int] = {}
+        self.total_requests = 0
+        self.total_failures = 0
+        self.dropped = 0  # Нераспознанные датаграммы
+        self.lost = 0  # Интервалы, которые генератор не смог отправить (пропуски seq)
+        self._seq_by_pid: dict[int, int] = {}
+
+    def drain(self) -> list[IntervalSample]:
+        """Забрать все пришедшие датаграммы"""
+        samples = []
+        while True:
+            try:
+                data = self._socket.recv(RECEIVE_BUFFER)
+            except BlockingIOError:
+                break
+            try:
+                sample = decode_interval(data)
+            except ValueError:
+                self.dropped += 1
+                continue
+
+            last_seq = self._seq_by_pid.get(sample.pid)
+            if last_seq is not None and sample.seq > last_seq + 1:
+                self.lost += sample.seq - last_seq - 1
+            if last_seq is None or sample.seq > last_seq:
+                self._seq_by_pid[sample.pid] = sample.seq
+
+            self.users_by_pid[sample.pid] = sample.users
+            self.total_requests += sample.requests
+            self.total_failures += sample.failures
+            samples.append(sample)
+        return samples
+
+    @property
+    def users(self) -> int:
+        return sum(self.users_by_pid.values())
+
+    def close(self) -> None:
+        self._socket.close()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
@@ -0,0 +1,185 @@
+"""
+Доверительные интервалы блочным бутстрепом
+
+max_stable_users / max_stable_rps - одиночные числа: по ним не отличить
+регрессию в 3% от шума. Здесь история теста делится на ступени нагрузки и
+для каждой ступени строятся интервалы среднего rps, p95 и p99, а по ним -
+интервал итоговой ёмкости (лучшая ступень по rps).
+
+Сэмплы внутри ступени автокоррелированы (соседние окна метрик похожи),
+поэтому ресэмплинг блочный: циклический блочный бутстреп с длиной блока
+~ n^(1/3). Статистика - среднее, поэтому реплика - это сумма k случайных
+блочных сумм (префиксные суммы считаются один раз): O(B * n^(2/3)) на
+ступень вместо O(B * n). Случайные индексы тянутся одним вызовом
+random.choices на все реплики. numpy не нужен.
+"""
+
+import math
+import random
+from dataclasses import dataclass
+
+from ..models import RawMetrics
+
+STEP_METRICS = ('rps', 'p95', 'p99')
+
+
+@dataclass
+class Interval:
+    """Оценка и доверительный интервал"""
+    estimate: float
+    low: float
+    high: float
+
+    def to_list(self) -> list[float]:
+        return [self.estimate, self.low, self.high]
+
+
+@dataclass
+class StepIntervals:
+    """Интервалы одной ступени нагрузки"""
+    users: int
+    samples: int
+    rps: Interval
+    p95: Interval
+    p99: Interval
+
+
+def split_steps(history: list[RawMetrics]) -> list[tuple[int, list[RawMetrics]]]:
+    """
+    Разбить историю на ступени: подряд идущие сэмплы с одинаковой нагрузкой
+
+    Сэмплы рампы и насыщенного генератора не учитываются.
+    """
+    steps: list[tuple[int, list[RawMetrics]]] = []
+    for m in history:
+        if m.ramping or m.generator_saturated or m.users <= 0:
+            continue
+        if steps and steps[-1][0] == m.users:
+            steps[-1][1].append(m)
+        else:
+            steps.append((m.users, [m]))
+    return steps
+
+
+class BlockBootstrap:
+    """Циклический блочный бутстреп среднего"""
+
+    def __init__(self, resamples: int = 1000, confidence: float = 0.95, seed: int | None = 0):
+        """
+        Args:
+            resamples: Количество реплик
+            confidence: Уровень доверия
+            seed: Зерно генератора (по умолчанию фиксированное - воспроизводимые отчёты)
+        """
+        if resamples < 1:
+            raise ValueError("'resamples' must be positive")
+        if not 0 < confidence < 1:
+            raise ValueError("'confidence' must be in (0, 1)")
+        self.resamples = resamples
+        self.confidence = confidence
+        self._random = random.Random(seed)
+
+    def replicates(self, values: list[float]) -> list[float]:
+        """
+        Средние по бутстреп-репликам
+
+        Args:
+            values: Ряд значений (порядок важен - блоки из соседних значений)
+
+        Returns:
+            resamples средних (для одного значения - оно само)
+        """
+        n = len(values)
+        if n < 2:
+            return [values[0]] * self.resamples if values else []
+
+        length = max(1, round(n ** (1 / 3)))
+        blocks = math.ceil(n / length)
+
+        # Блочные суммы по циклическому ряду через префиксные суммы
+        prefix = [0.0]
+        for v in values + values[:length - 1]:
+            prefix.append(prefix[-1] + v)
+        sums = [prefix[i + length] - prefix[i] for i in range(n)]
+
+        draws = self._random.choices(sums, k=blocks * self.resamples)
+        size = blocks * length
+        return [sum(draws[i:i + blocks]) / size for i in range(0, len(draws), blocks)]
+
+    def interval(self, estimate: float, replicates: list[float]) -> Interval:
+        """Процентильный интервал по репликам"""
+        if not replicates:
+            return Interval(estimate, estimate, estimate)
+        ordered = sorted(replicates)
+        alpha = (1 - self.confidence) / 2
+        low = ordered[int(alpha * (len(ordered) - 1))]
+        high = ordered[math.ceil((1 - alpha) * (len(ordered) - 1))]
+        return Interval(estimate, low, high)
+
+
+def bootstrap_report(
+    history: list[RawMetrics],
+    resamples: int = 1000,
+    confidence: float = 0.95,
+    seed: int | None = 0,
+) -> dict | None:
+    """
+    Интервалы по ступеням и итоговой ёмкости
+
+    Ёмкость - ступень с наибольшим средним rps. Её интервал по rps - это
+    распределение максимума средних rps ступеней по репликам; интервал
+    пользователей - разброс того, какая ступень оказывается лучшей.
+
+    Args:
+        history: Сэмплы теста
+        resamples: Количество реплик
+        confidence: Уровень доверия
+        seed: Зерно генератора
+
+    Returns:
+        Словарь для TestResult.intervals или None, если ступеней нет:
+        {'confidence', 'resamples', 'steps': [{'users', 'samples', 'rps': [оценка, низ, верх], ...}],
+         'capacity': {'rps': [...], 'users': [...]}}
+    """
+    steps = split_steps(history)
+    if not steps:
+        return None
+
+    bootstrap = BlockBootstrap(resamples=resamples, confidence=confidence, seed=seed)
+
+    results: list[StepIntervals] = []
+    rps_replicates: list[list[float]] = []
+    for users, samples in steps:
+        intervals = {}
+        for name in STEP_METRICS:
+            values = [getattr(m, name) for m in samples]
+            replicates = bootstrap.replicates(values)
+            intervals[name] = bootstrap.interval(sum(values) / len(values), replicates)
+            if name == 'rps':
+                rps_replicates.append(replicates)
+        results.append(StepIntervals(users=users, samples=len(samples), **intervals))
+
+    # Ёмкость: лучшая ступень в каждой реплике
+    best = max(range(len(results)), key=lambda i: results[i].rps.estimate)
+    capacity_rps, capacity_users = [], []
+    for replicate in zip(*rps_replicates):
+        i = max(range(len(replicate)), key=replicate.__getitem__)
+        capacity_rps.append(replicate[i])
+        capacity_users.append(results[i].users)
+
+    return {
+        'confidence': confidence,
+        'resamples': resamples,
+        'steps': [
+            {
+                'users': step.users,
+                'samples': step.samples,
+                **{name: getattr(step, name).to_list() for name in STEP_METRICS},
+            }
+            for step in results
+        ],
+        'capacity': {
+            'rps': bootstrap.interval(results[best].rps.estimate, capacity_rps).to_list(),
+            'users': bootstrap.interval(results[best].users, capacity_users).to_list(),
+        },
+    }
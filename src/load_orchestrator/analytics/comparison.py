@@ -0,0 +1,143 @@
+"""
+Статистический вывод A/B-сравнения
+
+ComparisonAdapter копит пары сэмплов (A, B) на одной и той же нагрузке.
+Парная разница убирает общий для обеих целей шум (фон инфраструктуры,
+время суток), поэтому интервал разницы уже, чем у двух отдельных прогонов.
+
+Для rps и задержек разница относительная, в процентах от A:
+(среднее(B - A)) / среднее(A) * 100; для error_rate - абсолютная, в
+процентных пунктах. Интервал - блочный бутстреп среднего парных разниц
+(пары соседних окон автокоррелированы так же, как сэмплы ступени).
+
+Вердикт по метрике - с точки зрения B (candidate): better / worse, если
+интервал не накрывает ноль и оценка по модулю не меньше min_effect, иначе
+no difference. Итоговый вердикт: worse, если хоть одна метрика хуже;
+better, если есть улучшения и нет ухудшений.
+"""
+
+from ..adapters.comparison import PAIRED_METRICS, PairedSample
+from .bootstrap import BlockBootstrap
+
+# Метрики, у которых больше - лучше (у остальных лучше меньше)
+HIGHER_IS_BETTER = ('rps',)
+
+# Метрики с абсолютной разницей (в процентных пунктах)
+ABSOLUTE_METRICS = ('error_rate',)
+
+# Реплик по умолчанию, если интервалы отключены (bootstrap_resamples: 0):
+# без них вердикта нет, а вердикт - смысл сравнения
+DEFAULT_RESAMPLES = 1000
+
+MIN_PAIRS = 2
+
+VERDICTS = ('better', 'worse', 'no difference', 'inconclusive')
+
+
+def _verdict(metric: str, low: float, high: float, estimate: float, min_effect: float) -> str:
+    if low <= 0 <= high or abs(estimate) < min_effect:
+        return 'no difference'
+    improved = estimate > 0 if metric in HIGHER_IS_BETTER else estimate < 0
+    return 'better' if improved else 'worse'
+
+
+def _differences(
+    pairs: list[PairedSample],
+    bootstrap: BlockBootstrap,
+    min_effect: float,
+) -> dict[str, dict]:
+    """Разница B - A по каждой метрике: средние, [оценка, низ, верх], вердикт"""
+    results = {}
+    for name in PAIRED_METRICS:
+        a = [p.a[name] for p in pairs]
+        b = [p.b[name] for p in pairs]
+        mean_a = sum(a) / len(a)
+        mean_b = sum(b) / len(b)
+        diffs = [y - x for x, y in zip(a, b)]
+
+        # Относительная разница: масштаб - среднее A
+        if name in ABSOLUTE_METRICS:
+            scale, unit = 1.0, 'pp'
+        elif mean_a > 0:
+            scale, unit = 100.0 / mean_a, '%'
+        else:
+            continue
+
+        interval = bootstrap.interval(
+            sum(diffs) / len(diffs) * scale,
+            [r * scale for r in bootstrap.replicates(diffs)],
+        )
+        results[name] = {
+            'a': mean_a,
+            'b': mean_b,
+            'diff': interval.to_list(),
+            'unit': unit,
+            'verdict': (
+                _verdict(name, interval.low, interval.high, interval.estimate, min_effect)
+                if len(pairs) >= MIN_PAIRS else 'inconclusive'
+            ),
+        }
+    return results
+
+
+def compare_report(
+    pairs: list[PairedSample],
+    labels: tuple[str, str] = ('A', 'B'),
+    mode: str = 'simultaneous',
+    resamples: int = 1000,
+    confidence: float = 0.95,
+    min_effect: float = 0.0,
+    seed: int | None = 0,
+) -> dict | None:
+    """
+    Статистический вывод по парным сэмплам
+
+    Args:
+        pairs: Пары сэмплов ComparisonAdapter
+        labels: Имена целей A и B
+        mode: Режим сравнения (для отчёта)
+        resamples: Количество реплик бутстрепа (0 - DEFAULT_RESAMPLES)
+        confidence: Уровень доверия
+        min_effect: Минимальная значимая разница (% или п.п.)
+        seed: Зерно генератора
+
+    Returns:
+        Словарь для TestResult.comparison или None, если пар нет:
+        {'mode', 'labels', 'pairs', 'confidence', 'verdict',
+         'metrics': {метрика: {'a', 'b', 'diff': [оценка, низ, верх], 'unit', 'verdict'}},
+         'steps': [{'load', 'pairs', 'metrics': {...}}]}
+    """
+    if not pairs:
+        return None
+
+    bootstrap = BlockBootstrap(resamples=resamples or DEFAULT_RESAMPLES, confidence=confidence, seed=seed)
+    metrics = _differences(pairs, bootstrap, min_effect)
+
+    # По ступеням нагрузки - в порядке первого появления
+    steps: dict[int, list[PairedSample]] = {}
+    for pair in pairs:
+        steps.setdefault(pair.load, []).append(pair)
+
+    verdicts = [m['verdict'] for m in metrics.values()]
+    if len(pairs) < MIN_PAIRS:
+        verdict = 'inconclusive'
+    elif 'worse' in verdicts:
+        verdict = 'worse'
+    elif 'better' in verdicts:
+        verdict = 'better'
+    else:
+        verdict = 'no difference'
+
+    return {
+        'mode': mode,
+        'labels': list(labels),
+        'pairs': len(pairs),
+        'confidence': confidence,
+        'min_effect': min_effect,
+        'verdict': verdict,
+        'metrics': metrics,
+        'steps': [
+            {'load': load, 'pairs': len(step), 'metrics': _differences(step, bootstrap, min_effect)}
+            for load, step in steps.items()
+        ],
+    }
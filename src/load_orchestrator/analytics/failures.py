@@ -0,0 +1,238 @@
+"""
+Сигнатуры ошибок: нормализация и подсчёт с ограниченной памятью
+
+В RawMetrics есть только failed_requests и error_rate - по ним не понять,
+какие ошибки преобладали, когда стратегия остановила тест. Здесь
+сообщения об ошибках сводятся к сигнатурам (normalize: числа, id, хосты
+и query-параметры заменяются заглушками), а сигнатуры считаются
+скетчем SpaceSaving: k счётчиков на любой поток ошибок, гарантированно
+точный для частых сигнатур (heavy hitters).
+
+Адаптеры отдают долю каждой сигнатуры за интервал в
+RawMetrics.failures (в % запросов интервала; сумма по сигнатурам не
+больше доли ошибок интервала). error_rate у Locust REST - накопленный
+fail_ratio, то есть в других единицах: orchestrator.ignore_failures
+(ожидаемые ошибки, например 404, не входят в error_rate для стратегий)
+вычитает сигнатуры из доли ошибок интервала, посчитанной по разности
+накопленных failed_requests/total_requests. По долям сигнатур работают и
+правила остановки (failures[timeout] > 1%) и итог прогона
+(FailureSummary -> TestResult.failures).
+"""
+
+import re
+from functools import lru_cache
+from typing import Iterable
+
+MAX_SIGNATURE_LENGTH = 200
+DEFAULT_TOP_K = 20
+
+_URL = re.compile(r"\b[a-z][a-z0-9+.-]*://[^\s'\"()<>]+", re.IGNORECASE)
+_PATH_ID = re.compile(r"/(?:\d+|[0-9a-f]{8,}|[0-9a-f-]{36})(?=/|$)", re.IGNORECASE)
+
+# Замены по порядку: более специфичные раньше
+_REPLACEMENTS = [
+    (re.compile(r"\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b", re.IGNORECASE), "<uuid>"),
+    (re.compile(r"\b0x[0-9a-f]+\b", re.IGNORECASE), "<hex>"),
+    (re.compile(r"\b(?=[0-9a-f]*\d)[0-9a-f]{12,}\b", re.IGNORECASE), "<hex>"),
+    (re.compile(r"\b\d{1,3}(?:\.\d{1,3}){3}(?::\d+)?\b"), "<ip>"),
+]
+
+# Числа целиком (1.5 -> <n>, единицы остаются: 1.5s -> <n>s)
+_NUMBER = re.compile(r"(?<![\w.<])\d+(?:\.\d+)?(?!\.?\d)")
+_SPACES = re.compile(r"\s+")
+
+# HTTP-код сохраняется (404 и 500 - разные ошибки), только если трёхзначное
+# число стоит там, где бывает статус: в начале сообщения, после status/code/HTTP
+# или перед "Client Error"/"Server Error". Прочие трёхзначные числа (таймауты,
+# номера заказов) - обычные числа.
+_STATUS = re.compile(r"[1-5]\d\d")
+_STATUS_BEFORE = re.compile(r"(?:^[\s(\[\'\"]*|(?:status|code|http)[\w/.]*[\s:=#(\'\"]{0,3})$", re.IGNORECASE)
+_STATUS_AFTER = re.compile(r"\s+(?:client|server) error", re.IGNORECASE)
+
+
+def _number(match: re.Match) -> str:
+    """Число -> <n>, HTTP-код в контексте статуса - как есть"""
+    value = match.group(0)
+    if _STATUS.fullmatch(value):
+        text, start, end = match.string, match.start(), match.end()
+        if _STATUS_BEFORE.search(text, 0, start) or _STATUS_AFTER.match(text, end):
+            return value
+    return "<n>"
+
+
+def _url_path(match: re.Match) -> str:
+    """URL -> путь без схемы, хоста и query; id в пути -> <id>"""
+    url = match.group(0)
+    path = url.split("://", 1)[1]
+    path = "/" + path.split("/", 1)[1] if "/" in path else "/"
+    path = path.split("?", 1)[0].split("#", 1)[0]
+    return _PATH_ID.sub("/<id>", path)
+
+
+@lru_cache(maxsize=4096)
+def normalize(message: str) -> str:
+    """
+    Сообщение об ошибке -> сигнатура
+
+    Одинаковые по смыслу ошибки с разными id, адресами и таймаутами дают
+    одну сигнатуру; HTTP-коды в контексте статуса сохраняются. Результат кешируется - сообщения
+    в потоке ошибок повторяются.
+
+    Args:
+        message: Текст ошибки генератора
+
+    Returns:
+        Сигнатура (не длиннее MAX_SIGNATURE_LENGTH)
+    """
+    signature = _URL.sub(_url_path, message)
+    for pattern, replacement in _REPLACEMENTS:
+        signature = pattern.sub(replacement, signature)
+    signature = _SPACES.sub(" ", _NUMBER.sub(_number, signature))
+    return signature.strip()[:MAX_SIGNATURE_LENGTH] or "<empty>"
+
+
+class SpaceSaving:
+    """
+    Скетч SpaceSaving: top-k частых элементов потока в capacity счётчиках
+
+    Новый элемент при заполненном скетче вытесняет элемент с наименьшим
+    счётчиком и наследует его значение (оно же - верхняя граница ошибки).
+    Любой элемент с долей больше 1/capacity гарантированно в скетче.
+    Поиск минимума - O(capacity); для десятков счётчиков это дешевле
+    поддержки кучи.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_TOP_K):
+        if capacity < 1:
+            raise ValueError("'capacity' must be positive")
+        self.capacity = capacity
+        self.counts: dict[str, float] = {}
+        self.errors: dict[str, float] = {}
+        self.total = 0.0
+
+    def add(self, item: str, weight: float = 1) -> None:
+        self.total += weight
+        if item in self.counts:
+            self.counts[item] += weight
+            return
+        if len(self.counts) < self.capacity:
+            self.counts[item] = weight
+            self.errors[item] = 0
+            return
+
+        victim = min(self.counts, key=self.counts.__getitem__)
+        floor = self.counts.pop(victim)
+        del self.errors[victim]
+        self.counts[item] = floor + weight
+        self.errors[item] = floor
+
+    def top(self, n: int | None = None) -> list[tuple[str, float, float]]:
+        """[(элемент, счётчик, ошибка), ...] по убыванию счётчика"""
+        ordered = sorted(self.counts.items(), key=lambda item: item[1], reverse=True)
+        return [(item, count, self.errors[item]) for item, count in ordered[:n]]
+
+    def clear(self) -> None:
+        self.counts.clear()
+        self.errors.clear()
+        self.total = 0.0
+
+
+def failure_rates(counts: SpaceSaving, requests: int) -> dict[str, float]:
+    """
+    Доли сигнатур за интервал в % запросов интервала
+
+    Args:
+        counts: Ошибки интервала по сигнатурам
+        requests: Запросов за интервал
+
+    Returns:
+        {сигнатура: %}; пусто, если запросов не было
+    """
+    if requests <= 0:
+        return {}
+    return {signature: count / requests * 100 for signature, count, _ in counts.top()}
+
+
+def matching_rate(failures: dict[str, float], pattern: str) -> float:
+    """Суммарная доля сигнатур, содержащих pattern (без учёта регистра)"""
+    pattern = pattern.lower()
+    return sum(rate for signature, rate in failures.items() if pattern in signature.lower())
+
+
+class CumulativeFailures:
+    """
+    Ошибки за интервал из накопительного списка генератора
+
+    Locust отдаёт в /stats/requests список ошибок с накопленным числом
+    повторений (errors). Дельта считается по сигнатурам, а не по сырым
+    сообщениям, поэтому помнить нужно только прошлые суммы сигнатур.
+    """
+
+    def __init__(self, top_k: int = DEFAULT_TOP_K):
+        self.top_k = top_k
+        self._previous: dict[str, int] = {}
+
+    def update(self, entries: Iterable[tuple[str, int]]) -> SpaceSaving:
+        """
+        Args:
+            entries: (сообщение, накопленное количество)
+
+        Returns:
+            Ошибки интервала по сигнатурам
+        """
+        current: dict[str, int] = {}
+        for message, occurrences in entries:
+            signature = normalize(message)
+            current[signature] = current.get(signature, 0) + occurrences
+
+        interval = SpaceSaving(self.top_k)
+        for signature, total in current.items():
+            delta = total - self._previous.get(signature, 0)
+            if delta < 0:
+                delta = total  # Статистику генератора сбросили
+            if delta > 0:
+                interval.add(signature, delta)
+        self._previous = current
+        return interval
+
+    def reset(self) -> None:
+        self._previous = {}
+
+
+class FailureSummary:
+    """
+    Итог прогона по сигнатурам ошибок
+
+    Вес сигнатуры - сумма её долей по сэмплам (≈ сколько «процент-сэмплов»
+    она занимала); в отчёт идёт доля веса и пиковая доля в одном сэмпле.
+    """
+
+    def __init__(self, top_k: int = DEFAULT_TOP_K):
+        self._sketch = SpaceSaving(top_k)
+        self._peaks: dict[str, float] = {}
+
+    def observe(self, failures: dict[str, float]) -> None:
+        for signature, rate in failures.items():
+            self._sketch.add(signature, rate)
+            if rate > self._peaks.get(signature, 0.0):
+                self._peaks[signature] = rate
+        # Пики - только для сигнатур, которые остались в скетче
+        if len(self._peaks) > 2 * self._sketch.capacity:
+            self._peaks = {s: p for s, p in self._peaks.items() if s in self._sketch.counts}
+
+    def report(self, n: int | None = None) -> list[dict]:
+        """
+        Returns:
+            [{'signature', 'share' (% веса всех ошибок), 'peak_rate' (% запросов)}, ...]
+        """
+        total = self._sketch.total
+        if total <= 0:
+            return []
+        return [
+            {
+                'signature': signature,
+                'share': weight / total * 100,
+                'peak_rate': self._peaks.get(signature, 0.0),
+            }
+            for signature, weight, _ in self._sketch.top(n)
+        ]
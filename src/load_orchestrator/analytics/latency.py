@@ -0,0 +1,214 @@
+"""
+Гистограмма задержек с коррекцией coordinated omission
+
+Закрытая модель Locust: пока пользователь ждёт зависший ответ, он не
+отправляет следующие запросы. Их задержки не попадают в статистику, и
+p95/p99 во время зависаний сильно занижены - ровно тогда, когда они
+важнее всего (BreakPoint, Spike).
+
+Коррекция строится на плановом времени отправки:
+- если оно известно (pacing-плагин, PacedUserMixin.intended_send_time),
+  задержка считается от планового времени, а не от фактической отправки;
+- иначе, по ожидаемому интервалу между запросами пользователя, достраиваются
+  запросы, которые были бы отправлены во время зависания
+  (как recordValueWithExpectedInterval в HdrHistogram);
+- если интервал неизвестен (think time случайный или не задан явно),
+  коррекция не делается: угаданный интервал искажает p99 сильнее,
+  чем её отсутствие.
+"""
+
+import math
+
+
+class LatencyHistogram:
+    """
+    Разреженная лог-гистограмма задержек (мс) с относительной точностью precision
+
+    Бакет i покрывает [(1+precision)^i, (1+precision)^(i+1)), поэтому память
+    зависит от диапазона задержек, а не от количества запросов. Гистограммы
+    складываются (merge) и сериализуются в dict для передачи master'у Locust.
+    """
+
+    def __init__(self, precision: float = 0.01):
+        """
+        Args:
+            precision: Относительная погрешность значения перцентиля
+        """
+        self.precision = precision
+        self._log_base = math.log1p(precision)
+        self.counts: dict[int, int] = {}
+        self.count = 0
+        self.max = 0.0
+
+    def _bucket(self, value: float) -> int:
+        # Всё меньше 1 мс попадает в нулевой бакет
+        return int(math.log(value) / self._log_base) if value > 1 else 0
+
+    def _value(self, bucket: int) -> float:
+        # Середина бакета
+        return math.exp((bucket + 0.5) * self._log_base) if bucket > 0 else 1.0
+
+    def record(self, value: float, count: int = 1) -> None:
+        """Записать задержку (мс)"""
+        bucket = self._bucket(value)
+        self.counts[bucket] = self.counts.get(bucket, 0) + count
+        self.count += count
+        if value > self.max:
+            self.max = value
+
+    def record_corrected(self, value: float, expected_interval: float) -> None:
+        """
+        Записать задержку и достроить запросы, пропущенные из-за неё
+
+        Args:
+            value: Задержка (мс)
+            expected_interval: Ожидаемый интервал между запросами пользователя (мс)
+        """
+        self.record(value)
+        if expected_interval <= 0:
+            return
+
+        missing = value - expected_interval
+        while missing >= expected_interval:
+            self.record(missing)
+            missing -= expected_interval
+
+    def percentile(self, q: float) -> float:
+        """
+        Перцентиль задержки
+
+        Args:
+            q: Доля от 0 до 1 (например 0.99)
+
+        Returns:
+            Задержка в мс (0, если гистограмма пуста)
+        """
+        if self.count == 0:
+            return 0.0
+
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= rank:
+                return min(self._value(bucket), self.max)
+        return self.max
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Добавить значения другой гистограммы с той же точностью"""
+        for bucket, count in other.counts.items():
+            self.counts[bucket] = self.counts.get(bucket, 0) + count
+        self.count += other.count
+        self.max = max(self.max, other.max)
+
+    def reset(self) -> None:
+        self.counts.clear()
+        self.count = 0
+        self.max = 0.0
+
+    def to_dict(self) -> dict:
+        return {'precision': self.precision, 'counts': self.counts, 'max': self.max}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LatencyHistogram":
+        histogram = cls(precision=data['precision'])
+        # После msgpack/JSON ключи могут прийти строками
+        for bucket, count in data['counts'].items():
+            histogram.counts[int(bucket)] = count
+            histogram.count += count
+        histogram.max = data['max']
+        return histogram
+
+
+PERCENTILES = {'p50': 0.50, 'p95': 0.95, 'p99': 0.99}
+
+
+def constant_think_time(user_classes) -> float | None:
+    """
+    Общий постоянный think time пользователей Locust (мс)
+
+    wait_time вызывается без экземпляра: constant() и wait_time без
+    переопределения (0) дают число, а between(), constant_pacing() и
+    свои реализации - разные значения или ошибку.
+
+    Args:
+        user_classes: Классы пользователей (без PacedUserMixin - у них своё расписание)
+
+    Returns:
+        Think time в мс или None, если он случайный, зависит от состояния
+        пользователя или различается между классами
+    """
+    waits = set()
+    for user_class in user_classes:
+        try:
+            values = {float(user_class.wait_time(None)) for _ in range(3)}
+        except Exception:
+            return None
+        waits |= values
+
+    if len(waits) != 1:
+        return None
+    return waits.pop() * 1000
+
+
+class LatencyWindow:
+    """Сырая и скорректированная гистограммы текущего окна"""
+
+    def __init__(self, expected_interval: float | None = None, think_time: float | None = None):
+        """
+        Args:
+            expected_interval: Ожидаемый интервал между запросами (мс), задан явно
+            think_time: Постоянный think time пользователей (мс); интервал -
+                think time плюс медиана сырых задержек прошлого окна.
+                Если не задан ни он, ни expected_interval, запросы без
+                планового времени отправки не корректируются
+        """
+        self.expected_interval = expected_interval
+        self.think_time = think_time
+        self.raw = LatencyHistogram()
+        self.corrected = LatencyHistogram()
+        self._typical_latency = 0.0
+
+    def record(self, response_time: float, start_time: float | None, intended_send_time: float | None) -> None:
+        self.raw.record(response_time)
+
+        if intended_send_time is not None and start_time is not None:
+            # Опоздание отправки относительно расписания - тоже задержка
+            self.corrected.record(response_time + max(0.0, (start_time - intended_send_time) * 1000))
+            return
+
+        if self.expected_interval is not None:
+            interval = self.expected_interval
+        elif self.think_time is not None:
+            interval = self.think_time + self._typical_latency
+        else:
+            return  # Интервал неизвестен - не угадываем
+        self.corrected.record_corrected(response_time, interval)
+
+    def merge(self, raw: LatencyHistogram, corrected: LatencyHistogram) -> None:
+        self.raw.merge(raw)
+        self.corrected.merge(corrected)
+
+    def take(self) -> dict:
+        """
+        Перцентили окна; окно начинается заново
+
+        corrected равен None, если в окне не было ни одного запроса,
+        который можно скорректировать.
+        """
+        summary = {
+            'count': self.raw.count,
+            'raw': {name: self.raw.percentile(q) for name, q in PERCENTILES.items()},
+            'corrected': (
+                {name: self.corrected.percentile(q) for name, q in PERCENTILES.items()}
+                if self.corrected.count else None
+            ),
+        }
+        self.roll()
+        return summary
+
+    def roll(self) -> None:
+        if self.raw.count:
+            self._typical_latency = self.raw.percentile(0.5)
+        self.raw.reset()
+        self.corrected.reset()
@@ -0,0 +1,246 @@
+"""
+Анализ спайков: деградация, выброс и восстановление
+
+По каждому спайку (baseline -> spike -> recovery) считается:
+- time_to_degrade  - от начала спайка до первого сэмпла, где p95 выше
+                     базовой линии больше чем на tolerance % или ошибки
+                     выше больше чем на error_tolerance п.п.;
+- пики p95 и ошибок за спайк и восстановление, выброс относительно
+  базовой линии (latency_overshoot в %, error_overshoot в п.п.);
+- time_to_recover  - от начала восстановления до первого сэмпла серии
+                     из hold сэмплов подряд в пределах tolerance от
+                     базовой линии.
+
+Точность времён - интервал сбора метрик у сэмпла, на котором сработало
+условие (resolution): с burst-сбором у переходов (см. sampling) это доли
+секунды.
+
+Нужны перцентили за интервал: накопленный с начала теста p95 (Locust
+REST, RawMetrics.cumulative_percentiles) после спайка почти не
+возвращается к базовой линии. Для таких сэмплов берутся перцентили
+плагина latency (*_corrected, всегда за интервал), а без них сэмпл не
+учитывается - и если таких сэмплов нет вовсе, отчёт вместо времён
+говорит, что анализ недоступен (unavailable).
+
+Анализ инкрементальный: сэмплы не хранятся, состояние спайка - несколько
+чисел, итог спайка - один словарь. Серию из сотен повторяющихся спайков
+можно анализировать в течение многочасового теста.
+"""
+
+from typing import Callable
+
+from ..models import RawMetrics
+
+MIN_BASELINE_LATENCY = 1.0  # мс: относительный допуск от нулевой базовой линии бессмыслен
+
+UNAVAILABLE = "percentiles are cumulative (use locust stream: true or the latency plugin)"
+
+
+class _SpikeState:
+    """Открытый спайк"""
+
+    __slots__ = (
+        'index', 'started', 'recovery_started', 'samples',
+        'degraded_at', 'degrade_resolution', 'peak_p95', 'peak_error_rate', 'peak_at',
+        'recovered_at', 'recover_resolution', '_candidate', '_candidate_resolution', '_streak',
+    )
+
+    def __init__(self, index: int, started: float):
+        self.index = index
+        self.started = started
+        self.recovery_started: float | None = None
+        self.samples = 0
+        self.degraded_at: float | None = None
+        self.degrade_resolution: float | None = None
+        self.peak_p95 = 0.0
+        self.peak_error_rate = 0.0
+        self.peak_at: float | None = None
+        self.recovered_at: float | None = None
+        self.recover_resolution: float | None = None
+        self._candidate: float | None = None
+        self._candidate_resolution: float | None = None
+        self._streak = 0
+
+
+class SpikeRecovery:
+    """Инкрементальный анализ серии спайков относительно базовой линии"""
+
+    def __init__(
+        self,
+        tolerance: float = 10.0,
+        error_tolerance: float = 1.0,
+        hold: int = 3,
+        latency: Callable[[RawMetrics, str], float] | None = None,
+    ):
+        """
+        Args:
+            tolerance: Допуск p95 от базовой линии (%)
+            error_tolerance: Допуск ошибок от базовой линии (п.п.)
+            hold: Сколько сэмплов подряд в допуске считается восстановлением
+            latency: Перцентиль задержки за интервал (по умолчанию RawMetrics.latency - сырые)
+
+        Raises:
+            ValueError: Если параметры невалидны
+        """
+        if tolerance <= 0 or error_tolerance < 0:
+            raise ValueError("'recovery_tolerance' must be positive and 'error_tolerance' non-negative")
+        if hold < 1:
+            raise ValueError("'recovery_hold' must be at least 1")
+        self.tolerance = tolerance
+        self.error_tolerance = error_tolerance
+        self.hold = hold
+        self.latency = latency or (lambda m, name: m.latency(name))
+        self.reset()
+
+    def reset(self) -> None:
+        self._baseline_samples = 0
+        self._baseline_p95 = 0.0
+        self._baseline_error_rate = 0.0
+        self._baseline_rps = 0.0
+        self._current: _SpikeState | None = None
+        self._skipped = 0  # Сэмплы без перцентилей за интервал
+        self._observed = 0
+        self.spikes: list[dict] = []
+
+    # Переходы фаз (момент - таймстемп сэмпла, на котором стратегия сменила фазу)
+
+    def spike_started(self, at: float) -> None:
+        self._close()
+        self._current = _SpikeState(len(self.spikes) + 1, at)
+
+    def recovery_started(self, at: float) -> None:
+        if self._current is not None and self._current.recovery_started is None:
+            self._current.recovery_started = at
+
+    def finish(self) -> None:
+        """Закрыть последний спайк (конец теста)"""
+        self._close()
+
+    def _close(self) -> None:
+        if self._current is not None:
+            self.spikes.append(self._summary(self._current))
+            self._current = None
+
+    # Сэмплы
+
+    def _thresholds(self) -> tuple[float, float] | None:
+        if self._baseline_samples == 0:
+            return None
+        p95 = max(self._baseline_p95, MIN_BASELINE_LATENCY) * (1 + self.tolerance / 100)
+        return p95, self._baseline_error_rate + self.error_tolerance
+
+    def _interval_p95(self, metrics: RawMetrics) -> float | None:
+        """p95 за интервал или None, если у сэмпла только накопленный"""
+        if metrics.cumulative_percentiles:
+            return metrics.p95_corrected
+        return self.latency(metrics, 'p95')
+
+    def observe(self, metrics: RawMetrics) -> None:
+        """Учесть сэмпл текущей фазы"""
+        p95 = self._interval_p95(metrics)
+        if p95 is None:
+            self._skipped += 1
+            return
+        self._observed += 1
+        spike = self._current
+
+        if spike is None:
+            # Базовая линия: средние по сэмплам вне рампы
+            if not metrics.ramping:
+                n = self._baseline_samples = self._baseline_samples + 1
+                self._baseline_p95 += (p95 - self._baseline_p95) / n
+                self._baseline_error_rate += (metrics.error_rate - self._baseline_error_rate) / n
+                self._baseline_rps += (metrics.rps - self._baseline_rps) / n
+            return
+
+        spike.samples += 1
+        if p95 > spike.peak_p95:
+            spike.peak_p95 = p95
+            spike.peak_at = metrics.timestamp
+        spike.peak_error_rate = max(spike.peak_error_rate, metrics.error_rate)
+
+        thresholds = self._thresholds()
+        if thresholds is None:
+            return
+        within = p95 <= thresholds[0] and metrics.error_rate <= thresholds[1]
+
+        if not within and spike.degraded_at is None:
+            spike.degraded_at = metrics.timestamp
+            spike.degrade_resolution = metrics.sampling_interval
+
+        if spike.recovery_started is None or spike.recovered_at is not None:
+            return
+        if within:
+            if spike._streak == 0:
+                spike._candidate = metrics.timestamp
+                spike._candidate_resolution = metrics.sampling_interval
+            spike._streak += 1
+            if spike._streak >= self.hold:
+                spike.recovered_at = spike._candidate
+                spike.recover_resolution = spike._candidate_resolution
+        else:
+            spike._streak = 0
+
+    # Итоги
+
+    def _summary(self, spike: _SpikeState) -> dict:
+        baseline_p95 = max(self._baseline_p95, MIN_BASELINE_LATENCY)
+        has_baseline = self._baseline_samples > 0
+
+        def since(at: float | None, origin: float | None) -> float | None:
+            return at - origin if at is not None and origin is not None else None
+
+        return {
+            'index': spike.index,
+            'samples': spike.samples,
+            'time_to_degrade': since(spike.degraded_at, spike.started),
+            'degrade_resolution': spike.degrade_resolution,
+            'peak_p95': spike.peak_p95,
+            'peak_error_rate': spike.peak_error_rate,
+            'time_to_peak': since(spike.peak_at, spike.started),
+            'latency_overshoot': (spike.peak_p95 / baseline_p95 - 1) * 100 if has_baseline else None,
+            'error_overshoot': spike.peak_error_rate - self._baseline_error_rate if has_baseline else None,
+            'recovered': spike.recovered_at is not None if spike.samples else None,
+            'time_to_recover': since(spike.recovered_at, spike.recovery_started),
+            'recover_resolution': spike.recover_resolution,
+        }
+
+    def report(self) -> dict:
+        """
+        Returns:
+            {'baseline', 'tolerance', 'error_tolerance', 'hold', 'unavailable',
+             'spikes': [по спайку, включая незакрытый], 'summary'};
+            unavailable - причина, если ни один сэмпл не дал перцентилей за интервал
+        """
+        spikes = list(self.spikes)
+        if self._current is not None:
+            spikes.append(self._summary(self._current))
+
+        def values(key: str) -> list[float]:
+            return [s[key] for s in spikes if s[key] is not None]
+
+        recover = values('time_to_recover')
+        degrade = values('time_to_degrade')
+        return {
+            'baseline': {
+                'samples': self._baseline_samples,
+                'p95': self._baseline_p95,
+                'error_rate': self._baseline_error_rate,
+                'rps': self._baseline_rps,
+            },
+            'tolerance': self.tolerance,
+            'error_tolerance': self.error_tolerance,
+            'hold': self.hold,
+            'unavailable': UNAVAILABLE if self._skipped and not self._observed else None,
+            'spikes': spikes,
+            'summary': {
+                'spikes': len(spikes),
+                'degraded': len(degrade),
+                'recovered': sum(bool(s['recovered']) for s in spikes),
+                'min_time_to_degrade': min(degrade) if degrade else None,
+                'mean_time_to_recover': sum(recover) / len(recover) if recover else None,
+                'max_time_to_recover': max(recover) if recover else None,
+                'max_latency_overshoot': max(values('latency_overshoot'), default=None),
+                'max_error_overshoot': max(values('error_overshoot'), default=None),
+            },
+        }
@@ -1,44 +1,432 @@
 import click
 from .factory import OrchestratorFactory
+from .report import DEFAULT_MAX_POINTS
 
 
-@click.command()
-@click.option('-c', '--config', required=True, help='Path to config file')
+@click.group(invoke_without_command=True)
+@click.option('-c', '--config', default=None, help='Path to config file')
 @click.option('-v', '--verbose', is_flag=True, help='Verbose output')
-def main(config: str, verbose: bool):
+@click.option('--serve', metavar='HOST:PORT', default=None,
+              help='Serve live metrics (/metrics, /ws); requires the web extra')
+@click.pass_context
+def main(ctx: click.Context, config: str | None, verbose: bool, serve: str | None):
     """
     Load Orchestrator - Интеллектуальный фреймворк для нагрузочного тестирования
+
+    Без команды запускает тест по конфигу -c (как команда run).
     """
+    if ctx.invoked_subcommand is not None:
+        return
+    if config is None:
+        raise click.UsageError("Missing option '-c' / '--config'")
+    ctx.invoke(run, config=config, verbose=verbose, serve=serve)
+
+
+@main.command()
+@click.option('-c', '--config', required=True, help='Path to config file')
+@click.option('-v', '--verbose', is_flag=True, help='Verbose output')
+@click.option('--serve', metavar='HOST:PORT', default=None,
+              help='Serve live metrics (/metrics, /ws); requires the web extra')
+@click.option('--report', 'reports', multiple=True, metavar='PATH',
+              help='Write a report; format by extension: .txt, .json, .html')
+@click.option('--report-points', type=int, default=DEFAULT_MAX_POINTS, show_default=True,
+              help='Chart points per series in reports (LTTB downsampling)')
+def run(config: str, verbose: bool, serve: str | None, reports: tuple[str, ...], report_points: int):
+    """Запустить тест по конфигу"""
+    for path in reports:
+        _check_report_path(path)
 
     # CLI режим
     click.echo("Starting adaptive load test...")
 
+    hooks = []
+    server = None
+    if serve:
+        from .web import LiveFeed, start_server
+
+        host, _, port = serve.rpartition(':')
+        feed = LiveFeed()
+        try:
+            server = start_server(feed, host=host or '127.0.0.1', port=int(port))
+        except ImportError as e:
+            raise click.ClickException(str(e))
+        hooks.append(feed)
+
     # TODO: Загрузить конфиг
-    orchestrator = OrchestratorFactory.from_yaml(config)
+    orchestrator = OrchestratorFactory.from_yaml(config, hooks=hooks)
 
-    result = orchestrator.run()
+    try:
+        result = orchestrator.run()
+    finally:
+        if server is not None:
+            server.stop()
 
     # TODO: Вывести результаты
     print_results(result, verbose)
+    _write_reports(result, reports, report_points)
+
 
+@main.command()
+@click.option('-c', '--config', required=True, help='Path to config file')
+def validate(config: str):
+    """
+    Проверить конфиг без запуска теста
 
-def print_results(result, verbose: bool):
+    Разбирает YAML и создаёт адаптер, стратегию и сборщики - импортируются
+    только плагины, на которые ссылается конфиг. Генератор не запускается.
     """
-    TODO: Вывести результаты теста в консоль
+    from .config import Config
+
+    try:
+        parsed = Config.from_yaml(config)
+        OrchestratorFactory.create_adapter(parsed)
+        OrchestratorFactory.create_strategy(parsed)
+        OrchestratorFactory.create_collectors(parsed)
+    except (FileNotFoundError, ValueError) as e:
+        raise click.ClickException(str(e))
+
+    click.echo(
+        f"✅ Config is valid: adapter={parsed.adapter.type}, "
+        f"strategy={parsed.strategy.type}, collectors={len(parsed.collectors)}"
+    )
+
+
+@main.command()
+@click.option('--socket', 'socket_path', default=None, help='Unix socket path')
+@click.option('--capacity', type=int, default=None,
+              help='Generator processes for all running tests (default: CPU count)')
+@click.option('--warm', multiple=True, metavar='CONFIG', help='Pre-start a generator for this config')
+@click.option('--max-idle', type=int, default=4, help='Idle warm generators to keep')
+@click.option('--ports', default='20000-21000', metavar='START-END', help='Port range for generators')
+def daemon(socket_path: str | None, capacity: int | None, warm: tuple[str, ...], max_idle: int, ports: str):
+    """Запустить демон очереди тестов с пулом прогретых генераторов"""
+    import os
+    import signal
+    import threading
+
+    from .config import Config
+    from .daemon import DaemonServer, GeneratorPool, PortAllocator, TestQueue, default_socket_path
+
+    try:
+        start, _, end = ports.partition('-')
+        pool = GeneratorPool(PortAllocator(int(start), int(end)), max_idle=max_idle)
+        queue = TestQueue(pool, capacity=capacity or os.cpu_count() or 1)
+        for path in warm:
+            pool.warm(Config.from_yaml(path))
+    except (FileNotFoundError, ValueError, RuntimeError) as e:
+        raise click.ClickException(str(e))
+
+    server = DaemonServer(socket_path or default_socket_path(), queue).start()
+    click.echo(f"🛰️  Daemon listening on {server.path} (capacity {queue.capacity})")
+
+    stopped = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stopped.set())
+    try:
+        stopped.wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+        server.server_close()
+        pool.close()
+
+
+@main.command()
+@click.option('-c', '--config', required=True, help='Path to config file')
+@click.option('-p', '--priority', type=int, default=0, help='Higher runs first')
+@click.option('--socket', 'socket_path', default=None, help='Unix socket path')
+@click.option('-v', '--verbose', is_flag=True, help='Verbose output')
+def submit(config: str, priority: int, socket_path: str | None, verbose: bool):
+    """Поставить тест в очередь демона и дождаться результата"""
+    from .daemon import DaemonClient, DaemonError
+
+    def queued(response: dict):
+        click.echo(f"📥 Job {response['id']} queued, position {response.get('position')}")
+
+    try:
+        result = DaemonClient(socket_path).submit(config, priority=priority, on_queued=queued)
+    except (FileNotFoundError, DaemonError) as e:
+        raise click.ClickException(str(e))
+    print_results(result, verbose)
+
+
+@main.command()
+@click.option('--socket', 'socket_path', default=None, help='Unix socket path')
+def status(socket_path: str | None):
+    """Показать очередь демона и пул генераторов"""
+    from .daemon import DaemonClient, DaemonError
+
+    try:
+        response = DaemonClient(socket_path, timeout=10).status()
+    except DaemonError as e:
+        raise click.ClickException(str(e))
+
+    queue, pool = response['queue'], response['pool']
+    click.echo(
+        f"Capacity: {queue['used']}/{queue['capacity']}, running {queue['running']}, queued {queue['queued']}"
+    )
+    click.echo(
+        f"Pool: {pool['idle']} idle, {pool['ports_in_use']} port blocks, {pool['hits']} hits / {pool['misses']} misses"
+    )
+    for job in response['jobs']:
+        click.echo(f"  {job['id']:>4}  {job['state']:<10} p={job['priority']:<4} cost={job['cost']:<3} {job['name']}")
+
+
+@main.command()
+@click.argument('run_file', type=click.Path(exists=True, dir_okay=False))
+@click.option('-o', '--output', 'outputs', multiple=True, required=True, metavar='PATH',
+              help='Report file; format by extension: .txt, .json, .html')
+@click.option('--points', type=int, default=DEFAULT_MAX_POINTS, show_default=True,
+              help='Chart points per series (LTTB downsampling)')
+def report(run_file: str, outputs: tuple[str, ...], points: int):
+    """Построить отчёты по сохранённому прогону (JSON из orchestrator.runs_dir)"""
+    import json
+
+    from .store import result_from_dict
+
+    for path in outputs:
+        _check_report_path(path)
+    try:
+        with open(run_file, 'r', encoding='utf-8') as f:
+            result = result_from_dict(json.load(f))
+    except (ValueError, KeyError, TypeError) as e:
+        raise click.ClickException(f"Invalid run file '{run_file}': {e}")
+    _write_reports(result, outputs, points)
+
+
+def _check_report_path(path: str) -> None:
+    """Проверить формат отчёта до запуска теста"""
+    from .report import report_format
+
+    try:
+        report_format(path)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="report path")
+
+
+def _write_reports(result, paths: tuple[str, ...], points: int) -> None:
+    """Записать отчёты; текстовый - тот же вывод, что print_results(verbose=True)"""
+    from .report import render, report_format
+
+    for path in paths:
+        fmt = report_format(path)
+        with open(path, 'w', encoding='utf-8') as f:
+            if fmt == 'text':
+                print_results(result, True, echo=lambda line: f.write(line + "\n"))
+            else:
+                f.write(render(result, fmt, max_points=points))
+        click.echo(f"📄 Report written: {path}")
+
+
+@main.command('list-plugins')
+def list_plugins():
+    """Показать доступные адаптеры, стратегии и сборщики (без их импорта)"""
+    groups = {
+        'Adapters': OrchestratorFactory.ADAPTERS,
+        'Strategies': OrchestratorFactory.STRATEGIES,
+        'Collectors': OrchestratorFactory.COLLECTORS,
+    }
+    for title, plugins in groups.items():
+        click.echo(f"{title} ({plugins.group}):")
+        for name, target, source in plugins.describe():
+            click.echo(f"  {name:<20} {target}  [{source}]")
+
+
+def _format_duration(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    return f"{minutes}m {seconds}s" if minutes else f"{seconds}s"
+
+
+def _format_interval(values: list[float], digits: int = 1) -> str:
+    estimate, low, high = values
+    return f"{estimate:.{digits}f} [{low:.{digits}f} .. {high:.{digits}f}]"
+
+
+def print_results(result, verbose: bool, echo=click.echo):
+    """
+    Вывести результаты теста в консоль
 
     Формат:
     ==================================================
     RESULTS
     ==================================================
-    Max stable users: 150
-    Max stable RPS:   220.5
+    Max stable users: 150  (95% CI 140 .. 160)
+    Max stable RPS:   220.5  (95% CI 214.1 .. 226.0)
     Duration:        6m 32s
     Stop reason:      DEGRADATION
     ==================================================
 
-    Если verbose=True, показать всю историю шагов
+    Интервалы - из TestResult.intervals (блочный бутстреп), если они
+    посчитаны. Если verbose=True, показать все ступени с интервалами
+    rps/p95/p99. Для A/B-сравнения (TestResult.comparison) - разница
+    B против A по метрикам и вердикт. Преобладающие сигнатуры ошибок
+    (TestResult.failures) - top 5, с verbose - все. SLO по эндпоинтам
+    (TestResult.strategy_report['slo']) - нагрузка, до которой выполнялись
+    все цели, с verbose - burn rate целей по ступеням.
+
+    Без бутстрепа verbose показывает ступени без интервалов и смены
+    нагрузки (по report.build_report). echo - куда писать строки (для
+    текстового отчёта в файл).
     """
-    print("Results: ", result)
+    line = "=" * 50
+    intervals = result.intervals or {}
+    capacity = intervals.get('capacity')
+    level = f"{intervals.get('confidence', 0.95) * 100:.0f}% CI"
+
+    echo(line)
+    echo("RESULTS")
+    echo(line)
+
+    users = f"Max stable users: {result.max_stable_users}"
+    rps = f"Max stable RPS:   {result.max_stable_rps:.1f}"
+    if capacity:
+        _, low, high = capacity['users']
+        users += f"  (best step {capacity['users'][0]:.0f}, {level} {low:.0f} .. {high:.0f})"
+        _, low, high = capacity['rps']
+        rps += f"  (best step {capacity['rps'][0]:.1f}, {level} {low:.1f} .. {high:.1f})"
+    echo(users)
+    echo(rps)
+
+    if result.finished_at is not None and result.started_at is not None:
+        echo(f"Duration:         {_format_duration(result.finished_at - result.started_at)}")
+    stop = f"Stop reason:      {result.stop_reason.name}"
+    if result.stop_rule:
+        stop += f" ({result.stop_rule})"
+    if result.failed_stage:
+        stop += f" at stage {result.failed_stage}"
+    echo(stop)
+    echo(line)
+
+    if verbose and intervals.get('steps'):
+        echo(f"Steps ({level}):")
+        echo(f"  {'users':>8}  {'n':>4}  {'rps':<28}{'p95, ms':<28}p99, ms")
+        for step in intervals['steps']:
+            echo(
+                f"  {step['users']:>8}  {step['samples']:>4}  "
+                f"{_format_interval(step['rps']):<28}{_format_interval(step['p95']):<28}"
+                f"{_format_interval(step['p99'])}"
+            )
+        echo(line)
+    elif verbose and result.history:
+        _print_steps(result, line, echo)
+
+    if verbose and result.decisions:
+        counts = {}
+        for d in result.decisions:
+            counts[d['decision']] = counts.get(d['decision'], 0) + d['samples']
+        applied = sum(1 for d in result.decisions if d['to'] is not None)
+        echo("Decisions: " + ", ".join(f"{name} {count}" for name, count in counts.items())
+             + f" (load changed {applied} times)")
+        echo(line)
+
+    if result.failures:
+        echo("Top failures (share of failures, peak % of requests):")
+        for failure in result.failures[:None if verbose else 5]:
+            echo(f"  {failure['share']:5.1f}%  peak {failure['peak_rate']:5.1f}%  {failure['signature']}")
+        echo(line)
+
+    slo = (result.strategy_report or {}).get('slo')
+    if slo:
+        _print_slo(slo, verbose, line, echo)
+
+    spike = (result.strategy_report or {}).get('spike')
+    if spike:
+        _print_spike(spike, verbose, line, echo)
+
+    if result.comparison:
+        _print_comparison(result.comparison, verbose, line, echo)
+
+
+def _print_steps(result, line: str, echo=click.echo):
+    """Ступени и смены нагрузки без доверительных интервалов"""
+    from .report import build_report
+
+    report = build_report(result, max_points=0)
+    echo("Steps:")
+    echo(f"  {'users':>8}  {'start':>8}  {'n':>5}  {'rps':>10}  {'p95, ms':>10}  {'p99, ms':>10}  {'errors, %':>9}")
+    for step in report['steps']:
+        echo(
+            f"  {step['users']:>8}  {_format_duration(step['start']):>8}  {step['samples']:>5}  "
+            f"{step['rps']:>10.1f}  {step['p95']:>10.1f}  {step['p99']:>10.1f}  {step['error_rate']:>9.2f}"
+        )
+    echo(f"Load changes: {len(report['load_changes'])}")
+    echo(line)
+
+
+def _print_slo(slo: dict, verbose: bool, line: str, echo=click.echo):
+    echo(f"SLO ({len(slo['objectives'])} objectives):")
+    echo(f"  Max compliant users: {slo['max_compliant_users']}")
+    if slo['breach']:
+        echo(f"  Breach: {slo['breach']}")
+    if verbose and slo['steps']:
+        echo("  Burn rate per step (> 1 - budget exhausted before the SLO period ends):")
+        for step in slo['steps']:
+            mark = "✓" if step['holds'] else "✗"
+            echo(f"  {mark} {step['users']:>8}")
+            for name, burn in step['burn'].items():
+                echo(f"      {'-' if burn is None else f'{burn:.2f}x':>8}  {name}")
+    echo(line)
+
+
+def _format_seconds(seconds: float | None, resolution: float | None = None) -> str:
+    if seconds is None:
+        return "-"
+    return f"{seconds:.2f}s" + (f" ±{resolution:.2f}" if resolution is not None else "")
+
+
+def _print_spike(spike: dict, verbose: bool, line: str, echo=click.echo):
+    if spike['unavailable']:
+        echo(f"SPIKES: recovery analysis unavailable - {spike['unavailable']}")
+        echo(line)
+        return
+    baseline = spike['baseline']
+    summary = spike['summary']
+    echo(f"SPIKES ({summary['spikes']}, tolerance {spike['tolerance']:g}% p95 / {spike['error_tolerance']:g} pp errors):")
+    echo(f"  Baseline:         p95 {baseline['p95']:.1f} ms, errors {baseline['error_rate']:.2f}%, "
+         f"{baseline['rps']:.1f} rps ({baseline['samples']} samples)")
+    echo(f"  Recovered:        {summary['recovered']}/{summary['spikes']}")
+    echo(f"  Time to degrade:  {_format_seconds(summary['min_time_to_degrade'])} (min)")
+    echo(f"  Time to recover:  {_format_seconds(summary['mean_time_to_recover'])} (mean), "
+         f"{_format_seconds(summary['max_time_to_recover'])} (max)")
+    if summary['max_latency_overshoot'] is not None:
+        echo(f"  Overshoot:        p95 +{summary['max_latency_overshoot']:.0f}%, "
+             f"errors +{summary['max_error_overshoot']:.2f} pp (max)")
+    if verbose or summary['spikes'] <= 5:
+        echo(f"  {'#':>3}  {'degrade':>14}  {'peak p95, ms':>12}  {'overshoot':>9}  {'peak err, %':>11}  {'recover':>14}")
+        for s in spike['spikes']:
+            overshoot = '-' if s['latency_overshoot'] is None else f"{s['latency_overshoot']:+.0f}%"
+            recover = _format_seconds(s['time_to_recover'], s['recover_resolution']) if s['recovered'] else "not recovered"
+            echo(
+                f"  {s['index']:>3}  {_format_seconds(s['time_to_degrade'], s['degrade_resolution']):>14}  "
+                f"{s['peak_p95']:>12.1f}  {overshoot:>9}  {s['peak_error_rate']:>11.2f}  {recover:>14}"
+            )
+    echo(line)
+
+
+def _print_comparison(comparison: dict, verbose: bool, line: str, echo=click.echo):
+    a, b = comparison['labels']
+    level = f"{comparison['confidence'] * 100:.0f}% CI"
+    echo(f"COMPARISON: {b} vs {a} ({comparison['mode']}, {comparison['pairs']} pairs, {level})")
+    echo(f"  {'metric':<12}{a:>12}{b:>12}  {'diff':<32}verdict")
+    for name, metric in comparison['metrics'].items():
+        echo(
+            f"  {name:<12}{metric['a']:>12.2f}{metric['b']:>12.2f}  "
+            f"{_format_interval(metric['diff']) + ' ' + metric['unit']:<32}{metric['verdict']}"
+        )
+    echo(f"Verdict:          {comparison['verdict'].upper()}")
+    echo(line)
+
+    if verbose and comparison['steps']:
+        echo(f"Steps, diff ({level}):")
+        echo(f"  {'load':>8}  {'n':>4}  {'rps':<32}{'p95':<32}error_rate")
+        for step in comparison['steps']:
+            cells = [
+                _format_interval(step['metrics'][name]['diff']) + ' ' + step['metrics'][name]['unit']
+                if name in step['metrics'] else '-'
+                for name in ('rps', 'p95', 'error_rate')
+            ]
+            echo(f"  {step['load']:>8}  {step['pairs']:>4}  {cells[0]:<32}{cells[1]:<32}{cells[2]}")
+        echo(line)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,80 @@
+"""
+Часы оркестратора
+
+Оркестратор, стратегии и адаптеры берут время и спят только через Clock.
+По умолчанию это SystemClock (time.time / time.sleep). VirtualClock не
+ждёт: sleep() сразу переводит часы к моменту пробуждения, то есть к
+следующему запланированному событию цикла (тику, сбору метрик, смене
+ступени). Сценарий на несколько часов с адаптером-симулятором (его
+метрики - функция нагрузки и self.clock.time()) проходит детерминированно
+за миллисекунды:
+
+    clock = VirtualClock(start=1_700_000_000)
+    orchestrator = Orchestrator(config, simulator, strategy, clock=clock)
+    result = orchestrator.run()
+
+Часы передаются стратегии и адаптеру хуком use_clock() (у обёрток -
+всем вложенным). Замеры накладных расходов самого оркестратора
+(instrumentation) и CPU генератора остаются на реальном времени.
+"""
+
+import threading
+import time
+from abc import ABC, abstractmethod
+
+
+class Clock(ABC):
+    """Источник времени и ожидания"""
+
+    @abstractmethod
+    def time(self) -> float:
+        """Текущее время (timestamp, секунды)"""
+
+    @abstractmethod
+    def sleep(self, seconds: float) -> None:
+        """Подождать seconds секунд"""
+
+
+class SystemClock(Clock):
+    """Реальное время"""
+
+    def time(self) -> float:
+        return time.time()
+
+    def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            time.sleep(seconds)
+
+
+class VirtualClock(Clock):
+    """
+    Виртуальное время: sleep() не ждёт, а переводит часы вперёд
+
+    Время меняется только через sleep() и advance(), поэтому прогон
+    детерминирован. Чтение и сдвиг защищены блокировкой - часы можно
+    читать из потоков сборщиков и адаптеров.
+    """
+
+    def __init__(self, start: float = 0.0):
+        """
+        Args:
+            start: Начальное время (timestamp)
+        """
+        self._now = float(start)
+        self._lock = threading.Lock()
+
+    def time(self) -> float:
+        with self._lock:
+            return self._now
+
+    def sleep(self, seconds: float) -> None:
+        self.advance(seconds)
+
+    def advance(self, seconds: float) -> None:
+        """Перевести часы на seconds вперёд (отрицательные значения игнорируются)"""
+        if seconds > 0:
+            with self._lock:
+                self._now += seconds
+
+
+SYSTEM_CLOCK = SystemClock()
@@ -0,0 +1,30 @@
+"""
+Сборщики метрик системы под нагрузкой
+
+Встроенные сборщики импортируются при первом обращении к имени.
+"""
+
+from importlib import import_module
+
+from .base import ICollector, CollectorPool
+
+_LAZY = {
+    'HostCollector': '.host',
+    'PrometheusCollector': '.prometheus',
+    'JsonCollector': '.json_endpoint',
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        return getattr(import_module(_LAZY[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = [
+    'ICollector',
+    'CollectorPool',
+    'HostCollector',
+    'PrometheusCollector',
+    'JsonCollector',
+]
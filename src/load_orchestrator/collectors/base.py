@@ -0,0 +1,129 @@
+"""
+Сборщики метрик системы под нагрузкой (SUT)
+
+Оркестратор принимает решения по метрикам генератора. Сборщики добавляют
+к каждому сэмплу то, что происходит на стороне сервера: CPU, память, GC,
+глубину очередей. Значения попадают в RawMetrics.server под ключами
+"<имя сборщика>.<метрика>" и доступны стратегиям и server_limits.
+"""
+
+from abc import ABC, abstractmethod
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+
+class ICollector(ABC):
+    """Интерфейс сборщика метрик SUT"""
+
+    def __init__(self, name: str):
+        """
+        Args:
+            name: Имя сборщика (префикс ключей в RawMetrics.server)
+        """
+        self.name = name
+
+    @abstractmethod
+    def collect(self) -> dict[str, float]:
+        """
+        Снять текущие значения
+
+        Вызывается из потока пула, по разу на каждый мониторинг.
+
+        Returns:
+            Метрика -> значение
+        """
+        pass
+
+    def close(self) -> None:
+        """Освободить ресурсы (соединения, файлы)"""
+        pass
+
+
+class CollectorPool:
+    """
+    Параллельный опрос сборщиков на общем пуле потоков
+
+    start() открывает окно сэмпла и запускает опрос всех сборщиков
+    одновременно с запросом метрик генератора, gather() собирает результаты
+    к моменту сэмпла - так серверные значения выровнены по времени с
+    RawMetrics. Сборщик, не успевший за timeout, пропускает сэмпл: его
+    опрос помечен окном, в котором запущен, и результат, пришедший в
+    следующем окне, отбрасывается, а не попадает в чужой сэмпл; как только
+    опоздавший опрос закончился, запускается опрос текущего окна. Пока он
+    не закончился, новый не запускается (медленный эндпоинт не копит потоки).
+    """
+
+    def __init__(self, collectors: list[ICollector], timeout: float = 2.0):
+        """
+        Args:
+            collectors: Сборщики
+            timeout: Сколько ждать сборщики после метрик генератора (сек)
+        """
+        self.collectors = collectors
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, len(collectors)), thread_name_prefix="collector"
+        )
+        self._window = 0  # Номер окна сэмпла (start())
+        self._pending: dict[str, tuple[Future, int]] = {}  # сборщик -> (опрос, окно запуска)
+        self.late: dict[str, int] = {}  # Сколько опоздавших результатов отброшено по сборщикам
+
+    def start(self) -> None:
+        """Открыть окно сэмпла и запустить опрос сборщиков, у которых нет незавершённого опроса"""
+        self._window += 1
+        for collector in self.collectors:
+            pending = self._pending.get(collector.name)
+            if pending is not None and pending[0].done():
+                self._drop_late(collector.name)  # Закончился между окнами
+                pending = None
+            if pending is None:
+                self._submit(collector)
+
+    def _submit(self, collector: ICollector) -> None:
+        self._pending[collector.name] = (self._executor.submit(collector.collect), self._window)
+
+    def _drop_late(self, name: str) -> None:
+        del self._pending[name]
+        self.late[name] = self.late.get(name, 0) + 1
+
+    def gather(self) -> dict[str, float]:
+        """
+        Дождаться опроса текущего окна (не дольше timeout)
+
+        Опрос прошлого окна, закончившийся за это время, отбрасывается, и
+        для сборщика сразу запускается опрос текущего окна.
+
+        Returns:
+            "<сборщик>.<метрика>" -> значение для успевших сборщиков
+        """
+        collectors = {collector.name: collector for collector in self.collectors}
+        deadline = time.monotonic() + self.timeout
+        while True:
+            for name, (future, window) in list(self._pending.items()):
+                if window != self._window and future.done():
+                    self._drop_late(name)  # Снят в прошлом окне - не выровнен с этим сэмплом
+                    self._submit(collectors[name])
+            waiting = [future for future, _ in self._pending.values() if not future.done()]
+            remaining = deadline - time.monotonic()
+            if not waiting or remaining <= 0:
+                break
+            wait(waiting, timeout=remaining, return_when=FIRST_COMPLETED)
+
+        values = {}
+        for name, (future, window) in list(self._pending.items()):
+            if window != self._window or not future.done():
+                continue
+            del self._pending[name]
+            try:
+                sample = future.result()
+            except Exception as e:
+                print(f"⚠️  Collector '{name}' failed: {e}")
+                continue
+            for metric, value in sample.items():
+                values[f"{name}.{metric}"] = value
+        return values
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        for collector in self.collectors:
+            collector.close()
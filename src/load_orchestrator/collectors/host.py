@@ -0,0 +1,65 @@
+"""
+Метрики хоста из /proc (Linux)
+
+Снимает метрики машины, на которой работает оркестратор, - имеет смысл,
+когда SUT запущена там же (локальный стенд). Для удалённых хостов
+используйте PrometheusCollector с node_exporter.
+"""
+
+from .base import ICollector
+
+
+class HostCollector(ICollector):
+    """CPU, iowait, память и load average из /proc"""
+
+    def __init__(self, name: str = "host", proc: str = "/proc"):
+        """
+        Args:
+            name: Имя сборщика
+            proc: Точка монтирования procfs (например, /host/proc в контейнере)
+        """
+        super().__init__(name)
+        self.proc = proc
+        self._previous_cpu: tuple[int, int, int] | None = None
+
+    def _cpu_times(self) -> tuple[int, int, int]:
+        """(всего, простой, iowait) в тиках по строке cpu из /proc/stat"""
+        with open(f"{self.proc}/stat", "r") as f:
+            fields = [int(v) for v in f.readline().split()[1:]]
+        # user nice system idle iowait irq softirq steal ...
+        idle, iowait = fields[3], fields[4]
+        return sum(fields[:8]), idle + iowait, iowait
+
+    def _memory(self) -> dict[str, float]:
+        meminfo = {}
+        with open(f"{self.proc}/meminfo", "r") as f:
+            for line in f:
+                key, value = line.split(":", 1)
+                meminfo[key] = int(value.split()[0])  # kB
+
+        total = meminfo.get("MemTotal", 0)
+        available = meminfo.get("MemAvailable", meminfo.get("MemFree", 0))
+        if total == 0:
+            return {}
+        return {
+            "mem_used_percent": (1 - available / total) * 100,
+            "mem_available_mb": available / 1024,
+        }
+
+    def collect(self) -> dict[str, float]:
+        values = {}
+
+        total, idle, iowait = self._cpu_times()
+        if self._previous_cpu is not None:
+            d_total = total - self._previous_cpu[0]
+            if d_total > 0:
+                values["cpu_percent"] = (1 - (idle - self._previous_cpu[1]) / d_total) * 100
+                values["iowait_percent"] = (iowait - self._previous_cpu[2]) / d_total * 100
+        self._previous_cpu = (total, idle, iowait)
+
+        values.update(self._memory())
+
+        with open(f"{self.proc}/loadavg", "r") as f:
+            values["load1"] = float(f.read().split()[0])
+
+        return values
@@ -0,0 +1,60 @@
+"""
+Метрики из JSON-эндпоинта (health/stats приложения, Spring Actuator и т.п.)
+"""
+
+from .base import ICollector
+
+
+def flatten_numbers(data, prefix: str = "") -> dict[str, float]:
+    """Все числовые листья JSON с ключами через точку ('queue.depth', 'pools.0.active')"""
+    values = {}
+    if isinstance(data, dict):
+        items = data.items()
+    elif isinstance(data, list):
+        items = enumerate(data)
+    else:
+        if isinstance(data, (int, float)) and not isinstance(data, bool):
+            values[prefix] = float(data)
+        return values
+
+    for key, value in items:
+        values.update(flatten_numbers(value, f"{prefix}.{key}" if prefix else str(key)))
+    return values
+
+
+class JsonCollector(ICollector):
+    """Опрос JSON-эндпоинта с выбором полей по пути"""
+
+    def __init__(
+        self,
+        name: str,
+        url: str,
+        fields: dict[str, str] | None = None,
+        timeout: float = 2.0,
+    ):
+        """
+        Args:
+            name: Имя сборщика
+            url: Адрес эндпоинта
+            fields: Метрика -> путь в JSON через точку (например, {'queue': 'executor.queue.size'});
+                None - все числовые поля
+            timeout: Таймаут HTTP-запроса (сек)
+        """
+        super().__init__(name)
+        self.url = url
+        self.fields = fields
+        self.timeout = timeout
+        import requests as rq
+        self._session = rq.Session()
+
+    def collect(self) -> dict[str, float]:
+        r = self._session.get(self.url, timeout=self.timeout)
+        r.raise_for_status()
+        values = flatten_numbers(r.json())
+
+        if self.fields is None:
+            return values
+        return {metric: values[path] for metric, path in self.fields.items() if path in values}
+
+    def close(self) -> None:
+        self._session.close()
@@ -0,0 +1,81 @@
+"""
+Метрики из произвольного эндпоинта в текстовом формате Prometheus
+"""
+
+import math
+
+from .base import ICollector
+
+
+def parse_prometheus_text(text: str) -> dict[str, float]:
+    """
+    Разобрать экспозицию Prometheus 0.0.4 / OpenMetrics
+
+    Args:
+        text: Тело ответа эндпоинта
+
+    Returns:
+        'имя{метки}' -> значение (метки как в исходном тексте)
+    """
+    values = {}
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+
+        # Значение идёт после серии; метки могут содержать пробелы
+        end = line.rfind("}")
+        head_end = end + 1 if end != -1 else line.find(" ")
+        series = line[:head_end]
+        parts = line[head_end:].split()
+        if not parts:
+            continue
+        try:
+            value = float(parts[0])
+        except ValueError:
+            continue
+        if math.isnan(value):
+            continue
+        values[series] = value
+    return values
+
+
+class PrometheusCollector(ICollector):
+    """Опрос /metrics в формате Prometheus (приложение, node_exporter, JMX exporter)"""
+
+    def __init__(
+        self,
+        name: str,
+        url: str,
+        metrics: list[str] | None = None,
+        timeout: float = 2.0,
+    ):
+        """
+        Args:
+            name: Имя сборщика
+            url: Адрес эндпоинта
+            metrics: Какие серии брать: имя метрики (все метки) или имя с метками;
+                None - все серии
+            timeout: Таймаут HTTP-запроса (сек)
+        """
+        super().__init__(name)
+        self.url = url
+        self.metrics = set(metrics) if metrics else None
+        self.timeout = timeout
+        import requests as rq  # Только когда сборщик действительно используется
+        self._session = rq.Session()
+
+    def collect(self) -> dict[str, float]:
+        r = self._session.get(self.url, timeout=self.timeout)
+        r.raise_for_status()
+        values = parse_prometheus_text(r.text)
+
+        if self.metrics is None:
+            return values
+        return {
+            series: value for series, value in values.items()
+            if series in self.metrics or series.split("{", 1)[0] in self.metrics
+        }
+
+    def close(self) -> None:
+        self._session.close()
@@ -1,7 +1,8 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
-import yaml
+
+from .rules import RuleSet
 
 
 
@@ -12,6 +13,7 @@ class AdapterConfig:
     test_file: str
     port: int = 8089
     host: str = "0.0.0.0"
+    options: dict[str, Any] | None = None  # Дополнительные параметры конкретного адаптера
 
 
 @dataclass
@@ -21,12 +23,68 @@ class StrategyConfig:
     params: dict[str, Any] | None = None
 
 
+@dataclass
+class CollectorConfig:
+    """Конфигурация сборщика метрик SUT"""
+    type: str
+    name: str
+    params: dict[str, Any] | None = None
+
+
 @dataclass
 class OrchestratorConfig:
     """Конфигурация оркестратора"""
     spawn_rate: int = 10
     max_users: int | None = None
-    monitoring_interval: int = 5  # Интервал сбора метрик в секундах
+    monitoring_interval: float = 5  # Интервал сбора метрик в секундах
+    burst_interval: float | None = None  # Частый сбор после изменений нагрузки и при шуме метрик (None - выключен)
+    burst_window: float = 10  # Сколько секунд собирать часто после изменения нагрузки
+    burst_cv: float = 0.2  # Коэффициент вариации rps/p95, при котором включается частый сбор
+    tick_interval: float = 1.0  # Шаг главного цикла в секундах
+    stabilization_time: float = 20  # Пауза после начальной нагрузки в секундах
+    load_model: str = "closed"  # closed - нагрузка в пользователях, open - в запросах/сек (arrival rate)
+    generator_saturation: str = "flag"  # flag - только пометить (в отчёте), veto - не отдавать такие сэмплы стратегии
+    max_saturated_samples: int = 3  # veto: сколько насыщенных сэмплов подряд до остановки
+    scale_out_cooldown: float = 30  # Пауза между добавлением worker'ов в секундах
+    collector_timeout: float = 2.0  # Сколько ждать сборщики метрик SUT в секундах
+    server_limits: dict[str, float] | None = None  # "<сборщик>.<метрика>" -> максимум, при превышении - остановка
+    runs_dir: str | None = None  # Каталог сохранённых прогонов (None - не сохранять)
+    warm_start: bool = False  # Стартовать с базовой линии и нагрузки последнего прогона того же конфига
+    warm_start_fraction: float = 0.8  # Доля прошлой максимальной стабильной нагрузки для старта
+    verify_samples: int = 3  # Сколько сэмплов проверять тёплый старт
+    verify_tolerance: float = 1.5  # Допустимое отличие p95 от прошлого прогона (раз)
+    bootstrap_resamples: int = 1000  # Реплик бутстрепа для доверительных интервалов (0 - не считать)
+    confidence: float = 0.95  # Уровень доверия интервалов
+    ignore_failures: list[str] | None = None  # Подстроки сигнатур ожидаемых ошибок: не входят в error_rate (за интервал)
+    schedule: str = "live"  # live - нагрузку меняет оркестратор, push - расписание стратегии исполняет генератор
+
+
+@dataclass
+class CompareConfig:
+    """Конфигурация A/B-сравнения двух целей (см. adapters.comparison)"""
+    mode: str = "simultaneous"  # simultaneous - обе цели сразу, interleaved - по очереди срезами ABBA
+    slice: float = 10  # interleaved: длительность среза в секундах
+    settle_samples: int = 1  # interleaved: сколько первых сэмплов среза не учитывать
+    min_effect: float = 0.0  # Разница меньше этого (% или п.п. для error_rate) - «без изменений»
+    a: dict[str, Any] = field(default_factory=dict)  # Переопределения секции adapter для baseline (+ label)
+    b: dict[str, Any] = field(default_factory=dict)  # То же для candidate
+
+    def adapter_config(self, base: AdapterConfig, side: str) -> AdapterConfig:
+        """Секция adapter с переопределениями цели side ('a' или 'b')"""
+        overrides = {k: v for k, v in getattr(self, side).items() if k != 'label'}
+        options = {**(base.options or {}), **{
+            k: v for k, v in overrides.items() if k not in ('type', 'test_file', 'port', 'host')
+        }}
+        return AdapterConfig(
+            type=overrides.get('type', base.type),
+            test_file=overrides.get('test_file', base.test_file),
+            port=overrides.get('port', base.port),
+            host=overrides.get('host', base.host),
+            options=options or None
+        )
+
+    def label(self, side: str) -> str:
+        return getattr(self, side).get('label', side.upper())
 
 
 @dataclass
@@ -35,6 +93,9 @@ class Config:
     adapter: AdapterConfig
     strategy: StrategyConfig
     orchestrator: OrchestratorConfig
+    collectors: list[CollectorConfig] = field(default_factory=list)
+    stop_rules: list[str] = field(default_factory=list)  # Правила остановки (см. rules)
+    compare: CompareConfig | None = None  # A/B-сравнение двух целей (None - одна цель)
 
     @classmethod
     def from_yaml(cls, path: str | Path) -> "Config":
@@ -56,12 +117,32 @@ class Config:
         if not path.exists():
             raise FileNotFoundError(f"Config file not found: {path}")
 
+        import yaml  # Лениво: CLI и --help не должны платить за импорт
+
         with open(path, 'r', encoding='utf-8') as f:
             data = yaml.safe_load(f)
 
         if not data:
             raise ValueError(f"Config file is empty: {path}")
 
+        return cls.from_dict(data)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Config":
+        """
+        Разобрать конфигурацию из словаря (содержимое YAML)
+
+        Относительные пути (test_file и др.) считаются от текущего каталога.
+
+        Args:
+            data: Секции конфига
+
+        Returns:
+            Config объект
+
+        Raises:
+            ValueError: Если конфигурация невалидна
+        """
         # Валидация и парсинг adapter
         if 'adapter' not in data:
             raise ValueError("Missing 'adapter' section in config")
@@ -76,11 +157,17 @@ class Config:
         if not test_file_path.exists():
             raise ValueError(f"Test file not found: {test_file_path}")
 
+        adapter_options = {
+            k: v for k, v in adapter_data.items()
+            if k not in ('type', 'test_file', 'port', 'host')
+        }
+
         adapter = AdapterConfig(
             type=adapter_data['type'],
             test_file=adapter_data['test_file'],
             port=adapter_data.get('port', 8089),
-            host=adapter_data.get('host', '0.0.0.0')
+            host=adapter_data.get('host', '0.0.0.0'),
+            options=adapter_options if adapter_options else None
         )
 
         # Валидация и парсинг strategy
@@ -91,6 +178,22 @@ class Config:
         if 'type' not in strategy_data:
             raise ValueError("Missing 'type' in strategy config")
 
+        if strategy_data['type'] == 'pipeline':
+            stages = strategy_data.get('stages')
+            if not isinstance(stages, list) or not stages:
+                raise ValueError("Pipeline strategy requires non-empty 'stages' list")
+            for i, stage in enumerate(stages):
+                if not isinstance(stage, dict) or 'type' not in stage:
+                    raise ValueError(f"Missing 'type' in pipeline stage #{i + 1}")
+
+        if strategy_data['type'] == 'profile':
+            segments = strategy_data.get('segments')
+            if not isinstance(segments, list) or not segments:
+                raise ValueError("Profile strategy requires non-empty 'segments' list")
+            for i, segment in enumerate(segments):
+                if not isinstance(segment, dict) or 'type' not in segment:
+                    raise ValueError(f"Missing 'type' in profile segment #{i + 1}")
+
         strategy_params = {k: v for k, v in strategy_data.items() if k != 'type'}
 
         strategy = StrategyConfig(
@@ -100,16 +203,135 @@ class Config:
 
         # Парсинг orchestrator (опциональный)
         orchestrator_data = data.get('orchestrator', {})
+        load_model = orchestrator_data.get('load_model', 'closed')
+        if load_model not in ('closed', 'open'):
+            raise ValueError(f"Invalid load_model: '{load_model}'. Supported: closed, open")
+
+        generator_saturation = orchestrator_data.get('generator_saturation', 'flag')
+        if generator_saturation not in ('flag', 'veto'):
+            raise ValueError(
+                f"Invalid generator_saturation: '{generator_saturation}'. Supported: flag, veto"
+            )
+
+        schedule = orchestrator_data.get('schedule', 'live')
+        if schedule not in ('live', 'push'):
+            raise ValueError(f"Invalid schedule: '{schedule}'. Supported: live, push")
+        if schedule == 'push' and load_model != 'closed':
+            raise ValueError("schedule: push supports only load_model: closed")
+
+        burst_interval = orchestrator_data.get('burst_interval')
+        if burst_interval is not None and burst_interval <= 0:
+            raise ValueError("'burst_interval' must be positive")
+
+        runs_dir = orchestrator_data.get('runs_dir')
+        warm_start = bool(orchestrator_data.get('warm_start', False))
+        if warm_start and not runs_dir:
+            raise ValueError("warm_start requires 'runs_dir'")
+        warm_start_fraction = orchestrator_data.get('warm_start_fraction', 0.8)
+        if not 0 < warm_start_fraction <= 1:
+            raise ValueError("'warm_start_fraction' must be in (0, 1]")
+
+        ignore_failures = orchestrator_data.get('ignore_failures')
+        if ignore_failures is not None and (
+            not isinstance(ignore_failures, list) or not all(isinstance(p, str) and p for p in ignore_failures)
+        ):
+            raise ValueError("'ignore_failures' must be a list of non-empty strings")
+
+        confidence = orchestrator_data.get('confidence', 0.95)
+        if not 0 < confidence < 1:
+            raise ValueError("'confidence' must be in (0, 1)")
+
         orchestrator = OrchestratorConfig(
             spawn_rate=orchestrator_data.get('spawn_rate', 10),
             max_users=orchestrator_data.get('max_users'),
-            monitoring_interval=orchestrator_data.get('monitoring_interval', 5)
+            monitoring_interval=orchestrator_data.get('monitoring_interval', 5),
+            burst_interval=burst_interval,
+            burst_window=orchestrator_data.get('burst_window', 10),
+            burst_cv=orchestrator_data.get('burst_cv', 0.2),
+            tick_interval=orchestrator_data.get('tick_interval', 1.0),
+            stabilization_time=orchestrator_data.get('stabilization_time', 20),
+            load_model=load_model,
+            generator_saturation=generator_saturation,
+            max_saturated_samples=orchestrator_data.get('max_saturated_samples', 3),
+            scale_out_cooldown=orchestrator_data.get('scale_out_cooldown', 30),
+            collector_timeout=orchestrator_data.get('collector_timeout', 2.0),
+            server_limits=orchestrator_data.get('server_limits'),
+            bootstrap_resamples=orchestrator_data.get('bootstrap_resamples', 1000),
+            confidence=confidence,
+            ignore_failures=ignore_failures,
+            schedule=schedule,
+            runs_dir=runs_dir,
+            warm_start=warm_start,
+            warm_start_fraction=warm_start_fraction,
+            verify_samples=orchestrator_data.get('verify_samples', 3),
+            verify_tolerance=orchestrator_data.get('verify_tolerance', 1.5)
         )
 
+        # Парсинг collectors (опциональный)
+        collectors = []
+        for i, collector_data in enumerate(data.get('collectors') or []):
+            if not isinstance(collector_data, dict) or 'type' not in collector_data:
+                raise ValueError(f"Missing 'type' in collector #{i + 1}")
+            collector_params = {
+                k: v for k, v in collector_data.items() if k not in ('type', 'name')
+            }
+            collectors.append(CollectorConfig(
+                type=collector_data['type'],
+                name=collector_data.get('name', collector_data['type']),
+                params=collector_params if collector_params else None
+            ))
+
+        names = [c.name for c in collectors]
+        duplicates = sorted({n for n in names if names.count(n) > 1})
+        if duplicates:
+            raise ValueError(f"Duplicate collector names: {', '.join(duplicates)}")
+
+        # Правила остановки (опциональные): разбираются сразу, чтобы ошибка была при загрузке
+        stop_rules = data.get('stop_rules') or []
+        if not isinstance(stop_rules, list) or not all(isinstance(r, str) for r in stop_rules):
+            raise ValueError("'stop_rules' must be a list of strings")
+        RuleSet(stop_rules)
+
+        # A/B-сравнение (опциональное)
+        compare = None
+        compare_data = data.get('compare')
+        if compare_data is not None:
+            if not isinstance(compare_data, dict):
+                raise ValueError("'compare' must be a mapping")
+            compare_mode = compare_data.get('mode', 'simultaneous')
+            if compare_mode not in ('simultaneous', 'interleaved'):
+                raise ValueError(
+                    f"Invalid compare mode: '{compare_mode}'. Supported: simultaneous, interleaved"
+                )
+            for side in ('a', 'b'):
+                if not isinstance(compare_data.get(side) or {}, dict):
+                    raise ValueError(f"'compare.{side}' must be a mapping of adapter overrides")
+            compare = CompareConfig(
+                mode=compare_mode,
+                slice=compare_data.get('slice', 10),
+                settle_samples=compare_data.get('settle_samples', 1),
+                min_effect=compare_data.get('min_effect', 0.0),
+                a=dict(compare_data.get('a') or {}),
+                b=dict(compare_data.get('b') or {})
+            )
+            if compare.slice <= 0:
+                raise ValueError("'compare.slice' must be positive")
+            if compare.settle_samples < 0:
+                raise ValueError("'compare.settle_samples' must be non-negative")
+            if compare.min_effect < 0:
+                raise ValueError("'compare.min_effect' must be non-negative")
+            a_adapter = compare.adapter_config(adapter, 'a')
+            b_adapter = compare.adapter_config(adapter, 'b')
+            if (a_adapter.host, a_adapter.port) == (b_adapter.host, b_adapter.port):
+                raise ValueError("compare: targets 'a' and 'b' must use different adapter ports")
+
         return cls(
             adapter=adapter,
             strategy=strategy,
-            orchestrator=orchestrator
+            orchestrator=orchestrator,
+            collectors=collectors,
+            stop_rules=stop_rules,
+            compare=compare
         )
 
     def to_dict(self) -> dict[str, Any]:
@@ -124,7 +346,8 @@ class Config:
                 'type': self.adapter.type,
                 'test_file': self.adapter.test_file,
                 'port': self.adapter.port,
-                'host': self.adapter.host
+                'host': self.adapter.host,
+                **(self.adapter.options or {})
             },
             'strategy': {
                 'type': self.strategy.type,
@@ -133,8 +356,41 @@ class Config:
             'orchestrator': {
                 'spawn_rate': self.orchestrator.spawn_rate,
                 'max_users': self.orchestrator.max_users,
-                'monitoring_interval': self.orchestrator.monitoring_interval
-            }
+                'monitoring_interval': self.orchestrator.monitoring_interval,
+                'burst_interval': self.orchestrator.burst_interval,
+                'burst_window': self.orchestrator.burst_window,
+                'burst_cv': self.orchestrator.burst_cv,
+                'tick_interval': self.orchestrator.tick_interval,
+                'stabilization_time': self.orchestrator.stabilization_time,
+                'load_model': self.orchestrator.load_model,
+                'generator_saturation': self.orchestrator.generator_saturation,
+                'max_saturated_samples': self.orchestrator.max_saturated_samples,
+                'scale_out_cooldown': self.orchestrator.scale_out_cooldown,
+                'collector_timeout': self.orchestrator.collector_timeout,
+                'server_limits': self.orchestrator.server_limits,
+                'bootstrap_resamples': self.orchestrator.bootstrap_resamples,
+                'confidence': self.orchestrator.confidence,
+                'ignore_failures': self.orchestrator.ignore_failures,
+                'schedule': self.orchestrator.schedule,
+                'runs_dir': self.orchestrator.runs_dir,
+                'warm_start': self.orchestrator.warm_start,
+                'warm_start_fraction': self.orchestrator.warm_start_fraction,
+                'verify_samples': self.orchestrator.verify_samples,
+                'verify_tolerance': self.orchestrator.verify_tolerance
+            },
+            'collectors': [
+                {'type': c.type, 'name': c.name, **(c.params or {})}
+                for c in self.collectors
+            ],
+            'stop_rules': list(self.stop_rules),
+            **({'compare': {
+                'mode': self.compare.mode,
+                'slice': self.compare.slice,
+                'settle_samples': self.compare.settle_samples,
+                'min_effect': self.compare.min_effect,
+                'a': dict(self.compare.a),
+                'b': dict(self.compare.b)
+            }} if self.compare is not None else {})
         }
 
     def to_yaml(self, path: str | Path) -> None:
@@ -147,5 +403,7 @@ class Config:
         path = Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
 
+        import yaml
+
         with open(path, 'w', encoding='utf-8') as f:
             yaml.dump(self.to_dict(), f, default_flow_style=False, allow_unicode=True)
\ No newline at end of file
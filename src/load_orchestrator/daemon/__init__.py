@@ -0,0 +1,27 @@
+"""
+Демон очереди тестов
+
+Долгоживущий процесс для CI: принимает тесты по локальному Unix-сокету,
+держит пул прогретых генераторов (pool), раздаёт генераторам
+непересекающиеся порты (ports) и запускает тесты по приоритету в пределах
+ёмкости (scheduler). Клиент (client.DaemonClient) получает TestResult.
+
+    load-orchestrator daemon --capacity 8 --warm configs/sla.yaml
+    load-orchestrator submit -c configs/sla.yaml --priority 10
+"""
+
+from .client import DaemonClient, DaemonError
+from .pool import GeneratorPool
+from .ports import PortAllocator
+from .scheduler import TestQueue
+from .server import DaemonServer, default_socket_path
+
+__all__ = [
+    'DaemonClient',
+    'DaemonError',
+    'DaemonServer',
+    'GeneratorPool',
+    'PortAllocator',
+    'TestQueue',
+    'default_socket_path',
+]
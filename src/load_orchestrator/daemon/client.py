@@ -0,0 +1,147 @@
+"""
+Клиент демона
+
+Конфиг читается и проверяется на стороне клиента: относительные пути
+(test_file, runs_dir, replay-файлы профиля) считаются от каталога
+клиента и передаются демону абсолютными.
+"""
+
+import os
+import socket
+from pathlib import Path
+from typing import Any
+
+from ..models import TestResult
+from ..store import result_from_dict
+from .server import default_socket_path, receive, send
+
+
+class DaemonError(RuntimeError):
+    """Демон недоступен или отклонил запрос"""
+
+
+def _absolute(path: str, base: Path) -> str:
+    return str((base / path).resolve())
+
+
+def absolute_paths(data: dict[str, Any], base: str | Path) -> dict[str, Any]:
+    """
+    Копия конфига (содержимого YAML) с абсолютными путями
+
+    Args:
+        data: Секции конфига
+        base: Каталог, от которого считаются относительные пути
+
+    Returns:
+        Новый словарь
+    """
+    base = Path(base)
+    data = {**data}
+
+    if isinstance(data.get('adapter'), dict) and 'test_file' in data['adapter']:
+        data['adapter'] = {**data['adapter'], 'test_file': _absolute(data['adapter']['test_file'], base)}
+
+    orchestrator = data.get('orchestrator')
+    if isinstance(orchestrator, dict) and orchestrator.get('runs_dir'):
+        data['orchestrator'] = {**orchestrator, 'runs_dir': _absolute(orchestrator['runs_dir'], base)}
+
+    compare = data.get('compare')
+    if isinstance(compare, dict):
+        compare = {**compare}
+        for side in ('a', 'b'):
+            if isinstance(compare.get(side), dict) and 'test_file' in compare[side]:
+                compare[side] = {**compare[side], 'test_file': _absolute(compare[side]['test_file'], base)}
+        data['compare'] = compare
+
+    # Replay-файлы профиля - относительно base_dir стратегии
+    def strategy(section: dict) -> dict:
+        if section.get('type') == 'profile':
+            return {**section, 'base_dir': _absolute(section.get('base_dir', '.'), base)}
+        if section.get('type') == 'pipeline' and isinstance(section.get('stages'), list):
+            return {**section, 'stages': [strategy(s) if isinstance(s, dict) else s for s in section['stages']]}
+        return section
+
+    if isinstance(data.get('strategy'), dict):
+        data['strategy'] = strategy(data['strategy'])
+    return data
+
+
+class DaemonClient:
+    """Запросы к демону по Unix-сокету"""
+
+    def __init__(self, path: str | None = None, timeout: float | None = None):
+        """
+        Args:
+            path: Путь к сокету (по умолчанию server.default_socket_path())
+            timeout: Таймаут операций сокета (None - ждать сколько угодно)
+        """
+        self.path = path or default_socket_path()
+        self.timeout = timeout
+
+    def _connect(self) -> socket.socket:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.path)
+        except OSError as e:
+            sock.close()
+            raise DaemonError(f"Cannot connect to daemon at {self.path}: {e}") from e
+        return sock
+
+    def _request(self, message: dict) -> dict:
+        with self._connect() as sock, sock.makefile('rwb') as stream:
+            send(stream, message)
+            return self._response(stream)
+
+    @staticmethod
+    def _response(stream) -> dict:
+        response = receive(stream)
+        if response is None:
+            raise DaemonError("Daemon closed the connection")
+        if 'error' in response and 'id' not in response:
+            raise DaemonError(response['error'])
+        return response
+
+    def submit(self, config_path: str | Path, priority: int = 0, on_queued=None) -> TestResult:
+        """
+        Поставить тест и дождаться результата
+
+        Args:
+            config_path: Путь к YAML конфигу
+            priority: Приоритет (больше - раньше)
+            on_queued: Вызывается с первым ответом демона ({'id', 'state', 'position'})
+
+        Returns:
+            Результат теста
+
+        Raises:
+            DaemonError: Если демон недоступен, отклонил конфиг или тест упал
+        """
+        import yaml
+
+        path = Path(config_path).resolve()
+        with open(path, 'r', encoding='utf-8') as f:
+            data = yaml.safe_load(f) or {}
+
+        message = {
+            'op': 'submit',
+            'config': absolute_paths(data, os.getcwd()),
+            'priority': priority,
+            'name': path.name,
+        }
+        with self._connect() as sock, sock.makefile('rwb') as stream:
+            send(stream, message)
+            queued = self._response(stream)
+            if on_queued is not None:
+                on_queued(queued)
+            done = self._response(stream)
+
+        if done.get('result') is None:
+            raise DaemonError(f"Job {done.get('id')} {done.get('state')}: {done.get('error')}")
+        return result_from_dict(done['result'])
+
+    def status(self) -> dict:
+        return self._request({'op': 'status'})
+
+    def cancel(self, job_id: str) -> bool:
+        return bool(self._request({'op': 'cancel', 'id': job_id}).get('cancelled'))
@@ -0,0 +1,287 @@
+"""
+Пул прогретых генераторов
+
+Запуск Locust и ожидание веб-интерфейса - десятки секунд на каждый
+прогон. Пул держит запущенные генераторы между тестами: после теста
+генератор останавливается (stop), сбрасывается (IAdapter.recycle) и ждёт
+следующий тест с тем же ключом - тип адаптера, test_file и параметры.
+Следующий тест получает его уже готовым: launch() ничего не делает,
+is_ready() сразу True.
+
+Генераторы, которые нельзя переиспользовать (A/B-сравнение, расписание
+push - LoadTestShape вшивается при запуске, адаптер без recycle),
+запускаются как обычно и останавливаются после теста; порты им всё равно
+выделяет пул.
+"""
+
+import dataclasses
+import json
+import threading
+import time
+from collections import OrderedDict
+
+from ..adapters.IAdapter import IAdapter
+from ..clock import Clock
+from ..config import AdapterConfig, Config
+from ..factory import OrchestratorFactory
+from ..schedule import LoadSchedule
+from .ports import PortAllocator
+
+# Ключ генератора: (тип, test_file, host, параметры без портов)
+GeneratorKey = tuple[str, str, str, str]
+
+
+def generator_key(adapter: AdapterConfig, allocator: PortAllocator) -> GeneratorKey:
+    port_options = set(allocator.assign(adapter.type, 0))
+    options = {k: v for k, v in (adapter.options or {}).items() if k not in port_options}
+    return (
+        adapter.type.lower(),
+        adapter.test_file,
+        adapter.host,
+        json.dumps(options, sort_keys=True, default=str),
+    )
+
+
+class PooledAdapter(IAdapter):
+    """
+    Генератор из пула: прозрачная обёртка адаптера
+
+    launch() запускает генератор только если он ещё не прогрет;
+    shutdown() генератор не останавливает - после теста его забирает
+    GeneratorPool.release().
+    """
+
+    def __init__(self, adapter: IAdapter, key: GeneratorKey, base_port: int, warm: bool):
+        super().__init__(test_file=adapter.test_file)
+        self.adapter = adapter
+        self.key = key
+        self.base_port = base_port
+        self.warm = warm
+
+    def use_clock(self, clock: Clock) -> None:
+        super().use_clock(clock)
+        self.adapter.use_clock(clock)
+
+    def launch(self):
+        if not self.warm:
+            self.adapter.launch()
+
+    def is_ready(self):
+        return self.adapter.is_ready()
+
+    def configure(self, **kwargs):
+        self.adapter.configure(**kwargs)
+
+    def get_stats(self):
+        return self.adapter.get_stats()
+
+    def stop(self):
+        self.adapter.stop()
+
+    def shutdown(self):
+        pass  # Генератор остаётся запущенным до GeneratorPool.release()
+
+    def generator_pids(self) -> list[int]:
+        return self.adapter.generator_pids()
+
+    def scale_out(self) -> bool:
+        return self.adapter.scale_out()
+
+    def push_schedule(self, schedule: LoadSchedule) -> bool:
+        return False  # Расписание вшивается при запуске - такие тесты идут мимо пула
+
+    def min_step_duration(self) -> float:
+        return self.adapter.min_step_duration()
+
+    def interval_percentiles(self) -> bool:
+        return self.adapter.interval_percentiles()
+
+    def min_sampling_interval(self) -> float:
+        return self.adapter.min_sampling_interval()
+
+
+class GeneratorPool:
+    """Прогретые генераторы по ключам и выделение портов"""
+
+    def __init__(self, allocator: PortAllocator | None = None, max_idle: int = 4, ready_timeout: float = 60):
+        """
+        Args:
+            allocator: Выделение портов (по умолчанию диапазон 20000-21000)
+            max_idle: Сколько простаивающих генераторов держать (лишние - старые - останавливаются)
+            ready_timeout: Сколько ждать готовности генератора при прогреве (сек)
+        """
+        self.allocator = allocator or PortAllocator()
+        self.max_idle = max_idle
+        self.ready_timeout = ready_timeout
+        self._idle: OrderedDict[int, PooledAdapter] = OrderedDict()  # base_port -> генератор, от старых к новым
+        self._leases: dict[int, list[int]] = {}  # id(адаптера) -> блоки портов непулового теста
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def poolable(config: Config) -> bool:
+        """Можно ли отдать тесту прогретый генератор"""
+        return config.compare is None and config.orchestrator.schedule == 'live'
+
+    def _new(self, adapter_config: AdapterConfig, key: GeneratorKey) -> PooledAdapter:
+        base = self.allocator.allocate()
+        ports = self.allocator.assign(adapter_config.type, base)
+        try:
+            adapter = OrchestratorFactory._build_adapter(dataclasses.replace(
+                adapter_config,
+                port=ports.pop('port'),
+                options={**(adapter_config.options or {}), **ports},
+            ))
+        except Exception:
+            self.allocator.release(base)
+            raise
+        return PooledAdapter(adapter, key, base, warm=False)
+
+    def acquire(self, config: Config) -> IAdapter:
+        """
+        Адаптер для теста: прогретый из пула или новый на свободных портах
+
+        Args:
+            config: Конфигурация теста
+
+        Returns:
+            Адаптер; после теста его нужно вернуть через release()
+
+        Raises:
+            ValueError: Если конфиг адаптера невалиден
+            RuntimeError: Если кончились порты
+        """
+        if not self.poolable(config):
+            return self._acquire_unpooled(config)
+
+        key = generator_key(config.adapter, self.allocator)
+        with self._lock:
+            for base, pooled in self._idle.items():
+                if pooled.key == key:
+                    del self._idle[base]
+                    self.hits += 1
+                    return pooled
+            self.misses += 1
+        return self._new(config.adapter, key)
+
+    def _acquire_unpooled(self, config: Config) -> IAdapter:
+        """Одноразовый адаптер (A/B-сравнение, расписание push) на выделенных портах"""
+        blocks: list[int] = []
+        try:
+            def ports(adapter_config: AdapterConfig) -> dict[str, int]:
+                blocks.append(self.allocator.allocate())
+                return self.allocator.assign(adapter_config.type, blocks[-1])
+
+            if config.compare is None:
+                assigned = ports(config.adapter)
+                config = dataclasses.replace(config, adapter=dataclasses.replace(
+                    config.adapter,
+                    port=assigned.pop('port'),
+                    options={**(config.adapter.options or {}), **assigned},
+                ))
+            else:
+                compare = config.compare
+                config = dataclasses.replace(config, compare=dataclasses.replace(
+                    compare,
+                    a={**compare.a, **ports(compare.adapter_config(config.adapter, 'a'))},
+                    b={**compare.b, **ports(compare.adapter_config(config.adapter, 'b'))},
+                ))
+            adapter = OrchestratorFactory.create_adapter(config)
+        except Exception:
+            for base in blocks:
+                self.allocator.release(base)
+            raise
+
+        with self._lock:
+            self._leases[id(adapter)] = blocks
+        return adapter
+
+    def release(self, adapter: IAdapter) -> None:
+        """
+        Вернуть адаптер после теста
+
+        Прогретый генератор сбрасывается и остаётся в пуле, если
+        recycle() удался; иначе он останавливается, порты освобождаются.
+        """
+        if not isinstance(adapter, PooledAdapter):
+            with self._lock:
+                blocks = self._leases.pop(id(adapter), [])
+            try:
+                adapter.shutdown()
+            finally:
+                for base in blocks:
+                    self.allocator.release(base)
+            return
+
+        try:
+            adapter.stop()
+            reusable = adapter.adapter.recycle()
+        except Exception as e:
+            print(f"⚠️  Generator on port {adapter.base_port} cannot be reused: {e}")
+            reusable = False
+
+        if not reusable:
+            self._discard(adapter)
+            return
+
+        adapter.warm = True
+        with self._lock:
+            self._idle[adapter.base_port] = adapter
+            evicted = []
+            while len(self._idle) > self.max_idle:
+                evicted.append(self._idle.popitem(last=False)[1])
+        for pooled in evicted:
+            self._discard(pooled)
+
+    def _discard(self, pooled: PooledAdapter) -> None:
+        try:
+            pooled.adapter.shutdown()
+        finally:
+            self.allocator.release(pooled.base_port)
+
+    def warm(self, config: Config, count: int = 1) -> None:
+        """
+        Заранее запустить генераторы для конфига
+
+        Args:
+            config: Конфигурация теста (берётся секция adapter)
+            count: Сколько генераторов запустить
+
+        Raises:
+            RuntimeError: Если генератор не стал готов за ready_timeout
+        """
+        if not self.poolable(config):
+            raise ValueError("Only single-target configs with schedule: live can be pre-warmed")
+
+        key = generator_key(config.adapter, self.allocator)
+        for _ in range(count):
+            pooled = self._new(config.adapter, key)
+            pooled.adapter.launch()
+            deadline = time.time() + self.ready_timeout
+            while not pooled.adapter.is_ready():
+                if time.time() > deadline:
+                    self._discard(pooled)
+                    raise RuntimeError(f"Generator for {config.adapter.test_file} is not ready")
+                time.sleep(0.5)
+            pooled.warm = True
+            print(f"🔥 Warm generator: {config.adapter.type} {config.adapter.test_file} on port {pooled.base_port}")
+            with self._lock:
+                self._idle[pooled.base_port] = pooled
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'idle': len(self._idle),
+                'ports_in_use': self.allocator.in_use,
+                'hits': self.hits,
+                'misses': self.misses,
+            }
+
+    def close(self) -> None:
+        """Остановить все простаивающие генераторы"""
+        with self._lock:
+            idle = list(self._idle.values())
+            self._idle.clear()
+        for pooled in idle:
+            self._discard(pooled)
@@ -0,0 +1,91 @@
+"""
+Выделение портов генераторам
+
+Все конфиги в configs/ слушают один и тот же порт веб-интерфейса, и
+параллельные прогоны в CI сталкиваются. Демон раздаёт каждому генератору
+свой блок портов из диапазона: port адаптера - первый порт блока,
+служебные порты адаптера (PORT_OPTIONS) - со смещением внутри блока.
+"""
+
+import socket
+import threading
+
+# Служебные порты адаптеров: параметр -> смещение от port
+# (JMeter занимает port и port + 1 под BeanShell-сервер)
+PORT_OPTIONS: dict[str, dict[str, int]] = {
+    'locust': {'master_port': 1},
+    'jmeter': {'shutdown_port': 2},
+}
+
+BLOCK_SIZE = 3
+
+
+def _is_free(port: int) -> bool:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        try:
+            s.bind(('127.0.0.1', port))
+        except OSError:
+            return False
+    return True
+
+
+class PortAllocator:
+    """Блоки портов из диапазона [start, end)"""
+
+    def __init__(self, start: int = 20000, end: int = 21000, block: int = BLOCK_SIZE):
+        """
+        Args:
+            start: Первый порт диапазона
+            end: Конец диапазона (не включается)
+            block: Портов на один генератор
+        """
+        if not 0 < start < end <= 65536:
+            raise ValueError("Invalid port range")
+        if end - start < block:
+            raise ValueError("Port range is smaller than one block")
+        self.start = start
+        self.end = end
+        self.block = block
+        self._used: set[int] = set()
+        self._lock = threading.Lock()
+
+    def allocate(self) -> int:
+        """
+        Выделить блок портов
+
+        Пропускаются блоки, порты которых уже заняты другими процессами.
+
+        Returns:
+            Первый порт блока
+
+        Raises:
+            RuntimeError: Если свободных блоков нет
+        """
+        with self._lock:
+            for base in range(self.start, self.end - self.block + 1, self.block):
+                if base in self._used:
+                    continue
+                if all(_is_free(port) for port in range(base, base + self.block)):
+                    self._used.add(base)
+                    return base
+        raise RuntimeError(f"No free ports in range {self.start}-{self.end}")
+
+    def release(self, base: int) -> None:
+        with self._lock:
+            self._used.discard(base)
+
+    def assign(self, adapter_type: str, base: int) -> dict[str, int]:
+        """
+        Порты адаптера для блока base
+
+        Returns:
+            {'port': base, <служебный порт>: base + смещение, ...}
+        """
+        ports = {'port': base}
+        for option, offset in PORT_OPTIONS.get(adapter_type.lower(), {}).items():
+            ports[option] = base + offset
+        return ports
+
+    @property
+    def in_use(self) -> int:
+        return len(self._used)
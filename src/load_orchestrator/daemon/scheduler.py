@@ -0,0 +1,210 @@
+"""
+Очередь тестов: приоритеты и ёмкость
+
+Каждый тест стоит столько единиц ёмкости, сколько процессов генератора
+он запускает (Locust: 1 + workers; A/B-сравнение - вдвое больше).
+Одновременно идут тесты, пока их суммарная стоимость не превышает
+capacity. Из очереди всегда берётся тест с наибольшим приоритетом (при
+равных - раньше поставленный); если он не помещается, более дешёвые
+тесты за ним не обгоняют его, иначе большой тест мог бы ждать вечно.
+Тест дороже всей ёмкости запускается, когда больше ничего не идёт.
+
+Каждый тест выполняется своим Orchestrator в отдельном потоке.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+import traceback
+from dataclasses import dataclass, field
+
+from ..config import Config
+from ..factory import OrchestratorFactory
+from ..models import TestResult
+from ..orchestrator import Orchestrator
+from .pool import GeneratorPool
+
+JOB_STATES = ('queued', 'running', 'finished', 'failed', 'cancelled')
+
+
+def job_cost(config: Config) -> int:
+    """Сколько процессов генератора запускает тест"""
+    def processes(options: dict | None) -> int:
+        return 1 + int((options or {}).get('workers', 0))
+
+    if config.compare is None:
+        return processes(config.adapter.options)
+    return sum(
+        processes(config.compare.adapter_config(config.adapter, side).options) for side in ('a', 'b')
+    )
+
+
+@dataclass
+class Job:
+    """Тест в очереди демона"""
+    id: str
+    config: Config
+    priority: int = 0
+    cost: int = 1
+    name: str = ''
+    submitted_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    state: str = 'queued'
+    result: TestResult | None = None
+    error: str | None = None
+    done: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    def to_dict(self) -> dict:
+        """Состояние задачи для ответа status (без результата)"""
+        return {
+            'id': self.id,
+            'name': self.name,
+            'priority': self.priority,
+            'cost': self.cost,
+            'state': self.state,
+            'submitted_at': self.submitted_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+            'error': self.error,
+        }
+
+
+class TestQueue:
+    """Планировщик тестов демона"""
+
+    def __init__(self, pool: GeneratorPool, capacity: int = 4, keep_finished: int = 100):
+        """
+        Args:
+            pool: Пул генераторов
+            capacity: Единиц ёмкости (процессов генератора) на все идущие тесты
+            keep_finished: Сколько завершённых задач помнить для status
+        """
+        if capacity < 1:
+            raise ValueError("'capacity' must be positive")
+        self.pool = pool
+        self.capacity = capacity
+        self.keep_finished = keep_finished
+
+        self._heap: list[tuple[int, int, Job]] = []
+        self._jobs: dict[str, Job] = {}
+        self._running: dict[str, Job] = {}
+        self._used = 0
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def submit(self, config: Config, priority: int = 0, name: str = '') -> Job:
+        """
+        Поставить тест в очередь
+
+        Args:
+            config: Конфигурация теста
+            priority: Приоритет (больше - раньше)
+            name: Имя для status (например, путь конфига)
+
+        Returns:
+            Задача; job.done выставляется по завершении
+        """
+        with self._lock:
+            seq = next(self._ids)
+            job = Job(id=str(seq), config=config, priority=priority, cost=job_cost(config), name=name)
+            self._jobs[job.id] = job
+            heapq.heappush(self._heap, (-priority, seq, job))
+        print(f"📥 Job {job.id} queued: {name or config.strategy.type} (priority {priority}, cost {job.cost})")
+        self._dispatch()
+        return job
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Снять тест из очереди (идущие тесты не прерываются)
+
+        Returns:
+            True если задача была в очереди и снята
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.state != 'queued':
+                return False
+            job.state = 'cancelled'
+            job.finished_at = time.time()
+        job.done.set()
+        self._dispatch()
+        return True
+
+    def position(self, job_id: str) -> int | None:
+        """Место задачи в очереди (0 - следующая) или None, если она не в очереди"""
+        with self._lock:
+            queued = sorted(entry for entry in self._heap if entry[2].state == 'queued')
+            for i, (_, _, job) in enumerate(queued):
+                if job.id == job_id:
+                    return i
+        return None
+
+    def jobs(self) -> list[Job]:
+        with self._lock:
+            return list(self._jobs.values())
+
+    def _dispatch(self) -> None:
+        """Запустить тесты из головы очереди, пока хватает ёмкости"""
+        with self._lock:
+            while self._heap:
+                job = self._heap[0][2]
+                if job.state != 'queued':
+                    heapq.heappop(self._heap)  # Снятая задача
+                    continue
+                fits = self._used + job.cost <= self.capacity
+                if not fits and self._running:
+                    break
+                heapq.heappop(self._heap)
+                job.state = 'running'
+                job.started_at = time.time()
+                self._used += job.cost
+                self._running[job.id] = job
+                threading.Thread(target=self._run, args=(job,), name=f"job-{job.id}", daemon=True).start()
+
+    def _run(self, job: Job) -> None:
+        print(f"▶️  Job {job.id} started")
+        adapter = None
+        try:
+            adapter = self.pool.acquire(job.config)
+            orchestrator = Orchestrator(
+                config=job.config,
+                adapter=adapter,
+                strategy=OrchestratorFactory.create_strategy(job.config),
+                collectors=OrchestratorFactory.create_collectors(job.config),
+            )
+            job.result = orchestrator.run()
+            job.state = 'finished'
+        except Exception as e:
+            traceback.print_exc()
+            job.error = f"{type(e).__name__}: {e}"
+            job.state = 'failed'
+        finally:
+            if adapter is not None:
+                try:
+                    self.pool.release(adapter)
+                except Exception as e:
+                    print(f"⚠️  Failed to release generator of job {job.id}: {e}")
+            job.finished_at = time.time()
+            with self._lock:
+                self._used -= job.cost
+                del self._running[job.id]
+                self._forget_finished()
+            job.done.set()
+            print(f"⏹️  Job {job.id} {job.state}")
+            self._dispatch()
+
+    def _forget_finished(self) -> None:
+        finished = [j for j in self._jobs.values() if j.done.is_set()]
+        for job in finished[:max(0, len(finished) - self.keep_finished)]:
+            del self._jobs[job.id]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'capacity': self.capacity,
+                'used': self._used,
+                'running': len(self._running),
+                'queued': sum(1 for _, _, job in self._heap if job.state == 'queued'),
+            }
@@ -0,0 +1,125 @@
+"""
+Сервер демона: JSON-строки по Unix-сокету
+
+Запрос - одна строка JSON с полем op, ответ - строки JSON:
+
+    {"op": "submit", "config": {...}, "priority": 0, "name": "sla.yaml"}
+        -> {"id": "1", "state": "queued", "position": 0}
+        -> {"id": "1", "state": "finished", "result": {...}}   (по завершении теста)
+    {"op": "status"}
+        -> {"jobs": [...], "queue": {...}, "pool": {...}}
+    {"op": "cancel", "id": "1"}
+        -> {"cancelled": true}
+
+config - содержимое YAML с абсолютными путями (см. client.submit),
+result - TestResult в формате store.result_to_dict. Ошибки - {"error": "..."}.
+"""
+
+import json
+import os
+import socketserver
+import tempfile
+import threading
+
+from ..config import Config
+from ..store import result_to_dict
+from .scheduler import TestQueue
+
+
+def default_socket_path() -> str:
+    """Сокет демона по умолчанию: в XDG_RUNTIME_DIR или во временном каталоге"""
+    directory = os.environ.get('XDG_RUNTIME_DIR') or tempfile.gettempdir()
+    return os.path.join(directory, f"load-orchestrator-{os.getuid()}.sock")
+
+
+def send(stream, message: dict) -> None:
+    stream.write(json.dumps(message).encode() + b"\n")
+    stream.flush()
+
+
+def receive(stream) -> dict | None:
+    line = stream.readline()
+    if not line:
+        return None
+    return json.loads(line)
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    server: "DaemonServer"
+
+    def handle(self):
+        try:
+            request = receive(self.rfile)
+        except ValueError as e:
+            send(self.wfile, {'error': f"Invalid request: {e}"})
+            return
+        if request is None:
+            return
+
+        queue = self.server.queue
+        match request.get('op'):
+            case 'submit':
+                self._submit(queue, request)
+            case 'status':
+                send(self.wfile, {
+                    'jobs': [job.to_dict() for job in queue.jobs()],
+                    'queue': queue.stats(),
+                    'pool': queue.pool.stats(),
+                })
+            case 'cancel':
+                send(self.wfile, {'cancelled': queue.cancel(str(request.get('id')))})
+            case op:
+                send(self.wfile, {'error': f"Unknown op: {op!r}"})
+
+    def _submit(self, queue: TestQueue, request: dict) -> None:
+        try:
+            config = Config.from_dict(request.get('config') or {})
+            priority = int(request.get('priority', 0))
+        except (ValueError, TypeError, KeyError) as e:
+            send(self.wfile, {'error': str(e)})
+            return
+
+        job = queue.submit(config, priority=priority, name=request.get('name', ''))
+        send(self.wfile, {'id': job.id, 'state': job.state, 'position': queue.position(job.id)})
+        if not request.get('wait', True):
+            return
+
+        job.done.wait()
+        response = {'id': job.id, 'state': job.state}
+        if job.result is not None:
+            response['result'] = result_to_dict(job.result)
+        if job.error is not None:
+            response['error'] = job.error
+        try:
+            send(self.wfile, response)
+        except OSError:
+            pass  # Клиент не дождался - результат остаётся в status и в runs_dir
+
+
+class DaemonServer(socketserver.ThreadingUnixStreamServer):
+    """Unix-сокет демона; каждый клиент - в своём потоке"""
+
+    daemon_threads = True
+
+    def __init__(self, path: str, queue: TestQueue):
+        """
+        Args:
+            path: Путь к сокету (старый файл сокета удаляется)
+            queue: Очередь тестов
+        """
+        if os.path.exists(path):
+            os.unlink(path)
+        self.path = path
+        self.queue = queue
+        super().__init__(path, _Handler)
+        os.chmod(path, 0o600)  # Только владелец может ставить тесты
+
+    def start(self) -> "DaemonServer":
+        """Обслуживать запросы в фоновом потоке"""
+        threading.Thread(target=self.serve_forever, name="daemon-server", daemon=True).start()
+        return self
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
@@ -3,53 +3,48 @@ Factory для создания Orchestrator из конфига
 
 Автоматически создаёт:
 - Adapter (LocustAdapter, JMeterAdapter, etc.)
-- Strategy (DegradationSearch, Spike, SLAValidation, etc.)
+- Strategy (DegradationSearch, Spike, SLAValidation, Pipeline, etc.)
 - Orchestrator с правильными зависимостями
+
+Типы берутся из реестров плагинов (registry) и импортируются лениво.
 """
 
-from .config import Config
+from .clock import Clock
+from .config import Config, AdapterConfig, CollectorConfig
 from .orchestrator import Orchestrator
 from .adapters.IAdapter import IAdapter
-from .strategies.base import IStrategy
-
-# Импорт адаптеров
-from .adapters.LocustAdapter import LocustAdapter
-
-# Импорт стратегий
-from .strategies.degradation_search import DegradationSearch
-from .strategies.break_point import BreakPoint
-from .strategies.sla_validation import SLAValidation
-from .strategies.target_rps import TargetRPS
-from .strategies.spike import Spike
-from .strategies.canary import Canary
+from .strategies.base import IStrategy, COMMON_PARAMS
+from .collectors.base import ICollector
+from .instrumentation import OrchestratorHook
 from .models import SpikeConfig
+from . import registry
 
 
 class OrchestratorFactory:
     """Фабрика для создания Orchestrator из конфига"""
 
-    # Маппинг типов адаптеров на классы
-    ADAPTERS = {
-        'locust': LocustAdapter,
-        # 'jmeter': JMeterAdapter,  # TODO
-        # 'gatling': GatlingAdapter,  # TODO
-    }
-
-    # Маппинг типов стратегий на классы
-    STRATEGIES = {
-        'degradation_search': DegradationSearch,
-        'break_point': BreakPoint,
-        'sla_validation': SLAValidation,
-        'target_rps': TargetRPS,
-        'spike': Spike,
-        'canary': Canary,
-    }
+    # Реестры плагинов: модули импортируются, только когда конфиг на них ссылается
+    # (сторонние плагины подключаются через entry points, см. registry)
+    ADAPTERS = registry.ADAPTERS
+    STRATEGIES = registry.STRATEGIES
+    COLLECTORS = registry.COLLECTORS
+
+    @staticmethod
+    def _load_plugin(plugins: registry.PluginRegistry, name: str, kind: str) -> type:
+        """Импортировать класс плагина; ошибка импорта превращается в ValueError конфига"""
+        try:
+            return plugins[name]
+        except (ImportError, AttributeError) as e:
+            raise ValueError(f"Cannot load {kind} '{name}': {e}") from e
 
     @classmethod
     def create_adapter(cls, config: Config) -> IAdapter:
         """
         Создать адаптер из конфига
 
+        С секцией compare создаются два адаптера (секция adapter с
+        переопределениями compare.a и compare.b), обёрнутые в ComparisonAdapter.
+
         Args:
             config: Конфигурация
 
@@ -59,7 +54,24 @@ class OrchestratorFactory:
         Raises:
             ValueError: Если тип адаптера не поддерживается
         """
-        adapter_type = config.adapter.type.lower()
+        if config.compare is None:
+            return cls._build_adapter(config.adapter)
+
+        from .adapters.comparison import ComparisonAdapter
+
+        compare = config.compare
+        return ComparisonAdapter(
+            a=cls._build_adapter(compare.adapter_config(config.adapter, 'a')),
+            b=cls._build_adapter(compare.adapter_config(config.adapter, 'b')),
+            mode=compare.mode,
+            slice_duration=compare.slice,
+            settle_samples=compare.settle_samples,
+            labels=(compare.label('a'), compare.label('b')),
+        )
+
+    @classmethod
+    def _build_adapter(cls, adapter_config: AdapterConfig) -> IAdapter:
+        adapter_type = adapter_config.type.lower()
 
         if adapter_type not in cls.ADAPTERS:
             supported = ', '.join(cls.ADAPTERS.keys())
@@ -68,14 +80,20 @@ class OrchestratorFactory:
                 f"Supported types: {supported}"
             )
 
-        adapter_class = cls.ADAPTERS[adapter_type]
+        adapter_class = cls._load_plugin(cls.ADAPTERS, adapter_type, 'adapter')
 
         # Создать адаптер с параметрами из конфига
-        return adapter_class(
-            test_file=config.adapter.test_file,
-            host=config.adapter.host,
-            port=config.adapter.port
-        )
+        try:
+            return adapter_class(
+                test_file=adapter_config.test_file,
+                host=adapter_config.host,
+                port=adapter_config.port,
+                **(adapter_config.options or {})
+            )
+        except TypeError as e:
+            raise ValueError(
+                f"Invalid parameters for adapter '{adapter_type}': {e}"
+            ) from e
 
     @classmethod
     def create_strategy(cls, config: Config) -> IStrategy:
@@ -91,7 +109,24 @@ class OrchestratorFactory:
         Raises:
             ValueError: Если тип стратегии не поддерживается или параметры неверны
         """
-        strategy_type = config.strategy.type.lower()
+        return cls._build_strategy(config.strategy.type, config.strategy.params or {})
+
+    @classmethod
+    def _build_strategy(cls, strategy_type: str, params: dict) -> IStrategy:
+        """
+        Создать стратегию по типу и параметрам
+
+        Args:
+            strategy_type: Тип стратегии из STRATEGIES
+            params: Параметры стратегии
+
+        Returns:
+            Экземпляр стратегии
+
+        Raises:
+            ValueError: Если тип стратегии не поддерживается или параметры неверны
+        """
+        strategy_type = strategy_type.lower()
 
         if strategy_type not in cls.STRATEGIES:
             supported = ', '.join(cls.STRATEGIES.keys())
@@ -100,8 +135,18 @@ class OrchestratorFactory:
                 f"Supported types: {supported}"
             )
 
-        strategy_class = cls.STRATEGIES[strategy_type]
-        params = config.strategy.params or {}
+        strategy_class = cls._load_plugin(cls.STRATEGIES, strategy_type, 'strategy')
+
+        # Общие для всех стратегий параметры (percentiles, ramp_samples)
+        params = dict(params)
+        common = {}
+        for name, modes in COMMON_PARAMS.items():
+            value = params.pop(name, modes[0])
+            if value not in modes:
+                raise ValueError(
+                    f"Invalid {name}: '{value}'. Supported: {', '.join(modes)}"
+                )
+            common[name] = value
 
         # Создать стратегию с параметрами из конфига
         try:
@@ -114,39 +159,141 @@ class OrchestratorFactory:
                     spike_duration=params.get('spike_duration', 60),
                     recovery_users=params.get('recovery_users', 50),
                     recovery_duration=params.get('recovery_duration', 30),
+                    spikes=params.get('spikes', 1),
+                    recovery_tolerance=params.get('recovery_tolerance', 10.0),
+                    error_tolerance=params.get('error_tolerance', 1.0),
+                    recovery_hold=params.get('recovery_hold', 3),
+                    burst_interval=params.get('burst_interval', 0.25),
                 )
-                return strategy_class(config=spike_config)
+                strategy = strategy_class(config=spike_config)
+
+            # Pipeline - список вложенных стратегий
+            elif strategy_type == 'pipeline':
+                strategy = cls._build_pipeline(params, common)
 
             # Все остальные стратегии принимают параметры напрямую
-            return strategy_class(**params)
+            else:
+                strategy = strategy_class(**params)
 
         except TypeError as e:
             raise ValueError(
                 f"Invalid parameters for strategy '{strategy_type}': {e}"
             ) from e
 
+        for name, value in common.items():
+            setattr(strategy, name, value)
+        return strategy
+
+    @classmethod
+    def _build_pipeline(cls, params: dict, common: dict | None = None) -> IStrategy:
+        """
+        Создать Pipeline из списка стадий
+
+        Каждая стадия описывается как обычная секция strategy:
+        type + параметры, опционально name для отчёта.
+
+        Args:
+            params: Параметры pipeline (stages, carry_load)
+            common: Общие параметры стратегий по умолчанию для стадий (percentiles, ramp_samples)
+
+        Returns:
+            Pipeline со стадиями
+        """
+        stages_data = params.get('stages') or []
+        if not stages_data:
+            raise ValueError("Pipeline requires non-empty 'stages' list")
+
+        stages = []
+        names = []
+        for i, stage_data in enumerate(stages_data):
+            stage_params = {k: v for k, v in stage_data.items() if k not in ('type', 'name')}
+            for name, value in (common or {}).items():
+                stage_params.setdefault(name, value)
+            stage_type = stage_data['type'].lower()
+            if stage_type == 'pipeline':
+                raise ValueError("Nested pipelines are not supported")
+
+            stages.append(cls._build_strategy(stage_type, stage_params))
+            names.append(stage_data.get('name', f"{i + 1}:{stage_type}"))
+
+        return cls.STRATEGIES['pipeline'](
+            stages=stages,
+            names=names,
+            carry_load=params.get('carry_load', True)
+        )
+
+    @classmethod
+    def create_collectors(cls, config: Config) -> list[ICollector]:
+        """
+        Создать сборщики метрик SUT из конфига
+
+        Args:
+            config: Конфигурация
+
+        Returns:
+            Список сборщиков (пустой, если секция collectors не задана)
+
+        Raises:
+            ValueError: Если тип сборщика не поддерживается или параметры неверны
+        """
+        return [cls._build_collector(c) for c in config.collectors]
+
+    @classmethod
+    def _build_collector(cls, collector_config: CollectorConfig) -> ICollector:
+        collector_type = collector_config.type.lower()
+
+        if collector_type not in cls.COLLECTORS:
+            supported = ', '.join(cls.COLLECTORS.keys())
+            raise ValueError(
+                f"Unsupported collector type: '{collector_type}'. "
+                f"Supported types: {supported}"
+            )
+
+        collector_class = cls._load_plugin(cls.COLLECTORS, collector_type, 'collector')
+
+        try:
+            return collector_class(
+                name=collector_config.name,
+                **(collector_config.params or {})
+            )
+        except TypeError as e:
+            raise ValueError(
+                f"Invalid parameters for collector '{collector_config.name}': {e}"
+            ) from e
+
     @classmethod
-    def create_orchestrator(cls, config: Config) -> Orchestrator:
+    def create_orchestrator(
+        cls,
+        config: Config,
+        hooks: list[OrchestratorHook] | None = None,
+        clock: Clock | None = None,
+    ) -> Orchestrator:
         """
         Создать полностью настроенный Orchestrator из конфига
 
         Args:
             config: Конфигурация из YAML
+            hooks: Хуки телеметрии оркестратора
+            clock: Часы (по умолчанию системные; VirtualClock - прогон без ожиданий)
 
         Returns:
             Готовый к запуску Orchestrator
         """
         adapter = cls.create_adapter(config)
         strategy = cls.create_strategy(config)
+        collectors = cls.create_collectors(config)
 
         return Orchestrator(
             config=config,
             adapter=adapter,
-            strategy=strategy
+            strategy=strategy,
+            hooks=hooks,
+            collectors=collectors,
+            clock=clock
         )
 
     @classmethod
-    def from_yaml(cls, config_path: str) -> Orchestrator:
+    def from_yaml(cls, config_path: str, hooks: list[OrchestratorHook] | None = None) -> Orchestrator:
         """
         Создать Orchestrator напрямую из YAML файла
 
@@ -154,10 +301,11 @@ class OrchestratorFactory:
 
         Args:
             config_path: Путь к YAML конфигу
+            hooks: Хуки телеметрии оркестратора
 
         Returns:
             Готовый к запуску Orchestrator
 
         """
         config = Config.from_yaml(config_path)
-        return cls.create_orchestrator(config)
\ No newline at end of file
+        return cls.create_orchestrator(config, hooks=hooks)
\ No newline at end of file
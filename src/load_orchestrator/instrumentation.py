@@ -0,0 +1,147 @@
+"""
+Самоинструментирование главного цикла оркестратора
+
+Оркестратор меряет собственные задержки, чтобы при странном прогоне было
+видно, кто опоздал - генератор, сеть или сам оркестратор:
+- tick.lateness             - насколько позже плана проснулся цикл
+- monitor.lateness          - насколько позже плана собраны метрики
+- adapter.<method>          - длительность вызовов адаптера (get_stats, configure, ...)
+- strategy.<method>         - длительность decide() / get_next_users()
+- load.convergence          - время от configure() до появления целевого
+                              количества пользователей в метриках
+
+Агрегаты считаются потоково (count/total/min/max/last) без хранения сэмплов,
+поэтому накладные расходы - пара perf_counter() и арифметика на вызов.
+Длительности вызовов - реальное время процесса; опоздания и сходимость -
+по часам оркестратора (с VirtualClock - виртуальное время теста).
+Для внешней телеметрии передайте свои OrchestratorHook в Orchestrator.
+"""
+
+import time
+from typing import Any, Callable
+
+from .clock import SYSTEM_CLOCK, Clock
+from .models import RawMetrics, Decision
+
+
+class OrchestratorHook:
+    """
+    Хук для внешней телеметрии
+
+    Переопределите нужные методы. Хуки вызываются синхронно из главного
+    цикла, поэтому должны быть быстрыми (тяжёлую работу - в свою очередь/поток).
+    Исключения в хуках не останавливают тест.
+    """
+
+    def on_timing(self, name: str, seconds: float) -> None:
+        """Новый замер времени (имена см. в модуле instrumentation)"""
+        pass
+
+    def on_sample(self, metrics: RawMetrics) -> None:
+        """Новые метрики от генератора"""
+        pass
+
+    def on_decision(self, decision: Decision, users: int) -> None:
+        """Решение стратегии и текущая нагрузка"""
+        pass
+
+
+class TimingStats:
+    """Потоковый агрегат длительностей"""
+
+    __slots__ = ('count', 'total', 'min', 'max', 'last')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = float('inf')
+        self.max = 0.0
+        self.last = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.last = seconds
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def to_dict(self) -> dict[str, float]:
+        return {
+            'count': self.count,
+            'mean': self.mean,
+            'min': self.min if self.count else 0.0,
+            'max': self.max,
+            'last': self.last,
+        }
+
+
+class LoopInstrumentation:
+    """Замеры главного цикла и рассылка их хукам"""
+
+    def __init__(self, hooks: list[OrchestratorHook] | None = None, clock: Clock = SYSTEM_CLOCK):
+        self.hooks: list[OrchestratorHook] = list(hooks or [])
+        self.clock = clock
+        self.timings: dict[str, TimingStats] = {}
+
+        self._convergence_target: int | None = None
+        self._convergence_started: float | None = None
+
+    def record(self, name: str, seconds: float) -> None:
+        """Записать замер и отдать его хукам"""
+        stats = self.timings.get(name)
+        if stats is None:
+            stats = self.timings[name] = TimingStats()
+        stats.record(seconds)
+
+        for hook in self.hooks:
+            self._notify(hook.on_timing, name, seconds)
+
+    def call(self, name: str, fn: Callable, *args, **kwargs) -> Any:
+        """Вызвать fn и записать его длительность под именем name"""
+        started = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self.record(name, time.perf_counter() - started)
+
+    def sample(self, metrics: RawMetrics) -> None:
+        """Отдать метрики хукам и проверить достижение целевой нагрузки"""
+        if self._convergence_target is not None and metrics.users == self._convergence_target:
+            self.record('load.convergence', self.clock.time() - self._convergence_started)
+            self._convergence_target = None
+
+        for hook in self.hooks:
+            self._notify(hook.on_sample, metrics)
+
+    def decision(self, decision: Decision, users: int) -> None:
+        """Отдать решение стратегии хукам"""
+        for hook in self.hooks:
+            self._notify(hook.on_decision, decision, users)
+
+    def load_changed(self, target_users: int | None) -> None:
+        """
+        Начать замер сходимости нагрузки после configure()
+
+        Args:
+            target_users: Целевое количество пользователей
+                (None - сходимость не отслеживается, например в открытой модели)
+        """
+        self._convergence_target = target_users
+        self._convergence_started = self.clock.time()
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Агрегаты всех замеров"""
+        return {name: stats.to_dict() for name, stats in self.timings.items()}
+
+    @staticmethod
+    def _notify(method: Callable, *args) -> None:
+        try:
+            method(*args)
+        except Exception as e:
+            print(f"⚠️  Instrumentation hook failed: {e!r}")
@@ -0,0 +1,19 @@
+"""
+Плагины, которые загружаются внутри процесса Locust
+
+Импортируются только из locustfile (требуют установленного locust).
+
+- pacing: открытая модель нагрузки (PacedHttpUser)
+- latency: перцентили без coordinated omission
+  (import load_orchestrator.locust_plugin.latency)
+- stream: статистика интервалами по Unix-сокету вместо REST-опроса
+  (LocustAdapter с stream: true подключает его сам)
+"""
+
+from .pacing import PacedHttpUser, PacedUserMixin, ArrivalRatePacer
+
+__all__ = [
+    'PacedHttpUser',
+    'PacedUserMixin',
+    'ArrivalRatePacer',
+]
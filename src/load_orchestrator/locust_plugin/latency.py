@@ -0,0 +1,87 @@
+"""
+Плагин задержек без coordinated omission
+
+Загружается внутри процесса Locust (импортом в locustfile). Слушает
+события request и копит за окно две гистограммы: сырую и
+скорректированную (см. analytics.latency). Оркестратор забирает окно
+через эндпоинт веб-интерфейса, после чего окно начинается заново:
+
+    GET /orchestrator/latency -> {"count", "raw": {"p50", "p95", "p99"},
+                                  "corrected": {"p50", "p95", "p99"}}
+
+Коррекция:
+- пользователи PacedUserMixin передают плановое время отправки в
+  context запроса, задержка считается от него;
+- для остальных пропущенные запросы достраиваются по ожидаемому интервалу.
+  Интервал задаётся переменной окружения ORCHESTRATOR_EXPECTED_INTERVAL_MS,
+  иначе выводится из wait_time пользователей: при постоянном think time
+  (constant(), в том числе 0 по умолчанию) это think time плюс медиана
+  сырых задержек прошлого окна;
+- если интервал неизвестен (between(), constant_pacing() и т.п.), запросы
+  без планового времени не корректируются, и corrected в окне без
+  таких запросов равен null.
+
+В распределённом режиме worker'ы отправляют свои гистограммы master'у в
+отчётах, master складывает их в своё окно.
+
+Пример locustfile:
+
+    import load_orchestrator.locust_plugin.latency  # noqa: F401
+"""
+
+import os
+
+from locust import events
+
+from ..analytics.latency import LatencyHistogram, LatencyWindow, constant_think_time
+from .pacing import PacedUserMixin
+
+LATENCY_PATH = "/orchestrator/latency"
+REPORT_KEY = "orchestrator_latency"
+
+def _expected_interval_from_env() -> float | None:
+    value = os.environ.get("ORCHESTRATOR_EXPECTED_INTERVAL_MS")
+    return float(value) if value else None
+
+
+window = LatencyWindow(expected_interval=_expected_interval_from_env())
+
+
+@events.request.add_listener
+def _on_request(response_time, context=None, start_time=None, **kwargs):
+    intended = (context or {}).get("intended_send_time")
+    window.record(response_time, start_time, intended)
+
+
+@events.init.add_listener
+def _on_init(environment, **kwargs):
+    unpaced = [u for u in environment.user_classes if not issubclass(u, PacedUserMixin)]
+    if unpaced and window.expected_interval is None:
+        window.think_time = constant_think_time(unpaced)
+        if window.think_time is None:
+            print(
+                "⚠️  Latency correction disabled for non-paced users: wait_time is not constant "
+                "(set ORCHESTRATOR_EXPECTED_INTERVAL_MS or use PacedHttpUser)"
+            )
+
+    if environment.web_ui is None:
+        return
+
+    from flask import jsonify
+
+    @environment.web_ui.app.route(LATENCY_PATH)
+    def latency():
+        return jsonify(window.take())
+
+
+@events.report_to_master.add_listener
+def _on_report_to_master(client_id, data, **kwargs):
+    data[REPORT_KEY] = (window.raw.to_dict(), window.corrected.to_dict())
+    window.roll()
+
+
+@events.worker_report.add_listener
+def _on_worker_report(client_id, data, **kwargs):
+    if REPORT_KEY in data:
+        raw, corrected = data[REPORT_KEY]
+        window.merge(LatencyHistogram.from_dict(raw), LatencyHistogram.from_dict(corrected))
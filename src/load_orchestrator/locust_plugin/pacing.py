@@ -0,0 +1,237 @@
+"""
+Pacing-плагин для открытой модели нагрузки (arrival rate)
+
+Загружается внутри процесса Locust (импортом в locustfile). Пользователи,
+унаследованные от PacedHttpUser/PacedUserMixin, отправляют запросы не
+"как только освободились", а по общему расписанию слотов с темпом
+arrival_rate запросов в секунду. Темп меняется на лету оркестратором
+через эндпоинт веб-интерфейса:
+
+    POST /orchestrator/arrival_rate  rate=<req/s>
+    GET  /orchestrator/arrival_rate  -> {"target_rate", "offered_rate", "missed_rate"}
+
+offered_rate - сколько слотов генератор реально выдал пользователям,
+missed_rate - сколько слотов пропущено, потому что весь пул был занят
+(признак того, что pool_users мал для текущего времени ответа).
+
+В распределённом режиме master делит темп поровну между worker'ами
+и собирает счётчики слотов из их отчётов. В отчёте worker сообщает и
+свою долю темпа: если она не совпадает с текущей (worker подключился
+после задания темпа, scale_out, другой worker потерян), master
+досылает ему правильную долю.
+
+Пример locustfile:
+
+    from locust import task
+    from load_orchestrator.locust_plugin import PacedHttpUser
+
+    class Api(PacedHttpUser):
+        @task
+        def index(self):
+            self.client.get("/")
+"""
+
+import time
+
+import gevent
+from locust import HttpUser, events
+from locust.runners import MasterRunner, WorkerRunner
+
+ARRIVAL_RATE_PATH = "/orchestrator/arrival_rate"
+RATE_MESSAGE = "orchestrator_arrival_rate"
+REPORT_KEY = "orchestrator_pacing"
+
+IDLE_POLL_INTERVAL = 0.1  # Как часто проверять темп, пока он равен 0 (сек)
+
+
+class ArrivalRatePacer:
+    """
+    Общее для процесса расписание слотов отправки
+
+    Слоты идут строго через 1/rate секунд и не зависят от того, когда
+    закончились предыдущие запросы. Если пул не успевает и слот отстал
+    больше чем на max_lag, пропущенные слоты учитываются в missed и не
+    отправляются пачкой.
+
+    Locust работает на gevent (кооперативная многозадачность), поэтому
+    блокировки не нужны.
+    """
+
+    def __init__(self, max_lag: float = 1.0):
+        self.max_lag = max_lag
+        self.rate = 0.0
+        self.offered = 0
+        self.missed = 0
+        self._next_slot: float | None = None
+
+    def set_rate(self, rate: float) -> None:
+        """Задать темп (запросов/сек); расписание начинается заново"""
+        self.rate = max(0.0, float(rate))
+        self._next_slot = None
+
+    def next_slot(self) -> float | None:
+        """
+        Занять следующий слот
+
+        Returns:
+            Плановое время отправки (timestamp) или None, если темп равен 0
+        """
+        if self.rate <= 0:
+            return None
+
+        now = time.time()
+        interval = 1.0 / self.rate
+        slot = self._next_slot if self._next_slot is not None else now
+
+        if slot < now - self.max_lag:
+            skipped = int((now - slot) / interval)
+            self.missed += skipped
+            slot += skipped * interval
+
+        self._next_slot = slot + interval
+        self.offered += 1
+        return slot
+
+
+pacer = ArrivalRatePacer()
+
+
+class PacedUserMixin:
+    """
+    Примесь для пользователей Locust с темпом из общего расписания
+
+    После ожидания в атрибуте intended_send_time лежит плановое время
+    отправки текущего запроса (для метрик без coordinated omission).
+    Если переопределяете on_start, вызовите super().on_start().
+    """
+
+    intended_send_time: float | None = None
+
+    def wait_time(self) -> float:
+        while True:
+            slot = pacer.next_slot()
+            if slot is not None:
+                break
+            gevent.sleep(IDLE_POLL_INTERVAL)
+
+        self.intended_send_time = slot
+        return max(0.0, slot - time.time())
+
+    def on_start(self) -> None:
+        # Первая задача тоже должна ждать своего слота
+        gevent.sleep(self.wait_time())
+
+    def context(self) -> dict:
+        # Плановое время относится только к первому запросу задачи
+        context = super().context()
+        if self.intended_send_time is not None:
+            context = {**context, "intended_send_time": self.intended_send_time}
+            self.intended_send_time = None
+        return context
+
+
+class PacedHttpUser(PacedUserMixin, HttpUser):
+    """HttpUser с темпом отправки из ArrivalRatePacer"""
+
+    abstract = True
+
+
+class _PacingReport:
+    """Счётчики слотов для ответа оркестратору (на master или в одиночном режиме)"""
+
+    def __init__(self):
+        self.worker_counters: dict[str, tuple[int, int]] = {}
+        self._last_offered = 0
+        self._last_missed = 0
+        self._last_time = time.time()
+
+    def totals(self, environment) -> tuple[int, int]:
+        if isinstance(environment.runner, MasterRunner):
+            offered = sum(c[0] for c in self.worker_counters.values())
+            missed = sum(c[1] for c in self.worker_counters.values())
+            return offered, missed
+        return pacer.offered, pacer.missed
+
+    def window(self, environment) -> tuple[float, float]:
+        """Темп выданных и пропущенных слотов с прошлого запроса"""
+        offered, missed = self.totals(environment)
+        now = time.time()
+        elapsed = max(now - self._last_time, 1e-6)
+
+        offered_rate = (offered - self._last_offered) / elapsed
+        missed_rate = (missed - self._last_missed) / elapsed
+
+        self._last_offered, self._last_missed, self._last_time = offered, missed, now
+        return offered_rate, missed_rate
+
+
+_report = _PacingReport()
+_target_rate = 0.0
+_master: MasterRunner | None = None
+
+SHARE_TOLERANCE = 1e-6  # Относительное расхождение доли темпа, которое не досылаем
+
+
+def _worker_share(runner: MasterRunner) -> float:
+    return _target_rate / max(1, runner.worker_count)
+
+
+def _apply_rate(environment, rate: float) -> None:
+    global _target_rate
+    _target_rate = rate
+
+    runner = environment.runner
+    if isinstance(runner, MasterRunner):
+        runner.send_message(RATE_MESSAGE, _worker_share(runner))
+    else:
+        pacer.set_rate(rate)
+
+
+def _correct_worker_share(runner: MasterRunner, client_id: str, worker_rate: float) -> None:
+    """Дослать worker'у долю темпа, если его доля устарела"""
+    share = _worker_share(runner)
+    if abs(worker_rate - share) > SHARE_TOLERANCE * max(share, 1.0):
+        runner.send_message(RATE_MESSAGE, share, client_id=client_id)
+
+
+@events.init.add_listener
+def _on_init(environment, **kwargs):
+    global _master
+    runner = environment.runner
+
+    if isinstance(runner, MasterRunner):
+        _master = runner
+    if isinstance(runner, WorkerRunner):
+        runner.register_message(RATE_MESSAGE, lambda msg, **kw: pacer.set_rate(msg.data))
+
+    if environment.web_ui is None:
+        return
+
+    from flask import request, jsonify
+
+    @environment.web_ui.app.route(ARRIVAL_RATE_PATH, methods=["GET", "POST"])
+    def arrival_rate():
+        if request.method == "POST":
+            _apply_rate(environment, float(request.form["rate"]))
+
+        offered_rate, missed_rate = _report.window(environment)
+        return jsonify(
+            target_rate=_target_rate,
+            offered_rate=offered_rate,
+            missed_rate=missed_rate,
+        )
+
+
+@events.report_to_master.add_listener
+def _on_report_to_master(client_id, data, **kwargs):
+    data[REPORT_KEY] = (pacer.offered, pacer.missed, pacer.rate)
+
+
+@events.worker_report.add_listener
+def _on_worker_report(client_id, data, **kwargs):
+    if REPORT_KEY not in data:
+        return
+    report = tuple(data[REPORT_KEY])
+    _report.worker_counters[client_id] = report[:2]
+    if _master is not None and len(report) > 2:
+        _correct_worker_share(_master, client_id, report[2])
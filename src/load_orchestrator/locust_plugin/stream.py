@@ -0,0 +1,115 @@
+"""
+Push-плагин: интервальные гистограммы в оркестратор по Unix-сокету
+
+Загружается внутри процесса Locust: импортом в locustfile или
+дополнительным файлом в -f (LocustAdapter с stream: true добавляет его
+сам). Слушает события request и раз в ORCHESTRATOR_STREAM_INTERVAL
+секунд (по умолчанию 1) отправляет статистику интервала датаграммой на
+сокет ORCHESTRATOR_STREAM_SOCKET (см. load_orchestrator.adapters.stream).
+Вместе с гистограммой уходят top-k сигнатур ошибок интервала
+(load_orchestrator.analytics.failures) - полный список ошибок Locust не
+сериализуется - и гистограммы эндпоинтов интервала (для SLO по эндпоинтам).
+Без переменной окружения плагин ничего не делает.
+
+Отправка неблокирующая: если оркестратор не слушает или не успевает
+читать, интервал отбрасывается (счётчик lost), а не сливается со
+следующим - иначе датаграмма росла бы, пока не перестанет помещаться в
+буфер сокета. seq при этом всё равно растёт, и оркестратор видит потерю
+по пропуску. Master в распределённом режиме ничего не шлёт - шлют worker'ы.
+
+Импорты абсолютные: при загрузке через -f файл исполняется как
+отдельный модуль, а не как часть пакета.
+"""
+
+import os
+import socket
+import time
+
+import gevent
+from locust import events
+from locust.runners import MasterRunner
+
+from load_orchestrator.adapters.stream import SOCKET_ENV, INTERVAL_ENV, ENDPOINT_PRECISION, encode_interval
+from load_orchestrator.analytics.failures import SpaceSaving, normalize
+from load_orchestrator.analytics.latency import LatencyHistogram
+
+
+class IntervalStream:
+    """Статистика текущего интервала и отправка в сокет"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.histogram = LatencyHistogram()
+        self.failures = 0
+        self.signatures = SpaceSaving()  # Top-k сигнатур ошибок интервала
+        self.elapsed_sum = 0.0
+        self.endpoints: dict[str, tuple[LatencyHistogram, int]] = {}  # "<метод> <имя>" -> (гистограмма, ошибки)
+        self.seq = 0
+        self.lost = 0  # Интервалы, которые не удалось отправить
+        self.pid = os.getpid()
+
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._socket.setblocking(False)
+
+    def record(self, endpoint: str, response_time: float, exception: BaseException | None) -> None:
+        self.histogram.record(response_time)
+        self.elapsed_sum += response_time
+        histogram, failures = self.endpoints.get(endpoint) or (LatencyHistogram(precision=ENDPOINT_PRECISION), 0)
+        histogram.record(response_time)
+        if exception is not None:
+            self.failures += 1
+            self.signatures.add(normalize(repr(exception)))
+            failures += 1
+        self.endpoints[endpoint] = (histogram, failures)
+
+    def flush(self, users: int, timestamp: float) -> None:
+        data = encode_interval(
+            self.pid, self.seq, timestamp, users, self.failures, self.elapsed_sum, self.histogram,
+            {signature: int(count) for signature, count, _ in self.signatures.top()},
+            self.endpoints,
+        )
+        try:
+            self._socket.sendto(data, self.path)
+        except OSError:
+            # Оркестратор ещё не слушает или буфер полон: интервал потерян
+            self.lost += 1
+
+        self.seq += 1
+        self.histogram.reset()
+        self.failures = 0
+        self.signatures.clear()
+        self.endpoints = {}
+        self.elapsed_sum = 0.0
+
+
+def _run(stream: IntervalStream, environment, interval: float) -> None:
+    while True:
+        gevent.sleep(interval)
+        runner = environment.runner
+        stream.flush(users=runner.user_count if runner else 0, timestamp=time.time())
+
+
+def _install() -> None:
+    path = os.environ.get(SOCKET_ENV)
+    if not path:
+        return
+
+    interval = float(os.environ.get(INTERVAL_ENV, "1"))
+    stream = IntervalStream(path)
+
+    @events.request.add_listener
+    def _on_request(request_type, name, response_time, exception=None, **kwargs):
+        # Имя как в /stats/requests LocustAdapter: "<метод> <имя>"
+        stream.record(f"{request_type or ''} {name}".strip(), response_time, exception)
+
+    @events.init.add_listener
+    def _on_init(environment, **kwargs):
+        if isinstance(environment.runner, MasterRunner):
+            return
+        gevent.spawn(_run, stream, environment, interval)
+
+
+# Плагин может быть подключён дважды (импортом в locustfile и через -f)
+if not getattr(events, "_orchestrator_stream_installed", False):
+    events._orchestrator_stream_installed = True
+    _install()
@@ -20,6 +20,8 @@ class StopReason(Enum):
     TARGET_REACHED = auto()  # Цель достигнута
     SLA_VIOLATED = auto()    # SLA нарушен
     MAX_USERS = auto()       # Достигнут лимит юзеров
+    GENERATOR_SATURATED = auto()  # Упёрлись в генератор, а не в систему
+    STOP_RULE = auto()       # Сработало правило из stop_rules (см. TestResult.stop_rule)
     TIMEOUT = auto()         # Таймаут теста
     MANUAL = auto()          # Ручная остановка
     ERROR = auto()           # Ошибка
@@ -37,6 +39,41 @@ class RawMetrics:
     failed_requests: int
     error_rate: float
     total_requests: int
+    offered_rps: float | None = None  # Предложенная нагрузка в open-модели (rps - фактическая)
+    generator_cpu: float | None = None  # CPU самого загруженного процесса генератора (% ядра)
+    generator_saturated: bool = False  # Генератор насыщен: метрики ограничены им, а не системой
+    # Перцентили с коррекцией coordinated omission (None - плагин latency не подключён)
+    p50_corrected: float | None = None
+    p95_corrected: float | None = None
+    p99_corrected: float | None = None
+    # p50/p95/p99 (и перцентили endpoints) накоплены с начала теста, а не за интервал (Locust REST);
+    # *_corrected всегда за интервал
+    cumulative_percentiles: bool = False
+    sampling_interval: float | None = None  # Секунд с предыдущего сэмпла (фактический темп мониторинга)
+    ramping: bool = False  # Снят до того, как генератор достиг заданного количества пользователей
+    # Метрики SUT от сборщиков, снятые в тот же момент: "<сборщик>.<метрика>" -> значение
+    server: dict[str, float] = field(default_factory=dict)
+    # Ошибки интервала по сигнатурам (top-k): сигнатура -> % запросов интервала (см. analytics.failures)
+    failures: dict[str, float] = field(default_factory=dict)
+    # Эндпоинты за интервал: "<метод> <имя>" -> {requests, failures, p50, p95, p99, max} (см. slo)
+    endpoints: dict[str, dict[str, float]] = field(default_factory=dict)
+
+    def latency(self, name: str, corrected: bool = False) -> float:
+        """
+        Перцентиль задержки
+
+        Args:
+            name: 'p50', 'p95' или 'p99'
+            corrected: Взять скорректированное значение, если оно есть
+
+        Returns:
+            Задержка в мс (сырая, если скорректированной нет)
+        """
+        if corrected:
+            value = getattr(self, f"{name}_corrected")
+            if value is not None:
+                return value
+        return getattr(self, name)
 
 @dataclass
 class TestResult:
@@ -46,7 +83,31 @@ class TestResult:
     max_stable_users: int
     max_stable_rps: float
     stop_reason: StopReason
+    stop_rule: str | None = None  # Сработавшее правило при stop_reason STOP_RULE
     history: list[RawMetrics] = field(default_factory=list)
+    name: str | None = None  # Имя стадии пайплайна
+    stages: list["TestResult"] = field(default_factory=list)  # Результаты стадий пайплайна
+    failed_stage: str | None = None  # Стадия пайплайна, на которой тест остановлен (не пройдена или прервана)
+    timings: dict[str, dict[str, float]] = field(default_factory=dict)  # Замеры самого оркестратора
+    seeded_from: str | None = None  # Прогон, из которого взят тёплый старт
+    seed_verified: bool | None = None  # Подтвердился ли тёплый старт (False - откат на холодный)
+    intervals: dict | None = None  # Доверительные интервалы по ступеням и ёмкости (см. analytics.bootstrap)
+    failures: list[dict] = field(default_factory=list)  # Преобладающие сигнатуры ошибок прогона (FailureSummary)
+    comparison: dict | None = None  # Итог A/B-сравнения двух целей (см. analytics.comparison)
+    strategy_report: dict | None = None  # Итог стратегии (IStrategy.report), например SLO по ступеням
+    # Решения по сэмплам: подряд идущие одинаковые (решение, нагрузка, источник) схлопнуты в одну запись
+    # {timestamp, until, decision, users, to, samples, source}; to - новая нагрузка, если решение её изменило
+    decisions: list[dict] = field(default_factory=list)
+
+
+@dataclass
+class WarmStart:
+    """Тёплый старт из прошлого прогона того же конфига (см. warmstart)"""
+    source: str  # Идентификатор прогона
+    start_users: int  # С какой нагрузки начинать
+    baseline: list[RawMetrics]  # Сэмплы прошлого прогона на нагрузке не выше start_users
+    expected_p95: float  # Ожидаемый p95 на start_users по прошлому прогону
+    expected_error_rate: float  # Ожидаемый error rate на start_users
 
 
 class SpikePhase(Enum):
@@ -63,4 +124,9 @@ class SpikeConfig:
     spike_users: int = 500
     spike_duration: float = 60
     recovery_users: int = 50
-    recovery_duration: float = 30
\ No newline at end of file
+    recovery_duration: float = 30
+    spikes: int = 1  # Сколько раз повторить spike -> recovery
+    recovery_tolerance: float = 10.0  # Допуск p95 от базовой линии для восстановления (%)
+    error_tolerance: float = 1.0  # Допуск ошибок от базовой линии (п.п.)
+    recovery_hold: int = 3  # Сэмплов подряд в допуске, чтобы считать систему восстановившейся
+    burst_interval: float | None = 0.25  # Частый сбор метрик у переходов фаз (None - как в orchestrator)
\ No newline at end of file
@@ -1,10 +1,23 @@
-import time
-from datetime import datetime
+import math
 
+from .clock import SYSTEM_CLOCK, Clock
 from .models import State, StopReason, TestResult, RawMetrics, Decision
 from .config import Config
 from .adapters.IAdapter import IAdapter
 from .strategies.base import IStrategy
+from .strategies.pipeline import Pipeline
+from .instrumentation import LoopInstrumentation, OrchestratorHook
+from .collectors.base import ICollector, CollectorPool
+from .adapters.comparison import ComparisonAdapter
+from .analytics.bootstrap import bootstrap_report
+from .analytics.comparison import compare_report
+from .analytics.failures import FailureSummary
+from .ramp import RampController
+from .schedule import LoadSchedule
+from .sampling import AdaptiveSampler
+from .rules import RuleSet, StopRule
+from .store import RunStore, config_fingerprint
+from .warmstart import UNUSABLE_STOP_REASONS, WarmStartVerifier, build_warm_start
 
 
 class Orchestrator:
@@ -15,19 +28,206 @@ class Orchestrator:
     1. INIT - запуск генератора и подготовка
     2. RUNNING - цикл сбора метрик и принятия решений
     3. FINISHED - остановка и формирование результата
+
+    Значения нагрузки от стратегий - пользователи в закрытой модели
+    (load_model: closed) или запросы в секунду в открытой (load_model: open).
+
+    Если стратегия - Pipeline, фаза RUNNING повторяется для каждой стадии
+    в рамках одной сессии генератора (без повторного запуска и стабилизации).
+
+    Оркестратор меряет собственные задержки (см. instrumentation): опоздание
+    тиков, длительность вызовов адаптера и стратегии, сходимость нагрузки.
+    Агрегаты попадают в TestResult.timings, сырые замеры - в hooks.
+
+    Сборщики метрик SUT (collectors) опрашиваются параллельно с запросом
+    метрик генератора; их значения попадают в RawMetrics.server того же
+    сэмпла и проверяются по server_limits.
+
+    Изменения нагрузки в закрытой модели проходят через RampController:
+    spawn_rate не выше измеренной способности генератора, сэмплы до
+    фактического завершения рампы помечаются ramping (стратегии с
+    ramp_samples: exclude их не получают и держат нагрузку).
+
+    В режиме schedule: push плановая нагрузка стратегии (get_schedule)
+    компилируется в расписание и исполняется самим генератором: переходы
+    точны по его часам, оркестратор только отслеживает план, собирает
+    метрики и останавливает тест.
+
+    Интервал мониторинга адаптивный (см. sampling): с burst_interval
+    метрики собираются часто после изменений нагрузки и при шуме метрик,
+    иначе - раз в monitoring_interval.
+
+    Правила stop_rules из конфига (см. rules) проверяются на каждом сэмпле
+    поверх решений стратегии; сработавшее правило попадает в
+    TestResult.stop_rule.
+
+    С orchestrator.runs_dir результат сохраняется в хранилище прогонов, а
+    с warm_start стратегия стартует с базовой линии и нагрузки последнего
+    прогона того же конфига. Первые сэмплы проверяют засев (стратегия их
+    не получает); если он не подтвердился - откат на холодный старт.
+
+    Сигнатуры ошибок сэмплов (RawMetrics.failures) копятся в итог прогона
+    (TestResult.failures); ошибки, подходящие под ignore_failures, не
+    входят в error_rate, который видят стратегия и правила (с
+    ignore_failures error_rate - доля ошибок за интервал).
+
+    Всё время цикла (тики, ожидания, таймстемпы результата) берётся из
+    clock (см. clock); он же передаётся стратегии и адаптеру. С
+    VirtualClock и адаптером-симулятором тест проходит без ожиданий.
     """
 
-    def __init__(self, config: Config, adapter: IAdapter, strategy: IStrategy):
+    MIN_TICK = 0.01  # Минимальный шаг цикла (сек)
+
+    def __init__(
+        self,
+        config: Config,
+        adapter: IAdapter,
+        strategy: IStrategy,
+        hooks: list[OrchestratorHook] | None = None,
+        collectors: list[ICollector] | None = None,
+        clock: Clock | None = None
+    ):
         self.config = config
         self.adapter = adapter
         self.strategy = strategy
+        self.clock = clock or SYSTEM_CLOCK
+        adapter.use_clock(self.clock)
+        strategy.use_clock(self.clock)
+        self.instrumentation = LoopInstrumentation(hooks, clock=self.clock)
+        self.collectors = CollectorPool(
+            collectors, timeout=config.orchestrator.collector_timeout
+        ) if collectors else None
 
         self.state = State.INIT
         self.current_users: int = 0
         self.started_at: float | None = None
         self.finished_at: float | None = None
         self.history: list[RawMetrics] = []
+        self.decisions: list[dict] = []  # См. TestResult.decisions
         self.stop_reason: StopReason = StopReason.MANUAL
+        self.stop_rule: StopRule | None = None
+        self.rules = RuleSet(config.stop_rules) if config.stop_rules else None
+        self.failures = FailureSummary()
+        self._ignored_failures = [p.lower() for p in config.orchestrator.ignore_failures or []]
+        self._failure_counters: tuple[int, int] | None = None  # Накопленные запросы/ошибки прошлого сэмпла
+
+        # Результаты стадий пайплайна
+        self.stage_results: list[TestResult] = []
+        self._stage_started_at: float | None = None
+        self._stage_start_index: int = 0
+        self._stage_decision_index: int = 0
+
+        # Рампы нагрузки (закрытая модель)
+        self.ramp = RampController(spawn_rate=config.orchestrator.spawn_rate)
+
+        # Насыщение генератора
+        self._saturated_streak: int = 0
+        self._next_scale_out_time: float = 0.0
+
+        # Хранилище прогонов и тёплый старт
+        self.store = RunStore(config.orchestrator.runs_dir) if config.orchestrator.runs_dir else None
+        self.fingerprint = config_fingerprint(config) if self.store is not None else None
+        self.seeded_from: str | None = None
+        self.seed_verified: bool | None = None
+        self._verifier: WarmStartVerifier | None = None
+        if config.orchestrator.warm_start and self.store is not None:
+            self._seed_strategy()
+
+        # Темп мониторинга (burst_interval из конфига или нужный стратегии/стадии)
+        self.sampler = AdaptiveSampler(
+            interval=config.orchestrator.monitoring_interval,
+            burst_interval=self._burst_interval(),
+            burst_window=config.orchestrator.burst_window,
+            burst_cv=config.orchestrator.burst_cv,
+        )
+
+        if self.strategy.needs_interval_percentiles() and not self.adapter.interval_percentiles():
+            raise ValueError(
+                f"Strategy {type(self.strategy).__name__} needs per-interval percentiles (latency SLOs), "
+                f"but {type(self.adapter).__name__} reports cumulative ones; "
+                f"use a streaming adapter mode (locust: stream: true) or availability SLOs"
+            )
+
+        # Расписание, переданное генератору (schedule: push)
+        self.schedule: LoadSchedule | None = None
+        if config.orchestrator.schedule == 'push':
+            self.schedule = self._push_schedule()
+
+    def _seed_strategy(self) -> None:
+        """Засеять стратегию последним пригодным прогоном того же конфига"""
+        latest = self.store.latest(self.fingerprint, exclude=UNUSABLE_STOP_REASONS)
+        if latest is None:
+            print("🧊 Warm start: no previous runs of this config, cold start")
+            return
+
+        run_id, previous = latest
+        seed = build_warm_start(run_id, previous, fraction=self.config.orchestrator.warm_start_fraction)
+        if seed is None or not self.strategy.warm_start(seed):
+            print(f"🧊 Warm start: run {run_id} is not usable for {type(self.strategy).__name__}, cold start")
+            return
+
+        self.seeded_from = run_id
+        self._verifier = WarmStartVerifier(
+            seed,
+            samples=self.config.orchestrator.verify_samples,
+            tolerance=self.config.orchestrator.verify_tolerance,
+        )
+        print(f"🔥 Warm start from run {run_id}: {seed.start_users} users, {len(seed.baseline)} baseline samples")
+
+    def _verify_warm_start(self, metrics: RawMetrics) -> bool | None:
+        """
+        Проверить засев очередным сэмплом; при неудаче откатиться на холодный старт
+
+        Returns:
+            None пока проверка идёт, True если засев подтверждён, False если откат
+        """
+        verdict = self._verifier.observe(metrics)
+        if verdict is None:
+            return None
+
+        self._verifier = None
+        self.seed_verified = verdict
+        if verdict:
+            print("✅ Warm start verified")
+            return True
+
+        print("🧊 Falling back to cold start")
+        self.strategy.cold_start()
+        self.current_users = self.instrumentation.call(
+            'strategy.get_next_users', self.strategy.get_next_users, 0, self._dummy_metrics()
+        )
+        self._configure_load(self.current_users)
+        return False
+
+    def _push_schedule(self) -> LoadSchedule:
+        """
+        Скомпилировать плановую нагрузку стратегии и передать её адаптеру
+
+        Перед таймлайном стратегии расписание держит его начальную нагрузку
+        stabilization_time секунд - как живой режим во время стабилизации.
+
+        Raises:
+            ValueError: Если стратегия не знает нагрузку заранее или адаптер
+                не умеет исполнять расписание
+        """
+        timeline = self.strategy.get_schedule()
+        if timeline is None:
+            raise ValueError(
+                f"Strategy {type(self.strategy).__name__} has no precomputed schedule, "
+                f"use schedule: live"
+            )
+
+        points, duration = timeline
+        schedule = LoadSchedule.compile(
+            points,
+            duration=duration,
+            spawn_rate=self.config.orchestrator.spawn_rate,
+            resolution=self.strategy.get_tick_interval(),
+            lead_in=(self.config.orchestrator.stabilization_time, points[0][1]),
+        )
+        if not self.adapter.push_schedule(schedule):
+            raise ValueError(f"Adapter {type(self.adapter).__name__} does not support schedule: push")
+        return schedule
 
     def run(self) -> TestResult:
         """
@@ -41,6 +241,8 @@ class Orchestrator:
         try:
             self._init_phase()
             self._running_phase()
+            while self._next_stage():
+                self._running_phase(hold_initial_load=True)
         except Exception as e:
             self.stop_reason = StopReason.ERROR
             raise
@@ -49,34 +251,107 @@ class Orchestrator:
 
     def _init_phase(self) -> None:
         """Фаза инициализации: запуск генератора и настройка начальной нагрузки"""
-        self.started_at = datetime.now().timestamp()
+        self.started_at = self.clock.time()
+        self._stage_started_at = self.started_at
         self.state = State.INIT
 
         # Запустить генератор нагрузки
-        self.adapter.launch()
+        self.instrumentation.call('adapter.launch', self.adapter.launch)
         self._wait_until_ready()
 
         # Получить начальное количество пользователей из стратегии
         self._configure_initial_load()
 
-        time.sleep(20) # стабилизация
+        self.clock.sleep(self.config.orchestrator.stabilization_time) # стабилизация
 
         self.state = State.RUNNING
 
     def _wait_until_ready(self) -> None:
         """Ожидание готовности генератора нагрузки"""
-        while not self.adapter.is_ready():
-            time.sleep(1)
+        while not self.instrumentation.call('adapter.is_ready', self.adapter.is_ready):
+            self.clock.sleep(1)
 
     def _configure_initial_load(self) -> None:
         """
         Конфигурация начальной нагрузки
 
-        Получает initial_users из стратегии через get_next_users(0, dummy_metrics)
+        Получает initial_users из стратегии через get_next_users(0, dummy_metrics).
+        В режиме schedule: push вместо этого запускает расписание генератора.
+        """
+        # Получить начальное количество пользователей из стратегии
+        self.current_users = self.instrumentation.call(
+            'strategy.get_next_users', self.strategy.get_next_users, 0, self._dummy_metrics()
+        )
+
+        if self.schedule is not None:
+            now = self.clock.time()
+            self.ramp.start(self.current_users, self.schedule.steps[0].spawn_rate, now)
+            self.instrumentation.call('adapter.start_schedule', self.adapter.start_schedule)
+            self.instrumentation.load_changed(self.current_users)
+            self.sampler.load_changed(now)
+            for step in self.schedule.steps[1:]:
+                self.sampler.expect_change(now + step.at)
+            return
+
+        # Настроить генератор
+        self._configure_load(self.current_users)
+
+
+
+    def _record_decision(self, timestamp: float, decision: Decision, source: str) -> None:
+        """Дописать решение в журнал (повтор предыдущего без смены нагрузки - продлить запись)"""
+        last = self.decisions[-1] if self.decisions else None
+        if last is not None and last['to'] is None and last['decision'] == decision.name \
+                and last['users'] == self.current_users and last['source'] == source:
+            last['until'] = timestamp
+            last['samples'] += 1
+            return
+        self.decisions.append({
+            'timestamp': timestamp,
+            'until': timestamp,
+            'decision': decision.name,
+            'users': self.current_users,
+            'to': None,
+            'samples': 1,
+            'source': source,
+        })
+
+    def _burst_interval(self) -> float | None:
+        """
+        burst_interval из конфига, иначе - нужный текущей стратегии (стадии)
+
+        Не чаще, чем адаптер обновляет метрики (IAdapter.min_sampling_interval):
+        более частый опрос вычитывал бы пустые окна.
+        """
+        interval = self.config.orchestrator.burst_interval or self.strategy.get_burst_interval()
+        if interval is None:
+            return None
+        return max(interval, self.adapter.min_sampling_interval())
+
+    def _expect_timeline(self, now: float) -> None:
         """
-        # Создать dummy metrics для получения initial_users
-        dummy_metrics = RawMetrics(
-            timestamp=datetime.now().timestamp(),
+        Передать sampler'у плановые переходы стратегии (schedule: live)
+
+        Таймлайн стратегии (get_schedule) отсчитывается от первого сэмпла
+        фазы RUNNING (стадии пайплайна), поэтому сэмплы приходятся точно на
+        границы фаз, а не на следующий медленный тик. В режиме push переходы
+        уже переданы из расписания генератора.
+        """
+        if self.schedule is not None or not self.sampler.enabled:
+            return
+        planned = self.strategy.current if isinstance(self.strategy, Pipeline) else self.strategy
+        timeline = planned.get_schedule()
+        if timeline is None:
+            return
+        points, duration = timeline
+        for at, _ in points[1:]:
+            self.sampler.expect_change(now + at)
+        self.sampler.expect_change(now + duration)
+
+    def _dummy_metrics(self) -> RawMetrics:
+        """Пустые метрики для запроса начальной нагрузки у стратегии"""
+        return RawMetrics(
+            timestamp=self.clock.time(),
             users=0,
             rps=0.0,
             rt_avg=0.0,
@@ -88,36 +363,114 @@ class Orchestrator:
             total_requests=0
         )
 
-        # Получить начальное количество пользователей из стратегии
-        self.current_users = self.strategy.get_next_users(0, dummy_metrics)
+    def _next_stage(self) -> bool:
+        """
+        Перейти к следующей стадии пайплайна
 
-        # Настроить генератор
-        self.adapter.configure(
-            user_count=self.current_users,
-            spawn_rate=self.current_users
-        )
+        Закрывает текущую стадию (формирует её TestResult) и, если стадия
+        пройдена (TARGET_REACHED) и следующая есть, передаёт ей нагрузку и
+        метрики, настраивает её начальную нагрузку без перезапуска генератора.
+        Проваленная или прерванная стадия завершает тест.
+
+        Returns:
+            True если следующая стадия запущена, False если тест закончен
+        """
+        if not isinstance(self.strategy, Pipeline):
+            return False
+
+        self._close_stage()
+
+        if self.stop_reason != StopReason.TARGET_REACHED:
+            print(f"⛔ Стадия {self.strategy.current_name} не пройдена ({self.stop_reason.name}), пайплайн остановлен")
+            return False
+        if not self.strategy.has_next_stage():
+            return False
+
+        last_metrics = self.history[-1] if self.history else self._dummy_metrics()
+        self.strategy.advance(self.current_users, last_metrics)
+        if self.config.orchestrator.burst_interval is None:
+            # Burst стадии не распространяется на остальные стадии
+            self.sampler.set_burst_interval(self._burst_interval())
+
+        self._stage_started_at = self.clock.time()
+        self._stage_start_index = len(self.history)
+        self._stage_decision_index = len(self.decisions)
 
+        self.current_users = self.instrumentation.call(
+            'strategy.get_next_users', self.strategy.get_next_users, 0, last_metrics
+        )
+        self._configure_load(self.current_users)
 
+        self.stop_reason = StopReason.MANUAL
+        self.state = State.RUNNING
+        return True
 
-    def _running_phase(self) -> None:
+    def _close_stage(self) -> None:
+        """Сформировать TestResult для текущей стадии пайплайна"""
+        self.stage_results.append(self._build_result(
+            started_at=self._stage_started_at,
+            finished_at=self.clock.time(),
+            stop_reason=self.stop_reason,
+            stop_rule=self._fired_rule(),
+            history=self.history[self._stage_start_index:],
+            decisions=self.decisions[self._stage_decision_index:],
+            name=self.strategy.current_name,
+        ))
+        self.stage_results[-1].strategy_report = self.strategy.current.report()
+
+    def _running_phase(self, hold_initial_load: bool = False) -> None:
         """
         Главный цикл: сбор метрик и принятие решений
 
         Два независимых таймера:
         1. next_monitor_time - сбор метрик и принятие решений стратегией
         2. next_change_time - изменение нагрузки
+
+        Стратегии, управляемые временем (get_setpoint), дополнительно
+        применяют плановую нагрузку на каждом тике цикла.
+
+        Args:
+            hold_initial_load: Держать начальную нагрузку get_wait_time() секунд
+                перед первым изменением (для стадий пайплайна, которые
+                стартуют без стабилизации)
         """
-        next_monitor_time = time.time()
-        next_change_time = time.time()  # Время следующего изменения нагрузки
+        next_monitor_time = self.clock.time()
+        next_change_time = self.clock.time()  # Время следующего изменения нагрузки
+        if hold_initial_load:
+            next_change_time += self._step_wait_time()
+        self._expect_timeline(next_monitor_time)
+
+        instrumentation = self.instrumentation
 
         while self.state == State.RUNNING:
-            time.sleep(1)  # Проверяем каждую секунду
-            now = time.time()
+            # Проверяем не реже раза в tick_interval
+            tick = min(self.config.orchestrator.tick_interval, self.strategy.get_tick_interval())
+            if self.sampler.enabled:
+                # Проснуться точно к следующему сбору метрик (burst, плановые переходы)
+                tick = min(tick, max(next_monitor_time - self.clock.time(), self.MIN_TICK))
+            wake_at = self.clock.time() + tick
+            self.clock.sleep(tick)
+            instrumentation.record('tick.lateness', self.clock.time() - wake_at)
+            now = self.clock.time()
+
+            # Плановая нагрузка стратегий, управляемых временем
+            self._apply_setpoint(now)
 
             # Собираем метрики и принимаем решения по расписанию
             if now >= next_monitor_time:
-                metrics = self.adapter.get_stats()
+                instrumentation.record('monitor.lateness', now - next_monitor_time)
+                if self.collectors is not None:
+                    self.collectors.start()
+                metrics = instrumentation.call('adapter.get_stats', self.adapter.get_stats)
+                if self.collectors is not None:
+                    metrics.server = instrumentation.call('collectors.gather', self.collectors.gather)
+                self.failures.observe(metrics.failures)
+                if self._ignored_failures:
+                    self._ignore_failures(metrics)
+                self._track_ramp(metrics)
+                self.sampler.observe(metrics, now)
                 self.history.append(metrics)
+                instrumentation.sample(metrics)
 
                 # Проверяем критические условия оркестратора
                 if self._check_critical_conditions(metrics):
@@ -125,27 +478,189 @@ class Orchestrator:
                     self.stop_reason = StopReason.DEGRADATION
                     break
 
+                # Декларативные правила остановки
+                if self.rules is not None:
+                    fired = instrumentation.call('rules.update', self.rules.update, metrics)
+                    if fired is not None:
+                        print(f"🛑 Stop rule fired: {fired.source}")
+                        self.state = State.FINISHED
+                        self.stop_reason = StopReason.STOP_RULE
+                        self.stop_rule = fired
+                        break
+
+                # Генератор насыщен: метрики ограничены им, а не системой
+                vetoed = False
+                if metrics.generator_saturated:
+                    if self._handle_generator_saturation(now):
+                        self.state = State.FINISHED
+                        self.stop_reason = StopReason.GENERATOR_SATURATED
+                        break
+                    vetoed = self.config.orchestrator.generator_saturation == 'veto'
+                else:
+                    self._saturated_streak = 0
+
                 # Стратегия принимает решение ПРИ КАЖДОМ мониторинге
-                decision = self.strategy.decide(metrics)
+                # (в режиме veto насыщенные сэмплы до стратегии не доходят,
+                # сэмплы рампы - если стратегия их исключает)
+                if vetoed:
+                    decision, source = Decision.HOLD, 'saturation'
+                elif not self.strategy.accepts_sample(metrics):
+                    decision, source = Decision.HOLD, 'ramp'
+                elif self._verifier is not None:
+                    # Проверка тёплого старта: нагрузку держим, стратегия сэмплы не получает
+                    decision, source = Decision.HOLD, 'warm_start'
+                    if not metrics.ramping and self._verify_warm_start(metrics) is False:
+                        next_change_time = now + self.config.orchestrator.stabilization_time
+                else:
+                    decision = instrumentation.call('strategy.decide', self.strategy.decide, metrics)
+                    source = 'strategy'
+                instrumentation.decision(decision, self.current_users)
+                self._record_decision(metrics.timestamp, decision, source)
 
                 if decision == Decision.STOP:
                     self.state = State.FINISHED
-                    self.stop_reason = StopReason.TARGET_REACHED
+                    if metrics.generator_saturated and self.config.orchestrator.generator_saturation == 'veto':
+                        self.stop_reason = StopReason.GENERATOR_SATURATED
+                    elif self.strategy.passed():
+                        self.stop_reason = StopReason.TARGET_REACHED
+                    else:
+                        self.stop_reason = StopReason.SLA_VIOLATED
                     break
 
                 # Изменять нагрузку только если пришло время и решение CONTINUE
                 if decision == Decision.CONTINUE and now >= next_change_time:
-                    next_users = self.strategy.get_next_users(self.current_users, metrics)
-                    self.adapter.configure(
-                        user_count=next_users,
-                        spawn_rate=self.config.orchestrator.spawn_rate
+                    next_users = instrumentation.call(
+                        'strategy.get_next_users', self.strategy.get_next_users, self.current_users, metrics
                     )
+                    self._configure_load(next_users)
+                    self.decisions[-1]['to'] = next_users
                     self.current_users = next_users
-                    next_change_time = now + self.strategy.get_wait_time()
+                    next_change_time = now + self._step_wait_time()
 
                 # HOLD - просто не меняем нагрузку
 
-                next_monitor_time = now + self.config.orchestrator.monitoring_interval
+                next_monitor_time = now + self.sampler.next_interval(now)
+
+    def _ignore_failures(self, metrics: RawMetrics) -> None:
+        """
+        Вычесть из error_rate ожидаемые ошибки (ignore_failures); failures не меняются
+
+        Доли сигнатур - за интервал, а error_rate у Locust REST накоплен с
+        начала теста, поэтому вычитание идёт из доли ошибок интервала по
+        разности накопленных failed_requests/total_requests.
+        """
+        counters = (metrics.total_requests, metrics.failed_requests)
+        previous, self._failure_counters = self._failure_counters, counters
+        if previous is None or counters[0] < previous[0]:
+            requests, failed = counters  # Первый сэмпл или статистику генератора сбросили
+        else:
+            requests, failed = counters[0] - previous[0], max(0, counters[1] - previous[1])
+        if requests <= 0:
+            return  # Запросов за интервал не было - и сигнатур тоже
+
+        ignored = sum(
+            rate for signature, rate in metrics.failures.items()
+            if any(pattern in signature.lower() for pattern in self._ignored_failures)
+        )
+        metrics.error_rate = max(0.0, failed / requests * 100 - ignored)
+
+    def _step_wait_time(self) -> float:
+        """Пауза до следующего изменения нагрузки: стратегия, но не меньше, чем нужно адаптеру"""
+        return max(self.strategy.get_wait_time(), self.adapter.min_step_duration())
+
+    def _handle_generator_saturation(self, now: float) -> bool:
+        """
+        Реакция на насыщение генератора
+
+        Пытается добавить мощности генератору (scale_out, не чаще
+        scale_out_cooldown). В режиме veto, если генератор насыщен
+        max_saturated_samples сэмплов подряд и масштабироваться некуда,
+        тест останавливается: дальнейшие решения были бы о генераторе.
+
+        Returns:
+            True если тест нужно остановить
+        """
+        self._saturated_streak += 1
+
+        if now >= self._next_scale_out_time and self.adapter.scale_out():
+            self._next_scale_out_time = now + self.config.orchestrator.scale_out_cooldown
+            self._saturated_streak = 0
+            return False
+
+        return (
+            self.config.orchestrator.generator_saturation == 'veto'
+            and self._saturated_streak >= self.config.orchestrator.max_saturated_samples
+        )
+
+    def _apply_setpoint(self, now: float) -> None:
+        """
+        Применить плановую нагрузку стратегии, если она изменилась
+
+        Повторные configure() с тем же значением не отправляются. Скорость
+        спавна выбирается так, чтобы значение было достигнуто за один тик.
+        """
+        setpoint = self.strategy.get_setpoint(now)
+        if setpoint is None or setpoint == self.current_users:
+            return
+
+        tick = self.strategy.get_tick_interval()
+        spawn_rate = max(
+            self.config.orchestrator.spawn_rate,
+            math.ceil(abs(setpoint - self.current_users) / tick)
+        )
+        self._configure_load(setpoint, spawn_rate=spawn_rate)
+        self.current_users = setpoint
+
+    def _track_ramp(self, metrics: RawMetrics) -> None:
+        """Пометить сэмпл рампы и учесть завершение рампы (только закрытая модель)"""
+        if self.config.orchestrator.load_model == 'open':
+            return
+
+        metrics.ramping, duration = self.ramp.observe(metrics.users, metrics.timestamp)
+        if duration is not None:
+            self.instrumentation.record('ramp.duration', duration)
+
+    def _configure_load(self, load: int, spawn_rate: int | None = None) -> None:
+        """
+        Применить нагрузку с учётом модели нагрузки из конфига
+
+        В закрытой модели (closed) load - количество пользователей.
+        В открытой (open) стратегии управляют темпом: load передаётся
+        генератору как arrival_rate (запросов/сек).
+
+        В режиме schedule: push генератор меняет нагрузку сам: здесь только
+        запоминается план (для пометки сэмплов рампы), configure() не вызывается.
+
+        Args:
+            load: Значение нагрузки от стратегии
+            spawn_rate: Скорость спавна пользователей (по умолчанию - из RampController)
+        """
+        now = self.clock.time()
+        if self.schedule is not None:
+            # Моменты переходов уже переданы sampler'у из расписания
+            self.ramp.start(load, spawn_rate or self.config.orchestrator.spawn_rate, now)
+            self.instrumentation.load_changed(load)
+            return
+
+        self.sampler.load_changed(now)
+
+        if self.config.orchestrator.load_model == 'open':
+            self.instrumentation.call(
+                'adapter.configure', self.adapter.configure,
+                arrival_rate=load, spawn_rate=spawn_rate or self.config.orchestrator.spawn_rate
+            )
+            self.instrumentation.load_changed(None)
+            return
+
+        if spawn_rate is None:
+            spawn_rate = self.ramp.plan(load, now)
+        else:
+            self.ramp.start(load, spawn_rate, now)
+
+        self.instrumentation.call(
+            'adapter.configure', self.adapter.configure, user_count=load, spawn_rate=spawn_rate
+        )
+        self.instrumentation.load_changed(load)
 
     def _check_critical_conditions(self, metrics: RawMetrics) -> bool:
         """
@@ -155,6 +670,7 @@ class Orchestrator:
         - Катастрофический error rate (>50%)
         - Полная неработоспособность (RPS = 0)
         - Превышение max_users из конфига
+        - Превышение server_limits по метрикам SUT
 
         Returns:
             True если обнаружено критическое состояние, False иначе
@@ -172,6 +688,13 @@ class Orchestrator:
             if metrics.users >= self.config.orchestrator.max_users:
                 return True
 
+        # Лимиты метрик SUT
+        for key, limit in (self.config.orchestrator.server_limits or {}).items():
+            value = metrics.server.get(key)
+            if value is not None and value > limit:
+                print(f"⚠️  Server limit exceeded: {key}={value:.2f} > {limit}")
+                return True
+
         return False
 
     def _finished_phase(self) -> TestResult:
@@ -182,29 +705,116 @@ class Orchestrator:
             TestResult с результатами теста
         """
         self.state = State.FINISHED
-        self.finished_at = datetime.now().timestamp()
+        self.finished_at = self.clock.time()
 
         # Остановить генератор нагрузки
-        self.adapter.stop()
+        self.instrumentation.call('adapter.stop', self.adapter.stop)
         self.adapter.shutdown()
+        if self.collectors is not None:
+            self.collectors.close()
 
+        # Закрыть последнюю стадию пайплайна
+        if isinstance(self.strategy, Pipeline) and len(self.stage_results) <= self.strategy.index:
+            self._close_stage()
+
+        result = self._build_result(
+            started_at=self.started_at,
+            finished_at=self.finished_at,
+            stop_reason=self.stop_reason,
+            stop_rule=self._fired_rule(),
+            history=self.history,
+            decisions=self.decisions,
+        )
+        result.stages = self.stage_results
+        if self.stage_results and self.stop_reason != StopReason.TARGET_REACHED:
+            result.failed_stage = self.stage_results[-1].name
+        result.seeded_from = self.seeded_from
+        result.seed_verified = self.seed_verified
+        result.failures = self.failures.report()
+        result.strategy_report = self.strategy.report()
+
+        # Доверительные интервалы по ступеням и ёмкости
+        if self.config.orchestrator.bootstrap_resamples > 0:
+            for target in [result, *result.stages]:
+                target.intervals = self.instrumentation.call(
+                    'analytics.bootstrap', bootstrap_report, target.history,
+                    resamples=self.config.orchestrator.bootstrap_resamples,
+                    confidence=self.config.orchestrator.confidence,
+                )
+
+        # Статистический вывод A/B-сравнения
+        if isinstance(self.adapter, ComparisonAdapter):
+            result.comparison = self.instrumentation.call(
+                'analytics.comparison', compare_report, self.adapter.pairs,
+                labels=self.adapter.labels,
+                mode=self.adapter.mode,
+                resamples=self.config.orchestrator.bootstrap_resamples,
+                confidence=self.config.orchestrator.confidence,
+                min_effect=self.config.compare.min_effect if self.config.compare else 0.0,
+            )
+
+        result.timings = self.instrumentation.summary()
+
+        if self.store is not None:
+            try:
+                run_id = self.store.save(self.fingerprint, result)
+                print(f"💾 Run saved: {run_id}")
+            except OSError as e:
+                print(f"⚠️  Failed to save run: {e}")
+        return result
+
+    def _fired_rule(self) -> str | None:
+        """Текст сработавшего правила остановки (если тест остановлен правилом)"""
+        if self.stop_reason == StopReason.STOP_RULE and self.stop_rule is not None:
+            return self.stop_rule.source
+        return None
+
+    @staticmethod
+    def _build_result(
+        started_at: float | None,
+        finished_at: float | None,
+        stop_reason: StopReason,
+        history: list[RawMetrics],
+        name: str | None = None,
+        stop_rule: str | None = None,
+        decisions: list[dict] | None = None,
+    ) -> TestResult:
+        """
+        Сформировать TestResult по истории метрик
+
+        Args:
+            started_at: Время начала
+            finished_at: Время окончания
+            stop_reason: Причина остановки
+            history: Метрики теста или стадии
+            name: Имя стадии пайплайна
+            stop_rule: Сработавшее правило остановки
+            decisions: Журнал решений теста или стадии
+
+        Returns:
+            TestResult с максимальной стабильной нагрузкой
+        """
         # Найти максимальную стабильную нагрузку
         max_stable_users = 0
         max_stable_rps = 0.0
 
-        if self.history:
+        # Сэмплы при насыщенном генераторе говорят о генераторе, а не о системе
+        trusted = [m for m in history if not m.generator_saturated]
+        if trusted:
             # Последняя стабильная точка перед остановкой
-            max_stable_users = max(m.users for m in self.history)
-            max_stable_rps = max(m.rps for m in self.history)
+            max_stable_users = max(m.users for m in trusted)
+            max_stable_rps = max(m.rps for m in trusted)
 
-        # Сформировать результат
         return TestResult(
-            started_at=self.started_at,
-            finished_at=self.finished_at,
+            started_at=started_at,
+            finished_at=finished_at,
             max_stable_users=max_stable_users,
             max_stable_rps=max_stable_rps,
-            stop_reason=self.stop_reason,
-            history=self.history
+            stop_reason=stop_reason,
+            stop_rule=stop_rule,
+            history=history,
+            name=name,
+            decisions=decisions or [],
         )
 
     def stop(self) -> None:
@@ -0,0 +1,133 @@
+"""
+Планирование скорости спавна и отслеживание рампы
+
+Генератор не может добавить пользователей мгновенно: 10 000 пользователей
+при spawn_rate 100 - это 100 секунд рампы, и сэмплы из её середины
+описывают не ту нагрузку, которую выбрала стратегия.
+
+RampController:
+- выбирает spawn_rate для изменения нагрузки: orchestrator.spawn_rate,
+  но не выше измеренной способности генератора спавнить пользователей;
+- по user_count из метрик отслеживает фактическое завершение рампы и
+  помечает сэмплы до него (RawMetrics.ramping);
+- по наблюдаемой скорости роста пользователей уточняет способность
+  генератора (EWMA по интервалам, где он не успевал за запрошенным темпом).
+"""
+
+import math
+
+
+class RampController:
+    """Планировщик spawn_rate и трекер завершения рампы по user_count"""
+
+    def __init__(
+        self,
+        spawn_rate: int,
+        tolerance: float = 0.02,
+        smoothing: float = 0.3,
+        limited_ratio: float = 0.8,
+        probe: float = 1.25,
+    ):
+        """
+        Args:
+            spawn_rate: Запрошенная скорость спавна из конфига (пользователей/сек)
+            tolerance: Доля целевой нагрузки, в пределах которой рампа считается завершённой
+            smoothing: Вес нового измерения в EWMA способности генератора
+            limited_ratio: Генератор считается ограничивающим, если фактическая
+                скорость ниже этой доли от запрошенной
+            probe: Во сколько раз запрашивать больше измеренной способности
+        """
+        self.spawn_rate = spawn_rate
+        self.tolerance = tolerance
+        self.smoothing = smoothing
+        self.limited_ratio = limited_ratio
+        self.probe = probe
+
+        self.capacity: float | None = None  # Измеренная способность генератора (польз./сек)
+
+        self.target: int | None = None
+        self.started_at: float | None = None
+        self.planned_rate: float = spawn_rate
+        self.last_users = 0
+        self._last_time: float | None = None
+
+    @property
+    def active(self) -> bool:
+        """Идёт ли рампа к target"""
+        return self.target is not None
+
+    def plan(self, target: int, now: float) -> int:
+        """
+        Начать рампу к target и выбрать скорость спавна
+
+        Args:
+            target: Целевое количество пользователей
+            now: Текущее время (timestamp)
+
+        Returns:
+            spawn_rate для adapter.configure()
+        """
+        rate = self.spawn_rate
+        if self.capacity is not None:
+            # Запрашиваем чуть больше измеренного, чтобы заметить рост способности
+            rate = min(rate, max(1, math.floor(self.capacity * self.probe)))
+
+        self.start(target, rate, now)
+        return rate
+
+    def start(self, target: int, spawn_rate: float, now: float) -> None:
+        """
+        Начать отслеживание рампы с уже выбранной скоростью спавна
+
+        Args:
+            target: Целевое количество пользователей
+            spawn_rate: Скорость спавна, переданная генератору
+            now: Текущее время (timestamp)
+        """
+        self.planned_rate = spawn_rate
+        self.target = target
+        self.started_at = now
+        self._last_time = now
+
+    def _update_capacity(self, achieved: float) -> None:
+        if achieved <= 0:
+            return
+        limited = achieved < self.planned_rate * self.limited_ratio
+        if self.capacity is None:
+            # Пока генератор успевает за запрошенным темпом, предел неизвестен
+            if limited:
+                self.capacity = achieved
+        elif limited or achieved > self.capacity:
+            self.capacity += self.smoothing * (achieved - self.capacity)
+
+    def _reached(self, users: int) -> bool:
+        return abs(users - self.target) <= max(1, self.target * self.tolerance)
+
+    def observe(self, users: int, now: float) -> tuple[bool, float | None]:
+        """
+        Учесть user_count из очередного сэмпла
+
+        Args:
+            users: Пользователи, о которых сообщил генератор
+            now: Время сэмпла
+
+        Returns:
+            (сэмпл снят во время рампы, длительность рампы если она только что завершилась)
+        """
+        previous_users, previous_time = self.last_users, self._last_time
+        self.last_users, self._last_time = users, now
+
+        if not self.active:
+            return False, None
+
+        # Скорость спавна между сэмплами посреди рампы
+        if previous_time is not None and now > previous_time and not self._reached(users):
+            self._update_capacity(abs(users - previous_users) / (now - previous_time))
+
+        if not self._reached(users):
+            return True, None
+
+        duration = now - self.started_at
+        self.target = None
+        self.started_at = None
+        return False, duration
@@ -0,0 +1,142 @@
+"""
+Реестр плагинов: адаптеры, стратегии, сборщики метрик SUT
+
+Плагин описывается строкой "модуль:Класс" и импортируется только когда
+конфиг на него ссылается - запуск CLI, --help и validate не тянут
+requests и модули неиспользуемых адаптеров.
+
+Встроенные плагины перечислены здесь. Сторонние пакеты добавляют свои
+через entry points, без форка:
+
+    # pyproject.toml стороннего пакета
+    [project.entry-points."load_orchestrator.strategies"]
+    my_strategy = "my_package.strategy:MyStrategy"
+
+После установки пакета стратегия доступна как strategy.type: my_strategy.
+Встроенные имена сторонними плагинами не переопределяются.
+"""
+
+from importlib import import_module
+
+ADAPTERS_GROUP = "load_orchestrator.adapters"
+STRATEGIES_GROUP = "load_orchestrator.strategies"
+COLLECTORS_GROUP = "load_orchestrator.collectors"
+
+BUILTIN = "builtin"
+
+
+class PluginRegistry:
+    """
+    Ленивый реестр плагинов одной группы
+
+    Ведёт себя как словарь имя -> класс ('name' in registry, registry[name],
+    registry.keys()), но импортирует модуль плагина при первом обращении
+    к registry[name]. Entry points читаются один раз, при первом запросе
+    имени, которого нет среди встроенных.
+    """
+
+    def __init__(self, group: str, builtins: dict[str, str]):
+        """
+        Args:
+            group: Группа entry points
+            builtins: Встроенные плагины: имя -> "модуль:Класс"
+        """
+        self.group = group
+        self._specs: dict[str, tuple[str, str]] = {
+            name: (target, BUILTIN) for name, target in builtins.items()
+        }
+        self._loaded: dict[str, type] = {}
+        self._discovered = False
+
+    def _discover(self) -> None:
+        if self._discovered:
+            return
+        self._discovered = True
+
+        from importlib.metadata import entry_points
+
+        for ep in entry_points(group=self.group):
+            if ep.name in self._specs:
+                continue
+            source = ep.dist.name if ep.dist is not None else ep.value
+            self._specs[ep.name] = (ep.value, source)
+
+    def register(self, name: str, target: str | type) -> None:
+        """
+        Зарегистрировать плагин вручную (например, из кода или тестов)
+
+        Args:
+            name: Имя типа в конфиге
+            target: Класс или строка "модуль:Класс"
+        """
+        if isinstance(target, str):
+            self._specs[name] = (target, "runtime")
+            self._loaded.pop(name, None)
+        else:
+            self._specs[name] = (f"{target.__module__}:{target.__qualname__}", "runtime")
+            self._loaded[name] = target
+
+    def __contains__(self, name: str) -> bool:
+        if name not in self._specs:
+            self._discover()
+        return name in self._specs
+
+    def __getitem__(self, name: str) -> type:
+        """
+        Класс плагина (модуль импортируется при первом обращении)
+
+        Raises:
+            KeyError: Если плагин не зарегистрирован
+            ImportError: Если модуль плагина не импортируется
+        """
+        if name in self._loaded:
+            return self._loaded[name]
+        if name not in self:
+            raise KeyError(name)
+
+        target, _ = self._specs[name]
+        module_name, _, attr = target.partition(":")
+        obj = import_module(module_name)
+        for part in attr.split("."):
+            obj = getattr(obj, part)
+
+        self._loaded[name] = obj
+        return obj
+
+    def keys(self) -> list[str]:
+        """Все имена плагинов группы (без импорта модулей)"""
+        self._discover()
+        return list(self._specs)
+
+    def describe(self) -> list[tuple[str, str, str]]:
+        """
+        Список плагинов для вывода
+
+        Returns:
+            [(имя, "модуль:Класс", источник)] - источник "builtin" или имя пакета
+        """
+        self._discover()
+        return [(name, target, source) for name, (target, source) in self._specs.items()]
+
+
+ADAPTERS = PluginRegistry(ADAPTERS_GROUP, {
+    'locust': 'load_orchestrator.adapters.LocustAdapter:LocustAdapter',
+    'jmeter': 'load_orchestrator.adapters.JMeterAdapter:JMeterAdapter',
+})
+
+STRATEGIES = PluginRegistry(STRATEGIES_GROUP, {
+    'degradation_search': 'load_orchestrator.strategies.degradation_search:DegradationSearch',
+    'break_point': 'load_orchestrator.strategies.break_point:BreakPoint',
+    'sla_validation': 'load_orchestrator.strategies.sla_validation:SLAValidation',
+    'target_rps': 'load_orchestrator.strategies.target_rps:TargetRPS',
+    'spike': 'load_orchestrator.strategies.spike:Spike',
+    'canary': 'load_orchestrator.strategies.canary:Canary',
+    'pipeline': 'load_orchestrator.strategies.pipeline:Pipeline',
+    'profile': 'load_orchestrator.strategies.profile:Profile',
+})
+
+COLLECTORS = PluginRegistry(COLLECTORS_GROUP, {
+    'host': 'load_orchestrator.collectors.host:HostCollector',
+    'prometheus': 'load_orchestrator.collectors.prometheus:PrometheusCollector',
+    'json': 'load_orchestrator.collectors.json_endpoint:JsonCollector',
+})
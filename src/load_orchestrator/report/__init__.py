@@ -0,0 +1,68 @@
+"""
+Отчёты по результату теста: JSON и самодостаточный HTML
+
+Данные отчёта (build_report) собираются за один проход по истории,
+графики прореживаются LTTB до max_points точек на ряд. Текстовый отчёт -
+cli.print_results.
+
+    report = build_report(result)
+    Path("report.html").write_text(render_html(report))
+"""
+
+import json
+from pathlib import Path
+
+from ..models import TestResult
+from .builder import DEFAULT_MAX_POINTS, build_report
+from .html import render_html
+from .lttb import lttb
+
+REPORT_FORMATS = ('text', 'json', 'html')
+
+_SUFFIXES = {'.txt': 'text', '.json': 'json', '.html': 'html', '.htm': 'html'}
+
+
+def report_format(path: str | Path) -> str:
+    """
+    Формат отчёта по расширению файла
+
+    Raises:
+        ValueError: Если расширение не поддерживается
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix not in _SUFFIXES:
+        raise ValueError(
+            f"Unsupported report file '{path}'. Supported extensions: {', '.join(_SUFFIXES)}"
+        )
+    return _SUFFIXES[suffix]
+
+
+def render(result: TestResult, fmt: str, max_points: int = DEFAULT_MAX_POINTS) -> str:
+    """
+    Отчёт в формате json или html
+
+    Args:
+        result: Результат теста
+        fmt: 'json' или 'html'
+        max_points: Сколько точек оставить в каждом ряду графика
+
+    Raises:
+        ValueError: Если формат не поддерживается
+    """
+    if fmt not in ('json', 'html'):
+        raise ValueError(f"Unsupported report format: '{fmt}'")
+    report = build_report(result, max_points=max_points)
+    if fmt == 'json':
+        return json.dumps(report, ensure_ascii=False)
+    return render_html(report)
+
+
+__all__ = [
+    'DEFAULT_MAX_POINTS',
+    'REPORT_FORMATS',
+    'build_report',
+    'lttb',
+    'render',
+    'render_html',
+    'report_format',
+]
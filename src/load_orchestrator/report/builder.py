@@ -0,0 +1,145 @@
+"""
+Данные отчёта по TestResult за один проход по истории
+
+История читается один раз: тот же генератор кормит прореживание графиков
+(LTTB) и потоковые агрегаты ступеней и смен нагрузки, поэтому время
+построения - O(n), а память - O(ступеней + точек графика), а не O(n).
+"""
+
+from typing import Iterator
+
+from ..models import RawMetrics, TestResult
+from .lttb import lttb
+
+DEFAULT_MAX_POINTS = 1000
+
+# Ряды графиков (поля RawMetrics)
+CHART_SERIES = ('users', 'rps', 'p95', 'p99', 'error_rate')
+
+
+class _Step:
+    """Потоковый агрегат ступени нагрузки"""
+
+    __slots__ = ('users', 'started', 'finished', 'samples', 'rps', 'p95', 'p99', 'error_rate', 'p95_max', 'p99_max')
+
+    def __init__(self, users: int, timestamp: float):
+        self.users = users
+        self.started = self.finished = timestamp
+        self.samples = 0
+        self.rps = self.p95 = self.p99 = self.error_rate = 0.0
+        self.p95_max = self.p99_max = 0.0
+
+    def add(self, m: RawMetrics) -> None:
+        self.finished = m.timestamp
+        self.samples += 1
+        self.rps += m.rps
+        self.p95 += m.p95
+        self.p99 += m.p99
+        self.error_rate += m.error_rate
+        self.p95_max = max(self.p95_max, m.p95)
+        self.p99_max = max(self.p99_max, m.p99)
+
+    def to_dict(self, origin: float) -> dict:
+        n = self.samples
+        return {
+            'users': self.users,
+            'start': self.started - origin,
+            'duration': self.finished - self.started,
+            'samples': n,
+            'rps': self.rps / n,
+            'p95': self.p95 / n,
+            'p95_max': self.p95_max,
+            'p99': self.p99 / n,
+            'p99_max': self.p99_max,
+            'error_rate': self.error_rate / n,
+        }
+
+
+def _stream(history: list[RawMetrics], origin: float, steps: list[_Step]) -> Iterator[tuple[float, ...]]:
+    """Точки графиков; попутно копит ступени (как analytics.bootstrap.split_steps)"""
+    step: _Step | None = None
+    for m in history:
+        if not (m.ramping or m.generator_saturated or m.users <= 0):
+            if step is None or step.users != m.users:
+                step = _Step(m.users, m.timestamp)
+                steps.append(step)
+            step.add(m)
+        yield m.timestamp - origin, m.users, m.rps, m.p95, m.p99, m.error_rate
+
+
+def build_report(result: TestResult, max_points: int = DEFAULT_MAX_POINTS) -> dict:
+    """
+    Собрать данные отчёта
+
+    Args:
+        result: Результат теста
+        max_points: Сколько точек оставить в каждом ряду графика (0 - без графиков)
+
+    Returns:
+        {'summary', 'stages', 'steps', 'load_changes', 'decisions', 'charts',
+         'failures', 'intervals', 'comparison', 'strategy_report'}; время в
+         steps, load_changes, decisions и charts - секунды от начала теста
+    """
+    history = result.history
+    origin = result.started_at or (history[0].timestamp if history else 0.0)
+
+    steps: list[_Step] = []
+    points = _stream(history, origin, steps)
+    if max_points > 0:
+        selected = lttb(points, len(history), max_points)
+    else:
+        selected = []
+        for _ in points:
+            pass
+    charts = {
+        'samples': len(history),
+        'series': {name: [list(point) for point in points] for name, points in zip(CHART_SERIES, selected)},
+    }
+
+    # Смены нагрузки - переходы между ступенями
+    load_changes = [
+        {'time': current.started - origin, 'from': previous.users, 'to': current.users}
+        for previous, current in zip(steps, steps[1:])
+    ]
+
+    duration = None
+    if result.started_at is not None and result.finished_at is not None:
+        duration = result.finished_at - result.started_at
+
+    return {
+        'summary': {
+            'name': result.name,
+            'started_at': result.started_at,
+            'finished_at': result.finished_at,
+            'duration': duration,
+            'max_stable_users': result.max_stable_users,
+            'max_stable_rps': result.max_stable_rps,
+            'stop_reason': result.stop_reason.name,
+            'stop_rule': result.stop_rule,
+            'failed_stage': result.failed_stage,
+            'seeded_from': result.seeded_from,
+            'seed_verified': result.seed_verified,
+        },
+        'stages': [
+            {
+                'name': stage.name,
+                'start': (stage.started_at or origin) - origin,
+                'max_stable_users': stage.max_stable_users,
+                'max_stable_rps': stage.max_stable_rps,
+                'stop_reason': stage.stop_reason.name,
+                'stop_rule': stage.stop_rule,
+            }
+            for stage in result.stages
+        ],
+        'steps': [step.to_dict(origin) for step in steps],
+        'load_changes': load_changes,
+        'decisions': [
+            {**d, 'timestamp': d['timestamp'] - origin, 'until': d['until'] - origin}
+            for d in result.decisions
+        ],
+        'charts': charts,
+        'failures': result.failures,
+        'intervals': result.intervals,
+        'comparison': result.comparison,
+        'strategy_report': result.strategy_report,
+    }
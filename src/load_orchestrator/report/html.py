@@ -0,0 +1,257 @@
+"""
+Самодостаточный HTML-отчёт
+
+Один файл без JS и внешних ресурсов: стили встроены, графики - inline
+SVG по прореженным рядам (см. lttb), поэтому размер файла зависит от
+max_points, а не от длины истории. Длинные таблицы обрезаются до
+MAX_TABLE_ROWS строк (полные данные - в JSON-отчёте).
+"""
+
+from html import escape
+
+MAX_TABLE_ROWS = 500
+
+CHART_WIDTH = 900
+CHART_HEIGHT = 180
+_PAD_LEFT, _PAD_RIGHT, _PAD_TOP, _PAD_BOTTOM = 60, 10, 10, 24
+
+# Графики: заголовок -> [(ряд, цвет)]
+CHARTS = {
+    'Users': [('users', '#4c72b0')],
+    'RPS': [('rps', '#55a868')],
+    'Latency, ms': [('p95', '#dd8452'), ('p99', '#c44e52')],
+    'Error rate, %': [('error_rate', '#8172b3')],
+}
+
+_STYLE = """
+body { font-family: -apple-system, Segoe UI, Helvetica, Arial, sans-serif; margin: 24px; color: #222; }
+h1 { font-size: 20px; } h2 { font-size: 16px; margin-top: 28px; }
+table { border-collapse: collapse; font-size: 13px; }
+th, td { padding: 3px 10px; border-bottom: 1px solid #e4e4e4; text-align: right; }
+th { background: #f5f5f5; } td.l, th.l { text-align: left; }
+.summary td { text-align: left; } .muted { color: #888; font-size: 12px; }
+svg { display: block; margin-bottom: 8px; } svg text { font-size: 11px; fill: #555; }
+.bad { color: #c44e52; }
+"""
+
+
+def _number(value, digits: int = 1) -> str:
+    if value is None:
+        return '-'
+    if isinstance(value, int):
+        return str(value)
+    return f"{value:.{digits}f}"
+
+
+def _duration(seconds: float | None) -> str:
+    if seconds is None:
+        return '-'
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h {minutes}m {seconds}s" if hours else f"{minutes}m {seconds}s"
+
+
+def _seconds(seconds: float | None, resolution: float | None = None) -> str:
+    """Субсекундное время (спайки) с точностью сэмпла"""
+    if seconds is None:
+        return '-'
+    return f"{seconds:.2f}s" + (f" ±{resolution:.2f}" if resolution is not None else "")
+
+
+def _table(headers: list[str], rows: list[list], left: int = 0) -> str:
+    """Таблица; первые left колонок выровнены влево"""
+    def cell(tag: str, i: int, value) -> str:
+        css = ' class="l"' if i < left else ''
+        return f"<{tag}{css}>{escape(str(value))}</{tag}>"
+
+    parts = ["<table><tr>", *(cell('th', i, h) for i, h in enumerate(headers)), "</tr>"]
+    for row in rows[:MAX_TABLE_ROWS]:
+        parts += ["<tr>", *(cell('td', i, v) for i, v in enumerate(row)), "</tr>"]
+    parts.append("</table>")
+    if len(rows) > MAX_TABLE_ROWS:
+        parts.append(f'<p class="muted">{len(rows) - MAX_TABLE_ROWS} more rows in the JSON report</p>')
+    return "".join(parts)
+
+
+def _chart(title: str, series: list[tuple[str, str, list[list[float]]]], markers: list[float]) -> str:
+    """SVG-график: ряды с общей осью x и вертикальные отметки стадий"""
+    points = [p for _, _, data in series for p in data]
+    if not points:
+        return ""
+    x_min = min(p[0] for p in points)
+    x_max = max(p[0] for p in points)
+    y_max = max(p[1] for p in points) or 1.0
+    x_span = (x_max - x_min) or 1.0
+
+    width = CHART_WIDTH - _PAD_LEFT - _PAD_RIGHT
+    height = CHART_HEIGHT - _PAD_TOP - _PAD_BOTTOM
+
+    def sx(x: float) -> float:
+        return _PAD_LEFT + (x - x_min) / x_span * width
+
+    def sy(y: float) -> float:
+        return _PAD_TOP + height - y / y_max * height
+
+    parts = [f'<svg width="{CHART_WIDTH}" height="{CHART_HEIGHT}" xmlns="http://www.w3.org/2000/svg">']
+    for fraction in (0.0, 0.5, 1.0):
+        y = sy(y_max * fraction)
+        parts.append(
+            f'<line x1="{_PAD_LEFT}" x2="{CHART_WIDTH - _PAD_RIGHT}" y1="{y:.1f}" y2="{y:.1f}" stroke="#eee"/>'
+            f'<text x="{_PAD_LEFT - 6}" y="{y + 4:.1f}" text-anchor="end">{_number(y_max * fraction)}</text>'
+        )
+    for x in markers:
+        if x_min <= x <= x_max:
+            parts.append(
+                f'<line x1="{sx(x):.1f}" x2="{sx(x):.1f}" y1="{_PAD_TOP}" y2="{_PAD_TOP + height}" '
+                f'stroke="#aaa" stroke-dasharray="4 3"/>'
+            )
+    for name, color, data in series:
+        path = " ".join(f"{sx(x):.1f},{sy(y):.1f}" for x, y in data)
+        parts.append(f'<polyline fill="none" stroke="{color}" stroke-width="1.4" points="{path}"><title>{name}</title></polyline>')
+
+    bottom = CHART_HEIGHT - 6
+    parts.append(f'<text x="{_PAD_LEFT}" y="{bottom}">{_duration(x_min)}</text>')
+    parts.append(f'<text x="{CHART_WIDTH - _PAD_RIGHT}" y="{bottom}" text-anchor="end">{_duration(x_max)}</text>')
+    legend = ", ".join(f'<tspan fill="{color}">{name}</tspan>' for name, color, _ in series)
+    parts.append(f'<text x="{CHART_WIDTH / 2:.0f}" y="{bottom}" text-anchor="middle">{escape(title)}: {legend}</text>')
+    parts.append("</svg>")
+    return "".join(parts)
+
+
+def render_html(report: dict) -> str:
+    """
+    HTML-отчёт по данным build_report()
+
+    Args:
+        report: Результат report.build_report
+
+    Returns:
+        Готовая HTML-страница
+    """
+    summary = report['summary']
+    title = f"Load test report{': ' + summary['name'] if summary['name'] else ''}"
+    body = [f"<h1>{escape(title)}</h1>"]
+
+    stop = summary['stop_reason'] + (f" ({summary['stop_rule']})" if summary['stop_rule'] else "")
+    if summary['failed_stage']:
+        stop += f" at stage {summary['failed_stage']}"
+    rows = [
+        ('Max stable users', summary['max_stable_users']),
+        ('Max stable RPS', _number(summary['max_stable_rps'])),
+        ('Duration', _duration(summary['duration'])),
+        ('Stop reason', stop),
+        ('Samples', report['charts']['samples']),
+    ]
+    if summary['seeded_from']:
+        rows.append(('Warm start', f"{summary['seeded_from']} (verified: {summary['seed_verified']})"))
+    slo = (report.get('strategy_report') or {}).get('slo')
+    if slo:
+        rows.append(('Max SLO-compliant users', slo['max_compliant_users']))
+    spike = (report.get('strategy_report') or {}).get('spike')
+    if spike and spike['unavailable']:
+        rows.append(('Spike recovery', f"unavailable: {spike['unavailable']}"))
+    elif spike:
+        totals = spike['summary']
+        rows.append(('Spikes recovered', f"{totals['recovered']}/{totals['spikes']}"))
+        rows.append(('Max time to recover', _seconds(totals['max_time_to_recover'])))
+    comparison = report.get('comparison')
+    if comparison:
+        rows.append(('A/B verdict', f"{comparison['labels'][1]} vs {comparison['labels'][0]}: {comparison['verdict']}"))
+    body.append('<table class="summary">' + "".join(
+        f"<tr><th class=\"l\">{escape(k)}</th><td>{escape(str(v))}</td></tr>" for k, v in rows
+    ) + "</table>")
+
+    # Графики
+    series = report['charts']['series']
+    markers = [stage['start'] for stage in report['stages'][1:]]
+    body.append(f'<h2>Charts</h2><p class="muted">{report["charts"]["samples"]} samples, '
+                f'downsampled with LTTB; dashed lines - pipeline stages</p>')
+    for chart_title, lines in CHARTS.items():
+        body.append(_chart(chart_title, [(name, color, series.get(name, [])) for name, color in lines], markers))
+
+    if report['stages']:
+        body.append("<h2>Stages</h2>")
+        body.append(_table(
+            ['stage', 'start', 'max users', 'max rps', 'stop reason'],
+            [
+                [s['name'], _duration(s['start']), s['max_stable_users'], _number(s['max_stable_rps']),
+                 s['stop_reason'] + (f" ({s['stop_rule']})" if s['stop_rule'] else "")]
+                for s in report['stages']
+            ],
+            left=1,
+        ))
+
+    body.append("<h2>Steps</h2>")
+    body.append(_table(
+        ['users', 'start', 'duration', 'samples', 'rps', 'p95', 'p95 max', 'p99', 'p99 max', 'errors, %'],
+        [
+            [s['users'], _duration(s['start']), _duration(s['duration']), s['samples'], _number(s['rps']),
+             _number(s['p95']), _number(s['p95_max']), _number(s['p99']), _number(s['p99_max']),
+             _number(s['error_rate'], 2)]
+            for s in report['steps']
+        ],
+    ))
+
+    if report['decisions']:
+        body.append("<h2>Decisions</h2>")
+        body.append('<p class="muted">Consecutive identical decisions are merged; '
+                    'source - strategy or why the orchestrator held the load</p>')
+        body.append(_table(
+            ['time', 'until', 'decision', 'users', 'to', 'samples', 'source'],
+            [
+                [_duration(d['timestamp']), _duration(d['until']), d['decision'], d['users'],
+                 '-' if d['to'] is None else d['to'], d['samples'], d['source']]
+                for d in report['decisions']
+            ],
+        ))
+
+    body.append("<h2>Load changes</h2>")
+    body.append(_table(
+        ['time', 'from', 'to'],
+        [[_duration(c['time']), c['from'], c['to']] for c in report['load_changes']],
+    ))
+
+    if slo:
+        body.append("<h2>SLO</h2>")
+        if slo['breach']:
+            body.append(f'<p class="bad">Breach: {escape(slo["breach"])}</p>')
+        body.append(_table(
+            ['users', 'holds', *slo['objectives']],
+            [
+                [s['users'], '✓' if s['holds'] else '✗',
+                 *(_number(s['burn'][name], 2) for name in slo['objectives'])]
+                for s in slo['steps']
+            ],
+        ))
+
+    if spike and not spike['unavailable']:
+        baseline = spike['baseline']
+        body.append("<h2>Spikes</h2>")
+        body.append(
+            f'<p class="muted">Baseline p95 {_number(baseline["p95"])} ms, errors '
+            f'{_number(baseline["error_rate"], 2)}%; tolerance {spike["tolerance"]:g}% p95 / '
+            f'{spike["error_tolerance"]:g} pp errors, recovery after {spike["hold"]} samples in tolerance</p>'
+        )
+        body.append(_table(
+            ['#', 'time to degrade', 'peak p95', 'p95 overshoot, %', 'peak errors, %', 'time to recover'],
+            [
+                [s['index'], _seconds(s['time_to_degrade'], s['degrade_resolution']), _number(s['peak_p95']),
+                 _number(s['latency_overshoot']), _number(s['peak_error_rate'], 2),
+                 _seconds(s['time_to_recover'], s['recover_resolution']) if s['recovered'] else 'not recovered']
+                for s in spike['spikes']
+            ],
+        ))
+
+    if report['failures']:
+        body.append("<h2>Top failures</h2>")
+        body.append(_table(
+            ['signature', 'share, %', 'peak, %'],
+            [[f['signature'], _number(f['share']), _number(f['peak_rate'])] for f in report['failures']],
+            left=1,
+        ))
+
+    return (
+        "<!DOCTYPE html><html><head><meta charset=\"utf-8\">"
+        f"<title>{escape(title)}</title><style>{_STYLE}</style></head><body>"
+        + "".join(body) + "</body></html>"
+    )
@@ -0,0 +1,86 @@
+"""
+Прореживание рядов для графиков: Largest-Triangle-Three-Buckets (LTTB)
+
+LTTB оставляет threshold точек из count так, что форма ряда сохраняется:
+пики, провалы и ступени не усредняются, как при простом прореживании.
+Точки (кроме первой и последней) делятся на threshold - 2 корзин; из каждой
+берётся точка, образующая наибольший треугольник с выбранной точкой
+предыдущей корзины и средним следующей.
+
+Реализация потоковая: точки читаются из итератора, в памяти только две
+корзины, поэтому история в сотни тысяч сэмплов не копируется. Несколько
+рядов с общей осью x прореживаются за один проход, у каждого - свой выбор.
+"""
+
+from itertools import islice
+from typing import Iterable, Iterator
+
+
+def lttb(
+    points: Iterable[tuple[float, ...]],
+    count: int,
+    threshold: int,
+) -> list[list[tuple[float, float]]]:
+    """
+    Прорежить ряды с общей осью x
+
+    Args:
+        points: Точки (x, y1, y2, ...) по возрастанию x
+        count: Сколько точек отдаст итератор
+        threshold: Сколько точек оставить в каждом ряду
+
+    Returns:
+        Для каждого ряда - [(x, y), ...] не длиннее threshold
+    """
+    iterator: Iterator[tuple[float, ...]] = iter(points)
+    first = next(iterator, None)
+    if first is None:
+        return []
+    series = len(first) - 1
+
+    if threshold >= count or threshold < 3:
+        selected = [[(first[0], first[i + 1])] for i in range(series)]
+        for point in iterator:
+            for i in range(series):
+                selected[i].append((point[0], point[i + 1]))
+        return selected
+
+    selected = [[(first[0], first[i + 1])] for i in range(series)]
+    every = (count - 2) / (threshold - 2)
+    buckets = threshold - 2
+
+    def read(bucket: int) -> list[tuple[float, ...]]:
+        if bucket >= buckets:
+            return list(iterator)  # Последняя точка (и всё, что пришло сверх count)
+        size = int((bucket + 1) * every) - int(bucket * every)
+        return list(islice(iterator, size))
+
+    current = read(0)
+    for bucket in range(buckets):
+        following = read(bucket + 1)
+        if not current:
+            current = following
+            continue
+        anchor = following or current
+        n = len(anchor)
+        avg_x = sum(p[0] for p in anchor) / n
+
+        for i in range(series):
+            column = i + 1
+            avg_y = sum(p[column] for p in anchor) / n
+            a_x, a_y = selected[i][-1]
+            dx = a_x - avg_x
+            dy = avg_y - a_y
+            best, best_area = current[0], -1.0
+            for point in current:
+                area = abs(dx * (point[column] - a_y) - (a_x - point[0]) * dy)
+                if area > best_area:
+                    best, best_area = point, area
+            selected[i].append((best[0], best[column]))
+        current = following
+
+    if current:
+        last = current[-1]
+        for i in range(series):
+            selected[i].append((last[0], last[i + 1]))
+    return selected
@@ -0,0 +1,276 @@
+"""
+Декларативные правила остановки
+
+Правила задаются строками в секции stop_rules конфига и работают с любой
+стратегией:
+
+    stop_rules:
+      - p99 > 800 for 3 of 5 windows
+      - error_rate slope > 2%/min
+      - p95_corrected >= 1500ms for 30s
+      - server.host.cpu_percent > 95 for 2 windows
+      - rps slope over 120s < -50/min
+      - failures[timeout] > 1% for 3 windows
+
+Грамматика:
+
+    <метрика> [slope [over <длительность>]] <оператор> <число>[ед.][/s|/min]
+              [for <N> [of <M>] windows | for <длительность>]
+
+- метрика: числовое поле RawMetrics (p99, error_rate, rps, users, ...),
+  метрика сборщика SUT: server.<сборщик>.<метрика> или доля ошибок с
+  сигнатурой, содержащей подстроку: failures[<подстрока>] (% запросов,
+  без учёта регистра, см. analytics.failures);
+- slope: наклон метрики (МНК по сэмплам за over, по умолчанию 60s) в
+  единицах метрики за секунду (/s, по умолчанию) или минуту (/min);
+- оператор: > >= < <= == !=;
+- единицы (ms, %, rps) - для читаемости, на значение не влияют;
+- for N of M windows: условие выполнено в N из последних M сэмплов;
+  for N windows - в N подряд; for 30s - непрерывно 30 секунд;
+  без for - правило срабатывает на первом же сэмпле.
+
+Строки разбираются один раз (RuleSet) в инкрементальные вычислители:
+окно «N из M» - кольцевой буфер со счётчиком, slope - скользящие суммы
+МНК, общие для правил с одинаковыми метрикой и окном. Обработка сэмпла -
+O(1) на правило, история не пересматривается.
+"""
+
+import operator
+import re
+from collections import deque
+from dataclasses import fields
+from typing import Callable
+
+from .analytics.failures import matching_rate
+from .models import RawMetrics
+
+OPERATORS: dict[str, Callable[[float, float], bool]] = {
+    '>=': operator.ge,
+    '<=': operator.le,
+    '==': operator.eq,
+    '!=': operator.ne,
+    '>': operator.gt,
+    '<': operator.lt,
+}
+
+DEFAULT_SLOPE_WINDOW = 60.0  # Секунд
+MIN_SLOPE_SAMPLES = 3  # По двум точкам наклон - шум, а не тренд
+
+_NUMBER = r'-?\d+(?:\.\d+)?'
+_DURATION = rf'(?P<{{name}}>{_NUMBER})\s*(?P<{{name}}_unit>s|sec|m|min)'
+
+_RULE = re.compile(
+    r'^\s*(?P<metric>[A-Za-z_][\w.]*(?:\[[^\]]+\])?)'
+    r'(?:\s+(?P<slope>slope)(?:\s+over\s+' + _DURATION.format(name='over') + r')?)?'
+    r'\s*(?P<op>>=|<=|==|!=|>|<)'
+    rf'\s*(?P<value>{_NUMBER})\s*(?:ms|%|rps)?'
+    r'(?:\s*/\s*(?P<per>s|sec|min))?'
+    r'(?:\s+for\s+(?:'
+    r'(?P<hits>\d+)(?:\s+of\s+(?P<windows>\d+))?\s+(?:windows?|samples?)'
+    r'|' + _DURATION.format(name='hold') +
+    r'))?\s*$'
+)
+
+# Числовые поля сэмпла, по которым можно писать правила
+_NUMERIC_FIELDS = {
+    f.name for f in fields(RawMetrics)
+    if f.name not in (
+        'timestamp', 'server', 'failures', 'endpoints', 'ramping', 'generator_saturated', 'cumulative_percentiles',
+    )
+}
+
+
+def _seconds(value: str, unit: str) -> float:
+    return float(value) * (60 if unit in ('m', 'min') else 1)
+
+
+def _extractor(metric: str) -> Callable[[RawMetrics], float | None]:
+    if metric.startswith('server.'):
+        key = metric[len('server.'):]
+        return lambda m: m.server.get(key)
+    if metric.startswith('failures[') and metric.endswith(']'):
+        pattern = metric[len('failures['):-1].strip()
+        return lambda m: matching_rate(m.failures, pattern)
+    if metric not in _NUMERIC_FIELDS:
+        raise ValueError(
+            f"Unknown metric '{metric}'. Supported: {', '.join(sorted(_NUMERIC_FIELDS))}, server.<collector>.<metric>, failures[<text>]"
+        )
+    return operator.attrgetter(metric)
+
+
+class SlopeTracker:
+    """Наклон метрики МНК по скользящему окну времени (скользящие суммы)"""
+
+    def __init__(self, extract: Callable[[RawMetrics], float | None], window: float):
+        self.extract = extract
+        self.window = window
+        self._points: deque[tuple[float, float]] = deque()
+        self._origin: float | None = None  # Сдвиг времени против потери точности
+        self._st = self._sy = self._stt = self._sty = 0.0
+        self.value: float | None = None
+
+    def update(self, metrics: RawMetrics) -> None:
+        y = self.extract(metrics)
+        if y is None:
+            return
+        if self._origin is None:
+            self._origin = metrics.timestamp
+        t = metrics.timestamp - self._origin
+
+        self._points.append((t, y))
+        self._add(t, y, 1)
+        while t - self._points[0][0] > self.window:
+            self._add(*self._points.popleft(), -1)
+
+        n = len(self._points)
+        denominator = n * self._stt - self._st * self._st
+        self.value = (n * self._sty - self._st * self._sy) / denominator if n >= MIN_SLOPE_SAMPLES and denominator > 0 else None
+
+    def _add(self, t: float, y: float, sign: int) -> None:
+        self._st += sign * t
+        self._sy += sign * y
+        self._stt += sign * t * t
+        self._sty += sign * t * y
+
+
+class StopRule:
+    """Скомпилированное правило: условие по сэмплу + окно срабатывания"""
+
+    def __init__(
+        self,
+        source: str,
+        value: Callable[[RawMetrics], float | None],
+        compare: Callable[[float, float], bool],
+        threshold: float,
+        hits: int = 1,
+        windows: int = 1,
+        hold: float | None = None,
+    ):
+        """
+        Args:
+            source: Исходная строка правила
+            value: Значение для сравнения по сэмплу (None - сэмпл не учитывается)
+            compare: Оператор сравнения
+            threshold: Порог
+            hits: Сколько сэмплов из windows должны нарушать условие
+            windows: Длина окна в сэмплах
+            hold: Сколько секунд условие должно держаться непрерывно
+        """
+        self.source = source
+        self.value = value
+        self.compare = compare
+        self.threshold = threshold
+        self.hits = hits
+        self.windows = windows
+        self.hold = hold
+
+        self._ring = [False] * windows
+        self._position = 0
+        self._count = 0
+        self._since: float | None = None
+
+    def update(self, metrics: RawMetrics) -> bool:
+        """
+        Учесть сэмпл
+
+        Returns:
+            True если правило сработало
+        """
+        value = self.value(metrics)
+        if value is None:
+            return False
+        hit = self.compare(value, self.threshold)
+
+        if self.hold is not None:
+            if not hit:
+                self._since = None
+                return False
+            if self._since is None:
+                self._since = metrics.timestamp
+            return metrics.timestamp - self._since >= self.hold
+
+        # Кольцевой буфер последних windows результатов со счётчиком попаданий
+        self._count += hit - self._ring[self._position]
+        self._ring[self._position] = hit
+        self._position = (self._position + 1) % self.windows
+        return self._count >= self.hits
+
+    def __repr__(self) -> str:
+        return f"StopRule({self.source!r})"
+
+
+class RuleSet:
+    """Набор правил над потоком сэмплов"""
+
+    def __init__(self, sources: list[str]):
+        """
+        Args:
+            sources: Строки правил
+
+        Raises:
+            ValueError: Если правило не разбирается
+        """
+        self._slopes: dict[tuple[str, float], SlopeTracker] = {}
+        self.rules = [self._compile(source) for source in sources]
+
+    def _compile(self, source: str) -> StopRule:
+        match = _RULE.match(source)
+        if match is None:
+            raise ValueError(f"Invalid stop rule: '{source}'")
+
+        metric = match['metric']
+        extract = _extractor(metric)
+        threshold = float(match['value'])
+
+        if match['slope']:
+            window = _seconds(match['over'], match['over_unit']) if match['over'] else DEFAULT_SLOPE_WINDOW
+            # Правила по одной метрике и окну делят один вычислитель наклона
+            tracker = self._slopes.get((metric, window))
+            if tracker is None:
+                tracker = self._slopes[(metric, window)] = SlopeTracker(extract, window)
+            if match['per'] == 'min':
+                threshold /= 60
+
+            def value(m: RawMetrics, tracker: SlopeTracker = tracker) -> float:
+                return tracker.value
+        elif match['per']:
+            raise ValueError(f"Invalid stop rule: '{source}' (rate units need 'slope')")
+        else:
+            value = extract
+
+        hits = windows = 1
+        hold = None
+        if match['hits']:
+            hits = int(match['hits'])
+            windows = int(match['windows'] or hits)
+            if not 0 < hits <= windows:
+                raise ValueError(f"Invalid stop rule: '{source}' (need 0 < N <= M in 'for N of M')")
+        elif match['hold']:
+            hold = _seconds(match['hold'], match['hold_unit'])
+
+        return StopRule(
+            source=source.strip(),
+            value=value,
+            compare=OPERATORS[match['op']],
+            threshold=threshold,
+            hits=hits,
+            windows=windows,
+            hold=hold,
+        )
+
+    def update(self, metrics: RawMetrics) -> StopRule | None:
+        """
+        Учесть сэмпл во всех правилах
+
+        Returns:
+            Первое сработавшее правило или None
+        """
+        for tracker in self._slopes.values():
+            tracker.update(metrics)
+
+        fired = None
+        for rule in self.rules:
+            # Все правила видят каждый сэмпл, чтобы окна не разъезжались
+            if rule.update(metrics) and fired is None:
+                fired = rule
+        return fired
@@ -0,0 +1,125 @@
+"""
+Адаптивный интервал мониторинга
+
+Фиксированный monitoring_interval - компромисс: большой дёшев на длинных
+удержаниях, но размывает начало спайка и восстановление; маленький
+ловит переходы, но нагружает генератор опросами всё остальное время.
+
+AdaptiveSampler переключается между двумя темпами:
+- burst_interval - в течение burst_window секунд после каждого изменения
+  нагрузки и пока метрики «шумят» (коэффициент вариации rps или p95 по
+  последним сэмплам выше burst_cv);
+- monitoring_interval - в установившемся режиме.
+
+Изменения нагрузки, известные заранее (расписание в режиме schedule: push),
+регистрируются через expect_change(): первый частый сэмпл приходится точно
+на момент перехода, а не на следующий медленный тик.
+
+Фактический интервал между сэмплами записывается в RawMetrics.sampling_interval.
+"""
+
+import bisect
+import math
+from collections import deque
+
+from .models import RawMetrics
+
+
+class AdaptiveSampler:
+    """Выбор интервала до следующего сбора метрик"""
+
+    def __init__(
+        self,
+        interval: float,
+        burst_interval: float | None = None,
+        burst_window: float = 10.0,
+        burst_cv: float = 0.2,
+        variance_samples: int = 5,
+    ):
+        """
+        Args:
+            interval: Интервал в установившемся режиме (monitoring_interval)
+            burst_interval: Интервал в режиме burst (None - всегда interval)
+            burst_window: Сколько секунд держать burst после изменения нагрузки
+            burst_cv: Коэффициент вариации rps/p95, выше которого включается burst
+            variance_samples: По скольким последним сэмплам считать вариацию
+        """
+        self.interval = interval
+        self.burst_interval = burst_interval
+        self.burst_window = burst_window
+        self.burst_cv = burst_cv
+
+        self._rps: deque[float] = deque(maxlen=variance_samples)
+        self._p95: deque[float] = deque(maxlen=variance_samples)
+        self._burst_until = 0.0
+        self._last_sample: float | None = None
+        self._planned: list[float] = []  # Будущие изменения нагрузки (по возрастанию)
+
+    @property
+    def enabled(self) -> bool:
+        return self.burst_interval is not None and self.burst_interval < self.interval
+
+    def set_burst_interval(self, burst_interval: float | None) -> None:
+        """
+        Сменить интервал burst (новая стадия пайплайна со своим темпом)
+
+        Плановые изменения и открытый burst прошлой стадии сбрасываются.
+        """
+        self.burst_interval = burst_interval
+        self._burst_until = 0.0
+        self._planned.clear()
+        self._rps.clear()
+        self._p95.clear()
+
+    def load_changed(self, now: float) -> None:
+        """Нагрузка изменилась: собирать метрики часто burst_window секунд"""
+        if self.enabled:
+            self._burst_until = max(self._burst_until, now + self.burst_window)
+
+    def expect_change(self, at: float) -> None:
+        """Зарегистрировать изменение нагрузки, которое произойдёт в момент at"""
+        if self.enabled:
+            bisect.insort(self._planned, at)
+
+    def observe(self, metrics: RawMetrics, now: float) -> None:
+        """
+        Учесть новый сэмпл: записать фактический интервал и проверить вариацию
+
+        Args:
+            metrics: Сэмпл (получает sampling_interval)
+            now: Время сбора
+        """
+        if self._last_sample is not None:
+            metrics.sampling_interval = now - self._last_sample
+        self._last_sample = now
+
+        if not self.enabled:
+            return
+
+        self._rps.append(metrics.rps)
+        self._p95.append(metrics.p95)
+        if self._noisy(self._rps) or self._noisy(self._p95):
+            self._burst_until = max(self._burst_until, now + self.burst_interval)
+
+    def _noisy(self, values: deque[float]) -> bool:
+        if len(values) < values.maxlen:
+            return False
+        mean = sum(values) / len(values)
+        if mean <= 0:
+            return False
+        variance = sum((v - mean) ** 2 for v in values) / (len(values) - 1)
+        return math.sqrt(variance) / mean > self.burst_cv
+
+    def bursting(self, now: float) -> bool:
+        # Наступившие плановые изменения открывают burst от своего момента
+        while self._planned and self._planned[0] <= now:
+            self.load_changed(self._planned.pop(0))
+        return self.enabled and now < self._burst_until
+
+    def next_interval(self, now: float) -> float:
+        """Интервал до следующего сбора метрик (не позже ближайшего планового изменения)"""
+        if self.bursting(now):
+            return self.burst_interval
+        if self._planned:
+            return max(self.burst_interval, min(self.interval, self._planned[0] - now))
+        return self.interval
@@ -0,0 +1,147 @@
+"""
+Предвычисленное расписание нагрузки для генератора
+
+Для стратегий, управляемых временем (Profile, Spike), вся нагрузка известна
+заранее. В режиме orchestrator.schedule: push расписание компилируется в
+таблицу ступеней и целиком передаётся генератору (для Locust - в
+сгенерированный LoadTestShape). Переходы нагрузки происходят по часам
+генератора, без POST /swarm и без задержки цикла оркестратора; оркестратор
+только собирает метрики и останавливает тест.
+"""
+
+import bisect
+import math
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ScheduleStep:
+    """Ступень расписания: с момента at держать users, добираясь до них со скоростью spawn_rate"""
+    at: float
+    users: int
+    spawn_rate: float
+
+
+class LoadSchedule:
+    """Таблица ступеней нагрузки от начала теста"""
+
+    def __init__(self, steps: list[ScheduleStep], duration: float):
+        """
+        Args:
+            steps: Ступени по возрастанию at, первая - с at = 0
+            duration: Длительность расписания (сек), после неё нагрузка снимается
+
+        Raises:
+            ValueError: Если расписание пустое или ступени не упорядочены
+        """
+        if not steps:
+            raise ValueError("Load schedule requires at least one step")
+        if steps[0].at != 0:
+            raise ValueError("First schedule step must start at 0")
+        if any(b.at <= a.at for a, b in zip(steps, steps[1:])):
+            raise ValueError("Schedule steps must be strictly ordered by time")
+        if duration <= steps[-1].at:
+            raise ValueError("Schedule duration must cover the last step")
+
+        self.steps = steps
+        self.duration = duration
+        self._times = [step.at for step in steps]
+
+    @classmethod
+    def compile(
+        cls,
+        points: list[tuple[float, int]],
+        duration: float,
+        spawn_rate: int,
+        resolution: float = 1.0,
+        lead_in: tuple[float, int] | None = None,
+    ) -> "LoadSchedule":
+        """
+        Собрать расписание из плановых точек стратегии
+
+        Соседние точки с одинаковой нагрузкой схлопываются. Скорость спавна
+        ступени выбирается как в живом режиме: не меньше spawn_rate и такая,
+        чтобы новое значение было достигнуто за resolution секунд.
+
+        Args:
+            points: (смещение от начала таймлайна стратегии, нагрузка)
+            duration: Длительность таймлайна стратегии (сек)
+            spawn_rate: Скорость спавна из конфига
+            resolution: За сколько секунд достигать значения ступени
+            lead_in: (длительность, нагрузка) - удержание начальной нагрузки
+                перед таймлайном (стабилизация генератора)
+
+        Returns:
+            LoadSchedule
+        """
+        offset = 0.0
+        raw: list[tuple[float, int]] = []
+        if lead_in is not None and lead_in[0] > 0:
+            offset = lead_in[0]
+            raw.append((0.0, lead_in[1]))
+        raw.extend((offset + at, users) for at, users in points)
+
+        steps: list[ScheduleStep] = []
+        for at, users in raw:
+            at = round(at, 3)
+            # Фаза нулевой длительности: следующая точка в тот же момент её заменяет
+            if steps and at <= steps[-1].at:
+                steps.pop()
+            if steps and users == steps[-1].users:
+                continue
+            previous = steps[-1].users if steps else 0
+            rate = max(spawn_rate, math.ceil(abs(users - previous) / resolution))
+            steps.append(ScheduleStep(at=at, users=users, spawn_rate=rate))
+
+        return cls(steps, duration=offset + duration)
+
+    def at(self, t: float) -> ScheduleStep | None:
+        """
+        Ступень на момент t от начала расписания
+
+        Returns:
+            ScheduleStep или None, если расписание закончилось
+        """
+        if t >= self.duration:
+            return None
+        return self.steps[max(0, bisect.bisect_right(self._times, t) - 1)]
+
+    def to_locust_shape(self) -> str:
+        """
+        Исходный код locustfile с LoadTestShape по этому расписанию
+
+        Файл самодостаточен (импортирует только locust) и подключается
+        дополнительным -f рядом с основным locustfile. В основном
+        locustfile не должно быть своего LoadTestShape.
+        """
+        times = ", ".join(repr(step.at) for step in self.steps)
+        users = ", ".join(str(step.users) for step in self.steps)
+        rates = ", ".join(repr(float(step.spawn_rate)) for step in self.steps)
+        return SHAPE_TEMPLATE.format(
+            steps=len(self.steps), duration=repr(float(self.duration)),
+            times=times, users=users, rates=rates,
+        )
+
+
+SHAPE_TEMPLATE = '''"""
+Сгенерировано load_orchestrator: расписание нагрузки, ступеней: {steps}
+"""
+
+import bisect
+
+from locust import LoadTestShape
+
+DURATION = {duration}
+TIMES = ({times},)
+USERS = ({users},)
+SPAWN_RATES = ({rates},)
+
+
+class OrchestratorSchedule(LoadTestShape):
+    def tick(self):
+        run_time = self.get_run_time()
+        if run_time >= DURATION:
+            return None
+        i = bisect.bisect_right(TIMES, run_time) - 1
+        return USERS[i], SPAWN_RATES[i]
+'''
@@ -0,0 +1,361 @@
+"""
+SLO по эндпоинтам и скорость сжигания бюджета ошибок
+
+Один глобальный max_p99 не описывает реальные SLO: у эндпоинтов разные
+цели, и задаются они как бюджет «плохих» событий. Цель (Objective):
+
+    {endpoint: "GET /api/items", latency: 300, percentile: 99}
+        - 99% запросов эндпоинта быстрее 300 мс
+    {endpoint: "*", availability: 99.9}
+        - 99.9% всех запросов без ошибок ('*' - агрегат теста)
+
+Бюджет цели - допустимая доля плохих событий (1 - target). Скорость
+сжигания (burn rate) за окно - доля плохих событий в окне, делённая на
+бюджет: 1 - бюджет расходуется ровно к концу периода SLO, 10 - в десять
+раз быстрее. Окна парные (multi-window): нарушение - когда и длинное,
+и короткое окно горят быстрее max; длинное отсекает одиночные выбросы,
+короткое - подтверждает, что горит сейчас, а не горело раньше.
+
+Плохие события латентности оцениваются по перцентилям интервала
+(кусочно-линейная функция распределения через p50/p95/p99/max), так как
+адаптеры отдают перцентили, а не сырые задержки. Накопленные с начала
+теста перцентили (Locust REST) для этого не годятся: стратегия с целями
+по латентности требует адаптер с IAdapter.interval_percentiles() (Locust
+stream, JMeter). Эндпоинты берутся из RawMetrics.endpoints; '*' - агрегат
+теста. Если эндпоинт цели несколько сэмплов подряд не приходит при
+живом трафике (опечатка в имени, адаптер без эндпоинтов), выводится
+предупреждение - цель не оценивается.
+
+Суммы окон скользящие: обработка сэмпла - O(1) амортизированно на
+пару (цель, окно). Дополнительно по каждой ступени нагрузки копится
+доля плохих событий - отчёт даёт максимальную нагрузку, на которой все
+SLO ещё выполнялись.
+"""
+
+import re
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from .models import RawMetrics
+
+AGGREGATE = '*'
+
+# Сколько сэмплов с трафиком без данных эндпоинта цели до предупреждения
+MISSING_SAMPLES = 3
+
+# Пары окон по умолчанию: тесты идут минуты, а не недели - окна короче,
+# чем в классических алертах на месячный бюджет
+DEFAULT_BURN_WINDOWS = [
+    {'long': '30s', 'short': '10s', 'max': 10},
+    {'long': '2m', 'short': '30s', 'max': 2},
+]
+
+_DURATION = re.compile(r'^\s*(\d+(?:\.\d+)?)\s*(s|sec|m|min)?\s*$')
+
+
+def _seconds(value: Any) -> float:
+    if isinstance(value, (int, float)):
+        return float(value)
+    match = _DURATION.match(str(value))
+    if not match:
+        raise ValueError(f"Invalid duration: '{value}'")
+    return float(match.group(1)) * (60 if match.group(2) in ('m', 'min') else 1)
+
+
+@dataclass(frozen=True)
+class Objective:
+    """Цель SLO одного эндпоинта"""
+    endpoint: str
+    kind: str  # latency | availability
+    target: float  # Доля хороших событий, %
+    threshold: float | None = None  # latency: порог, мс
+
+    @property
+    def budget(self) -> float:
+        """Допустимая доля плохих событий"""
+        return 1 - self.target / 100
+
+    @property
+    def name(self) -> str:
+        if self.kind == 'latency':
+            return f"{self.endpoint} p{self.target:g} < {self.threshold:g}ms"
+        return f"{self.endpoint} availability {self.target:g}%"
+
+
+@dataclass(frozen=True)
+class BurnWindow:
+    """Пара окон и порог скорости сжигания"""
+    long: float
+    short: float
+    max: float
+
+
+def parse_objectives(data: list[dict[str, Any]]) -> list[Objective]:
+    """
+    Разобрать цели из конфига
+
+    Одна запись может задать и латентность, и доступность - это две цели.
+
+    Raises:
+        ValueError: Если запись невалидна
+    """
+    if not isinstance(data, list) or not data:
+        raise ValueError("'slos' must be a non-empty list")
+
+    objectives = []
+    for i, item in enumerate(data):
+        if not isinstance(item, dict):
+            raise ValueError(f"SLO #{i + 1} must be a mapping")
+        unknown = set(item) - {'endpoint', 'latency', 'percentile', 'availability'}
+        if unknown:
+            raise ValueError(f"Unknown keys in SLO #{i + 1}: {', '.join(sorted(unknown))}")
+        endpoint = str(item.get('endpoint', AGGREGATE))
+
+        if 'latency' in item:
+            percentile = float(item.get('percentile', 99))
+            if not 0 < percentile < 100:
+                raise ValueError(f"SLO #{i + 1}: 'percentile' must be in (0, 100)")
+            if float(item['latency']) <= 0:
+                raise ValueError(f"SLO #{i + 1}: 'latency' must be positive")
+            objectives.append(Objective(endpoint, 'latency', percentile, float(item['latency'])))
+        if 'availability' in item:
+            availability = float(item['availability'])
+            if not 0 < availability < 100:
+                raise ValueError(f"SLO #{i + 1}: 'availability' must be in (0, 100)")
+            objectives.append(Objective(endpoint, 'availability', availability))
+        if 'latency' not in item and 'availability' not in item:
+            raise ValueError(f"SLO #{i + 1} requires 'latency' or 'availability'")
+    return objectives
+
+
+def parse_burn_windows(data: list[dict[str, Any]] | None) -> list[BurnWindow]:
+    """
+    Разобрать пары окон: [{long: 2m, short: 30s, max: 2}, ...]
+
+    Raises:
+        ValueError: Если пара невалидна
+    """
+    windows = []
+    for i, item in enumerate(data or DEFAULT_BURN_WINDOWS):
+        try:
+            window = BurnWindow(_seconds(item['long']), _seconds(item['short']), float(item['max']))
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Burn window #{i + 1} requires 'long', 'short' and 'max'") from e
+        if not 0 < window.short <= window.long:
+            raise ValueError(f"Burn window #{i + 1}: 'short' must be positive and not longer than 'long'")
+        if window.max <= 0:
+            raise ValueError(f"Burn window #{i + 1}: 'max' must be positive")
+        windows.append(window)
+    return windows
+
+
+def slow_fraction(stats: dict[str, float], threshold: float) -> float:
+    """
+    Оценка доли запросов медленнее threshold по перцентилям
+
+    Функция распределения - ломаная через (p50, 0.5), (p95, 0.95),
+    (p99, 0.99) и (max, 1); без max хвост после p99 считается до 2 * p99.
+    """
+    p99 = stats.get('p99', 0.0)
+    points = [
+        (0.0, 0.0),
+        (stats.get('p50', 0.0), 0.50),
+        (stats.get('p95', 0.0), 0.95),
+        (p99, 0.99),
+        (max(stats.get('max') or 2 * p99, p99), 1.0),
+    ]
+    if threshold >= points[-1][0]:
+        return 0.0
+
+    previous_x, previous_q = points[0]
+    for x, q in points[1:]:
+        x = max(x, previous_x)  # Перцентили из разных окон могут быть немонотонны
+        if threshold < x:
+            share = (threshold - previous_x) / (x - previous_x) if x > previous_x else 1.0
+            return 1 - (previous_q + share * (q - previous_q))
+        previous_x, previous_q = x, q
+    return 0.0
+
+
+class _WindowSum:
+    """Скользящие суммы событий за окно времени"""
+
+    def __init__(self, duration: float):
+        self.duration = duration
+        self._events: deque[tuple[float, float, float]] = deque()
+        self.total = 0.0
+        self.bad = 0.0
+
+    def add(self, timestamp: float, total: float, bad: float) -> None:
+        self._events.append((timestamp, total, bad))
+        self.total += total
+        self.bad += bad
+        while timestamp - self._events[0][0] > self.duration:
+            _, old_total, old_bad = self._events.popleft()
+            self.total -= old_total
+            self.bad -= old_bad
+
+    def burn(self, budget: float) -> float | None:
+        if self.total <= 0:
+            return None
+        return self.bad / self.total / budget
+
+
+@dataclass
+class Breach:
+    """Нарушение: цель горит быстрее порога в обоих окнах пары"""
+    objective: Objective
+    window: BurnWindow
+    long_burn: float
+    short_burn: float
+
+    def describe(self) -> str:
+        return (
+            f"{self.objective.name}: burn {self.long_burn:.1f}x over {self.window.long:g}s, "
+            f"{self.short_burn:.1f}x over {self.window.short:g}s (max {self.window.max:g}x)"
+        )
+
+
+class SLOEngine:
+    """Инкрементальная оценка целей SLO по сэмплам"""
+
+    def __init__(
+        self,
+        objectives: list[Objective],
+        windows: list[BurnWindow] | None = None,
+        latency: Callable[[RawMetrics, str], float] | None = None,
+    ):
+        """
+        Args:
+            objectives: Цели
+            windows: Пары окон (по умолчанию DEFAULT_BURN_WINDOWS)
+            latency: Перцентиль агрегата (по умолчанию RawMetrics.latency - сырые)
+        """
+        self.objectives = objectives
+        self.windows = windows or parse_burn_windows(None)
+        self.latency = latency or (lambda m, name: m.latency(name))
+        self.reset()
+
+    def reset(self) -> None:
+        durations = sorted({d for w in self.windows for d in (w.long, w.short)})
+        self._sums = [{d: _WindowSum(d) for d in durations} for _ in self.objectives]
+        self._steps: dict[int, list[list[float]]] = {}  # нагрузка -> [[total, bad] по целям]
+        self._previous: tuple[int, int] | None = None  # Накопленные запросы/ошибки агрегата
+        self._missing = [0] * len(self.objectives)  # Сэмплов подряд без данных эндпоинта цели
+        self.breach: Breach | None = None
+
+    def _aggregate(self, metrics: RawMetrics) -> dict[str, float]:
+        """Агрегат за интервал: счётчики - разность накопленных"""
+        requests, failures = metrics.total_requests, metrics.failed_requests
+        if self._previous is not None and requests >= self._previous[0]:
+            interval = requests - self._previous[0], max(0, failures - self._previous[1])
+        else:
+            interval = requests, failures
+        self._previous = (requests, failures)
+        return {
+            'requests': interval[0],
+            'failures': interval[1],
+            'p50': self.latency(metrics, 'p50'),
+            'p95': self.latency(metrics, 'p95'),
+            'p99': self.latency(metrics, 'p99'),
+        }
+
+    @staticmethod
+    def _events(objective: Objective, stats: dict[str, float]) -> tuple[float, float]:
+        total = stats.get('requests', 0)
+        if objective.kind == 'availability':
+            return total, min(stats.get('failures', 0), total)
+        return total, total * slow_fraction(stats, objective.threshold)
+
+    def update(self, metrics: RawMetrics) -> Breach | None:
+        """
+        Учесть сэмпл
+
+        Returns:
+            Первое нарушение (пара окон горит быстрее max) или None
+        """
+        aggregate = self._aggregate(metrics)
+        step = None if metrics.ramping else self._steps.setdefault(
+            metrics.users, [[0.0, 0.0] for _ in self.objectives]
+        )
+
+        breach = None
+        for i, objective in enumerate(self.objectives):
+            stats = aggregate if objective.endpoint == AGGREGATE else metrics.endpoints.get(objective.endpoint)
+            if not stats:
+                if aggregate['requests'] > 0:
+                    self._warn_missing(i, objective, metrics)
+                continue
+            self._missing[i] = 0
+            total, bad = self._events(objective, stats)
+            if total <= 0:
+                continue
+
+            sums = self._sums[i]
+            for window in sums.values():
+                window.add(metrics.timestamp, total, bad)
+            if step is not None:
+                step[i][0] += total
+                step[i][1] += bad
+
+            if breach is None:
+                for window in self.windows:
+                    long_burn = sums[window.long].burn(objective.budget)
+                    short_burn = sums[window.short].burn(objective.budget)
+                    if long_burn is not None and short_burn is not None and \
+                            long_burn > window.max and short_burn > window.max:
+                        breach = Breach(objective, window, long_burn, short_burn)
+                        break
+
+        if breach is not None and self.breach is None:
+            self.breach = breach
+        return breach
+
+    def _warn_missing(self, i: int, objective: Objective, metrics: RawMetrics) -> None:
+        """Предупредить, что цель не оценивается (раз за серию сэмплов без эндпоинта)"""
+        self._missing[i] += 1
+        if self._missing[i] != MISSING_SAMPLES:
+            return
+        if not metrics.endpoints:
+            print(f"⚠️  SLO '{objective.name}' is not evaluated: the adapter reports no per-endpoint stats")
+        else:
+            known = ', '.join(sorted(metrics.endpoints)[:10])
+            print(f"⚠️  SLO '{objective.name}': no requests to '{objective.endpoint}' (seen: {known})")
+
+    def burn_rates(self) -> dict[str, dict[str, float | None]]:
+        """Текущая скорость сжигания по целям и окнам"""
+        return {
+            objective.name: {f"{d:g}s": s.burn(objective.budget) for d, s in self._sums[i].items()}
+            for i, objective in enumerate(self.objectives)
+        }
+
+    def report(self) -> dict:
+        """
+        Итог: ступени нагрузки с burn rate каждой цели и максимальная
+        нагрузка, до которой (включительно) все SLO выполнялись
+
+        Returns:
+            {'objectives': [...], 'max_compliant_users', 'breach',
+             'steps': [{'users', 'holds', 'burn': {цель: burn rate}}]}
+        """
+        steps = []
+        max_compliant = 0
+        compliant_so_far = True
+        for users in sorted(self._steps):
+            burns = {}
+            for i, objective in enumerate(self.objectives):
+                total, bad = self._steps[users][i]
+                burns[objective.name] = bad / total / objective.budget if total > 0 else None
+            holds = all(burn is None or burn <= 1 for burn in burns.values())
+            compliant_so_far = compliant_so_far and holds
+            if compliant_so_far:
+                max_compliant = users
+            steps.append({'users': users, 'holds': holds, 'burn': burns})
+
+        return {
+            'objectives': [objective.name for objective in self.objectives],
+            'max_compliant_users': max_compliant,
+            'breach': self.breach.describe() if self.breach else None,
+            'steps': steps,
+        }
@@ -0,0 +1,155 @@
+"""
+Хранилище результатов прогонов
+
+Каждый TestResult сохраняется в JSON в каталог orchestrator.runs_dir,
+в подкаталог по отпечатку конфига (fingerprint): прогоны одного и того же
+теста лежат рядом, и следующий прогон может взять из последнего базовую
+линию и стартовую нагрузку (см. warmstart).
+
+    <runs_dir>/<fingerprint>/<run_id>.json
+"""
+
+import dataclasses
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from .config import Config
+from .models import RawMetrics, StopReason, TestResult
+
+# Параметры оркестратора, которые меняют саму нагрузку (остальные - настройки прогона)
+_WORKLOAD_KEYS = ('load_model', 'max_users')
+
+
+def config_fingerprint(config: Config) -> str:
+    """
+    Отпечаток конфига: тот же тест - тот же отпечаток
+
+    Учитываются адаптер, стратегия, модель нагрузки и цели A/B-сравнения; интервалы
+    мониторинга, хранилище, правила остановки и прочие настройки прогона
+    на отпечаток не влияют.
+    """
+    data = config.to_dict()
+    workload = {
+        'adapter': data['adapter'],
+        'strategy': data['strategy'],
+        'orchestrator': {key: data['orchestrator'][key] for key in _WORKLOAD_KEYS},
+    }
+    if 'compare' in data:
+        workload['compare'] = data['compare']
+    encoded = json.dumps(workload, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def result_to_dict(result: TestResult) -> dict[str, Any]:
+    """TestResult -> словарь для JSON (причина остановки - по имени)"""
+    def convert(value):
+        if isinstance(value, StopReason):
+            return value.name
+        if isinstance(value, dict):
+            return {k: convert(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [convert(v) for v in value]
+        return value
+
+    return convert(dataclasses.asdict(result))
+
+
+_METRIC_FIELDS = {f.name for f in dataclasses.fields(RawMetrics)}
+_RESULT_FIELDS = {f.name for f in dataclasses.fields(TestResult)}
+
+
+def result_from_dict(data: dict[str, Any]) -> TestResult:
+    """
+    Словарь из JSON -> TestResult
+
+    Неизвестные поля пропускаются: файлы старых и новых версий читаются.
+    """
+    values = {k: v for k, v in data.items() if k in _RESULT_FIELDS}
+    values['stop_reason'] = StopReason[values['stop_reason']]
+    values['history'] = [
+        RawMetrics(**{k: v for k, v in m.items() if k in _METRIC_FIELDS})
+        for m in values.get('history', [])
+    ]
+    values['stages'] = [result_from_dict(stage) for stage in values.get('stages', [])]
+    return TestResult(**values)
+
+
+def _run_order(run_id: str) -> tuple[str, int]:
+    """Порядок прогонов: по времени старта, затем по номеру в пределах секунды"""
+    base, _, n = run_id.partition('-')
+    return base, int(n) if n.isdigit() else 1
+
+
+class RunStore:
+    """Каталог сохранённых прогонов"""
+
+    def __init__(self, directory: str | Path):
+        """
+        Args:
+            directory: Корневой каталог хранилища (создаётся при первой записи)
+        """
+        self.directory = Path(directory)
+
+    def save(self, fingerprint: str, result: TestResult) -> str:
+        """
+        Сохранить результат прогона
+
+        Args:
+            fingerprint: Отпечаток конфига
+            result: Результат
+
+        Returns:
+            Идентификатор прогона
+        """
+        run_dir = self.directory / fingerprint
+        run_dir.mkdir(parents=True, exist_ok=True)
+
+        started = result.started_at or time.time()
+        base = time.strftime('%Y%m%dT%H%M%S', time.localtime(started))
+        run_id, n = base, 1
+        while (run_dir / f"{run_id}.json").exists():
+            n += 1
+            run_id = f"{base}-{n}"
+        path = run_dir / f"{run_id}.json"
+
+        # Через временный файл: прерванная запись не оставит битый JSON
+        tmp = path.with_suffix('.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(result_to_dict(result), f)
+        os.replace(tmp, path)
+        return run_id
+
+    def runs(self, fingerprint: str) -> list[str]:
+        """Идентификаторы прогонов конфига, от старых к новым"""
+        run_dir = self.directory / fingerprint
+        if not run_dir.is_dir():
+            return []
+        return sorted((p.stem for p in run_dir.glob('*.json')), key=_run_order)
+
+    def load(self, fingerprint: str, run_id: str) -> TestResult:
+        with open(self.directory / fingerprint / f"{run_id}.json", encoding='utf-8') as f:
+            return result_from_dict(json.load(f))
+
+    def latest(self, fingerprint: str, exclude: tuple[StopReason, ...] = ()) -> tuple[str, TestResult] | None:
+        """
+        Последний прогон конфига
+
+        Args:
+            fingerprint: Отпечаток конфига
+            exclude: Причины остановки, с которыми прогон не подходит
+
+        Returns:
+            (идентификатор, результат) или None, если подходящих прогонов нет
+        """
+        for run_id in reversed(self.runs(fingerprint)):
+            try:
+                result = self.load(fingerprint, run_id)
+            except (OSError, ValueError, KeyError, TypeError):
+                continue  # Повреждённый или чужой файл
+            if result.stop_reason not in exclude:
+                return run_id, result
+        return None
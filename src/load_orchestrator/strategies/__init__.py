@@ -1,10 +1,32 @@
+"""
+Стратегии тестирования
+
+Модули стратегий импортируются при первом обращении к имени
+(from load_orchestrator.strategies import Spike), а не при импорте пакета.
+"""
+
+from importlib import import_module
+
 from .base import IStrategy
-from .degradation_search import DegradationSearch
-from .break_point import BreakPoint
-from .target_rps import TargetRPS
-from .sla_validation import SLAValidation
-from .spike import Spike
-from .canary import Canary
+
+_LAZY = {
+    'DegradationSearch': '.degradation_search',
+    'BreakPoint': '.break_point',
+    'TargetRPS': '.target_rps',
+    'SLAValidation': '.sla_validation',
+    'Spike': '.spike',
+    'Canary': '.canary',
+    'Pipeline': '.pipeline',
+    'Profile': '.profile',
+    'LoadProfile': '.profile',
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        return getattr(import_module(_LAZY[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     'IStrategy',
@@ -14,4 +36,7 @@ __all__ = [
     'SLAValidation',
     'Spike',
     'Canary',
-]
\ No newline at end of file
+    'Pipeline',
+    'Profile',
+    'LoadProfile',
+]
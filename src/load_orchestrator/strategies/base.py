@@ -1,10 +1,57 @@
 from abc import ABC, abstractmethod
-from ..models import RawMetrics, Decision
+from ..clock import SYSTEM_CLOCK, Clock
+from ..models import RawMetrics, Decision, WarmStart
+
+
+PERCENTILE_MODES = ('raw', 'corrected')
+RAMP_SAMPLE_MODES = ('include', 'exclude')
+
+# Параметры, которые принимает любая стратегия (первое значение - по умолчанию)
+COMMON_PARAMS = {
+    'percentiles': PERCENTILE_MODES,
+    'ramp_samples': RAMP_SAMPLE_MODES,
+}
 
 
 class IStrategy(ABC):
     """Интерфейс стратегии тестирования"""
 
+    # Какие перцентили использовать в решениях: raw - как отдаёт генератор,
+    # corrected - с коррекцией coordinated omission (если адаптер их отдаёт).
+    # Задаётся параметром стратегии percentiles.
+    percentiles: str = 'raw'
+
+    # Сэмплы, снятые во время рампы (RawMetrics.ramping): include - отдавать
+    # в decide() как есть (стратегия может сама учесть флаг), exclude - не
+    # отдавать, оркестратор держит нагрузку до конца рампы.
+    # Задаётся параметром стратегии ramp_samples.
+    ramp_samples: str = 'include'
+
+    # Часы стратегий, управляемых временем (см. use_clock)
+    clock: Clock = SYSTEM_CLOCK
+
+    def use_clock(self, clock: Clock) -> None:
+        """
+        Брать время из clock (вызывается оркестратором до начала теста)
+
+        Args:
+            clock: Часы оркестратора
+        """
+        self.clock = clock
+
+    def latency(self, metrics: RawMetrics, name: str) -> float:
+        """
+        Перцентиль задержки в режиме percentiles стратегии
+
+        Args:
+            metrics: Сырые метрики
+            name: 'p50', 'p95' или 'p99'
+
+        Returns:
+            Задержка в мс
+        """
+        return metrics.latency(name, corrected=self.percentiles == 'corrected')
+
     @abstractmethod
     def decide(self, metrics: RawMetrics) -> Decision:
         """
@@ -32,6 +79,15 @@ class IStrategy(ABC):
         """
         pass
 
+    def accepts_sample(self, metrics: RawMetrics) -> bool:
+        """
+        Принимает ли стратегия сэмпл в decide()
+
+        Returns:
+            False для сэмплов рампы при ramp_samples: exclude
+        """
+        return not (metrics.ramping and self.ramp_samples == 'exclude')
+
     def get_wait_time(self) -> int:
         """
         Вернуть время ожидания между изменениями нагрузки (в секундах)
@@ -51,6 +107,139 @@ class IStrategy(ABC):
         """
         return 30
 
+    def get_setpoint(self, now: float) -> int | None:
+        """
+        Вернуть плановую нагрузку на момент now (для стратегий, управляемых временем)
+
+        Вызывается оркестратором на каждом тике цикла, независимо от
+        мониторинга. Если возвращено значение, отличное от текущей нагрузки,
+        оркестратор сразу применяет его через adapter.configure().
+
+        Args:
+            now: Текущее время (timestamp)
+
+        Returns:
+            Количество пользователей или None, если стратегия не управляет
+            нагрузкой по времени (по умолчанию)
+        """
+        return None
+
+    def get_tick_interval(self) -> float:
+        """
+        Вернуть шаг главного цикла оркестратора (в секундах)
+
+        Стратегии с get_setpoint() могут уменьшить его, чтобы применять
+        плановую нагрузку с точностью меньше секунды.
+
+        Returns:
+            Шаг цикла в секундах (по умолчанию 1)
+        """
+        return 1.0
+
+    def get_burst_interval(self) -> float | None:
+        """
+        Вернуть интервал частого сбора метрик, нужный стратегии
+
+        Используется, если orchestrator.burst_interval не задан: стратегии,
+        которым важна субсекундная картина у переходов нагрузки (Spike),
+        включают burst-сбор без правки конфига оркестратора. В пайплайне
+        оркестратор перечитывает интервал при смене стадии: burst одной
+        стадии не меняет темп мониторинга остальных.
+
+        Returns:
+            Интервал в секундах или None, если стратегии хватает
+            monitoring_interval (по умолчанию)
+        """
+        return None
+
+    def needs_interval_percentiles(self) -> bool:
+        """
+        Нужны ли стратегии перцентили за интервал (см. IAdapter.interval_percentiles)
+
+        Оркестратор не запустит такую стратегию с адаптером, который отдаёт
+        только накопленные перцентили.
+
+        Returns:
+            True если решения теряют смысл на накопленных перцентилях (по умолчанию False)
+        """
+        return False
+
+    def get_schedule(self) -> tuple[list[tuple[float, int]], float] | None:
+        """
+        Вернуть всю плановую нагрузку заранее (для orchestrator.schedule: push)
+
+        Стратегии, чья нагрузка зависит только от времени, могут отдать
+        таймлайн целиком: оркестратор скомпилирует его в расписание и
+        передаст генератору. Отсчёт - от начала таймлайна стратегии
+        (после стабилизации), точки - по возрастанию смещения.
+
+        Returns:
+            ([(смещение в секундах, нагрузка), ...], длительность таймлайна)
+            или None, если нагрузка зависит от метрик (по умолчанию)
+        """
+        return None
+
+    def handoff(self, current_users: int, metrics: RawMetrics) -> None:
+        """
+        Принять состояние от предыдущей стадии пайплайна
+
+        Вызывается перед стартом стратегии внутри Pipeline, когда генератор
+        уже держит нагрузку от предыдущей стадии. Стратегии с наращиванием
+        нагрузки могут начать рампу с текущего уровня, а не с initial_users.
+
+        Args:
+            current_users: Нагрузка, на которой закончилась предыдущая стадия
+            metrics: Последние метрики предыдущей стадии
+        """
+        pass
+
+    def warm_start(self, seed: WarmStart) -> bool:
+        """
+        Начать с состояния прошлого прогона того же конфига
+
+        Вызывается до начала теста. Стратегия может взять стартовую
+        нагрузку seed.start_users и засеять свою базовую линию сэмплами
+        seed.baseline. Если засев не подтвердится, оркестратор вызовет
+        cold_start().
+
+        Args:
+            seed: Тёплый старт (см. warmstart)
+
+        Returns:
+            True если стратегия использует засев (по умолчанию False - холодный старт)
+        """
+        return False
+
+    def cold_start(self) -> None:
+        """Отменить засев warm_start() и начать как обычно"""
+        pass
+
+    def passed(self) -> bool:
+        """
+        Пройдена ли проверка, после того как стратегия вернула STOP
+
+        Стратегии-гейты (Canary, SLAValidation) останавливаются и при
+        успехе, и при нарушении: по этому признаку оркестратор отличает
+        TARGET_REACHED от SLA_VIOLATED, а Pipeline не переходит к
+        следующей стадии после проваленной.
+
+        Returns:
+            False если STOP вызван нарушением (по умолчанию True)
+        """
+        return True
+
+    def report(self) -> dict | None:
+        """
+        Итог стратегии для TestResult.strategy_report
+
+        Вызывается оркестратором при формировании результата теста
+        (и каждой стадии пайплайна).
+
+        Returns:
+            Словарь для JSON или None, если стратегии нечего добавить (по умолчанию)
+        """
+        return None
+
     @abstractmethod
     def reset(self) -> None:
         """Сбросить состояние для нового теста"""
@@ -1,5 +1,5 @@
 from .base import IStrategy
-from ..models import RawMetrics, Decision
+from ..models import RawMetrics, Decision, WarmStart
 
 
 class BreakPoint(IStrategy):
@@ -27,6 +27,7 @@ class BreakPoint(IStrategy):
             error_threshold: Порог ошибок для остановки (в процентах)
         """
         self.initial_users = initial_users
+        self._cold_initial_users = initial_users  # Для отката с тёплого старта
         self.step_multiplier = step_multiplier
         self.error_threshold = error_threshold
         self.previous_metrics: RawMetrics = RawMetrics(
@@ -63,8 +64,9 @@ class BreakPoint(IStrategy):
             return Decision.STOP
 
         # Экстремальная латентность
-        if metrics.p99 > 10000:  # 10 секунд
-            print(f"⚠️  Extreme latency: {metrics.p99:.0f}ms")
+        p99 = self.latency(metrics, 'p99')
+        if p99 > 10000:  # 10 секунд
+            print(f"⚠️  Extreme latency: {p99:.0f}ms")
             return Decision.STOP
 
         # Проверка падения RPS (требует previous_metrics)
@@ -86,6 +88,21 @@ class BreakPoint(IStrategy):
             return self.initial_users
         return int(current_users * self.step_multiplier)
 
+    def handoff(self, current_users: int, metrics: RawMetrics) -> None:
+        """Продолжить рампу с нагрузки предыдущей стадии"""
+        if current_users > 0:
+            self.initial_users = current_users
+
+    def warm_start(self, seed: WarmStart) -> bool:
+        """Начать рост нагрузки с seed.start_users"""
+        self.initial_users = seed.start_users
+        return True
+
+    def cold_start(self) -> None:
+        """Вернуть initial_users из конфига"""
+        self.initial_users = self._cold_initial_users
+        self.reset()
+
     def reset(self) -> None:
         """TODO: Сбросить внутреннее состояние"""
         pass
\ No newline at end of file
@@ -1,5 +1,3 @@
-import time
-
 from .base import IStrategy
 from ..models import RawMetrics, Decision
 
@@ -22,42 +20,51 @@ class Canary(IStrategy):
         canary_users: int = 5,
         canary_duration: int = 30,  # секунд
         error_threshold: float = 1.0,  # 1% ошибок уже плохо для canary
+        max_p99: float = 5000,  # в миллисекундах
     ):
         """
         Args:
             canary_users: Количество пользователей для проверки
             canary_duration: Длительность проверки (секунд)
             error_threshold: Порог ошибок для остановки (%)
+            max_p99: P99, выше которого система считается неработающей (мс)
         """
         self.canary_users = canary_users
         self.canary_duration = canary_duration
         self.error_threshold = error_threshold
+        self.max_p99 = max_p99
 
         self._checks_done = 0
         self._started_at = None
+        self._failed = False
 
     def decide(self, metrics: RawMetrics) -> Decision:
         """
 
         Логика:
-        1. Если error_rate > error_threshold -> STOP (система не работает)
-        2. Если p99 очень большой (> 5000ms) -> STOP (система тормозит)
+        1. Если error_rate > error_threshold -> STOP (система не работает, проверка провалена)
+        2. Если p99 очень большой (> max_p99) -> STOP (система тормозит, проверка провалена)
         3. Если прошло достаточно времени и всё OK -> STOP (успешная проверка)
         4. Иначе -> HOLD (продолжаем проверку)
         """
         # На первом шаге всегда держим
         if self._checks_done == 0:
-            self._started_at = time.time()
+            self._started_at = self.clock.time()
             self._checks_done += 1
             return Decision.HOLD
 
 
         if metrics.error_rate > self.error_threshold:
+            print(f"⚠️  Canary failed: error_rate={metrics.error_rate:.2f}% > {self.error_threshold}%")
+            self._failed = True
             return Decision.STOP
-        if metrics.p99 > self.error_threshold:
+        p99 = self.latency(metrics, 'p99')
+        if p99 > self.max_p99:
+            print(f"⚠️  Canary failed: P99={p99:.0f}ms > {self.max_p99}ms")
+            self._failed = True
             return Decision.STOP
 
-        if time.time() - self._started_at > self.canary_duration:
+        if self.clock.time() - self._started_at > self.canary_duration:
             return Decision.STOP
 
         return Decision.HOLD
@@ -79,7 +86,12 @@ class Canary(IStrategy):
         """
         return self.canary_duration
 
+    def passed(self) -> bool:
+        """Проверка провалена, если STOP вызван ошибками или задержкой"""
+        return not self._failed
+
     def reset(self) -> None:
         """TODO: Сбросить внутреннее состояние"""
         self._checks_done = 0
-        self._started_at = None
\ No newline at end of file
+        self._started_at = None
+        self._failed = False
\ No newline at end of file
@@ -2,7 +2,7 @@ from collections import deque
 
 from .base import IStrategy
 from ..analytics.metrics_calculator import MetricsCalculator
-from ..models import RawMetrics, Decision
+from ..models import RawMetrics, Decision, WarmStart
 
 import statistics
 
@@ -47,6 +47,7 @@ class DegradationSearch(IStrategy):
             Если step_size=None, используется step_multiplier (экспоненциальный рост).
         """
         self.initial_users = initial_users
+        self._cold_initial_users = initial_users  # Для отката с тёплого старта
         self.step_multiplier = step_multiplier
         self.step_size = step_size
         self.degradation_threshold = 0.6
@@ -97,7 +98,7 @@ class DegradationSearch(IStrategy):
             return Decision.CONTINUE
 
         # Берём только p95
-        p95 = [m.p95 for m in self.metrics_history]
+        p95 = [self.latency(m, 'p95') for m in self.metrics_history]
         errors = [m.error_rate for m in self.metrics_history]
 
         BASELINE_WINDOW = 10
@@ -131,11 +132,29 @@ class DegradationSearch(IStrategy):
         1. Линейный рост (step_size): users + step_size
         2. Экспоненциальный рост (step_multiplier): users * step_multiplier
         """
+        if current_users == 0:
+            return self.initial_users
         return current_users + 10
 
     def get_wait_time(self) -> int:
         return 5
 
+    def warm_start(self, seed: WarmStart) -> bool:
+        """Стартовать с seed.start_users с базовой линией прошлого прогона"""
+        self.initial_users = seed.start_users
+        self.metrics_history = list(seed.baseline)
+        return True
+
+    def cold_start(self) -> None:
+        """Вернуть initial_users из конфига и копить базовую линию заново"""
+        self.initial_users = self._cold_initial_users
+        self.reset()
+
+    def handoff(self, current_users: int, metrics: RawMetrics) -> None:
+        """Продолжить поиск деградации с нагрузки предыдущей стадии"""
+        if current_users > 0:
+            self.initial_users = current_users
+
     def reset(self) -> None:
         """Сбросить внутреннее состояние стратегии"""
         self.metrics_history.clear()
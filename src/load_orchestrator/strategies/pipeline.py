@@ -0,0 +1,135 @@
+from .base import IStrategy
+from ..clock import Clock
+from ..models import RawMetrics, Decision
+
+
+class Pipeline(IStrategy):
+    """
+    Последовательный запуск нескольких стратегий в одной сессии генератора
+
+    Генератор запускается и стабилизируется один раз, после чего стадии
+    выполняются по очереди: STOP текущей стадии означает переход к следующей,
+    если стадия пройдена (IStrategy.passed()); проваленная стадия завершает тест.
+    Типичный гейт: canary -> sla_validation -> degradation_search -> spike.
+
+    Между стадиями передаётся состояние: следующая стадия получает текущую
+    нагрузку и последние метрики через IStrategy.handoff(), поэтому, например,
+    рампа SLA начинается с нагрузки canary, а не с нуля.
+
+    Переключением стадий управляет Orchestrator, он же формирует
+    отдельный TestResult для каждой стадии.
+    """
+
+    def __init__(
+        self,
+        stages: list[IStrategy],
+        names: list[str] | None = None,
+        carry_load: bool = True,
+    ):
+        """
+        Args:
+            stages: Стратегии в порядке выполнения
+            names: Имена стадий для отчёта (по умолчанию имена классов)
+            carry_load: Передавать нагрузку предыдущей стадии следующей (handoff)
+
+        Raises:
+            ValueError: Если список стадий пуст или имена не совпадают по длине
+        """
+        if not stages:
+            raise ValueError("Pipeline requires at least one stage")
+        if names is not None and len(names) != len(stages):
+            raise ValueError("Pipeline stage names must match stages")
+
+        self.stages = stages
+        self.names = names or [type(stage).__name__ for stage in stages]
+        self.carry_load = carry_load
+
+        self._index = 0
+
+    @property
+    def index(self) -> int:
+        """Индекс текущей стадии"""
+        return self._index
+
+    @property
+    def current(self) -> IStrategy:
+        """Текущая стадия"""
+        return self.stages[self._index]
+
+    @property
+    def current_name(self) -> str:
+        """Имя текущей стадии"""
+        return self.names[self._index]
+
+    def has_next_stage(self) -> bool:
+        """Есть ли стадии после текущей"""
+        return self._index + 1 < len(self.stages)
+
+    def advance(self, current_users: int, metrics: RawMetrics) -> IStrategy:
+        """
+        Перейти к следующей стадии
+
+        Args:
+            current_users: Нагрузка, на которой закончилась текущая стадия
+            metrics: Последние метрики текущей стадии
+
+        Returns:
+            Новая текущая стадия
+
+        Raises:
+            IndexError: Если стадий больше нет
+        """
+        if not self.has_next_stage():
+            raise IndexError("Pipeline has no more stages")
+
+        self._index += 1
+        stage = self.current
+        if self.carry_load:
+            stage.handoff(current_users, metrics)
+
+        print(f"▶️  Стадия {self._index + 1}/{len(self.stages)}: {self.current_name}")
+        return stage
+
+    def decide(self, metrics: RawMetrics) -> Decision:
+        return self.current.decide(metrics)
+
+    def get_next_users(self, current_users: int, metrics: RawMetrics) -> int:
+        return self.current.get_next_users(current_users, metrics)
+
+    def get_wait_time(self) -> int:
+        return self.current.get_wait_time()
+
+    def get_setpoint(self, now: float) -> int | None:
+        return self.current.get_setpoint(now)
+
+    def get_tick_interval(self) -> float:
+        return self.current.get_tick_interval()
+
+    def needs_interval_percentiles(self) -> bool:
+        return any(stage.needs_interval_percentiles() for stage in self.stages)
+
+    def get_burst_interval(self) -> float | None:
+        return self.current.get_burst_interval()
+
+    def accepts_sample(self, metrics: RawMetrics) -> bool:
+        return self.current.accepts_sample(metrics)
+
+    def handoff(self, current_users: int, metrics: RawMetrics) -> None:
+        self.current.handoff(current_users, metrics)
+
+    def use_clock(self, clock: Clock) -> None:
+        super().use_clock(clock)
+        for stage in self.stages:
+            stage.use_clock(clock)
+
+    def passed(self) -> bool:
+        return self.current.passed()
+
+    def report(self) -> dict | None:
+        return self.current.report()
+
+    def reset(self) -> None:
+        """Сбросить все стадии и вернуться к первой"""
+        self._index = 0
+        for stage in self.stages:
+            stage.reset()
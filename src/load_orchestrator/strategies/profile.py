@@ -0,0 +1,375 @@
+import bisect
+import csv
+import math
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .base import IStrategy
+from ..models import RawMetrics, Decision
+
+
+@dataclass
+class ProfileSegment:
+    """
+    Сегмент профиля нагрузки
+
+    Значение сегмента в момент t (от начала сегмента) задаётся kind:
+    - ramp: линейно от start до end
+    - step: ступени values, каждая держится step_duration
+    - hold: постоянное значение start
+    - sine: start + amplitude * sin(2π * t / period + phase)
+    - sawtooth: линейно от start до end, повторяется каждые period
+    - replay: кусочно-линейная интерполяция точек (times, values) из CSV
+    """
+    kind: str
+    duration: float
+    start: float = 0.0
+    end: float = 0.0
+    amplitude: float = 0.0
+    period: float = 0.0
+    phase: float = 0.0
+    step_duration: float = 0.0
+    values: tuple[float, ...] = ()
+    times: tuple[float, ...] = ()
+    interpolate: bool = True
+
+    def value_at(self, t: float) -> float:
+        """
+        Значение сегмента через t секунд от его начала
+
+        Args:
+            t: Смещение от начала сегмента (0 <= t <= duration)
+
+        Returns:
+            Плановое значение нагрузки
+        """
+        match self.kind:
+            case 'ramp':
+                if self.duration <= 0:
+                    return self.end
+                return self.start + (self.end - self.start) * min(t / self.duration, 1.0)
+            case 'hold':
+                return self.start
+            case 'step':
+                index = min(int(t // self.step_duration), len(self.values) - 1)
+                return self.values[index]
+            case 'sine':
+                return self.start + self.amplitude * math.sin(2 * math.pi * t / self.period + self.phase)
+            case 'sawtooth':
+                return self.start + (self.end - self.start) * ((t % self.period) / self.period)
+            case 'replay':
+                return self._replay_value(t)
+
+        raise ValueError(f"Unknown profile segment type: '{self.kind}'")
+
+    def _replay_value(self, t: float) -> float:
+        """Интерполяция записанной кривой"""
+        i = bisect.bisect_right(self.times, t) - 1
+        if i < 0:
+            return self.values[0]
+        if i >= len(self.times) - 1 or not self.interpolate:
+            return self.values[i]
+
+        t0, t1 = self.times[i], self.times[i + 1]
+        v0, v1 = self.values[i], self.values[i + 1]
+        return v0 + (v1 - v0) * (t - t0) / (t1 - t0)
+
+
+class LoadProfile:
+    """
+    Таймлайн из сегментов: вычисляет плановую нагрузку в любой момент времени
+
+    Сегменты идут друг за другом. Начальное значение ramp/hold/sawtooth можно
+    не указывать - тогда используется значение, на котором закончился
+    предыдущий сегмент.
+
+    Поиск сегмента - bisect по смещениям начала, с кэшем последнего индекса:
+    при монотонно растущем t (обычный случай) это O(1) на вызов.
+    """
+
+    SEGMENT_TYPES = ('ramp', 'step', 'hold', 'sine', 'sawtooth', 'replay')
+
+    def __init__(self, segments: list[ProfileSegment]):
+        if not segments:
+            raise ValueError("Load profile requires at least one segment")
+
+        self.segments = segments
+        self._offsets: list[float] = []
+
+        offset = 0.0
+        for segment in segments:
+            self._offsets.append(offset)
+            offset += segment.duration
+        self.duration = offset
+
+        self._cached_index = 0
+
+    @classmethod
+    def from_dicts(cls, segments: list[dict[str, Any]], base_dir: str | Path | None = None) -> "LoadProfile":
+        """
+        Построить профиль из описания сегментов (секция segments в YAML)
+
+        Args:
+            segments: Список словарей с ключом type и параметрами сегмента
+            base_dir: Каталог для относительных путей replay-файлов
+
+        Returns:
+            LoadProfile
+
+        Raises:
+            ValueError: Если сегмент описан неверно
+        """
+        parsed = []
+        previous = 0.0
+        for i, data in enumerate(segments):
+            try:
+                segment = cls._parse_segment(data, previous, base_dir)
+            except (KeyError, TypeError, ValueError) as e:
+                raise ValueError(f"Invalid profile segment #{i + 1} ({data.get('type')}): {e}") from e
+            parsed.append(segment)
+            previous = segment.value_at(segment.duration)
+        return cls(parsed)
+
+    @classmethod
+    def _parse_segment(cls, data: dict[str, Any], previous: float, base_dir: str | Path | None) -> ProfileSegment:
+        kind = data['type']
+        if kind not in cls.SEGMENT_TYPES:
+            raise ValueError(f"unknown type, supported: {', '.join(cls.SEGMENT_TYPES)}")
+
+        match kind:
+            case 'ramp':
+                segment = ProfileSegment(
+                    kind=kind,
+                    duration=float(data['duration']),
+                    start=float(data.get('from', previous)),
+                    end=float(data['to']),
+                )
+            case 'hold':
+                segment = ProfileSegment(
+                    kind=kind,
+                    duration=float(data['duration']),
+                    start=float(data.get('value', previous)),
+                )
+            case 'step':
+                if 'values' in data:
+                    values = tuple(float(v) for v in data['values'])
+                else:
+                    start, end, steps = float(data['from']), float(data['to']), int(data['steps'])
+                    if steps < 2:
+                        raise ValueError("'steps' must be >= 2")
+                    values = tuple(start + (end - start) * i / (steps - 1) for i in range(steps))
+                if not values:
+                    raise ValueError("'values' must not be empty")
+                step_duration = float(data['step_duration'])
+                segment = ProfileSegment(
+                    kind=kind,
+                    duration=step_duration * len(values),
+                    step_duration=step_duration,
+                    values=values,
+                )
+            case 'sine':
+                segment = ProfileSegment(
+                    kind=kind,
+                    duration=float(data['duration']),
+                    start=float(data.get('base', previous)),
+                    amplitude=float(data['amplitude']),
+                    period=float(data['period']),
+                    phase=float(data.get('phase', 0.0)),
+                )
+            case 'sawtooth':
+                segment = ProfileSegment(
+                    kind=kind,
+                    duration=float(data['duration']),
+                    start=float(data.get('min', previous)),
+                    end=float(data['max']),
+                    period=float(data['period']),
+                )
+            case _:  # replay
+                times, values = cls._read_replay(data, base_dir)
+                segment = ProfileSegment(
+                    kind=kind,
+                    duration=float(data.get('duration', times[-1])),
+                    times=times,
+                    values=values,
+                    interpolate=bool(data.get('interpolate', True)),
+                )
+
+        if segment.duration <= 0:
+            raise ValueError("'duration' must be positive")
+        if kind in ('sine', 'sawtooth') and segment.period <= 0:
+            raise ValueError("'period' must be positive")
+        return segment
+
+    @staticmethod
+    def _read_replay(data: dict[str, Any], base_dir: str | Path | None) -> tuple[tuple[float, ...], tuple[float, ...]]:
+        """
+        Прочитать кривую нагрузки из CSV
+
+        Колонки задаются time_column (секунды, по умолчанию 'time') и
+        value_column (по умолчанию 'value'). Время нормируется к первой строке,
+        значения умножаются на scale.
+        """
+        path = Path(data['file'])
+        if base_dir is not None and not path.is_absolute():
+            path = Path(base_dir) / path
+        if not path.exists():
+            raise ValueError(f"replay file not found: {path}")
+
+        time_column = data.get('time_column', 'time')
+        value_column = data.get('value_column', 'value')
+        scale = float(data.get('scale', 1.0))
+
+        points = []
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            for row in csv.DictReader(f):
+                points.append((float(row[time_column]), float(row[value_column]) * scale))
+
+        if not points:
+            raise ValueError(f"replay file is empty: {path}")
+
+        points.sort()
+        t0 = points[0][0]
+        times = tuple(t - t0 for t, _ in points)
+        values = tuple(v for _, v in points)
+        return times, values
+
+    def value_at(self, t: float) -> float | None:
+        """
+        Плановое значение через t секунд от начала профиля
+
+        Args:
+            t: Смещение от начала профиля
+
+        Returns:
+            Значение нагрузки или None, если профиль закончился
+        """
+        if t < 0:
+            t = 0.0
+        if t >= self.duration:
+            return None
+
+        i = self._cached_index
+        if not (self._offsets[i] <= t and (i + 1 == len(self._offsets) or t < self._offsets[i + 1])):
+            i = bisect.bisect_right(self._offsets, t) - 1
+            self._cached_index = i
+
+        return self.segments[i].value_at(t - self._offsets[i])
+
+
+class Profile(IStrategy):
+    """
+    Стратегия с декларативным профилем нагрузки
+
+    Нагрузка задаётся таймлайном сегментов в YAML (ramp, step, hold, sine,
+    sawtooth, replay из CSV) вместо отдельного Python-класса под каждую форму.
+
+    Плановое значение интерполируется и отдаётся оркестратору через
+    get_setpoint() с шагом resolution (можно меньше секунды). Избыточные
+    configure() схлопываются: новое значение применяется, только если оно
+    отличается от последнего применённого хотя бы на min_change.
+
+    Значения профиля - пользователи или, при load_model: open, запросы
+    в секунду (arrival rate).
+
+    Тест заканчивается, когда закончился таймлайн.
+    """
+
+    def __init__(
+        self,
+        segments: list[dict[str, Any]],
+        resolution: float = 0.5,
+        min_change: int = 1,
+        base_dir: str | None = None,
+    ):
+        """
+        Args:
+            segments: Сегменты профиля (см. LoadProfile.from_dicts)
+            resolution: Шаг обновления плановой нагрузки (секунд)
+            min_change: Минимальное изменение для нового configure()
+            base_dir: Каталог для относительных путей replay-файлов
+        """
+        if resolution <= 0:
+            raise ValueError("'resolution' must be positive")
+
+        self.profile = LoadProfile.from_dicts(segments, base_dir=base_dir)
+        self.resolution = resolution
+        self.min_change = max(1, min_change)
+
+        self._started_at: float | None = None
+        self._last_setpoint: int | None = None
+        self._finished = False
+
+    def _setpoint_at(self, elapsed: float) -> int | None:
+        value = self.profile.value_at(elapsed)
+        if value is None:
+            return None
+        return max(0, round(value))
+
+    def get_setpoint(self, now: float) -> int | None:
+        """
+        Плановая нагрузка на момент now
+
+        Таймлайн стартует с первого вызова (после стабилизации генератора).
+        Возвращает None, если изменение меньше min_change или профиль закончился.
+        """
+        if self._started_at is None:
+            self._started_at = now
+
+        setpoint = self._setpoint_at(now - self._started_at)
+        if setpoint is None:
+            self._finished = True
+            return None
+
+        if self._last_setpoint is not None and abs(setpoint - self._last_setpoint) < self.min_change:
+            return None
+
+        self._last_setpoint = setpoint
+        return setpoint
+
+    def get_tick_interval(self) -> float:
+        return self.resolution
+
+    def get_schedule(self) -> tuple[list[tuple[float, int]], float]:
+        """Профиль, дискретизированный с шагом resolution (с учётом min_change)"""
+        points = []
+        last = None
+        steps = math.ceil(self.profile.duration / self.resolution)
+        for i in range(steps):
+            at = i * self.resolution
+            setpoint = self._setpoint_at(at)
+            if setpoint is None:
+                break
+            if last is None or abs(setpoint - last) >= self.min_change:
+                points.append((at, setpoint))
+                last = setpoint
+        return points, self.profile.duration
+
+    def decide(self, metrics: RawMetrics) -> Decision:
+        """STOP когда таймлайн закончился, иначе HOLD (нагрузкой управляет get_setpoint)"""
+        if self._finished:
+            print("🏁 Профиль нагрузки завершён")
+            return Decision.STOP
+        return Decision.HOLD
+
+    def get_next_users(self, current_users: int, metrics: RawMetrics) -> int:
+        """Плановая нагрузка текущего момента (в начале теста - значение профиля в t=0)"""
+        if self._started_at is None:
+            setpoint = self._setpoint_at(0.0)
+        else:
+            setpoint = self._setpoint_at(metrics.timestamp - self._started_at)
+
+        if setpoint is None:
+            return current_users
+
+        self._last_setpoint = setpoint
+        return setpoint
+
+    def get_wait_time(self) -> int:
+        return 1
+
+    def reset(self) -> None:
+        """Сбросить внутреннее состояние"""
+        self._started_at = None
+        self._last_setpoint = None
+        self._finished = False
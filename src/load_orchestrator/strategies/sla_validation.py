@@ -1,5 +1,6 @@
 from .base import IStrategy
-from ..models import RawMetrics, Decision
+from ..models import RawMetrics, Decision, WarmStart
+from ..slo import SLOEngine, parse_burn_windows, parse_objectives
 
 
 class SLAValidation(IStrategy):
@@ -14,27 +15,52 @@ class SLAValidation(IStrategy):
     - Останавливаться если:
       * Нарушили SLA
       * Или достигли max_users без нарушений
+
+    Вместо (или вместе с) глобальными порогами можно задать SLO по
+    эндпоинтам (slos): тест останавливается, когда бюджет ошибок какой-то
+    цели горит быстрее порога в обоих окнах пары (burn_windows), а в
+    report() - максимальная нагрузка, на которой выполнялись все SLO
+    (см. load_orchestrator.slo).
     """
 
     def __init__(
         self,
-        max_p99: float,  # в миллисекундах
-        max_error_rate: float,  # в процентах
+        max_p99: float | None = None,  # в миллисекундах
+        max_error_rate: float | None = None,  # в процентах
         initial_users: int = 10,
         step_multiplier: float = 1.5,
+        max_users: int | None = None,
+        slos: list[dict] | None = None,
+        burn_windows: list[dict] | None = None,
     ):
         """
         Args:
             max_p99: Максимально допустимый P99 (мс)
             max_error_rate: Максимально допустимый уровень ошибок (%)
-            max_users: Максимальное количество пользователей для проверки
             initial_users: Начальное количество пользователей
             step_multiplier: Множитель для увеличения нагрузки
+            max_users: Нагрузка, выдержав которую без нарушений, SLA считается
+                подтверждённым (None - наращивать до нарушения)
+            slos: Цели по эндпоинтам: [{endpoint, latency, percentile}, {endpoint, availability}]
+            burn_windows: Пары окон: [{long: 2m, short: 30s, max: 2}, ...]
+
+        Raises:
+            ValueError: Если не задан ни один критерий или SLO невалидны
         """
+        if max_p99 is None and max_error_rate is None and not slos:
+            raise ValueError("sla_validation requires 'max_p99', 'max_error_rate' or 'slos'")
         self.max_p99 = max_p99
         self.max_error_rate = max_error_rate
+        self.slo = None
+        if slos:
+            self.slo = SLOEngine(
+                parse_objectives(slos), parse_burn_windows(burn_windows), latency=self.latency
+            )
         self.initial_users = initial_users
+        self._cold_initial_users = initial_users  # Для отката с тёплого старта
         self.step_multiplier = step_multiplier
+        self.max_users = max_users
+        self._violated = False
 
     def decide(self, metrics: RawMetrics) -> Decision:
         """
@@ -43,16 +69,32 @@ class SLAValidation(IStrategy):
         Проверяет соответствие SLA:
         - P99 превышает лимит
         - Error rate превышает лимит
+        - Бюджет ошибок SLO горит быстрее порога
         - Достигнут max_users (успешная валидация)
         """
         # Проверка нарушения P99
-        if metrics.p99 > self.max_p99:
-            print(f"⚠️  SLA violation: P99={metrics.p99:.0f}ms > {self.max_p99}ms")
+        p99 = self.latency(metrics, 'p99')
+        if self.max_p99 is not None and p99 > self.max_p99:
+            print(f"⚠️  SLA violation: P99={p99:.0f}ms > {self.max_p99}ms")
+            self._violated = True
             return Decision.STOP
 
         # Проверка нарушения error rate
-        if metrics.error_rate > self.max_error_rate:
+        if self.max_error_rate is not None and metrics.error_rate > self.max_error_rate:
             print(f"⚠️  SLA violation: error_rate={metrics.error_rate:.2f}% > {self.max_error_rate}%")
+            self._violated = True
+            return Decision.STOP
+
+        # Проверка скорости сжигания бюджета SLO
+        if self.slo is not None:
+            breach = self.slo.update(metrics)
+            if breach is not None:
+                print(f"⚠️  SLO violation: {breach.describe()}")
+                self._violated = True
+                return Decision.STOP
+
+        # max_users выдержан без нарушений (сэмплы рампы не в счёт)
+        if self.max_users is not None and metrics.users >= self.max_users and not metrics.ramping:
             return Decision.STOP
 
         return Decision.CONTINUE
@@ -64,11 +106,44 @@ class SLAValidation(IStrategy):
         Не превышать max_users
         """
         if current_users == 0:
-            return self.initial_users
-
-        next_users = int(current_users * self.step_multiplier)
+            next_users = self.initial_users
+        else:
+            next_users = int(current_users * self.step_multiplier)
+        if self.max_users is not None:
+            next_users = min(next_users, self.max_users)
         return next_users
 
+    def handoff(self, current_users: int, metrics: RawMetrics) -> None:
+        """Продолжить рампу с нагрузки предыдущей стадии"""
+        if current_users > 0:
+            self.initial_users = current_users
+
+    def warm_start(self, seed: WarmStart) -> bool:
+        """Начать рост нагрузки с seed.start_users"""
+        self.initial_users = seed.start_users
+        return True
+
+    def cold_start(self) -> None:
+        """Вернуть initial_users из конфига"""
+        self.initial_users = self._cold_initial_users
+        self.reset()
+
+    def needs_interval_percentiles(self) -> bool:
+        """Цели по латентности оцениваются по перцентилям интервала (см. slo)"""
+        return self.slo is not None and any(o.kind == 'latency' for o in self.slo.objectives)
+
+    def passed(self) -> bool:
+        """Проверка провалена, если STOP вызван нарушением SLA или SLO"""
+        return not self._violated
+
+    def report(self) -> dict | None:
+        """SLO по ступеням и максимальная нагрузка, на которой они выполнялись"""
+        if self.slo is None:
+            return None
+        return {'slo': self.slo.report()}
+
     def reset(self) -> None:
-        """TODO: Сбросить внутреннее состояние"""
-        pass
\ No newline at end of file
+        """Сбросить окна и ступени SLO"""
+        self._violated = False
+        if self.slo is not None:
+            self.slo.reset()
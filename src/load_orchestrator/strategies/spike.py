@@ -1,4 +1,5 @@
 from .base import IStrategy
+from ..analytics.spike import SpikeRecovery
 from ..models import RawMetrics, Decision, SpikePhase, SpikeConfig
 
 
@@ -6,26 +7,33 @@ class Spike(IStrategy):
     """
     Стратегия резкого скачка нагрузки (Spike Test)
 
-    TODO: Реализовать логику:
-    - Резко увеличить нагрузку до spike_users
-    - Держать нагрузку spike_duration секунд
-    - Проверить:
-      * Выдержала ли система скачок
-      * Как быстро восстановилась
-    - Опционально: вернуться к baseline и проверить восстановление
+    Фазы: baseline -> spike -> recovery, цикл spike -> recovery
+    повторяется config.spikes раз. По каждому спайку считается время до
+    деградации, выброс p95 и ошибок и время восстановления относительно
+    базовой линии (см. analytics.spike), итог - в report().
+
+    get_burst_interval() включает частый сбор метрик у переходов фаз,
+    чтобы времена деградации и восстановления были точнее секунды.
     """
 
     def __init__(
         self,
         config: SpikeConfig,
     ):
+        if config.spikes < 1:
+            raise ValueError("'spikes' must be at least 1")
         self.config = config
         self._phase: SpikePhase = SpikePhase.BASELINE # baseline -> spike -> recovery
         self.phase_start_time = None
+        self._spikes_done = 0
 
         self.baseline_metrics: RawMetrics | None = None
-        self.spike_metrics: list[RawMetrics] = []
-        self.recovery_metrics: list[RawMetrics] = []
+        self.analysis = SpikeRecovery(
+            tolerance=config.recovery_tolerance,
+            error_tolerance=config.error_tolerance,
+            hold=config.recovery_hold,
+            latency=self.latency,
+        )
 
     def decide(self, metrics: RawMetrics, ) -> Decision:
 
@@ -37,6 +45,9 @@ class Spike(IStrategy):
 
         elapsed = now - self.phase_start_time
 
+        # Сэмпл относится к фазе, в которой снят (переход - после учёта)
+        self.analysis.observe(metrics)
+
         match self._phase:
             case SpikePhase.SPIKE:
                 return self._handle_spike(metrics, elapsed)
@@ -51,20 +62,17 @@ class Spike(IStrategy):
     def _handle_spike(self, metrics: RawMetrics, elapsed: float) -> Decision:
         """Фаза spike — держим пиковую нагрузку"""
 
-        self.spike_metrics.append(metrics)
-
         # Проверяем не сломалась ли система полностью
         if metrics.error_rate > 50:  # 50% ошибок — система мертва
-            self._phase = SpikePhase.RECOVERY
-            self.phase_start_time = metrics.timestamp  # Сброс времени для новой фазы
+            self._start_recovery(metrics.timestamp)
             return Decision.CONTINUE  # На самом деле уменьшим (см. get_next_users)
 
         if metrics.rps == 0:
+            self.analysis.finish()
             return Decision.STOP
 
         if elapsed >= self.config.spike_duration:
-            self._phase = SpikePhase.RECOVERY
-            self.phase_start_time = metrics.timestamp  # Сброс времени для новой фазы
+            self._start_recovery(metrics.timestamp)
             print("Сброс активности")
             return Decision.CONTINUE  # Сигнал на изменение (уменьшение)
 
@@ -73,15 +81,30 @@ class Spike(IStrategy):
     def _handle_recovery(self, metrics: RawMetrics, elapsed: float) -> Decision:
         """Фаза recovery — проверяем восстановление"""
 
-        self.recovery_metrics.append(metrics)
-
         if elapsed >= self.config.recovery_duration:
+            self._spikes_done += 1
+            if self._spikes_done < self.config.spikes:
+                self._start_spike(metrics.timestamp)
+                print(f"Резкий скачок ({self._spikes_done + 1}/{self.config.spikes})")
+                return Decision.CONTINUE
+
             self._phase = SpikePhase.FINISHED
+            self.analysis.finish()
             print("Тест закончен")
             return Decision.STOP
 
         return Decision.HOLD
 
+    def _start_spike(self, timestamp: float) -> None:
+        self._phase = SpikePhase.SPIKE
+        self.phase_start_time = timestamp  # Сброс времени для новой фазы
+        self.analysis.spike_started(timestamp)
+
+    def _start_recovery(self, timestamp: float) -> None:
+        self._phase = SpikePhase.RECOVERY
+        self.phase_start_time = timestamp  # Сброс времени для новой фазы
+        self.analysis.recovery_started(timestamp)
+
     def _handle_baseline(self, metrics: RawMetrics, elapsed: float) -> Decision:
         """Фаза baseline — держим начальную нагрузку"""
 
@@ -90,8 +113,7 @@ class Spike(IStrategy):
             self.baseline_metrics = metrics
 
             # Переходим к спайку
-            self._phase = SpikePhase.SPIKE
-            self.phase_start_time = metrics.timestamp  # Сброс времени для новой фазы
+            self._start_spike(metrics.timestamp)
             print("Резкий скачок")
             return Decision.CONTINUE  # Сигнал на резкое увеличение
 
@@ -106,6 +128,20 @@ class Spike(IStrategy):
         else:  # recovery
             return self.config.recovery_users
 
+    def get_schedule(self) -> tuple[list[tuple[float, int]], float]:
+        """Фазы baseline -> (spike -> recovery) x spikes по их длительностям"""
+        config = self.config
+        points = [(0.0, config.baseline_users)]
+        offset = config.baseline_duration
+        for _ in range(config.spikes):
+            points.append((offset, config.spike_users))
+            points.append((offset + config.spike_duration, config.recovery_users))
+            offset += config.spike_duration + config.recovery_duration
+        return points, offset
+
+    def get_burst_interval(self) -> float | None:
+        return self.config.burst_interval
+
     def get_wait_time(self) -> int:
         """
         Spike проверяет метрики часто для отслеживания фаз
@@ -115,7 +151,13 @@ class Spike(IStrategy):
         """
         return 1
 
+    def report(self) -> dict | None:
+        """Деградация и восстановление по каждому спайку (см. analytics.spike)"""
+        return {'spike': self.analysis.report()}
+
     def reset(self) -> None:
-        """TODO: Сбросить внутреннее состояние"""
-        self._phase = SpikePhase.SPIKE
-        self._spike_steps = 0
\ No newline at end of file
+        self._phase = SpikePhase.BASELINE
+        self.phase_start_time = None
+        self._spikes_done = 0
+        self.baseline_metrics = None
+        self.analysis.reset()
\ No newline at end of file
@@ -1,4 +1,3 @@
-import time
 from .base import IStrategy
 from ..models import RawMetrics, Decision
 
@@ -55,13 +54,13 @@ class TargetRPS(IStrategy):
             # Целевой RPS достигнут
             if not self._target_reached:
                 # Первый раз достигли цели - запускаем таймер
-                self._start_time = time.time()
+                self._start_time = self.clock.time()
                 self._target_reached = True
                 print(f"✅ Целевой RPS достигнут: {current_rps:.1f} (цель: {self.target_rps:.1f})")
                 print(f"⏱️  Держим нагрузку {self.test_duration} секунд...")
 
             # Проверяем не истекло ли время
-            elapsed = time.time() - self._start_time
+            elapsed = self.clock.time() - self._start_time
             if elapsed >= self.test_duration:
                 print(f"🏁 Тест завершен: {elapsed:.0f} секунд")
                 return Decision.STOP
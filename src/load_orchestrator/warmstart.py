@@ -0,0 +1,108 @@
+"""
+Тёплый старт из прошлого прогона
+
+Регрессионный прогон того же конфига против почти той же сборки не
+обязан заново копить базовую линию и подниматься с initial_users.
+С orchestrator.warm_start оркестратор берёт последний сохранённый прогон
+(см. store) и строит WarmStart:
+- start_users = warm_start_fraction * максимальная стабильная нагрузка;
+- baseline - последние доверенные сэмплы прошлого прогона на нагрузке не
+  выше start_users;
+- ожидаемые p95 и error rate на этой нагрузке.
+
+Стратегия, которая умеет тёплый старт (IStrategy.warm_start), начинает с
+start_users и засеянной базовой линией. Первые verify_samples сэмплов
+идут в WarmStartVerifier, а не в стратегию: если p95 или error rate
+заметно отличаются от прошлого прогона, засев считается невалидным и
+тест откатывается на холодный старт.
+"""
+
+import statistics
+
+from .models import RawMetrics, StopReason, TestResult, WarmStart
+
+# Прогоны, которые не годятся как источник тёплого старта
+UNUSABLE_STOP_REASONS = (StopReason.ERROR, StopReason.MANUAL, StopReason.GENERATOR_SATURATED)
+
+BASELINE_SAMPLES = 15
+
+
+def _trusted(history: list[RawMetrics]) -> list[RawMetrics]:
+    return [m for m in history if not m.generator_saturated and not m.ramping and m.users > 0]
+
+
+def build_warm_start(run_id: str, result: TestResult, fraction: float = 0.8) -> WarmStart | None:
+    """
+    Построить тёплый старт по прошлому прогону
+
+    Args:
+        run_id: Идентификатор прошлого прогона
+        result: Его результат
+        fraction: Доля максимальной стабильной нагрузки для старта
+
+    Returns:
+        WarmStart или None, если в прогоне нет пригодных сэмплов
+    """
+    trusted = _trusted(result.history)
+    start_users = int(result.max_stable_users * fraction)
+    below = [m for m in trusted if m.users <= start_users]
+    if start_users < 1 or not below:
+        return None
+
+    # Ожидание на старте - по сэмплам ближайшей к start_users нагрузки
+    nearest = max(m.users for m in below)
+    reference = [m for m in below if m.users == nearest]
+
+    return WarmStart(
+        source=run_id,
+        start_users=start_users,
+        baseline=below[-BASELINE_SAMPLES:],
+        expected_p95=statistics.median(m.p95 for m in reference),
+        expected_error_rate=statistics.median(m.error_rate for m in reference),
+    )
+
+
+class WarmStartVerifier:
+    """Проверка засева по первым сэмплам на стартовой нагрузке"""
+
+    def __init__(self, seed: WarmStart, samples: int = 3, tolerance: float = 1.5, error_margin: float = 1.0):
+        """
+        Args:
+            seed: Тёплый старт
+            samples: Сколько сэмплов собрать для проверки
+            tolerance: Во сколько раз p95 может отличаться от ожидаемого (в обе стороны)
+            error_margin: На сколько процентных пунктов error rate может превысить ожидаемый
+        """
+        self.seed = seed
+        self.samples = samples
+        self.tolerance = tolerance
+        self.error_margin = error_margin
+        self._p95: list[float] = []
+        self._errors: list[float] = []
+
+    def observe(self, metrics: RawMetrics) -> bool | None:
+        """
+        Учесть сэмпл
+
+        Returns:
+            None пока сэмплов мало, True если засев подтверждён, False если нет
+        """
+        self._p95.append(metrics.p95)
+        self._errors.append(metrics.error_rate)
+        if len(self._p95) < self.samples:
+            return None
+
+        p95 = statistics.median(self._p95)
+        error_rate = statistics.median(self._errors)
+        expected = self.seed.expected_p95
+
+        if expected > 0 and not expected / self.tolerance <= p95 <= expected * self.tolerance:
+            print(f"⚠️  Warm start rejected: p95={p95:.0f}ms, previous run {expected:.0f}ms")
+            return False
+        if error_rate > self.seed.expected_error_rate + self.error_margin:
+            print(
+                f"⚠️  Warm start rejected: error_rate={error_rate:.2f}%, "
+                f"previous run {self.seed.expected_error_rate:.2f}%"
+            )
+            return False
+        return True
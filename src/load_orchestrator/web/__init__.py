@@ -0,0 +1,39 @@
+"""
+Живые метрики прогона (опционально, extra web)
+
+LiveFeed не требует дополнительных зависимостей; сервер (start_server)
+требует pip install load-orchestrator[web].
+"""
+
+from .feed import LiveFeed
+
+
+def start_server(feed: LiveFeed, host: str = "127.0.0.1", port: int = 8765):
+    """
+    Запустить веб-сервер живых метрик в фоновом потоке
+
+    Args:
+        feed: Лента, подключённая к оркестратору как хук
+        host: Адрес для прослушивания
+        port: Порт
+
+    Returns:
+        Запущенный LiveServer
+
+    Raises:
+        ImportError: Если не установлен extra web
+    """
+    try:
+        from .server import LiveServer
+    except ImportError as e:
+        raise ImportError(
+            "Live metrics server requires the 'web' extra: pip install load-orchestrator[web]"
+        ) from e
+
+    return LiveServer(feed, host=host, port=port).start()
+
+
+__all__ = [
+    'LiveFeed',
+    'start_server',
+]
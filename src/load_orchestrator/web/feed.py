@@ -0,0 +1,133 @@
+"""
+Живая лента текущего прогона для веб-сервера
+
+LiveFeed - хук оркестратора (OrchestratorHook). Главный цикл только
+отдаёт ему сэмплы и решения: хук запоминает ссылку на сэмпл, обновляет
+счётчики и, если есть подписчики, передаёт объект в event loop сервера
+(call_soon_threadsafe). Сериализация и раздача - только там:
+- каждое событие кодируется в JSON ровно один раз и раздаётся всем
+  подписчикам (websocket-клиентам) одной и той же строкой;
+- сэмплы дельта-кодируются: в сообщении только изменившиеся поля;
+- у каждого клиента своя ограниченная очередь. Медленный клиент не
+  тормозит остальных: при переполнении его очередь очищается и он
+  получает полный снимок состояния (resync).
+
+Формат сообщений:
+    {"type": "snapshot", "seq": 10, "sample": {...все поля...}, "users": 50}
+    {"type": "sample", "seq": 11, "delta": {"timestamp": ..., "rps": 120.5}}
+    {"type": "decision", "seq": 12, "decision": "CONTINUE", "users": 75}
+Клиент применяет delta к последнему состоянию; пропуск seq означает,
+что нужно дождаться следующего snapshot. Сообщения с seq не больше seq
+последнего snapshot клиент пропускает (они уже учтены в снимке).
+"""
+
+import asyncio
+import json
+from dataclasses import asdict
+from typing import Any
+
+from ..instrumentation import OrchestratorHook, TimingStats
+from ..models import RawMetrics, Decision
+
+DEFAULT_CLIENT_QUEUE = 256
+
+
+class LiveFeed(OrchestratorHook):
+    """Хук, который хранит текущее состояние прогона и раздаёт события подписчикам"""
+
+    def __init__(self, client_queue_size: int = DEFAULT_CLIENT_QUEUE):
+        self.client_queue_size = client_queue_size
+
+        self.seq = 0
+        self.users = 0
+        self.decisions: dict[str, int] = {}
+        self.timings: dict[str, TimingStats] = {}
+
+        self._metrics: RawMetrics | None = None  # Последний сэмпл (пишет главный цикл)
+        self._sent: dict[str, Any] | None = None  # Состояние, известное подписчикам (event loop)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._subscribers: set[asyncio.Queue] = set()
+
+    @property
+    def sample(self) -> dict[str, Any] | None:
+        """Последний сэмпл как словарь (кодируется по запросу, не в главном цикле)"""
+        metrics = self._metrics
+        return asdict(metrics) if metrics is not None else None
+
+    # --- Хук оркестратора (поток главного цикла): только ссылки и счётчики ---
+
+    def on_sample(self, metrics: RawMetrics) -> None:
+        self._metrics = metrics
+        loop = self._loop
+        if loop is None or not self._subscribers:
+            return
+        loop.call_soon_threadsafe(self._publish_sample, metrics)
+
+    def on_decision(self, decision: Decision, users: int) -> None:
+        self.users = users
+        self.decisions[decision.name] = self.decisions.get(decision.name, 0) + 1
+        loop = self._loop
+        if loop is None or not self._subscribers:
+            return
+        loop.call_soon_threadsafe(self._publish_decision, decision, users)
+
+    def on_timing(self, name: str, seconds: float) -> None:
+        stats = self.timings.get(name)
+        if stats is None:
+            stats = self.timings[name] = TimingStats()
+        stats.record(seconds)
+
+    # --- Подписчики (event loop сервера) ---
+
+    def attach_loop(self, loop: asyncio.AbstractEventLoop | None) -> None:
+        """Привязать event loop сервера (None - отвязать); без него события только обновляют состояние"""
+        self._loop = loop
+
+    def snapshot(self) -> str:
+        """Полное состояние, известное подписчикам, в формате сообщения snapshot"""
+        return json.dumps({'type': 'snapshot', 'seq': self.seq, 'sample': self._sent, 'users': self.users})
+
+    def subscribe(self) -> asyncio.Queue:
+        """Новая очередь подписчика; первым сообщением в ней лежит snapshot"""
+        if not self._subscribers:
+            # Без подписчиков сэмплы не публиковались - снимок с последнего сэмпла
+            self._sent = self.sample
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.client_queue_size)
+        queue.put_nowait(self.snapshot())
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        self._subscribers.discard(queue)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def _publish_sample(self, metrics: RawMetrics) -> None:
+        sample = asdict(metrics)
+        previous = self._sent
+        if previous is None:
+            delta = sample
+        else:
+            delta = {k: v for k, v in sample.items() if previous.get(k) != v}
+        self._sent = sample
+
+        self.seq += 1
+        self._fanout(json.dumps({'type': 'sample', 'seq': self.seq, 'delta': delta}))
+
+    def _publish_decision(self, decision: Decision, users: int) -> None:
+        self.seq += 1
+        self._fanout(json.dumps({
+            'type': 'decision', 'seq': self.seq, 'decision': decision.name, 'users': users,
+        }))
+
+    def _fanout(self, message: str) -> None:
+        for queue in self._subscribers:
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                # Клиент не успевает: выбрасываем накопленное и отдаём свежий снимок
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(self.snapshot())
@@ -0,0 +1,90 @@
+"""
+Экспозиция текущего прогона в текстовом формате Prometheus / OpenMetrics
+"""
+
+from .feed import LiveFeed
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+PREFIX = "load_orchestrator"
+
+# Поле RawMetrics -> (имя метрики, описание)
+SAMPLE_GAUGES = {
+    'users': ('users', 'Current number of users reported by the generator'),
+    'rps': ('rps', 'Achieved requests per second'),
+    'offered_rps': ('offered_rps', 'Offered requests per second (open model)'),
+    'rt_avg': ('response_time_avg_ms', 'Average response time in milliseconds'),
+    'p50': ('response_time_p50_ms', 'Median response time in milliseconds'),
+    'p95': ('response_time_p95_ms', '95th percentile response time in milliseconds'),
+    'p99': ('response_time_p99_ms', '99th percentile response time in milliseconds'),
+    'p95_corrected': ('response_time_p95_corrected_ms', '95th percentile corrected for coordinated omission'),
+    'p99_corrected': ('response_time_p99_corrected_ms', '99th percentile corrected for coordinated omission'),
+    'error_rate': ('error_rate_percent', 'Failed requests in percent'),
+    'total_requests': ('requests', 'Total requests reported by the generator'),
+    'failed_requests': ('failed_requests', 'Total failed requests reported by the generator'),
+    'generator_cpu': ('generator_cpu_percent', 'CPU of the busiest load generator process, percent of one core'),
+    'generator_saturated': ('generator_saturated', '1 if the load generator itself is saturated'),
+    'sampling_interval': ('sampling_interval_seconds', 'Seconds since the previous sample (effective monitoring rate)'),
+}
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def render(feed: LiveFeed, openmetrics: bool = False) -> str:
+    """
+    Отрендерить состояние прогона
+
+    Args:
+        feed: Живая лента с текущим состоянием
+        openmetrics: OpenMetrics (с # EOF) вместо Prometheus 0.0.4
+
+    Returns:
+        Текст экспозиции
+    """
+    lines = []
+
+    sample = feed.sample or {}
+    for field, (name, help_text) in SAMPLE_GAUGES.items():
+        value = sample.get(field)
+        if value is None:
+            continue
+        lines.append(f"# HELP {PREFIX}_{name} {help_text}")
+        lines.append(f"# TYPE {PREFIX}_{name} gauge")
+        lines.append(f"{PREFIX}_{name} {float(value)}")
+
+    server = sample.get('server') or {}
+    if server:
+        lines.append(f"# HELP {PREFIX}_server System under test metrics from collectors")
+        lines.append(f"# TYPE {PREFIX}_server gauge")
+        for key, value in sorted(server.items()):
+            lines.append(f'{PREFIX}_server{{metric="{_escape(key)}"}} {float(value)}')
+
+    lines.append(f"# HELP {PREFIX}_target_load Load requested by the strategy")
+    lines.append(f"# TYPE {PREFIX}_target_load gauge")
+    lines.append(f"{PREFIX}_target_load {float(feed.users)}")
+
+    # В OpenMetrics семейство счётчика называется без суффикса _total
+    family = f"{PREFIX}_decisions" if openmetrics else f"{PREFIX}_decisions_total"
+    lines.append(f"# HELP {family} Strategy decisions")
+    lines.append(f"# TYPE {family} counter")
+    for decision, count in sorted(feed.decisions.items()):
+        lines.append(f'{PREFIX}_decisions_total{{decision="{_escape(decision)}"}} {count}')
+
+    if feed.timings:
+        lines.append(f"# HELP {PREFIX}_loop_seconds Orchestrator control loop timings")
+        lines.append(f"# TYPE {PREFIX}_loop_seconds summary")
+        for name, stats in sorted(feed.timings.items()):
+            label = f'name="{_escape(name)}"'
+            lines.append(f"{PREFIX}_loop_seconds_count{{{label}}} {stats.count}")
+            lines.append(f"{PREFIX}_loop_seconds_sum{{{label}}} {stats.total}")
+
+    lines.append(f"# HELP {PREFIX}_viewers Connected websocket viewers")
+    lines.append(f"# TYPE {PREFIX}_viewers gauge")
+    lines.append(f"{PREFIX}_viewers {feed.subscriber_count}")
+
+    if openmetrics:
+        lines.append("# EOF")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,89 @@
+"""
+Встроенный веб-сервер живых метрик (extra web: fastapi, uvicorn, websockets)
+
+Эндпоинты:
+    GET /metrics - состояние прогона в формате Prometheus/OpenMetrics
+                   (OpenMetrics, если клиент принимает application/openmetrics-text)
+    WS  /ws      - поток дельта-кодированных сэмплов и решений (см. feed.LiveFeed)
+
+Сервер работает в отдельном потоке со своим event loop и не блокирует
+главный цикл оркестратора.
+"""
+
+import asyncio
+import threading
+from contextlib import asynccontextmanager
+
+import uvicorn
+from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import Response
+
+from .feed import LiveFeed
+from .metrics import render, OPENMETRICS_CONTENT_TYPE, PROMETHEUS_CONTENT_TYPE
+
+
+def create_app(feed: LiveFeed) -> FastAPI:
+    """
+    Создать FastAPI-приложение для ленты
+
+    Args:
+        feed: Живая лента (хук оркестратора)
+
+    Returns:
+        FastAPI-приложение
+    """
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        feed.attach_loop(asyncio.get_running_loop())
+        try:
+            yield
+        finally:
+            feed.attach_loop(None)  # События после остановки сервера не уходят в закрытый loop
+
+    app = FastAPI(title="Load Orchestrator live metrics", lifespan=lifespan)
+
+    @app.get("/metrics")
+    async def metrics(request: Request):
+        openmetrics = "application/openmetrics-text" in request.headers.get("accept", "")
+        return Response(
+            content=render(feed, openmetrics=openmetrics),
+            media_type=OPENMETRICS_CONTENT_TYPE if openmetrics else PROMETHEUS_CONTENT_TYPE,
+        )
+
+    @app.websocket("/ws")
+    async def stream(websocket: WebSocket):
+        await websocket.accept()
+        queue = feed.subscribe()
+        try:
+            while True:
+                await websocket.send_text(await queue.get())
+        except WebSocketDisconnect:
+            pass
+        finally:
+            feed.unsubscribe(queue)
+
+    return app
+
+
+class LiveServer:
+    """uvicorn в фоновом потоке"""
+
+    def __init__(self, feed: LiveFeed, host: str = "127.0.0.1", port: int = 8765):
+        self.feed = feed
+        self.host = host
+        self.port = port
+        self._server = uvicorn.Server(uvicorn.Config(
+            create_app(feed), host=host, port=port, log_level="warning",
+        ))
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> "LiveServer":
+        self._thread = threading.Thread(target=self._server.run, name="live-metrics", daemon=True)
+        self._thread.start()
+        print(f"📡 Live metrics: http://{self.host}:{self.port}/metrics, ws://{self.host}:{self.port}/ws")
+        return self
+
+    def stop(self) -> None:
+        self._server.should_exit = True
+        if self._thread is not None:
+            self._thread.join(timeout=5)
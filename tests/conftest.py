@@ -0,0 +1,98 @@
+"""Общие фикстуры: виртуальные часы и адаптер-симулятор"""
+
+import pytest
+
+from load_orchestrator.adapters.IAdapter import IAdapter
+from load_orchestrator.clock import VirtualClock
+from load_orchestrator.config import AdapterConfig, Config, OrchestratorConfig, StrategyConfig
+from load_orchestrator.factory import OrchestratorFactory
+from load_orchestrator.models import RawMetrics
+from load_orchestrator.orchestrator import Orchestrator
+
+
+class SimulatedAdapter(IAdapter):
+    """
+    Адаптер-симулятор: метрики - функция нагрузки, время - self.clock
+
+    До knee пользователей латентность постоянна, дальше растёт линейно;
+    накопительные счётчики растут на rps за каждую секунду виртуального времени.
+    """
+
+    def __init__(self, knee: int = 300, rps_per_user: float = 2.0, error_rate: float = 0.0):
+        super().__init__('simulated')
+        self.knee = knee
+        self.rps_per_user = rps_per_user
+        self.error_rate = error_rate
+        self.users = 0
+        self.configured: list[int] = []
+        self.launched = False
+        self.stopped = False
+        self.total_requests = 0.0
+        self._last_time: float | None = None
+
+    def launch(self):
+        self.launched = True
+
+    def is_ready(self):
+        return True
+
+    def configure(self, user_count: int = 0, spawn_rate: float = 0, **kwargs):
+        self.users = user_count
+        self.configured.append(user_count)
+
+    def stop(self):
+        self.stopped = True
+
+    def get_stats(self) -> RawMetrics:
+        now = self.clock.time()
+        rps = self.users * self.rps_per_user
+        if self._last_time is not None:
+            self.total_requests += rps * (now - self._last_time)
+        self._last_time = now
+
+        overload = max(0, self.users - self.knee)
+        total = int(self.total_requests)
+        failed = int(total * self.error_rate / 100)
+        return RawMetrics(
+            timestamp=now,
+            users=self.users,
+            rps=rps,
+            rt_avg=10,
+            p50=10 + overload,
+            p95=20 + overload * 2,
+            p99=30 + overload * 3,
+            failed_requests=failed,
+            error_rate=self.error_rate,
+            total_requests=total,
+        )
+
+
+@pytest.fixture
+def clock() -> VirtualClock:
+    return VirtualClock(start=1_700_000_000)
+
+
+@pytest.fixture
+def adapter() -> SimulatedAdapter:
+    return SimulatedAdapter()
+
+
+@pytest.fixture
+def run(adapter, clock):
+    """
+    Прогнать стратегию из конфига против симулятора на виртуальных часах
+
+    Returns:
+        run(strategy, params, **orchestrator) -> (Orchestrator, TestResult)
+    """
+    def run(strategy: str, params: dict, **orchestrator):
+        orchestrator.setdefault('bootstrap_resamples', 0)
+        config = Config(
+            AdapterConfig('locust', 'simulated'),
+            StrategyConfig(strategy, params),
+            OrchestratorConfig(**orchestrator),
+        )
+        instance = Orchestrator(config, adapter, OrchestratorFactory.create_strategy(config), clock=clock)
+        return instance, instance.run()
+
+    return run
@@ -0,0 +1,86 @@
+import random
+
+import pytest
+
+from load_orchestrator.analytics.bootstrap import BlockBootstrap, bootstrap_report, split_steps
+from load_orchestrator.models import RawMetrics
+
+
+def _metrics(users: int, rps: float, ramping: bool = False) -> RawMetrics:
+    return RawMetrics(
+        timestamp=0.0, users=users, rps=rps, rt_avg=10.0, p50=10.0, p95=20.0, p99=30.0,
+        failed_requests=0, error_rate=0.0, total_requests=0, ramping=ramping,
+    )
+
+
+def _history(seed: int = 1) -> list[RawMetrics]:
+    noise = random.Random(seed)
+    history = []
+    for users, rps in ((100, 200.0), (200, 390.0), (400, 500.0)):
+        history.append(_metrics(users, rps / 2, ramping=True))
+        history.extend(_metrics(users, rps + noise.gauss(0, rps * 0.05)) for _ in range(30))
+    return history
+
+
+def test_same_seed_gives_the_same_report():
+    history = _history()
+
+    assert bootstrap_report(history, resamples=200, seed=7) == bootstrap_report(history, resamples=200, seed=7)
+    assert bootstrap_report(history, resamples=200, seed=7) != bootstrap_report(history, resamples=200, seed=8)
+
+
+def test_replicates_are_reproducible_per_instance():
+    values = [float(v) for v in range(50)]
+
+    first = BlockBootstrap(resamples=100, seed=3).replicates(values)
+    second = BlockBootstrap(resamples=100, seed=3).replicates(values)
+
+    assert first == second
+    assert len(first) == 100
+
+
+def test_interval_brackets_the_estimate_and_narrows_with_confidence():
+    values = [100 + random.Random(i).gauss(0, 10) for i in range(64)]
+    estimate = sum(values) / len(values)
+
+    wide = BlockBootstrap(resamples=500, confidence=0.99, seed=0)
+    narrow = BlockBootstrap(resamples=500, confidence=0.5, seed=0)
+    wide_interval = wide.interval(estimate, wide.replicates(values))
+    narrow_interval = narrow.interval(estimate, narrow.replicates(values))
+
+    assert wide_interval.low < estimate < wide_interval.high
+    assert wide_interval.high - wide_interval.low > narrow_interval.high - narrow_interval.low
+
+
+def test_constant_series_has_a_degenerate_interval():
+    bootstrap = BlockBootstrap(resamples=50)
+    interval = bootstrap.interval(5.0, bootstrap.replicates([5.0] * 20))
+
+    assert (interval.low, interval.high) == pytest.approx((5.0, 5.0))
+
+
+def test_steps_skip_ramping_samples():
+    steps = split_steps(_history())
+
+    assert [(users, len(samples)) for users, samples in steps] == [(100, 30), (200, 30), (400, 30)]
+
+
+def test_capacity_is_the_best_step():
+    report = bootstrap_report(_history(), resamples=200)
+
+    assert [step['users'] for step in report['steps']] == [100, 200, 400]
+    capacity = report['capacity']
+    assert capacity['users'][0] == 400
+    low, high = capacity['rps'][1:]
+    assert low <= capacity['rps'][0] <= high
+    assert 450 < low and high < 550
+
+
+def test_no_steps_no_report():
+    assert bootstrap_report([_metrics(100, 50.0, ramping=True)]) is None
+
+
+@pytest.mark.parametrize("kwargs", [{'resamples': 0}, {'confidence': 1.0}])
+def test_invalid_parameters(kwargs):
+    with pytest.raises(ValueError):
+        BlockBootstrap(**kwargs)
@@ -0,0 +1,82 @@
+import threading
+
+from load_orchestrator.collectors.base import CollectorPool, ICollector
+
+
+class _Counter(ICollector):
+    """Сборщик, отдающий номер опроса; опрос может ждать события release"""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.polls = 0
+        self.release: threading.Event | None = None
+
+    def collect(self) -> dict[str, float]:
+        self.polls += 1
+        poll = self.polls
+        if self.release is not None:
+            self.release.wait(5)
+        return {'poll': poll}
+
+
+class _Failing(ICollector):
+    def collect(self) -> dict[str, float]:
+        raise ConnectionError("refused")
+
+
+def test_gather_merges_collectors_by_name():
+    pool = CollectorPool([_Counter('app'), _Counter('db')], timeout=1)
+    try:
+        pool.start()
+        assert pool.gather() == {'app.poll': 1, 'db.poll': 1}
+        pool.start()
+        assert pool.gather() == {'app.poll': 2, 'db.poll': 2}
+    finally:
+        pool.close()
+
+
+def test_late_poll_is_not_merged_into_next_sample():
+    slow = _Counter('slow')
+    slow.release = threading.Event()
+    pool = CollectorPool([slow], timeout=0.05)
+    try:
+        pool.start()
+        assert pool.gather() == {}  # Опрос 1 не успел
+
+        pool.start()  # Опрос 1 ещё идёт - новый не запускается
+        slow.release.set()
+        slow.release = None
+        # Опрос 1 закончился во время ожидания: отброшен, опрос 2 - для этого окна
+        pool.timeout = 1
+        assert pool.gather() == {'slow.poll': 2}
+        assert pool.late == {'slow': 1}
+    finally:
+        pool.close()
+
+
+def test_poll_finished_between_windows_is_dropped():
+    slow = _Counter('slow')
+    slow.release = threading.Event()
+    pool = CollectorPool([slow], timeout=0.05)
+    try:
+        pool.start()
+        assert pool.gather() == {}
+        slow.release.set()
+        slow.release = None
+        pool._pending['slow'][0].result(timeout=1)
+
+        pool.start()
+        pool.timeout = 1
+        assert pool.gather() == {'slow.poll': 2}
+        assert pool.late == {'slow': 1}
+    finally:
+        pool.close()
+
+
+def test_failing_collector_skips_sample():
+    pool = CollectorPool([_Failing('broken'), _Counter('app')], timeout=1)
+    try:
+        pool.start()
+        assert pool.gather() == {'app.poll': 1}
+    finally:
+        pool.close()
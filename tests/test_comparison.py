@@ -0,0 +1,102 @@
+import pytest
+
+from conftest import SimulatedAdapter
+from load_orchestrator.adapters.comparison import ComparisonAdapter, PairedSample
+from load_orchestrator.analytics.comparison import compare_report
+from load_orchestrator.config import AdapterConfig, Config, OrchestratorConfig, StrategyConfig
+from load_orchestrator.factory import OrchestratorFactory
+from load_orchestrator.orchestrator import Orchestrator
+
+
+def _pairs(b_p95: float, b_rps: float = 100.0, count: int = 20, load: int = 50) -> list[PairedSample]:
+    pairs = []
+    for i in range(count):
+        noise = (i % 5 - 2) * 0.5  # Общий для A и B фон
+        a = {'rps': 100.0 + noise, 'rt_avg': 10.0, 'p50': 10.0, 'p95': 20.0 + noise, 'p99': 30.0, 'error_rate': 0.0}
+        b = {**a, 'rps': b_rps + noise, 'p95': b_p95 + noise}
+        pairs.append(PairedSample(load, float(i), a, b))
+    return pairs
+
+
+def test_slower_candidate_is_worse():
+    report = compare_report(_pairs(b_p95=24.0), resamples=200)
+
+    p95 = report['metrics']['p95']
+    assert report['verdict'] == 'worse'
+    assert p95['verdict'] == 'worse' and p95['unit'] == '%'
+    assert p95['diff'][0] == pytest.approx(20.0)
+    assert p95['diff'][1] <= 20.0 <= p95['diff'][2]
+
+
+def test_faster_candidate_is_better_and_min_effect_hides_small_changes():
+    assert compare_report(_pairs(b_p95=20.0, b_rps=110.0), resamples=200)['verdict'] == 'better'
+    assert compare_report(_pairs(b_p95=20.0, b_rps=101.0), resamples=200, min_effect=5)['verdict'] == 'no difference'
+
+
+def test_identical_targets_show_no_difference():
+    report = compare_report(_pairs(b_p95=20.0), resamples=200)
+
+    assert report['verdict'] == 'no difference'
+    assert report['metrics']['error_rate']['unit'] == 'pp'
+
+
+def test_report_is_reproducible_and_split_by_steps():
+    pairs = _pairs(b_p95=22.0, count=10, load=50) + _pairs(b_p95=26.0, count=10, load=100)
+
+    report = compare_report(pairs, resamples=200)
+
+    assert report == compare_report(pairs, resamples=200)
+    assert [(step['load'], step['pairs']) for step in report['steps']] == [(50, 10), (100, 10)]
+    assert report['steps'][1]['metrics']['p95']['diff'][0] == pytest.approx(30.0)
+
+
+def test_single_pair_is_inconclusive():
+    assert compare_report(_pairs(b_p95=30.0, count=1))['verdict'] == 'inconclusive'
+    assert compare_report([]) is None
+
+
+def test_simultaneous_mode_shows_the_worst_target_to_the_strategy(clock):
+    adapter = ComparisonAdapter(SimulatedAdapter(knee=300), SimulatedAdapter(knee=100))
+    adapter.use_clock(clock)
+    adapter.configure(user_count=200, spawn_rate=10)
+
+    metrics = adapter.get_stats()
+
+    assert (metrics.users, metrics.p95) == (200, 20 + 100 * 2)
+    assert adapter.pairs[0].a['p95'] == 20 and adapter.pairs[0].b['p95'] == 220
+    assert adapter.a.configured == adapter.b.configured == [200]
+
+
+def test_interleaved_mode_alternates_abba_and_pairs_slices(clock):
+    a, b = SimulatedAdapter(), SimulatedAdapter()
+    adapter = ComparisonAdapter(a, b, mode='interleaved', slice_duration=5, settle_samples=1)
+    adapter.use_clock(clock)
+    adapter.configure(user_count=100, spawn_rate=10)
+
+    active = []
+    for _ in range(20):
+        clock.advance(1)
+        active.append(adapter.active)
+        adapter.get_stats()
+    adapter.stop()
+
+    assert ''.join(active[::5]) == 'abba'
+    assert a.configured == [100, 0, 100] and b.configured == [100, 0]
+    assert len(adapter.pairs) == 2  # AB и BA
+    assert all(pair.load == 100 for pair in adapter.pairs)
+
+
+def test_comparison_run_reports_a_verdict(clock):
+    config = Config(
+        AdapterConfig('locust', 'simulated'),
+        StrategyConfig('degradation_search', {'initial_users': 50}),
+        OrchestratorConfig(bootstrap_resamples=0),
+    )
+    adapter = ComparisonAdapter(SimulatedAdapter(knee=300), SimulatedAdapter(knee=100), labels=('main', 'pr'))
+    orchestrator = Orchestrator(config, adapter, OrchestratorFactory.create_strategy(config), clock=clock)
+
+    result = orchestrator.run()
+
+    assert result.comparison['labels'] == ['main', 'pr']
+    assert result.comparison['verdict'] == 'worse'
+    assert result.comparison['metrics']['p95']['verdict'] == 'worse'
@@ -0,0 +1,189 @@
+import threading
+
+import pytest
+
+from conftest import SimulatedAdapter
+from load_orchestrator.config import AdapterConfig, CompareConfig, Config, OrchestratorConfig, StrategyConfig
+from load_orchestrator.daemon import GeneratorPool, PortAllocator, scheduler
+from load_orchestrator.daemon.scheduler import job_cost
+from load_orchestrator.registry import ADAPTERS
+
+
+class RecyclableAdapter(SimulatedAdapter):
+    """Симулятор с параметрами адаптера из конфига, который можно переиспользовать"""
+
+    def __init__(self, test_file: str, host: str, port: int, master_port: int = 0, recyclable: bool = True):
+        super().__init__()
+        self.test_file = test_file
+        self.port = port
+        self.master_port = master_port
+        self.recyclable = recyclable
+        self.shut_down = False
+
+    def recycle(self):
+        return self.recyclable
+
+    def shutdown(self):
+        self.shut_down = True
+
+
+ADAPTERS.register('recyclable', RecyclableAdapter)
+
+
+def _config(strategy: str = 'degradation_search', **options) -> Config:
+    return Config(
+        AdapterConfig('recyclable', 'locustfile.py', options=options or None),
+        StrategyConfig(strategy, {}),
+        OrchestratorConfig(),
+    )
+
+
+@pytest.fixture
+def allocator():
+    return PortAllocator(39000, 39012)
+
+
+def test_ports_are_allocated_in_disjoint_blocks(allocator):
+    blocks = [allocator.allocate() for _ in range(4)]
+
+    assert blocks == [39000, 39003, 39006, 39009]
+    with pytest.raises(RuntimeError, match="No free ports"):
+        allocator.allocate()
+
+    allocator.release(39003)
+    assert allocator.allocate() == 39003
+    assert allocator.assign('locust', 39003) == {'port': 39003, 'master_port': 39004}
+
+
+def test_job_cost_counts_generator_processes():
+    assert job_cost(_config()) == 1
+    assert job_cost(_config(workers=3)) == 4
+
+    compare = _config(workers=1)
+    compare.compare = CompareConfig(b={'workers': 2})
+    assert job_cost(compare) == 2 + 3
+
+
+def test_pool_reuses_recycled_generators(allocator):
+    pool = GeneratorPool(allocator)
+
+    first = pool.acquire(_config())
+    port = first.adapter.port
+    pool.release(first)
+    second = pool.acquire(_config('spike'))  # Ключ - адаптер, а не стратегия
+    other = pool.acquire(_config(recyclable=True))  # Другие параметры - другой генератор
+
+    assert second is first and second.warm
+    assert other.adapter.port != port
+    assert pool.stats() == {'idle': 0, 'ports_in_use': 2, 'hits': 1, 'misses': 2}
+
+
+def test_pool_discards_generators_that_cannot_be_recycled(allocator):
+    pool = GeneratorPool(allocator)
+
+    pooled = pool.acquire(_config(recyclable=False))
+    pool.release(pooled)
+
+    assert pooled.adapter.shut_down
+    assert pool.stats()['idle'] == 0 and allocator.in_use == 0
+
+
+def test_pool_evicts_the_oldest_idle_generator(allocator):
+    pool = GeneratorPool(allocator, max_idle=1)
+    old, new = pool.acquire(_config()), pool.acquire(_config())
+
+    pool.release(old)
+    pool.release(new)
+
+    assert old.adapter.shut_down and not new.adapter.shut_down
+    assert pool.stats()['idle'] == 1
+
+
+def test_unpooled_tests_get_ports_and_release_them(allocator):
+    pool = GeneratorPool(allocator)
+    config = _config()
+    config.orchestrator.schedule = 'push'
+
+    adapter = pool.acquire(config)
+    assert adapter.port == 39000 and adapter.master_port == 0
+    pool.release(adapter)
+
+    assert adapter.shut_down and allocator.in_use == 0
+
+
+class GatedPool:
+    """Пул, который держит тест, пока его не отпустят"""
+
+    def __init__(self):
+        self.started: list[str] = []
+        self.gates: dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+        self.changed = threading.Condition(self._lock)
+
+    def acquire(self, config):
+        name = config.strategy.params['name']
+        with self.changed:
+            self.started.append(name)
+            self.gates[name] = threading.Event()
+            self.changed.notify_all()
+        self.gates[name].wait(5)
+        raise RuntimeError("released")  # Тест не запускаем: проверяется только очередь
+
+    def wait_started(self, count: int) -> list[str]:
+        with self.changed:
+            assert self.changed.wait_for(lambda: len(self.started) >= count, timeout=5)
+            return list(self.started)
+
+
+@pytest.fixture(autouse=True)
+def join_jobs():
+    """Дождаться потоков задач, чтобы их вывод не уходил в следующий тест"""
+    yield
+    for thread in threading.enumerate():
+        if thread.name.startswith('job-'):
+            thread.join(5)
+
+
+def _job(name: str, workers: int = 0) -> Config:
+    config = _config(workers=workers)
+    config.strategy.params = {'name': name}
+    return config
+
+
+def test_queue_runs_by_priority_within_capacity():
+    pool = GatedPool()
+    queue = scheduler.TestQueue(pool, capacity=2)
+
+    # Каждый тест занимает всю ёмкость - идут строго по одному
+    running = queue.submit(_job('running', workers=1))
+    low = queue.submit(_job('low', workers=1), priority=0)
+    high = queue.submit(_job('high', workers=1), priority=5)
+    assert pool.wait_started(1) == ['running']
+    assert queue.position(high.id) == 0 and queue.position(low.id) == 1
+
+    pool.gates['running'].set()
+    assert pool.wait_started(2) == ['running', 'high']
+    pool.gates['high'].set()
+    assert pool.wait_started(3) == ['running', 'high', 'low']
+    pool.gates['low'].set()
+    for job in (running, high, low):
+        assert job.done.wait(5)
+    assert {job.state for job in (running, high, low)} == {'failed'}
+    assert queue.stats() == {'capacity': 2, 'used': 0, 'running': 0, 'queued': 0}
+
+
+def test_big_job_is_not_overtaken_by_cheaper_ones():
+    pool = GatedPool()
+    queue = scheduler.TestQueue(pool, capacity=2)
+
+    queue.submit(_job('small'))
+    big = queue.submit(_job('big', workers=1), priority=5)
+    cheap = queue.submit(_job('cheap'))
+    assert pool.wait_started(1) == ['small']
+    assert queue.stats()['queued'] == 2  # cheap поместился бы, но ждёт big
+
+    assert queue.cancel(cheap.id) and cheap.state == 'cancelled'
+    pool.gates['small'].set()
+    assert pool.wait_started(2) == ['small', 'big']
+    pool.gates['big'].set()
+    assert big.done.wait(5)
@@ -0,0 +1,102 @@
+import pytest
+
+from load_orchestrator.analytics.failures import CumulativeFailures, SpaceSaving, normalize
+from load_orchestrator.config import AdapterConfig, Config, OrchestratorConfig, StrategyConfig
+from load_orchestrator.models import RawMetrics
+from load_orchestrator.orchestrator import Orchestrator
+from load_orchestrator.strategies.canary import Canary
+
+
+@pytest.mark.parametrize('message, signature', [
+    ("ConnectionError: http://10.0.0.5:8080/api/users/123?x=1 refused",
+     "ConnectionError: /api/users/<id> refused"),
+    ("HTTPSConnectionPool(host='10.1.2.3', port=443): Read timed out. (read timeout=30.5)",
+     "HTTPSConnectionPool(host='<ip>', port=<n>): Read timed out. (read timeout=<n>)"),
+    ("order 550e8400-e29b-41d4-a716-446655440000 not found", "order <uuid> not found"),
+    ("request took 1.5s", "request took <n>s"),
+    ("timeout after 250 ms", "timeout after <n> ms"),
+    ("HTTPError('404 Client Error: Not Found')", "HTTPError('404 Client Error: Not Found')"),
+    ("503 Service Unavailable", "503 Service Unavailable"),
+    ("unexpected status code: 502", "unexpected status code: 502"),
+    ("  many   spaces ", "many spaces"),
+    ("", "<empty>"),
+])
+def test_normalize(message, signature):
+    assert normalize(message) == signature
+
+
+def test_normalize_keeps_different_status_codes_apart():
+    assert normalize("404 Not Found for /a/1") != normalize("500 Server Error for /a/2")
+    assert normalize("timeout 200ms for order 123") == normalize("timeout 350ms for order 456")
+
+
+def test_space_saving_keeps_heavy_hitters():
+    sketch = SpaceSaving(capacity=3)
+    for i in range(100):
+        sketch.add('heavy')
+        sketch.add(f'rare-{i}')
+
+    item, count, error = sketch.top(1)[0]
+    assert item == 'heavy'
+    assert count - error <= 100 <= count
+    assert len(sketch.counts) == 3
+    assert sketch.total == 200
+
+
+def test_space_saving_evicts_minimum_and_inherits_its_count():
+    sketch = SpaceSaving(capacity=2)
+    sketch.add('a', 5)
+    sketch.add('b', 2)
+    sketch.add('c', 1)
+
+    assert sketch.top() == [('a', 5, 0), ('c', 3, 2)]
+
+
+def test_space_saving_rejects_empty_capacity():
+    with pytest.raises(ValueError):
+        SpaceSaving(capacity=0)
+
+
+def test_cumulative_failures_yield_interval_deltas():
+    failures = CumulativeFailures()
+    first = failures.update([("timeout after 1s", 3), ("timeout after 2s", 2)])
+    assert first.top() == [("timeout after <n>s", 5, 0)]
+
+    second = failures.update([("timeout after 1s", 4), ("timeout after 2s", 2), ("503 Service Unavailable", 1)])
+    assert dict((item, count) for item, count, _ in second.top()) == {
+        "timeout after <n>s": 1, "503 Service Unavailable": 1,
+    }
+
+    # Статистику генератора сбросили - накопленное считается заново
+    third = failures.update([("timeout after 1s", 2)])
+    assert third.top() == [("timeout after <n>s", 2, 0)]
+
+
+def _sample(total: int, failed: int, failures: dict[str, float]) -> RawMetrics:
+    # error_rate - накопленный fail_ratio, как у Locust REST
+    return RawMetrics(0.0, 10, 100.0, 10, 10, 20, 30, failed, failed / total * 100, total, failures=failures)
+
+
+def test_ignore_failures_subtracts_from_interval_rate(adapter, clock):
+    config = Config(
+        AdapterConfig('locust', 'simulated'),
+        StrategyConfig('canary', {}),
+        OrchestratorConfig(ignore_failures=['404 client error']),
+    )
+    orchestrator = Orchestrator(config, adapter, Canary(), clock=clock)
+    not_found = "404 Client Error: Not Found for url: /items/<id>"
+
+    first = _sample(1000, 10, {not_found: 1.0})
+    orchestrator._ignore_failures(first)
+    assert first.error_rate == pytest.approx(0.0)
+
+    # Интервал: 500 ошибок на 1000 запросов, из них 40% - 404, 10% - настоящие.
+    # Накопленный error_rate (25.5%) минус 40% скрыл бы настоящие ошибки.
+    burst = _sample(2000, 510, {not_found: 40.0, "timeout after <n>s": 10.0})
+    orchestrator._ignore_failures(burst)
+    assert burst.error_rate == pytest.approx(10.0)
+
+    # Интервал: 1% ошибок, половина - 404. Накопленные 17.3% оставили бы 404 в error_rate.
+    calm = _sample(3000, 520, {not_found: 0.5, "timeout after <n>s": 0.5})
+    orchestrator._ignore_failures(calm)
+    assert calm.error_rate == pytest.approx(0.5)
@@ -0,0 +1,89 @@
+import asyncio
+import json
+import threading
+
+from load_orchestrator.models import Decision, RawMetrics
+from load_orchestrator.web import feed as feed_module
+from load_orchestrator.web.feed import LiveFeed
+
+
+def _metrics(rps: float) -> RawMetrics:
+    return RawMetrics(1.0, 10, rps, 10, 10, 20, 30, 0, 0.0, 100)
+
+
+def test_without_subscribers_loop_thread_does_not_encode(monkeypatch):
+    feed = LiveFeed()
+    feed.attach_loop(asyncio.new_event_loop())
+    encoded = []
+    monkeypatch.setattr(feed_module, 'asdict', lambda m: encoded.append(m) or {})
+
+    feed.on_sample(_metrics(100))
+    feed.on_decision(Decision.CONTINUE, 20)
+
+    assert encoded == []
+    assert feed.seq == 0
+    assert feed.users == 20 and feed.decisions == {'CONTINUE': 1}
+
+
+def test_sample_property_reflects_latest_metrics():
+    feed = LiveFeed()
+    assert feed.sample is None
+
+    feed.on_sample(_metrics(100))
+    feed.on_sample(_metrics(150))
+
+    assert feed.sample['rps'] == 150
+
+
+def test_events_are_encoded_and_fanned_out_on_server_loop():
+    feed = LiveFeed()
+    feed.on_sample(_metrics(100))  # До подписчиков - только состояние
+
+    async def scenario():
+        feed.attach_loop(asyncio.get_running_loop())
+        queue = feed.subscribe()
+        encoder_threads = []
+        original = feed._publish_sample
+
+        def publish(metrics):
+            encoder_threads.append(threading.current_thread())
+            original(metrics)
+
+        feed._publish_sample = publish
+
+        # Главный цикл оркестратора - другой поток
+        loop_thread = threading.Thread(target=lambda: (
+            feed.on_sample(_metrics(120)), feed.on_decision(Decision.HOLD, 10),
+        ))
+        loop_thread.start()
+        loop_thread.join()
+
+        messages = [json.loads(await asyncio.wait_for(queue.get(), 1)) for _ in range(3)]
+        return messages, encoder_threads
+
+    messages, encoder_threads = asyncio.run(scenario())
+
+    snapshot, sample, decision = messages
+    assert snapshot == {'type': 'snapshot', 'seq': 0, 'sample': snapshot['sample'], 'users': 0}
+    assert snapshot['sample']['rps'] == 100
+    assert sample == {'type': 'sample', 'seq': 1, 'delta': {'rps': 120}}
+    assert decision == {'type': 'decision', 'seq': 2, 'decision': 'HOLD', 'users': 10}
+    assert encoder_threads == [threading.main_thread()]
+
+
+def test_slow_client_gets_resynced_with_snapshot():
+    feed = LiveFeed(client_queue_size=2)
+
+    async def scenario():
+        feed.attach_loop(asyncio.get_running_loop())
+        queue = feed.subscribe()
+        for rps in (110, 120, 130):
+            feed.on_sample(_metrics(rps))
+        await asyncio.sleep(0)
+        return [json.loads(queue.get_nowait()) for _ in range(queue.qsize())]
+
+    messages = asyncio.run(scenario())
+
+    assert messages[0]['type'] == 'snapshot' and messages[0]['seq'] == 2
+    assert messages[0]['sample']['rps'] == 120
+    assert messages[-1] == {'type': 'sample', 'seq': 3, 'delta': {'rps': 130}}
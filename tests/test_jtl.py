@@ -0,0 +1,58 @@
+from load_orchestrator.adapters.jtl import JtlTailer, JtlWindow
+
+HEADER = "timeStamp,elapsed,label,responseCode,responseMessage,success,failureMessage,allThreads\n"
+
+
+def _row(timestamp: int, elapsed: int, success: bool = True, message: str = "", threads: int = 5) -> str:
+    code = "200" if success else "500"
+    return f"{timestamp},{elapsed},GET /,{code},OK,{str(success).lower()},{message},{threads}\n"
+
+
+def test_partial_line_waits_for_next_read(tmp_path):
+    path = tmp_path / "results.jtl"
+    tailer = JtlTailer(str(path))
+    window = JtlWindow()
+    assert tailer.read(window) == 0  # Файла ещё нет
+
+    second = _row(1_700_000_001_000, 200, threads=7)
+    path.write_text(HEADER + _row(1_700_000_000_000, 100) + second[:10])
+    assert tailer.read(window) == 1
+    assert window.count == 1 and window.histogram.max == 100
+
+    with open(path, "a") as f:
+        f.write(second[10:])
+    assert tailer.read(window) == 1
+    assert tailer.read(window) == 0  # Новых байт нет
+
+    assert window.count == 2
+    assert window.rt_avg == 150
+    assert window.threads == 7
+    assert window.first_timestamp == 1_700_000_000 and window.last_timestamp == 1_700_000_001
+    assert tailer.total_requests == 2
+    assert window.endpoints()["GET /"]["requests"] == 2
+
+
+def test_failures_and_file_recreation(tmp_path):
+    path = tmp_path / "results.jtl"
+    path.write_text(HEADER + _row(1000, 10) + _row(2000, 20, success=False, message="timeout after 30s"))
+    tailer = JtlTailer(str(path))
+    window = JtlWindow()
+
+    assert tailer.read(window) == 2
+    assert window.failures == 1 and tailer.total_failures == 1
+    assert window.signatures.top() == [("timeout after <n>s", 1, 0)]
+
+    # Новый запуск JMeter пересоздал файл (он короче прочитанного) - читаем сначала
+    path.write_text(HEADER + _row(3000, 30))
+    fresh = JtlWindow()
+    assert tailer.read(fresh) == 1
+    assert fresh.histogram.max == 30
+
+
+def test_file_without_header_uses_default_columns(tmp_path):
+    path = tmp_path / "results.jtl"
+    path.write_text("1000,15,GET /,200,OK,Thread 1-1,text,true,,100,50,1,3,http://x/,10,0,2\n")
+    window = JtlWindow()
+
+    assert JtlTailer(str(path)).read(window) == 1
+    assert window.threads == 3 and window.histogram.max == 15
@@ -0,0 +1,63 @@
+from load_orchestrator.analytics.latency import LatencyWindow, constant_think_time
+
+
+class ConstantUser:
+    def wait_time(self):
+        return 2.0
+
+
+class ZeroWaitUser:
+    def wait_time(self):
+        return 0
+
+
+class PacingUser:
+    def wait_time(self):
+        return self.last_run + 1.0  # constant_pacing: зависит от состояния пользователя
+
+
+class RandomUser:
+    calls = 0
+
+    def wait_time(self):
+        RandomUser.calls += 1
+        return RandomUser.calls * 0.1
+
+
+def test_constant_think_time_from_wait_time():
+    assert constant_think_time([ConstantUser]) == 2000
+    assert constant_think_time([ZeroWaitUser]) == 0
+
+
+def test_think_time_unknown_for_random_stateful_or_mixed_waits():
+    assert constant_think_time([RandomUser]) is None
+    assert constant_think_time([PacingUser]) is None
+    assert constant_think_time([ConstantUser, ZeroWaitUser]) is None
+
+
+def test_unknown_interval_disables_correction():
+    window = LatencyWindow()
+    window.record(5000, start_time=None, intended_send_time=None)
+
+    summary = window.take()
+
+    assert summary['count'] == 1
+    assert summary['corrected'] is None
+
+
+def test_think_time_is_part_of_expected_interval():
+    window = LatencyWindow(think_time=1000)
+    window.record(100, None, None)
+    window.roll()  # медиана прошлого окна ~100 мс
+
+    window.record(3500, None, None)
+
+    # Интервал ~1100 мс: достроены ~2400 и ~1300, а не 34 запроса по 100 мс
+    assert window.corrected.count == 3
+
+
+def test_schedule_lag_is_added_for_paced_requests():
+    window = LatencyWindow()
+    window.record(100, start_time=10.5, intended_send_time=10.0)
+
+    assert window.take()['corrected']['p99'] > 550
@@ -0,0 +1,35 @@
+import math
+
+from load_orchestrator.report.lttb import lttb
+
+
+def test_short_series_returned_as_is():
+    points = [(0, 1, 10), (1, 2, 20), (2, 3, 30)]
+
+    assert lttb(iter(points), len(points), threshold=10) == [
+        [(0, 1), (1, 2), (2, 3)],
+        [(0, 10), (1, 20), (2, 30)],
+    ]
+    assert lttb(iter([]), 0, threshold=10) == []
+
+
+def test_keeps_endpoints_and_threshold():
+    points = [(x, math.sin(x / 10)) for x in range(1000)]
+
+    (selected,) = lttb(iter(points), len(points), threshold=50)
+
+    assert len(selected) == 50
+    assert selected[0] == (0, points[0][1]) and selected[-1] == (999, points[-1][1])
+    xs = [x for x, _ in selected]
+    assert xs == sorted(xs)
+
+
+def test_keeps_spike_that_uniform_decimation_would_drop():
+    points = [(x, 0.0, 0.0) for x in range(1000)]
+    points[503] = (503, 100.0, 0.0)
+
+    peaks, flat = lttb(iter(points), len(points), threshold=20)
+
+    assert (503, 100.0) in peaks
+    assert len(peaks) == len(flat) == 20
+    assert all(y == 0.0 for _, y in flat)
@@ -0,0 +1,24 @@
+from load_orchestrator.models import StopReason
+
+
+def test_sla_validation_stops_past_knee(run, adapter, clock):
+    start = clock.time()
+
+    orchestrator, result = run('sla_validation', {'max_p99': 1000, 'initial_users': 50, 'step_multiplier': 2})
+
+    # 50 -> 100 -> 200 -> 400 -> 800: p99 = 30 + 3 * (800 - 300) > 1000
+    assert adapter.launched and adapter.stopped
+    assert adapter.configured[:5] == [50, 100, 200, 400, 800]
+    assert result.stop_reason == StopReason.SLA_VIOLATED
+    assert result.history and result.history[-1].users == 800
+    # Виртуальное время шло только через clock
+    assert clock.time() - start >= orchestrator.config.orchestrator.stabilization_time
+    assert all(a.timestamp <= b.timestamp for a, b in zip(result.history, result.history[1:]))
+
+
+def test_sla_validation_passes_at_max_users(run, adapter):
+    _, result = run('sla_validation', {'max_p99': 1000, 'initial_users': 50, 'step_multiplier': 2, 'max_users': 300})
+
+    assert adapter.configured[:4] == [50, 100, 200, 300]
+    assert result.stop_reason == StopReason.TARGET_REACHED
+    assert result.failed_stage is None
@@ -0,0 +1,64 @@
+import pytest
+
+pytest.importorskip("locust")
+
+from load_orchestrator.locust_plugin import pacing  # noqa: E402
+from load_orchestrator.locust_plugin.pacing import ArrivalRatePacer  # noqa: E402
+
+
+class FakeMaster:
+    def __init__(self, worker_count: int):
+        self.worker_count = worker_count
+        self.sent = []
+
+    def send_message(self, msg_type, data=None, client_id=None):
+        self.sent.append((msg_type, data, client_id))
+
+
+@pytest.fixture
+def now(monkeypatch):
+    current = [1_700_000_000.0]
+    monkeypatch.setattr(pacing.time, "time", lambda: current[0])
+    return current
+
+
+def test_slots_follow_the_rate_not_the_responses(now):
+    pacer = ArrivalRatePacer()
+    assert pacer.next_slot() is None  # Темп 0 - слотов нет
+
+    pacer.set_rate(4)
+    slots = [pacer.next_slot() for _ in range(3)]
+
+    assert slots == [now[0], now[0] + 0.25, now[0] + 0.5]
+    assert pacer.offered == 3
+
+
+def test_lagging_slots_are_counted_as_missed_not_sent_in_a_burst(now):
+    pacer = ArrivalRatePacer(max_lag=1.0)
+    pacer.set_rate(10)
+    pacer.next_slot()
+
+    now[0] += 3.0
+    slot = pacer.next_slot()
+
+    assert pacer.missed == 29
+    assert now[0] - slot < 0.1
+
+
+def test_master_sends_the_current_share_to_a_stale_worker(monkeypatch):
+    monkeypatch.setattr(pacing, "_target_rate", 100.0)
+    master = FakeMaster(worker_count=4)
+
+    pacing._correct_worker_share(master, "new-worker", 0.0)
+    pacing._correct_worker_share(master, "old-worker", 25.0)
+
+    assert master.sent == [(pacing.RATE_MESSAGE, 25.0, "new-worker")]
+
+
+def test_share_shrinks_after_scale_out(monkeypatch):
+    monkeypatch.setattr(pacing, "_target_rate", 100.0)
+    master = FakeMaster(worker_count=5)
+
+    pacing._correct_worker_share(master, "old-worker", 25.0)
+
+    assert master.sent == [(pacing.RATE_MESSAGE, 20.0, "old-worker")]
@@ -0,0 +1,72 @@
+from load_orchestrator.models import Decision, RawMetrics, StopReason
+from load_orchestrator.strategies.canary import Canary
+from load_orchestrator.strategies.pipeline import Pipeline
+from load_orchestrator.strategies.sla_validation import SLAValidation
+
+
+def _metrics(users: int) -> RawMetrics:
+    return RawMetrics(0.0, users, users * 2.0, 10, 10, 20, 30, 0, 0.0, 100)
+
+
+CANARY = {'type': 'canary', 'canary_users': 50, 'canary_duration': 20, 'error_threshold': 5}
+SPIKE = {
+    'type': 'spike', 'baseline_users': 10, 'baseline_duration': 10, 'spike_users': 100,
+    'spike_duration': 10, 'recovery_users': 10, 'recovery_duration': 10,
+}
+
+
+def test_pipeline_hands_load_to_next_stage(run, adapter):
+    _, result = run('pipeline', {'stages': [
+        CANARY,
+        {'type': 'sla_validation', 'max_p99': 1000, 'step_multiplier': 2, 'max_users': 400},
+        SPIKE,
+    ]})
+
+    assert [stage.stop_reason for stage in result.stages] == [StopReason.TARGET_REACHED] * 3
+    assert result.stop_reason == StopReason.TARGET_REACHED and result.failed_stage is None
+    # Рампа SLA продолжается с нагрузки canary (50), а не с initial_users (10)
+    assert adapter.configured[:5] == [50, 50, 100, 200, 400]
+    canary, sla, _ = result.stages
+    assert canary.history[-1].timestamp <= sla.history[0].timestamp
+    assert sla.history[-1].users == 400
+
+
+def test_failed_sla_stage_stops_pipeline(run, adapter):
+    _, result = run('pipeline', {'stages': [
+        CANARY,
+        {'type': 'sla_validation', 'max_p99': 1000, 'step_multiplier': 2},
+        SPIKE,
+    ]})
+
+    assert [stage.name for stage in result.stages] == ['1:canary', '2:sla_validation']
+    assert result.stages[1].stop_reason == StopReason.SLA_VIOLATED
+    assert result.stop_reason == StopReason.SLA_VIOLATED
+    assert result.failed_stage == '2:sla_validation'
+    assert 100 not in adapter.configured[6:]  # Spike не запускался
+
+
+def test_failed_canary_stops_pipeline(run, adapter):
+    adapter.error_rate = 10.0
+
+    _, result = run('pipeline', {'stages': [
+        CANARY, {'type': 'sla_validation', 'max_p99': 1000, 'step_multiplier': 2},
+    ]})
+
+    assert len(result.stages) == 1
+    assert result.stop_reason == StopReason.SLA_VIOLATED
+    assert result.failed_stage == '1:canary'
+    assert adapter.configured == [50]
+
+
+def test_pipeline_advance_calls_handoff():
+    canary = Canary(canary_users=20, canary_duration=1, error_threshold=5)
+    sla = SLAValidation(max_p99=1000, initial_users=10)
+    pipeline = Pipeline([canary, sla], names=['canary', 'sla'])
+
+    assert pipeline.current is canary and pipeline.has_next_stage()
+    stage = pipeline.advance(70, _metrics(70))
+
+    assert stage is sla and pipeline.current_name == 'sla'
+    assert not pipeline.has_next_stage()
+    assert sla.get_next_users(0, _metrics(0)) == 70
+    assert sla.decide(_metrics(70)) == Decision.CONTINUE
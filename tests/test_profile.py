@@ -0,0 +1,87 @@
+import pytest
+
+from load_orchestrator.models import StopReason
+from load_orchestrator.strategies.profile import LoadProfile, Profile
+
+
+def test_segments_follow_each_other_and_inherit_the_start():
+    profile = LoadProfile.from_dicts([
+        {'type': 'ramp', 'from': 0, 'to': 100, 'duration': 10},
+        {'type': 'hold', 'duration': 5},  # value = конец ramp
+        {'type': 'sawtooth', 'max': 200, 'period': 2, 'duration': 4},
+        {'type': 'sine', 'base': 50, 'amplitude': 10, 'period': 4, 'duration': 4},
+        {'type': 'step', 'from': 10, 'to': 30, 'steps': 3, 'step_duration': 2},
+    ])
+
+    assert profile.duration == 29
+    assert profile.value_at(5) == 50
+    assert profile.value_at(12) == 100
+    assert profile.value_at(16) == 150  # Половина периода пилы от 100 до 200
+    assert profile.value_at(20) == pytest.approx(60)  # Четверть периода синуса
+    assert [profile.value_at(t) for t in (23, 25, 27)] == [10, 20, 30]
+    assert profile.value_at(29) is None
+
+
+def test_lookups_out_of_order_still_find_the_segment():
+    profile = LoadProfile.from_dicts([
+        {'type': 'hold', 'value': 1, 'duration': 1},
+        {'type': 'hold', 'value': 2, 'duration': 1},
+        {'type': 'hold', 'value': 3, 'duration': 1},
+    ])
+
+    assert [profile.value_at(t) for t in (2.5, 0.5, 1.5, -1)] == [3, 1, 2, 1]
+
+
+def test_replay_interpolates_scaled_csv(tmp_path):
+    (tmp_path / 'traffic.csv').write_text("ts,rps\n110,40\n100,10\n120,20\n")
+
+    profile = LoadProfile.from_dicts(
+        [{'type': 'replay', 'file': 'traffic.csv', 'time_column': 'ts', 'value_column': 'rps', 'scale': 2}],
+        base_dir=tmp_path,
+    )
+    stepped = LoadProfile.from_dicts(
+        [{'type': 'replay', 'file': str(tmp_path / 'traffic.csv'), 'time_column': 'ts', 'value_column': 'rps',
+          'interpolate': False, 'duration': 30}],
+    )
+
+    assert profile.duration == 20  # До последней точки, время от первой строки
+    assert profile.value_at(5) == 50
+    assert profile.value_at(15) == 60
+    assert stepped.value_at(15) == 40
+    assert stepped.value_at(25) == 20  # После последней точки держится её значение
+
+
+@pytest.mark.parametrize("segment, message", [
+    ({'type': 'wave', 'duration': 1}, "unknown type"),
+    ({'type': 'ramp', 'duration': 1}, "#1 \\(ramp\\)"),
+    ({'type': 'hold', 'value': 1, 'duration': 0}, "'duration' must be positive"),
+    ({'type': 'sine', 'amplitude': 1, 'period': 0, 'duration': 1}, "'period' must be positive"),
+    ({'type': 'replay', 'file': 'missing.csv'}, "replay file not found"),
+])
+def test_invalid_segments(segment, message):
+    with pytest.raises(ValueError, match=message):
+        LoadProfile.from_dicts([segment])
+
+
+def test_setpoints_skip_changes_below_min_change():
+    strategy = Profile(segments=[{'type': 'ramp', 'from': 0, 'to': 10, 'duration': 10}], resolution=0.5, min_change=3)
+
+    setpoints = [strategy.get_setpoint(1000 + t / 2) for t in range(22)]
+
+    assert [s for s in setpoints if s is not None] == [0, 3, 6, 9]
+    assert strategy.get_schedule() == ([(0.0, 0), (3.0, 3), (5.5, 6), (9.0, 9)], 10.0)  # round(5.5) == 6
+
+
+def test_profile_run_ends_with_the_timeline(run, adapter):
+    _, result = run('profile', {
+        'resolution': 0.5,
+        'segments': [
+            {'type': 'ramp', 'from': 10, 'to': 50, 'duration': 4},
+            {'type': 'hold', 'duration': 2},
+        ],
+    }, stabilization_time=0)
+
+    assert result.stop_reason == StopReason.TARGET_REACHED
+    assert adapter.configured[0] == 10
+    assert max(adapter.configured) == 50
+    assert adapter.configured == sorted(adapter.configured)
@@ -0,0 +1,38 @@
+from load_orchestrator.ramp import RampController
+
+
+def test_ramp_completes_when_users_reach_target():
+    ramp = RampController(spawn_rate=100)
+
+    assert ramp.plan(100, now=0.0) == 100
+    assert ramp.active
+    assert ramp.observe(40, now=1.0) == (True, None)
+    ramping, duration = ramp.observe(99, now=2.0)  # В пределах tolerance (2%)
+
+    assert not ramping and duration == 2.0
+    assert not ramp.active
+    assert ramp.observe(100, now=3.0) == (False, None)
+
+
+def test_capacity_learned_only_when_generator_lags():
+    ramp = RampController(spawn_rate=100, smoothing=0.5)
+    ramp.plan(1000, now=0.0)
+    ramp.observe(90, now=1.0)  # 90/с из 100 - генератор успевает
+    assert ramp.capacity is None
+
+    ramp.observe(130, now=2.0)  # 40/с - генератор ограничивает
+    assert ramp.capacity == 40
+
+    ramp.observe(150, now=3.0)  # 20/с: EWMA 40 + 0.5 * (20 - 40)
+    assert ramp.capacity == 30
+
+
+def test_plan_probes_above_measured_capacity():
+    ramp = RampController(spawn_rate=100, probe=1.25)
+    ramp.capacity = 40
+
+    assert ramp.plan(500, now=0.0) == 50
+    assert ramp.planned_rate == 50
+
+    ramp.capacity = 1000
+    assert ramp.plan(500, now=0.0) == 100  # Не выше spawn_rate из конфига
@@ -0,0 +1,107 @@
+import sys
+import types
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from load_orchestrator.cli import main
+from load_orchestrator.registry import BUILTIN, STRATEGIES, PluginRegistry
+from load_orchestrator.strategies.degradation_search import DegradationSearch
+
+
+class FakeEntryPoint:
+    def __init__(self, name: str, value: str):
+        self.name = name
+        self.value = value
+        self.dist = types.SimpleNamespace(name='third-party')
+
+
+@pytest.fixture
+def plugin_module(tmp_path, monkeypatch):
+    """Модуль плагина на sys.path, который ещё не импортирован"""
+    (tmp_path / 'fake_plugin.py').write_text("class Outer:\n    class Inner:\n        pass\n", encoding='utf-8')
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield 'fake_plugin'
+    sys.modules.pop('fake_plugin', None)
+
+
+def test_plugin_module_is_imported_on_first_lookup(plugin_module):
+    registry = PluginRegistry('test.group', {'fake': 'fake_plugin:Outer.Inner'})
+
+    assert 'fake' in registry
+    assert 'fake_plugin' not in sys.modules
+
+    assert registry['fake'].__qualname__ == 'Outer.Inner'
+    assert 'fake_plugin' in sys.modules
+
+
+def test_unknown_plugin_raises_key_error(monkeypatch):
+    monkeypatch.setattr('importlib.metadata.entry_points', lambda group: [])
+    registry = PluginRegistry('test.group', {})
+
+    assert 'missing' not in registry
+    with pytest.raises(KeyError):
+        registry['missing']
+
+
+def test_entry_points_add_plugins_but_do_not_override_builtins(monkeypatch):
+    monkeypatch.setattr('importlib.metadata.entry_points', lambda group: [
+        FakeEntryPoint('fake', 'fake_plugin:Outer'),
+        FakeEntryPoint('builtin', 'fake_plugin:Outer.Inner'),
+    ])
+    registry = PluginRegistry('test.group', {'builtin': 'load_orchestrator.strategies.spike:Spike'})
+
+    assert registry.describe() == [
+        ('builtin', 'load_orchestrator.strategies.spike:Spike', BUILTIN),
+        ('fake', 'fake_plugin:Outer', 'third-party'),
+    ]
+
+
+def test_runtime_registration_by_class():
+    registry = PluginRegistry('test.group', {})
+    registry.register('custom', DegradationSearch)
+
+    assert registry['custom'] is DegradationSearch
+    assert registry.describe() == [
+        ('custom', 'load_orchestrator.strategies.degradation_search:DegradationSearch', 'runtime'),
+    ]
+
+
+def _config(tmp_path: Path, strategy: str, params: str = "") -> Path:
+    locustfile = tmp_path / 'locustfile.py'
+    locustfile.write_text("", encoding='utf-8')
+    path = tmp_path / 'config.yaml'
+    path.write_text(
+        f"adapter:\n  type: locust\n  test_file: {locustfile}\n"
+        f"strategy:\n  type: {strategy}\n{params}"
+        f"collectors:\n  - type: json\n    url: http://localhost:9000/stats\n",
+        encoding='utf-8',
+    )
+    return path
+
+
+def test_validate_accepts_a_valid_config(tmp_path):
+    result = CliRunner().invoke(main, ['validate', '-c', str(_config(tmp_path, 'degradation_search'))])
+
+    assert result.exit_code == 0, result.output
+    assert "strategy=degradation_search, collectors=1" in result.output
+
+
+@pytest.mark.parametrize("strategy, params, message", [
+    ('no_such_strategy', '', 'no_such_strategy'),
+    ('profile', '  segments:\n    - type: wave\n      duration: 1\n', 'unknown type'),
+])
+def test_validate_reports_config_errors(tmp_path, strategy, params, message):
+    result = CliRunner().invoke(main, ['validate', '-c', str(_config(tmp_path, strategy, params))])
+
+    assert result.exit_code != 0
+    assert message in result.output
+
+
+def test_list_plugins_shows_builtins():
+    result = CliRunner().invoke(main, ['list-plugins'])
+
+    assert result.exit_code == 0
+    for name in STRATEGIES.keys():
+        assert name in result.output
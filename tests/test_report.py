@@ -0,0 +1,25 @@
+import json
+
+from load_orchestrator.report import render
+from load_orchestrator.store import result_from_dict, result_to_dict
+
+
+def test_run_records_decisions(run):
+    _, result = run('sla_validation', {'max_p99': 1000, 'initial_users': 50, 'step_multiplier': 2})
+
+    assert result.decisions[-1]['decision'] == 'STOP'
+    changes = [d['to'] for d in result.decisions if d['to'] is not None]
+    assert changes == [100, 200, 400, 800]
+    assert sum(d['samples'] for d in result.decisions) >= len(changes) + 1
+
+    restored = result_from_dict(json.loads(json.dumps(result_to_dict(result))))
+    assert restored.decisions == result.decisions
+
+
+def test_reports_render_decisions_relative_to_start(run):
+    _, result = run('sla_validation', {'max_p99': 1000, 'initial_users': 50, 'step_multiplier': 2})
+
+    report = json.loads(render(result, 'json', 100))
+    assert len(report['decisions']) == len(result.decisions)
+    assert report['decisions'][0]['timestamp'] == result.decisions[0]['timestamp'] - result.started_at
+    assert 'Decisions' in render(result, 'html', 100)
@@ -0,0 +1,99 @@
+import pytest
+
+from load_orchestrator.config import AdapterConfig, Config, OrchestratorConfig, StrategyConfig
+from load_orchestrator.factory import OrchestratorFactory
+from load_orchestrator.models import RawMetrics, StopReason
+from load_orchestrator.orchestrator import Orchestrator
+from load_orchestrator.rules import RuleSet
+
+
+def _metrics(timestamp: float, p99: float = 100.0, error_rate: float = 0.0, **kwargs) -> RawMetrics:
+    return RawMetrics(
+        timestamp=timestamp, users=100, rps=200.0, rt_avg=50.0, p50=50.0, p95=80.0, p99=p99,
+        failed_requests=0, error_rate=error_rate, total_requests=1000, **kwargs,
+    )
+
+
+def _feed(rules: RuleSet, samples: list[RawMetrics]) -> list[bool]:
+    return [rules.update(m) is not None for m in samples]
+
+
+@pytest.mark.parametrize("source", [
+    "p99 > 800 for 3 of 5 windows",
+    "error_rate slope > 2%/min",
+    "p95_corrected >= 1500ms for 30s",
+    "server.host.cpu_percent > 95 for 2 windows",
+    "rps slope over 120s < -50/min",
+    "failures[timeout] > 1% for 3 windows",
+])
+def test_documented_rules_compile(source):
+    assert RuleSet([source]).rules[0].source == source
+
+
+@pytest.mark.parametrize("source, message", [
+    ("p99 >> 800", "Invalid stop rule"),
+    ("latency > 800", "Unknown metric"),
+    ("p99 > 800/min", "rate units need 'slope'"),
+    ("p99 > 800 for 4 of 3 windows", "0 < N <= M"),
+    ("timestamp > 0", "Unknown metric"),
+])
+def test_invalid_rules_are_rejected(source, message):
+    with pytest.raises(ValueError, match=message):
+        RuleSet([source])
+
+
+def test_n_of_m_windows_counts_hits_in_the_sliding_window():
+    rules = RuleSet(["p99 > 800 for 3 of 5 windows"])
+    p99s = [900, 100, 900, 100, 100, 100, 900, 900, 100, 900]
+
+    fired = _feed(rules, [_metrics(i, p99=p99) for i, p99 in enumerate(p99s)])
+
+    # Первые два попадания выпадают из окна раньше, чем набирается третье
+    assert fired == [False] * 9 + [True]
+
+
+def test_n_windows_means_consecutive_samples():
+    rules = RuleSet(["p99 > 800 for 2 windows"])
+
+    assert _feed(rules, [_metrics(i, p99=p99) for i, p99 in enumerate([900, 100, 900, 900])]) == \
+        [False, False, False, True]
+
+
+def test_duration_window_requires_the_condition_to_hold():
+    rules = RuleSet(["p99 > 800 for 30s"])
+    samples = [_metrics(t, p99=p99) for t, p99 in [(0, 900), (20, 900), (25, 100), (30, 900), (50, 900), (60, 900)]]
+
+    # Нарушение в t=25 сбрасывает отсчёт: 30s набираются только к t=60
+    assert _feed(rules, samples) == [False, False, False, False, False, True]
+
+
+def test_slope_per_minute():
+    rules = RuleSet(["error_rate slope > 2%/min"])
+    # +3% в минуту: 0.05% в секунду
+    samples = [_metrics(t, error_rate=t * 0.05) for t in range(0, 40, 10)]
+
+    assert _feed(rules, samples) == [False, False, True, True]  # Наклон считается с трёх точек
+
+
+def test_server_and_failure_metrics():
+    rules = RuleSet(["server.db.connections >= 100", "failures[TIMEOUT] > 1%"])
+
+    assert rules.update(_metrics(0, server={"db.connections": 50})) is None  # failures[...] - 0
+    assert rules.update(_metrics(1, failures={"ReadTimeout after <n>s": 2.5})).source == "failures[TIMEOUT] > 1%"
+    assert rules.update(_metrics(2, server={"db.connections": 100})).source == "server.db.connections >= 100"
+
+
+def test_fired_rule_stops_the_run(adapter, clock):
+    config = Config(
+        AdapterConfig('locust', 'simulated'),
+        StrategyConfig('degradation_search', {'initial_users': 50}),
+        OrchestratorConfig(bootstrap_resamples=0),
+        stop_rules=["users >= 200 for 2 windows"],
+    )
+    orchestrator = Orchestrator(config, adapter, OrchestratorFactory.create_strategy(config), clock=clock)
+
+    result = orchestrator.run()
+
+    assert result.stop_reason == StopReason.STOP_RULE
+    assert result.stop_rule == "users >= 200 for 2 windows"
+    assert 200 <= max(adapter.configured) < adapter.knee  # Остановлено правилом, а не деградацией
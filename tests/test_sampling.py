@@ -0,0 +1,146 @@
+import socket
+
+import pytest
+
+from load_orchestrator.adapters.LocustAdapter import LocustAdapter
+from load_orchestrator.adapters.stream import IntervalStreamReader, encode_interval
+from load_orchestrator.analytics.latency import LatencyHistogram
+from load_orchestrator.config import AdapterConfig, Config, OrchestratorConfig, StrategyConfig
+from load_orchestrator.factory import OrchestratorFactory
+from load_orchestrator.models import RawMetrics
+from load_orchestrator.orchestrator import Orchestrator
+from load_orchestrator.sampling import AdaptiveSampler
+
+
+def _metrics(rps: float, p95: float = 20.0) -> RawMetrics:
+    return RawMetrics(0.0, 10, rps, 10, 10, p95, 30, 0, 0.0, 100)
+
+
+def test_sampler_without_burst_keeps_monitoring_interval():
+    sampler = AdaptiveSampler(interval=5.0)
+    sampler.load_changed(0.0)
+    sampler.expect_change(3.0)
+
+    assert not sampler.enabled
+    assert sampler.next_interval(0.0) == 5.0
+
+
+def test_sampler_bursts_after_load_change():
+    sampler = AdaptiveSampler(interval=5.0, burst_interval=0.5, burst_window=10.0)
+
+    assert sampler.next_interval(0.0) == 5.0
+    sampler.load_changed(1.0)
+    assert sampler.next_interval(1.0) == 0.5
+    assert sampler.next_interval(10.9) == 0.5
+    assert sampler.next_interval(11.0) == 5.0
+
+
+def test_sampler_wakes_at_planned_change():
+    sampler = AdaptiveSampler(interval=5.0, burst_interval=0.5, burst_window=2.0)
+    sampler.expect_change(3.0)
+
+    assert sampler.next_interval(0.0) == 3.0  # Не позже планового перехода
+    assert sampler.next_interval(2.9) == 0.5  # Но и не чаще burst_interval
+    assert sampler.bursting(3.0)
+    assert sampler.next_interval(4.9) == 0.5
+    assert sampler.next_interval(5.0) == 5.0
+
+
+def test_sampler_bursts_while_metrics_are_noisy():
+    sampler = AdaptiveSampler(interval=5.0, burst_interval=1.0, burst_cv=0.2, variance_samples=3)
+    for t, rps in enumerate([100, 100, 100]):
+        sampler.observe(_metrics(rps), float(t))
+    assert not sampler.bursting(2.0)
+
+    sampler.observe(_metrics(300), 3.0)
+    assert sampler.bursting(3.5)
+    assert not sampler.bursting(4.0)
+
+
+def test_sampler_records_actual_interval_and_resets_on_new_stage():
+    sampler = AdaptiveSampler(interval=5.0, burst_interval=0.5)
+    first, second = _metrics(100), _metrics(100)
+    sampler.observe(first, 10.0)
+    sampler.observe(second, 12.5)
+    assert first.sampling_interval is None and second.sampling_interval == 2.5
+
+    sampler.expect_change(20.0)
+    sampler.load_changed(12.5)
+    sampler.set_burst_interval(None)
+    assert not sampler.enabled
+    assert sampler.next_interval(13.0) == 5.0
+
+
+def _spike_config() -> Config:
+    return Config(
+        AdapterConfig('locust', 'simulated'),
+        StrategyConfig('spike', {'baseline_users': 10, 'spike_users': 100}),
+        OrchestratorConfig(bootstrap_resamples=0),
+    )
+
+
+def test_burst_interval_not_below_adapter_sampling_interval(adapter, clock):
+    config = _spike_config()
+    adapter.min_sampling_interval = lambda: 1.0
+
+    orchestrator = Orchestrator(config, adapter, OrchestratorFactory.create_strategy(config), clock=clock)
+
+    assert orchestrator.sampler.burst_interval == 1.0  # Spike просит 0.25
+
+
+def test_burst_interval_from_strategy_without_adapter_limit(adapter, clock):
+    config = _spike_config()
+
+    orchestrator = Orchestrator(config, adapter, OrchestratorFactory.create_strategy(config), clock=clock)
+
+    assert orchestrator.sampler.burst_interval == 0.25
+
+
+@pytest.fixture
+def streaming(tmp_path, clock):
+    adapter = LocustAdapter('locustfile.py', stream=True, stream_interval=1.0)
+    adapter.use_clock(clock)
+    adapter._stream = IntervalStreamReader(str(tmp_path / "stats.sock"))
+    adapter._stream_window_started = clock.time()
+    sender = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+
+    def send(requests: int, users: int = 10):
+        histogram = LatencyHistogram()
+        histogram.record(50, requests)
+        sender.sendto(encode_interval(1, 1, clock.time(), users, 0, 50.0 * requests, histogram), adapter._stream.path)
+
+    yield adapter, send
+    sender.close()
+    adapter._stream.close()
+
+
+def test_stream_window_without_datagrams_repeats_previous(streaming, clock):
+    adapter, send = streaming
+
+    clock.advance(1.0)
+    send(100)
+    first = adapter._stream_stats()
+    assert first.rps == pytest.approx(100.0)
+
+    # Burst-опрос раньше следующей датаграммы: не rps=0, а прошлое окно
+    clock.advance(0.25)
+    early = adapter._stream_stats()
+    assert early.rps == pytest.approx(100.0) and early.users == 10
+    assert early.timestamp == clock.time()
+
+    # Окно не закрывалось: следующая датаграмма делится на всю его длительность
+    clock.advance(0.75)
+    send(100)
+    assert adapter._stream_stats().rps == pytest.approx(100.0)
+
+
+def test_stream_window_reports_silence_after_two_intervals(streaming, clock):
+    adapter, send = streaming
+    clock.advance(1.0)
+    send(100)
+    adapter._stream_stats()
+
+    clock.advance(2.0)
+    silent = adapter._stream_stats()
+
+    assert silent.rps == 0.0 and silent.users == 10
@@ -0,0 +1,95 @@
+import pytest
+
+from load_orchestrator.adapters.saturation import GeneratorSaturationDetector
+from load_orchestrator.config import OrchestratorConfig
+from load_orchestrator.models import RawMetrics
+
+
+def _detector(cpu: list[float]) -> GeneratorSaturationDetector:
+    detector = GeneratorSaturationDetector(cpu_threshold=90, cpu_warning=70, baseline_samples=3)
+    readings = iter(cpu)
+    detector._sampler.sample = lambda pids: {1: next(readings)}
+    return detector
+
+
+def _metrics(users: int, rps: float, rt_avg: float, total: int = 0, cumulative: bool = False,
+             offered_rps: float | None = None) -> RawMetrics:
+    return RawMetrics(
+        0.0, users, rps, rt_avg, 10, 20, 30, 0, 0.0, total,
+        offered_rps=offered_rps, cumulative_percentiles=cumulative,
+    )
+
+
+def test_cpu_above_threshold_marks_saturation():
+    detector = _detector([95])
+
+    metrics = detector.observe(_metrics(10, 100, 50), [1])
+
+    assert metrics.generator_cpu == 95 and metrics.generator_saturated
+
+
+def test_littles_law_flags_unexplained_user_time():
+    detector = _detector([20, 20, 20, 80])
+    for _ in range(3):
+        # 100 пользователей, 100 rps: цикл 1 с = 0.1 с ответа + 0.9 с think
+        detector.observe(_metrics(100, 100, 100), [1])
+    assert detector.think_time() == pytest.approx(0.9)
+
+    # Цикл вырос до 2 с при той же задержке - пользователи ждут генератор
+    metrics = detector.observe(_metrics(100, 50, 100), [1])
+
+    assert metrics.generator_saturated
+
+
+def test_interval_latency_from_cumulative_rt_avg():
+    detector = GeneratorSaturationDetector()
+
+    assert detector.interval_rt(_metrics(10, 100, 100, total=1000, cumulative=True)) is None
+    # Накопленно 2000 запросов со средним 150 мс: вторая тысяча - по 200 мс
+    assert detector.interval_rt(_metrics(10, 100, 150, total=2000, cumulative=True)) == pytest.approx(200)
+    assert detector.interval_rt(_metrics(10, 100, 150, total=2000, cumulative=True)) is None
+    assert detector.interval_rt(_metrics(10, 100, 42)) == 42
+
+
+def test_cumulative_latency_does_not_hide_interval_growth():
+    detector = _detector([20, 20, 20, 20, 80])
+    total = 0
+    for _ in range(4):
+        total += 1000
+        detector.observe(_metrics(100, 100, 100, total=total, cumulative=True), [1])
+    assert detector.think_time() == pytest.approx(0.9)
+
+    # Задержка интервала выросла до 1 с: цикл 2 с объяснён (1 + 0.9), генератор не насыщен.
+    # Накопленный rt_avg (280 мс) дал бы residual 41%.
+    cumulative = (4000 * 100 + 1000 * 1000) / 5000
+    metrics = detector.observe(_metrics(100, 50, cumulative, total=5000, cumulative=True), [1])
+
+    assert not metrics.generator_saturated
+
+
+def test_open_model_skips_littles_law():
+    detector = _detector([20, 20, 20, 80])
+    for _ in range(3):
+        detector.observe(_metrics(100, 100, 100, offered_rps=100), [1])
+    assert detector.think_time() is None
+
+    metrics = detector.observe(_metrics(100, 10, 100, offered_rps=100), [1])
+
+    assert metrics.generator_cpu == 80 and not metrics.generator_saturated
+
+
+def test_saturation_is_report_only_by_default(run, adapter):
+    assert OrchestratorConfig().generator_saturation == 'flag'
+    original = adapter.get_stats
+
+    def saturated():
+        metrics = original()
+        metrics.generator_saturated = True
+        return metrics
+
+    adapter.get_stats = saturated
+    _, result = run('sla_validation', {'max_p99': 1000, 'initial_users': 50, 'step_multiplier': 2})
+
+    assert adapter.configured[:5] == [50, 100, 200, 400, 800]
+    assert all(d['source'] == 'strategy' for d in result.decisions)
+    assert all(m.generator_saturated for m in result.history)
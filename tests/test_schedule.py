@@ -0,0 +1,109 @@
+import sys
+import types
+
+import pytest
+
+from conftest import SimulatedAdapter
+from load_orchestrator.config import AdapterConfig, Config, OrchestratorConfig, StrategyConfig
+from load_orchestrator.factory import OrchestratorFactory
+from load_orchestrator.models import StopReason
+from load_orchestrator.orchestrator import Orchestrator
+from load_orchestrator.schedule import LoadSchedule, ScheduleStep
+
+
+class SchedulingAdapter(SimulatedAdapter):
+    """Симулятор, который исполняет переданное расписание по своим часам"""
+
+    def __init__(self):
+        super().__init__()
+        self.schedule: LoadSchedule | None = None
+        self.started_at: float | None = None
+
+    def push_schedule(self, schedule):
+        self.schedule = schedule
+        return True
+
+    def start_schedule(self):
+        self.started_at = self.clock.time()
+
+    def get_stats(self):
+        step = self.schedule.at(self.clock.time() - self.started_at)
+        self.users = step.users if step is not None else 0
+        return super().get_stats()
+
+
+def test_compile_collapses_repeats_and_prepends_the_lead_in():
+    schedule = LoadSchedule.compile(
+        [(0.0, 10), (1.0, 10), (2.0, 50), (2.0, 60), (3.0, 20)],
+        duration=5, spawn_rate=20, resolution=1.0, lead_in=(4.0, 10),
+    )
+
+    assert schedule.steps == [
+        ScheduleStep(at=0.0, users=10, spawn_rate=20),
+        ScheduleStep(at=6.0, users=60, spawn_rate=50),  # 50 заменено точкой в тот же момент
+        ScheduleStep(at=7.0, users=20, spawn_rate=40),
+    ]
+    assert schedule.duration == 9
+    assert [schedule.at(t).users for t in (0, 5.9, 6, 8.9)] == [10, 10, 60, 20]
+    assert schedule.at(9) is None
+
+
+@pytest.mark.parametrize("steps, duration, message", [
+    ([], 1, "at least one step"),
+    ([ScheduleStep(1, 10, 1)], 2, "start at 0"),
+    ([ScheduleStep(0, 10, 1), ScheduleStep(0, 20, 1)], 2, "strictly ordered"),
+    ([ScheduleStep(0, 10, 1), ScheduleStep(2, 20, 1)], 2, "cover the last step"),
+])
+def test_invalid_schedules(steps, duration, message):
+    with pytest.raises(ValueError, match=message):
+        LoadSchedule(steps, duration)
+
+
+def test_locust_shape_follows_the_table(monkeypatch):
+    class LoadTestShape:
+        run_time = 0.0
+
+        def get_run_time(self):
+            return self.run_time
+
+    monkeypatch.setitem(sys.modules, 'locust', types.SimpleNamespace(LoadTestShape=LoadTestShape))
+    schedule = LoadSchedule([ScheduleStep(0.0, 10, 5), ScheduleStep(1.5, 40, 30)], duration=3)
+    namespace: dict = {}
+    exec(compile(schedule.to_locust_shape(), 'shape.py', 'exec'), namespace)
+
+    shape = namespace['OrchestratorSchedule']()
+    ticks = []
+    for shape.run_time in (0.0, 1.4, 1.5, 3.0):
+        ticks.append(shape.tick())
+
+    assert ticks == [(10, 5.0), (10, 5.0), (40, 30.0), None]
+
+
+def test_push_mode_hands_the_profile_to_the_generator(clock):
+    adapter = SchedulingAdapter()
+    config = Config(
+        AdapterConfig('locust', 'simulated'),
+        StrategyConfig('profile', {'resolution': 1, 'segments': [
+            {'type': 'step', 'values': [20, 40, 80], 'step_duration': 5},
+        ]}),
+        OrchestratorConfig(schedule='push', stabilization_time=2, bootstrap_resamples=0),
+    )
+    orchestrator = Orchestrator(config, adapter, OrchestratorFactory.create_strategy(config), clock=clock)
+
+    result = orchestrator.run()
+
+    assert adapter.configured == []  # Нагрузку меняет генератор, не оркестратор
+    assert [(step.at, step.users) for step in adapter.schedule.steps] == [(0.0, 20), (7.0, 40), (12.0, 80)]
+    assert result.stop_reason == StopReason.TARGET_REACHED
+    assert {m.users for m in result.history} >= {20, 40, 80}
+
+
+def test_push_mode_requires_a_precomputed_strategy(clock):
+    config = Config(
+        AdapterConfig('locust', 'simulated'),
+        StrategyConfig('degradation_search', {}),
+        OrchestratorConfig(schedule='push'),
+    )
+
+    with pytest.raises(ValueError, match="no precomputed schedule"):
+        Orchestrator(config, SchedulingAdapter(), OrchestratorFactory.create_strategy(config), clock=clock)
@@ -0,0 +1,75 @@
+import pytest
+
+from load_orchestrator.models import RawMetrics
+from load_orchestrator.slo import BurnWindow, SLOEngine, parse_burn_windows, parse_objectives, slow_fraction
+
+
+def _metrics(timestamp: float, users: int, total: int, failed: int, endpoints=None) -> RawMetrics:
+    return RawMetrics(
+        timestamp, users, 10.0, 10, 10, 20, 30, failed, 0.0, total, endpoints=endpoints or {},
+    )
+
+
+def test_slow_fraction_interpolates_between_percentiles():
+    stats = {'p50': 100, 'p95': 200, 'p99': 300, 'max': 500}
+
+    assert slow_fraction(stats, 100) == pytest.approx(0.5)
+    assert slow_fraction(stats, 150) == pytest.approx(0.275)  # Между (100, 0.5) и (200, 0.95)
+    assert slow_fraction(stats, 300) == pytest.approx(0.01)
+    assert slow_fraction(stats, 400) == pytest.approx(0.005)
+    assert slow_fraction(stats, 500) == 0.0
+    assert slow_fraction(stats, 0) == pytest.approx(1.0)
+
+
+def test_slow_fraction_without_max_extends_tail_to_twice_p99():
+    assert slow_fraction({'p50': 10, 'p95': 20, 'p99': 100}, 150) == pytest.approx(0.005)
+
+
+def test_availability_burn_needs_both_windows():
+    objectives = parse_objectives([{'endpoint': 'GET /api', 'availability': 99}])
+    engine = SLOEngine(objectives, [BurnWindow(long=60, short=10, max=2)])
+    api = objectives[0]
+    assert api.budget == pytest.approx(0.01)
+
+    def sample(t, failures):
+        return _metrics(t, 10, 0, 0, {'GET /api': {'requests': 100, 'failures': failures}})
+
+    # Минута по 1% ошибок: burn 1x
+    for t in range(0, 60, 5):
+        assert engine.update(sample(t, 1)) is None
+    # Короткий всплеск: короткое окно горит, длинное ещё нет
+    assert engine.update(sample(60, 10)) is None
+    assert engine.burn_rates()[api.name]['10s'] == pytest.approx((1 + 1 + 10) / 300 / 0.01)
+
+    breach = None
+    t = 65
+    while breach is None and t < 200:
+        breach = engine.update(sample(t, 10))
+        t += 5
+    assert breach is not None
+    assert breach.long_burn > 2 and breach.short_burn > 2
+    assert engine.report()['breach'] == breach.describe()
+
+
+def test_aggregate_counters_are_interval_deltas_and_steps_report_compliance():
+    objectives = parse_objectives([{'availability': 99}])
+    engine = SLOEngine(objectives, parse_burn_windows([{'long': '1m', 'short': '10s', 'max': 100}]))
+
+    engine.update(_metrics(0, 10, total=1000, failed=0))
+    engine.update(_metrics(5, 10, total=2000, failed=5))   # 0.5% за интервал
+    engine.update(_metrics(10, 20, total=3000, failed=25))  # 2% за интервал
+
+    report = engine.report()
+    assert [step['users'] for step in report['steps']] == [10, 20]
+    burns = [step['burn'][objectives[0].name] for step in report['steps']]
+    assert burns == pytest.approx([5 / 2000 / 0.01, 20 / 1000 / 0.01])
+    assert report['max_compliant_users'] == 10
+
+
+def test_parse_objectives_rejects_invalid():
+    with pytest.raises(ValueError):
+        parse_objectives([{'endpoint': 'GET /', 'latency': 100, 'percentile': 100}])
+    with pytest.raises(ValueError):
+        parse_objectives([{'endpoint': 'GET /'}])
+    with pytest.raises(ValueError):
+        parse_burn_windows([{'long': 10, 'short': 60, 'max': 2}])
@@ -0,0 +1,105 @@
+import pytest
+
+from load_orchestrator.analytics.spike import UNAVAILABLE, SpikeRecovery
+from load_orchestrator.models import RawMetrics
+
+
+def _metrics(t: float, p95: float, error_rate: float = 0.0, cumulative: bool = False,
+             p95_corrected: float | None = None) -> RawMetrics:
+    return RawMetrics(
+        timestamp=t, users=100, rps=200.0, rt_avg=p95 / 2, p50=p95 / 2, p95=p95, p99=p95 * 1.5,
+        failed_requests=0, error_rate=error_rate, total_requests=0, sampling_interval=0.25,
+        cumulative_percentiles=cumulative, p95_corrected=p95_corrected,
+    )
+
+
+def _spike(analysis: SpikeRecovery, baseline: list[float], spike: list[float], recovery: list[float],
+           start: float = 0.0, **kwargs) -> float:
+    t = start
+    for p95 in baseline:
+        analysis.observe(_metrics(t, p95, **kwargs))
+        t += 1
+    analysis.spike_started(t)
+    for p95 in spike:
+        analysis.observe(_metrics(t, p95, **kwargs))
+        t += 1
+    analysis.recovery_started(t)
+    for p95 in recovery:
+        analysis.observe(_metrics(t, p95, **kwargs))
+        t += 1
+    return t
+
+
+def test_degradation_peak_and_recovery_times():
+    analysis = SpikeRecovery(tolerance=10, hold=3)
+    _spike(analysis, baseline=[100, 100], spike=[105, 150, 300, 200], recovery=[180, 105, 150, 108, 100, 100, 100])
+    analysis.finish()
+
+    report = analysis.report()
+    spike = report['spikes'][0]
+    assert report['baseline']['p95'] == 100
+    assert spike['time_to_degrade'] == 1  # 105 в допуске, 150 - нет
+    assert spike['degrade_resolution'] == 0.25
+    assert (spike['peak_p95'], spike['time_to_peak']) == (300, 2)
+    assert spike['latency_overshoot'] == pytest.approx(200)
+    # 105 в допуске, но серия прервана 150; серия из трёх начинается с 108
+    assert spike['recovered'] is True and spike['time_to_recover'] == 3
+    assert report['unavailable'] is None
+
+
+def test_errors_count_as_degradation():
+    analysis = SpikeRecovery(error_tolerance=1.0, hold=1)
+    analysis.observe(_metrics(0, 100, error_rate=0.5))
+    analysis.spike_started(1)
+    analysis.observe(_metrics(1, 100, error_rate=2.0))
+    analysis.recovery_started(2)
+    analysis.observe(_metrics(2, 100, error_rate=1.0))
+
+    spike = analysis.report()['spikes'][0]
+    assert spike['time_to_degrade'] == 0
+    assert spike['error_overshoot'] == pytest.approx(1.5)
+    assert spike['time_to_recover'] == 0
+
+
+def test_series_summary_and_unrecovered_spike():
+    analysis = SpikeRecovery(hold=2)
+    t = _spike(analysis, baseline=[100, 100], spike=[400], recovery=[100, 100])
+    _spike(analysis, baseline=[], spike=[250], recovery=[200, 100], start=t)
+
+    summary = analysis.report()['summary']
+    assert summary['spikes'] == 2 and summary['degraded'] == 2
+    assert summary['recovered'] == 1  # Второй не набрал hold сэмплов подряд
+    assert summary['max_latency_overshoot'] == pytest.approx(300)
+
+
+def test_cumulative_percentiles_use_corrected_or_are_unavailable():
+    corrected = SpikeRecovery(hold=1)
+    _spike(corrected, baseline=[100], spike=[100], recovery=[100], cumulative=True, p95_corrected=500)
+    assert corrected.report()['baseline']['p95'] == 500
+
+    cumulative = SpikeRecovery(hold=1)
+    _spike(cumulative, baseline=[100], spike=[900], recovery=[100], cumulative=True)
+    report = cumulative.report()
+    assert report['unavailable'] == UNAVAILABLE
+    assert report['spikes'][0]['time_to_degrade'] is None
+
+
+@pytest.mark.parametrize("kwargs", [{'tolerance': 0}, {'error_tolerance': -1}, {'hold': 0}])
+def test_invalid_parameters(kwargs):
+    with pytest.raises(ValueError):
+        SpikeRecovery(**kwargs)
+
+
+def test_spike_run_reports_recovery(run):
+    _, result = run('spike', {
+        'baseline_users': 100, 'baseline_duration': 5,
+        'spike_users': 600, 'spike_duration': 5,
+        'recovery_users': 100, 'recovery_duration': 5,
+        'spikes': 2, 'recovery_hold': 2,
+    }, stabilization_time=0)
+
+    report = result.strategy_report['spike']
+    assert report['summary']['spikes'] == 2
+    assert report['summary']['degraded'] == 2 and report['summary']['recovered'] == 2
+    assert report['baseline']['p95'] == 20
+    assert report['spikes'][0]['peak_p95'] == 20 + 300 * 2
@@ -0,0 +1,107 @@
+import socket
+import struct
+import tempfile
+
+import pytest
+
+from load_orchestrator.adapters import stream
+from load_orchestrator.adapters.stream import (
+    ENDPOINT_PRECISION, MAX_ENDPOINTS, MAX_SIGNATURE_BYTES, MAX_SIGNATURES, IntervalStreamReader, decode_interval,
+    encode_interval,
+)
+from load_orchestrator.analytics.latency import LatencyHistogram
+
+
+def _histogram(values, precision: float = 0.01) -> LatencyHistogram:
+    histogram = LatencyHistogram(precision=precision)
+    for value in values:
+        histogram.record(value)
+    return histogram
+
+
+def test_round_trip_with_signatures_and_endpoints():
+    aggregate = _histogram([10, 20, 30, 400])
+    login = _histogram([10, 400], ENDPOINT_PRECISION)
+    catalog = _histogram([20, 30], ENDPOINT_PRECISION)
+
+    data = encode_interval(
+        pid=42, seq=7, timestamp=1_700_000_000.5, users=25, failures=1, elapsed_sum=460.0,
+        histogram=aggregate, signatures={"timeout after <n>s": 1},
+        endpoints={"POST /login": (login, 1), "GET /catalog": (catalog, 0)},
+    )
+    sample = decode_interval(data)
+
+    assert (sample.pid, sample.seq, sample.users, sample.requests, sample.failures) == (42, 7, 25, 4, 1)
+    assert sample.timestamp == 1_700_000_000.5
+    assert sample.elapsed_sum == 460.0
+    assert sample.histogram.counts == aggregate.counts
+    assert sample.histogram.max == aggregate.max
+    assert sample.histogram.percentile(0.99) == aggregate.percentile(0.99)
+    assert sample.signatures == {"timeout after <n>s": 1}
+
+    assert set(sample.endpoints) == {"POST /login", "GET /catalog"}
+    histogram, failures = sample.endpoints["POST /login"]
+    assert failures == 1
+    assert histogram.count == 2 and histogram.precision == ENDPOINT_PRECISION
+    assert histogram.counts == login.counts
+
+
+def test_only_busiest_endpoints_are_sent():
+    endpoints = {f"GET /{i}": (_histogram([10] * (i + 1)), 0) for i in range(MAX_ENDPOINTS + 5)}
+
+    sample = decode_interval(encode_interval(1, 1, 0.0, 1, 0, 0.0, _histogram([10]), endpoints=endpoints))
+
+    assert len(sample.endpoints) == MAX_ENDPOINTS
+    assert "GET /0" not in sample.endpoints and f"GET /{MAX_ENDPOINTS + 4}" in sample.endpoints
+
+
+def test_only_most_frequent_signatures_are_sent():
+    signatures = {f"error {i} " + "x" * 1000: i + 1 for i in range(MAX_SIGNATURES + 5)}
+
+    sample = decode_interval(encode_interval(1, 1, 0.0, 1, 0, 0.0, _histogram([10]), signatures=signatures))
+
+    assert len(sample.signatures) == MAX_SIGNATURES
+    assert min(sample.signatures.values()) == 6
+    assert all(len(text.encode("utf-8")) <= MAX_SIGNATURE_BYTES for text in sample.signatures)
+
+
+def test_reader_counts_intervals_lost_by_the_generator():
+    with tempfile.TemporaryDirectory() as directory:
+        reader = IntervalStreamReader(f"{directory}/stream.sock")
+        sender = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        try:
+            for pid, seq in ((1, 0), (1, 1), (2, 5), (1, 4), (2, 6)):
+                sender.sendto(encode_interval(pid, seq, 0.0, 1, 0, 0.0, _histogram([10])), reader.path)
+
+            assert len(reader.drain()) == 5
+            assert reader.lost == 2  # pid 1: seq 2 и 3; первый seq процесса - не пропуск
+        finally:
+            sender.close()
+            reader.close()
+
+
+def test_decodes_older_versions():
+    histogram = _histogram([10, 20])
+    header = stream.HEADER.pack(
+        stream.MAGIC, 1, 3, 1, 5.0, histogram.precision, 2, histogram.count, 0, 30.0,
+        histogram.max, len(histogram.counts),
+    )
+    buckets = b"".join(stream.BUCKET.pack(b, c) for b, c in histogram.counts.items())
+
+    sample = decode_interval(header + buckets)
+
+    assert sample.requests == 2 and sample.signatures == {} and sample.endpoints == {}
+
+
+def test_rejects_truncated_and_foreign_datagrams():
+    data = encode_interval(
+        1, 1, 0.0, 1, 0, 0.0, _histogram([10, 20]),
+        endpoints={"GET /": (_histogram([10], ENDPOINT_PRECISION), 0)},
+    )
+    for end in (stream.HEADER.size - 1, stream.HEADER.size + 3, len(data) - 1):
+        with pytest.raises(ValueError):
+            decode_interval(data[:end])
+    with pytest.raises(ValueError):
+        decode_interval(data + b"\0")
+    with pytest.raises(ValueError):
+        decode_interval(struct.pack("<H", 0x1234) + data[2:])
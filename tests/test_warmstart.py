@@ -0,0 +1,82 @@
+from conftest import SimulatedAdapter
+from load_orchestrator.config import AdapterConfig, Config, OrchestratorConfig, StrategyConfig
+from load_orchestrator.factory import OrchestratorFactory
+from load_orchestrator import models
+from load_orchestrator.models import RawMetrics, StopReason, WarmStart
+from load_orchestrator.orchestrator import Orchestrator
+from load_orchestrator.warmstart import WarmStartVerifier, build_warm_start
+
+
+def _metrics(users: int, p95: float = 20.0, error_rate: float = 0.0, ramping: bool = False) -> RawMetrics:
+    return RawMetrics(
+        timestamp=0.0, users=users, rps=users * 2.0, rt_avg=10.0, p50=10.0, p95=p95, p99=30.0,
+        failed_requests=0, error_rate=error_rate, total_requests=0, ramping=ramping,
+    )
+
+
+def _seed(expected_p95: float = 20.0, expected_error_rate: float = 0.0) -> WarmStart:
+    return WarmStart(source='run', start_users=80, baseline=[], expected_p95=expected_p95,
+                     expected_error_rate=expected_error_rate)
+
+
+def test_warm_start_uses_trusted_samples_below_the_start_load():
+    history = [_metrics(50, p95=15), _metrics(80, p95=99, ramping=True), _metrics(80, p95=18),
+               _metrics(80, p95=22), _metrics(120, p95=40)]
+    result = models.TestResult(started_at=0, finished_at=1, max_stable_users=100, max_stable_rps=200,
+                        stop_reason=StopReason.DEGRADATION, history=history)
+
+    seed = build_warm_start('run-1', result, fraction=0.8)
+
+    assert seed.start_users == 80
+    assert [m.users for m in seed.baseline] == [50, 80, 80]
+    assert seed.expected_p95 == 20  # Медиана сэмплов на 80 (без рампы)
+
+
+def test_no_warm_start_without_usable_samples():
+    result = models.TestResult(started_at=0, finished_at=1, max_stable_users=100, max_stable_rps=200,
+                        stop_reason=StopReason.DEGRADATION, history=[_metrics(120)])
+
+    assert build_warm_start('run-1', result) is None
+
+
+def test_verifier_waits_for_samples_then_checks_p95_and_errors():
+    verifier = WarmStartVerifier(_seed(), samples=3, tolerance=1.5)
+    assert [verifier.observe(_metrics(80, p95=p95)) for p95 in (18, 25, 22)] == [None, None, True]
+
+    slower = WarmStartVerifier(_seed(), samples=1, tolerance=1.5)
+    assert slower.observe(_metrics(80, p95=31)) is False
+
+    failing = WarmStartVerifier(_seed(), samples=1, error_margin=1.0)
+    assert failing.observe(_metrics(80, error_rate=1.5)) is False
+
+
+def _run(clock, tmp_path, knee: int = 300):
+    adapter = SimulatedAdapter(knee=knee)
+    config = Config(
+        AdapterConfig('locust', 'simulated'),
+        StrategyConfig('degradation_search', {'initial_users': 50}),
+        OrchestratorConfig(runs_dir=str(tmp_path), warm_start=True, bootstrap_resamples=0),
+    )
+    orchestrator = Orchestrator(config, adapter, OrchestratorFactory.create_strategy(config), clock=clock)
+    return orchestrator, orchestrator.run(), adapter
+
+
+def test_second_run_starts_from_the_previous_capacity(clock, tmp_path):
+    cold, cold_result, cold_adapter = _run(clock, tmp_path)
+    warm, warm_result, warm_adapter = _run(clock, tmp_path)
+
+    assert cold.seeded_from is None and cold_adapter.configured[0] == 50
+    assert warm.seeded_from is not None and warm.seed_verified is True
+    assert warm_adapter.configured[0] == int(cold_result.max_stable_users * 0.8)
+    assert len(warm_adapter.configured) < len(cold_adapter.configured)
+    assert abs(warm_result.max_stable_users - cold_result.max_stable_users) <= 20
+
+
+def test_changed_system_falls_back_to_cold_start(clock, tmp_path):
+    _, cold_result, _ = _run(clock, tmp_path)
+    # Колено сдвинулось ниже стартовой нагрузки: p95 на старте сильно выше ожидаемого
+    warm, _, adapter = _run(clock, tmp_path, knee=100)
+
+    assert warm.seed_verified is False
+    assert adapter.configured[0] == int(cold_result.max_stable_users * 0.8)
+    assert adapter.configured[1] == 50